@@ -0,0 +1,96 @@
+"""Confere os solvers contra um BFS de referência em Python puro.
+
+Gera labirintos aleatórios (com borda de paredes), resolve cada um com o A* e o BFS
+bidirecional do módulo Cython e com o fallback NumPy, e verifica que todo caminho
+devolvido é válido (começa em S, termina em E, passos unitários, sem paredes) e tem o
+comprimento mínimo. Uso: python check_solvers.py [quantidade] [semente]
+"""
+import collections
+import random
+import sys
+
+import team_capivaras as tc
+
+
+def reference_length(char_arr, start, end):
+    """Número de células do caminho mais curto (BFS simples), ou None se não houver."""
+    rows, cols = char_arr.shape
+    dist = {start: 1}
+    queue = collections.deque([start])
+    while queue:
+        r, c = queue.popleft()
+        if (r, c) == end:
+            return dist[end]
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < cols and char_arr[nr, nc] != tc.WALL_CHAR_BYTE and (nr, nc) not in dist:
+                dist[(nr, nc)] = dist[(r, c)] + 1
+                queue.append((nr, nc))
+    return None
+
+
+def random_maze(rnd):
+    """Texto de um labirinto aleatório; às vezes com E emparedado (sem caminho)."""
+    rows = rnd.randint(3, 60)
+    cols = rnd.choice([rnd.randint(3, 70), rnd.randint(60, 200), 64, 65, 128, 129])
+    density = rnd.choice([0.0, 0.2, 0.3, 0.4])
+    grid = [['#' if r in (0, rows - 1) or c in (0, cols - 1) or rnd.random() < density else ' '
+             for c in range(cols)] for r in range(rows)]
+    cells = [(r, c) for r in range(1, rows - 1) for c in range(1, cols - 1)]
+    if len(cells) < 2:
+        return None
+    (sr, sc), (er, ec) = rnd.sample(cells, 2)
+    grid[sr][sc] = 'S'
+    grid[er][ec] = 'E'
+    if rnd.random() < 0.1:
+        for nr, nc in ((er - 1, ec), (er + 1, ec), (er, ec - 1), (er, ec + 1)):
+            if grid[nr][nc] != 'S':
+                grid[nr][nc] = '#'
+    return "\n".join("".join(row) for row in grid)
+
+
+def check_path(name, path, char_arr, start, end, expected):
+    """Levanta AssertionError se o caminho não for um caminho mínimo válido."""
+    if expected is None:
+        assert path is None, f"{name}: caminho encontrado onde não há"
+        return
+    assert path is not None, f"{name}: nenhum caminho, esperado {expected} células"
+    cells = [tuple(int(x) for x in p) for p in path]
+    assert len(cells) == expected, f"{name}: {len(cells)} células, esperado {expected}"
+    assert cells[0] == start and cells[-1] == end, f"{name}: extremos errados"
+    for (r0, c0), (r1, c1) in zip(cells, cells[1:]):
+        assert abs(r0 - r1) + abs(c0 - c1) == 1, f"{name}: passo inválido {(r0, c0)} -> {(r1, c1)}"
+    for r, c in cells:
+        assert char_arr[r, c] != tc.WALL_CHAR_BYTE, f"{name}: caminho atravessa parede em {(r, c)}"
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rnd = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    solvers = [("numpy", lambda ca, wb, s, e: tc.find_shortest_path_numpy(ca, s, e))]
+    if tc.maze_solver_cy is None:
+        print("maze_solver_cy não compilado; conferindo só o fallback NumPy")
+    else:
+        solvers += [(name, lambda ca, wb, s, e, f=getattr(tc.maze_solver_cy, name): f(wb, ca.shape[0], ca.shape[1], s, e))
+                    for name in ("find_shortest_path_astar", "find_shortest_path_cython_optimized")]
+
+    checked = unsolvable = 0
+    while checked < count:
+        maze = random_maze(rnd)
+        if maze is None:
+            continue
+        char_arr, wall_bits, start, end = tc.parse_maze_for_cython(maze)
+        expected = reference_length(char_arr, start, end)
+        for name, solve in solvers:
+            try:
+                check_path(name, solve(char_arr, wall_bits, start, end), char_arr, start, end, expected)
+            except AssertionError as e:
+                print(f"FALHOU no labirinto {checked}: {e}\n{maze}")
+                return 1
+        checked += 1
+        unsolvable += expected is None
+    print(f"OK: {checked} labirintos ({unsolvable} sem caminho), solvers: {', '.join(n for n, _ in solvers)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
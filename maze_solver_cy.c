@@ -4,14 +4,14 @@
 {
     "distutils": {
         "depends": [
-            "/Users/ifws/Documents/CESAR_School/GRAFOS/final_project/.venv/lib/python3.9/site-packages/numpy/_core/include/numpy/arrayobject.h",
-            "/Users/ifws/Documents/CESAR_School/GRAFOS/final_project/.venv/lib/python3.9/site-packages/numpy/_core/include/numpy/arrayscalars.h",
-            "/Users/ifws/Documents/CESAR_School/GRAFOS/final_project/.venv/lib/python3.9/site-packages/numpy/_core/include/numpy/ndarrayobject.h",
-            "/Users/ifws/Documents/CESAR_School/GRAFOS/final_project/.venv/lib/python3.9/site-packages/numpy/_core/include/numpy/ndarraytypes.h",
-            "/Users/ifws/Documents/CESAR_School/GRAFOS/final_project/.venv/lib/python3.9/site-packages/numpy/_core/include/numpy/ufuncobject.h"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/arrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/arrayscalars.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ndarrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ndarraytypes.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ufuncobject.h"
         ],
         "include_dirs": [
-            "/Users/ifws/Documents/CESAR_School/GRAFOS/final_project/.venv/lib/python3.9/site-packages/numpy/_core/include"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include"
         ],
         "language": "c",
         "name": "maze_solver_cy",
@@ -1371,8 +1371,8 @@ static const char *__pyx_filename;
 static const char* const __pyx_f[] = {
   "maze_solver_cy.pyx",
   "<stringsource>",
-  ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd",
-  ".venv/lib/python3.9/site-packages/Cython/Includes/cpython/type.pxd",
+  "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd",
+  "cpython/type.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* Atomics.proto */
@@ -1594,7 +1594,7 @@ typedef struct {
 
 /* #### Code section: numeric_typedefs ### */
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":770
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":770
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -1603,7 +1603,7 @@ typedef struct {
 */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":771
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":771
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -1612,7 +1612,7 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
 */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":772
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":772
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
@@ -1621,7 +1621,7 @@ typedef npy_int16 __pyx_t_5numpy_int16_t;
 */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":773
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":773
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
@@ -1630,7 +1630,7 @@ typedef npy_int32 __pyx_t_5numpy_int32_t;
 */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":777
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * #ctypedef npy_int128     int128_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
@@ -1639,7 +1639,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
 */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":778
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":778
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -1648,7 +1648,7 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":779
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":779
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
@@ -1657,7 +1657,7 @@ typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":780
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
@@ -1666,7 +1666,7 @@ typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":784
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":784
  * #ctypedef npy_uint128    uint128_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
@@ -1675,7 +1675,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":785
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":785
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -1684,7 +1684,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
 */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":792
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  * ctypedef double complex complex128_t
  * 
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -1693,7 +1693,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
 */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":793
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * ctypedef npy_longlong   longlong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -1702,7 +1702,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
 */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":795
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":795
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -1711,7 +1711,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":796
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":796
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -1720,7 +1720,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
 */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":798
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":798
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -1729,7 +1729,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
 */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":799
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":799
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -1738,7 +1738,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
 */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":800
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":800
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -1747,41 +1747,50 @@ typedef npy_double __pyx_t_5numpy_double_t;
 */
 typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
 
-/* "maze_solver_cy.pyx":16
- * from libc.string cimport memset
+/* "maze_solver_cy.pyx":15
+ * from libc.stdlib cimport malloc, free
  * 
- * ctypedef cnp.int32_t grid_cell_type_t             # <<<<<<<<<<<<<<
- * ctypedef cnp.uint8_t visited_cell_type_t
+ * ctypedef cnp.uint64_t wall_word_type_t             # <<<<<<<<<<<<<<
+ * ctypedef cnp.uint8_t visited_cell_type_t # Estado da clula: direo do predecessor (0 = no visitada)
  * ctypedef cnp.int32_t coord_type_t
 */
-typedef __pyx_t_5numpy_int32_t __pyx_t_14maze_solver_cy_grid_cell_type_t;
+typedef __pyx_t_5numpy_uint64_t __pyx_t_14maze_solver_cy_wall_word_type_t;
 
-/* "maze_solver_cy.pyx":17
+/* "maze_solver_cy.pyx":16
  * 
- * ctypedef cnp.int32_t grid_cell_type_t
- * ctypedef cnp.uint8_t visited_cell_type_t             # <<<<<<<<<<<<<<
+ * ctypedef cnp.uint64_t wall_word_type_t
+ * ctypedef cnp.uint8_t visited_cell_type_t # Estado da clula: direo do predecessor (0 = no visitada)             # <<<<<<<<<<<<<<
  * ctypedef cnp.int32_t coord_type_t
  * ctypedef cnp.uint32_t queue_index_t
 */
 typedef __pyx_t_5numpy_uint8_t __pyx_t_14maze_solver_cy_visited_cell_type_t;
 
-/* "maze_solver_cy.pyx":18
- * ctypedef cnp.int32_t grid_cell_type_t
- * ctypedef cnp.uint8_t visited_cell_type_t
+/* "maze_solver_cy.pyx":17
+ * ctypedef cnp.uint64_t wall_word_type_t
+ * ctypedef cnp.uint8_t visited_cell_type_t # Estado da clula: direo do predecessor (0 = no visitada)
  * ctypedef cnp.int32_t coord_type_t             # <<<<<<<<<<<<<<
  * ctypedef cnp.uint32_t queue_index_t
- * 
+ * ctypedef cnp.int32_t cell_index_type_t # ndice plano da clula: r * cols + c
 */
 typedef __pyx_t_5numpy_int32_t __pyx_t_14maze_solver_cy_coord_type_t;
 
-/* "maze_solver_cy.pyx":19
- * ctypedef cnp.uint8_t visited_cell_type_t
+/* "maze_solver_cy.pyx":18
+ * ctypedef cnp.uint8_t visited_cell_type_t # Estado da clula: direo do predecessor (0 = no visitada)
  * ctypedef cnp.int32_t coord_type_t
  * ctypedef cnp.uint32_t queue_index_t             # <<<<<<<<<<<<<<
+ * ctypedef cnp.int32_t cell_index_type_t # ndice plano da clula: r * cols + c
  * 
- * DEF PATH_CELL = 0
 */
 typedef __pyx_t_5numpy_uint32_t __pyx_t_14maze_solver_cy_queue_index_t;
+
+/* "maze_solver_cy.pyx":19
+ * ctypedef cnp.int32_t coord_type_t
+ * ctypedef cnp.uint32_t queue_index_t
+ * ctypedef cnp.int32_t cell_index_type_t # ndice plano da clula: r * cols + c             # <<<<<<<<<<<<<<
+ * 
+ * # Buffer de ndices planos de clula: fila no BFS, pilha nos baldes do A*. Cada clula entra
+*/
+typedef __pyx_t_5numpy_int32_t __pyx_t_14maze_solver_cy_cell_index_type_t;
 /* #### Code section: complex_type_declarations ### */
 /* Declarations.proto */
 #if CYTHON_CCOMPLEX && (1) && (!0 || __cplusplus)
@@ -1827,7 +1836,7 @@ struct __pyx_MemviewEnum_obj;
 struct __pyx_memoryview_obj;
 struct __pyx_memoryviewslice_obj;
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1096
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1096
  * 
  * # Iterator API added in v1.6
  * ctypedef int (*NpyIter_IterNextFunc)(NpyIter* it) noexcept nogil             # <<<<<<<<<<<<<<
@@ -1836,7 +1845,7 @@ struct __pyx_memoryviewslice_obj;
 */
 typedef int (*__pyx_t_5numpy_NpyIter_IterNextFunc)(NpyIter *);
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1097
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1097
  * # Iterator API added in v1.6
  * ctypedef int (*NpyIter_IterNextFunc)(NpyIter* it) noexcept nogil
  * ctypedef void (*NpyIter_GetMultiIndexFunc)(NpyIter* it, npy_intp* outcoords) noexcept nogil             # <<<<<<<<<<<<<<
@@ -1844,22 +1853,34 @@ typedef int (*__pyx_t_5numpy_NpyIter_IterNextFunc)(NpyIter *);
  * cdef extern from "numpy/arrayobject.h":
 */
 typedef void (*__pyx_t_5numpy_NpyIter_GetMultiIndexFunc)(NpyIter *, npy_intp *);
-struct __pyx_t_14maze_solver_cy_CircularQueue;
+struct __pyx_t_14maze_solver_cy_CellQueue;
+struct __pyx_t_14maze_solver_cy_SearchSide;
+
+/* "maze_solver_cy.pyx":23
+ * # Buffer de ndices planos de clula: fila no BFS, pilha nos baldes do A*. Cada clula entra
+ * # no mximo uma vez (por balde, no A*), ento com capacidade rows * cols nunca h volta
+ * cdef struct CellQueue:             # <<<<<<<<<<<<<<
+ *     cell_index_type_t* data
+ *     queue_index_t head
+*/
+struct __pyx_t_14maze_solver_cy_CellQueue {
+  __pyx_t_14maze_solver_cy_cell_index_type_t *data;
+  __pyx_t_14maze_solver_cy_queue_index_t head;
+  __pyx_t_14maze_solver_cy_queue_index_t tail;
+};
 
-/* "maze_solver_cy.pyx":25
+/* "maze_solver_cy.pyx":75
  * 
- * # Estrutura para queue circular otimizada
- * cdef struct CircularQueue:             # <<<<<<<<<<<<<<
- *     coord_type_t* data_r
- *     coord_type_t* data_c
+ * # Estado de um dos lados da BFS bidirecional
+ * cdef struct SearchSide:             # <<<<<<<<<<<<<<
+ *     CellQueue queue
+ *     int shift # Posio do nibble desta busca no estado da clula
 */
-struct __pyx_t_14maze_solver_cy_CircularQueue {
-  __pyx_t_14maze_solver_cy_coord_type_t *data_r;
-  __pyx_t_14maze_solver_cy_coord_type_t *data_c;
-  __pyx_t_14maze_solver_cy_queue_index_t head;
-  __pyx_t_14maze_solver_cy_queue_index_t tail;
-  __pyx_t_14maze_solver_cy_queue_index_t size;
-  __pyx_t_14maze_solver_cy_queue_index_t capacity;
+struct __pyx_t_14maze_solver_cy_SearchSide {
+  struct __pyx_t_14maze_solver_cy_CellQueue queue;
+  int shift;
+  __pyx_t_14maze_solver_cy_visited_cell_type_t own_mask;
+  __pyx_t_14maze_solver_cy_visited_cell_type_t other_mask;
 };
 
 /* "View.MemoryView":110
@@ -2641,30 +2662,6 @@ static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, P
 #define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
 #endif
 
-/* ErrOccurredWithGIL.proto */
-static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void);
-
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-        L->ob_item[len] = x;
-        #else
-        PyList_SET_ITEM(list, len, x);
-        #endif
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
-#endif
-
 /* CallTypeTraverse.proto */
 #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
 #define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
@@ -2928,14 +2925,17 @@ static int __Pyx_ValidateAndInit_memviewslice(
                 PyObject *original_obj);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_5numpy_int32_t(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_wall_word_type_t__const__(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(PyObject *, int writable_flag);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_cell_index_type_t(PyObject *, int writable_flag);
+
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -3105,6 +3105,9 @@ static CYTHON_INLINE int __pyx_sub_acquisition_count_locked(
 static CYTHON_INLINE void __Pyx_INC_MEMVIEW(__Pyx_memviewslice *, int, int);
 static CYTHON_INLINE void __Pyx_XCLEAR_MEMVIEW(__Pyx_memviewslice *, int, int);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 
@@ -3117,9 +3120,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_npy_int32(npy_int32 value);
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
 
-/* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
-
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
@@ -3257,12 +3257,21 @@ static PyObject *contiguous = 0;
 static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_init_queue(struct __pyx_t_14maze_solver_cy_CircularQueue *, __pyx_t_14maze_solver_cy_queue_index_t); /*proto*/
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_free_queue(struct __pyx_t_14maze_solver_cy_CircularQueue *); /*proto*/
-static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_queue_empty(struct __pyx_t_14maze_solver_cy_CircularQueue *); /*proto*/
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_enqueue(struct __pyx_t_14maze_solver_cy_CircularQueue *, __pyx_t_14maze_solver_cy_coord_type_t, __pyx_t_14maze_solver_cy_coord_type_t); /*proto*/
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_dequeue(struct __pyx_t_14maze_solver_cy_CircularQueue *, __pyx_t_14maze_solver_cy_coord_type_t *, __pyx_t_14maze_solver_cy_coord_type_t *); /*proto*/
-static PyObject *__pyx_f_14maze_solver_cy_find_shortest_path_cython_optimized(__Pyx_memviewslice, PyObject *, PyObject *, int __pyx_skip_dispatch); /*proto*/
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_init_queue(struct __pyx_t_14maze_solver_cy_CellQueue *, __pyx_t_14maze_solver_cy_queue_index_t); /*proto*/
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_free_queue(struct __pyx_t_14maze_solver_cy_CellQueue *); /*proto*/
+static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_queue_empty(struct __pyx_t_14maze_solver_cy_CellQueue *); /*proto*/
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_enqueue(struct __pyx_t_14maze_solver_cy_CellQueue *, __pyx_t_14maze_solver_cy_cell_index_type_t); /*proto*/
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_dequeue(struct __pyx_t_14maze_solver_cy_CellQueue *); /*proto*/
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_pop_last(struct __pyx_t_14maze_solver_cy_CellQueue *); /*proto*/
+static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_wall(__Pyx_memviewslice, __pyx_t_14maze_solver_cy_cell_index_type_t); /*proto*/
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_init_side(struct __pyx_t_14maze_solver_cy_SearchSide *, int, __pyx_t_14maze_solver_cy_queue_index_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_14maze_solver_cy_visit(struct __pyx_t_14maze_solver_cy_SearchSide *, __pyx_t_14maze_solver_cy_visited_cell_type_t *, __pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_visited_cell_type_t, __pyx_t_14maze_solver_cy_cell_index_type_t *); /*proto*/
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_parent_of(__pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_visited_cell_type_t, int); /*proto*/
+static int __pyx_f_14maze_solver_cy_expand_level(struct __pyx_t_14maze_solver_cy_SearchSide *, __pyx_t_14maze_solver_cy_visited_cell_type_t *, __Pyx_memviewslice, int, int, __pyx_t_14maze_solver_cy_cell_index_type_t *); /*proto*/
+static PyObject *__pyx_f_14maze_solver_cy_find_shortest_path_cython_optimized(__Pyx_memviewslice, int, int, PyObject *, PyObject *, int __pyx_skip_dispatch); /*proto*/
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_manhattan(__pyx_t_14maze_solver_cy_coord_type_t, __pyx_t_14maze_solver_cy_coord_type_t, __pyx_t_14maze_solver_cy_coord_type_t, __pyx_t_14maze_solver_cy_coord_type_t); /*proto*/
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_astar_visit(__pyx_t_14maze_solver_cy_visited_cell_type_t *, __pyx_t_14maze_solver_cy_cell_index_type_t *, struct __pyx_t_14maze_solver_cy_CellQueue *, struct __pyx_t_14maze_solver_cy_CellQueue *, __pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_cell_index_type_t, __pyx_t_14maze_solver_cy_visited_cell_type_t); /*proto*/
+static PyObject *__pyx_f_14maze_solver_cy_find_shortest_path_astar(__Pyx_memviewslice, int, int, PyObject *, PyObject *, int __pyx_skip_dispatch); /*proto*/
 static int __pyx_array_allocate_buffer(struct __pyx_array_obj *); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char const *, char *); /*proto*/
 static PyObject *__pyx_memoryview_new(PyObject *, int, int, __Pyx_TypeInfo const *); /*proto*/
@@ -3298,9 +3307,10 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
-static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t = { "int32_t", NULL, sizeof(__pyx_t_5numpy_int32_t), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_5numpy_int32_t) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_5numpy_int32_t), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_wall_word_type_t__const__ = { "const wall_word_type_t", NULL, sizeof(__pyx_t_14maze_solver_cy_wall_word_type_t const ), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_wall_word_type_t const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_wall_word_type_t const ), 0 };
 static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_visited_cell_type_t = { "visited_cell_type_t", NULL, sizeof(__pyx_t_14maze_solver_cy_visited_cell_type_t), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_visited_cell_type_t) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_visited_cell_type_t), 0 };
 static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_coord_type_t = { "coord_type_t", NULL, sizeof(__pyx_t_14maze_solver_cy_coord_type_t), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_coord_type_t) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_coord_type_t), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_cell_index_type_t = { "cell_index_type_t", NULL, sizeof(__pyx_t_14maze_solver_cy_cell_index_type_t), { 0 }, 0, __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_cell_index_type_t) ? 'U' : 'I', __PYX_IS_UNSIGNED(__pyx_t_14maze_solver_cy_cell_index_type_t), 0 };
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "maze_solver_cy"
 extern int __pyx_module_is_main_maze_solver_cy;
@@ -3308,12 +3318,12 @@ int __pyx_module_is_main_maze_solver_cy = 0;
 
 /* Implementation of "maze_solver_cy" */
 /* #### Code section: global_var ### */
-static PyObject *__pyx_builtin_range;
-static PyObject *__pyx_builtin___import__;
 static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin___import__;
 static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_enumerate;
 static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_AssertionError;
 static PyObject *__pyx_builtin_Ellipsis;
 static PyObject *__pyx_builtin_id;
@@ -3321,24 +3331,17 @@ static PyObject *__pyx_builtin_IndexError;
 static PyObject *__pyx_builtin_ImportError;
 /* #### Code section: string_decls ### */
 static const char __pyx_k_[] = ": ";
-static const char __pyx_k_E[] = "E";
 static const char __pyx_k_O[] = "O";
-static const char __pyx_k_S[] = "S";
 static const char __pyx_k_c[] = "c";
-static const char __pyx_k_r[] = "r";
 static const char __pyx_k_x[] = "x";
 static const char __pyx_k__2[] = ".";
 static const char __pyx_k__3[] = ">";
 static const char __pyx_k__4[] = "'";
 static const char __pyx_k__5[] = ")";
-static const char __pyx_k__6[] = "\n";
-static const char __pyx_k__7[] = "#";
-static const char __pyx_k__8[] = " ";
-static const char __pyx_k__9[] = "\302\267";
+static const char __pyx_k__6[] = "?";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_id[] = "id";
 static const char __pyx_k_np[] = "np";
-static const char __pyx_k__10[] = "?";
 static const char __pyx_k_abc[] = "abc";
 static const char __pyx_k_and[] = " and ";
 static const char __pyx_k_got[] = " (got ";
@@ -3346,12 +3349,9 @@ static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_obj[] = "obj";
 static const char __pyx_k_pop[] = "pop";
 static const char __pyx_k_base[] = "base";
-static const char __pyx_k_char[] = "char";
 static const char __pyx_k_cols[] = "cols";
 static const char __pyx_k_dict[] = "__dict__";
-static const char __pyx_k_full[] = "full";
 static const char __pyx_k_func[] = "__func__";
-static const char __pyx_k_line[] = "line";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_mode[] = "mode";
 static const char __pyx_k_name[] = "name";
@@ -3364,21 +3364,20 @@ static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_ASCII[] = "ASCII";
+static const char __pyx_k_array[] = "array";
 static const char __pyx_k_at_0x[] = " at 0x";
 static const char __pyx_k_class[] = "__class__";
 static const char __pyx_k_count[] = "count";
 static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
 static const char __pyx_k_index[] = "index";
 static const char __pyx_k_int32[] = "int32";
-static const char __pyx_k_lines[] = "lines";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
-static const char __pyx_k_split[] = "split";
 static const char __pyx_k_start[] = "start";
-static const char __pyx_k_strip[] = "strip";
 static const char __pyx_k_uint8[] = "uint8";
 static const char __pyx_k_zeros[] = "zeros";
 static const char __pyx_k_enable[] = "enable";
@@ -3396,12 +3395,13 @@ static const char __pyx_k_update[] = "update";
 static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_fortran[] = "fortran";
 static const char __pyx_k_memview[] = "memview";
+static const char __pyx_k_Dimenses[] = "Dimens\303\265es ";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_Sequence[] = "Sequence";
 static const char __pyx_k_add_note[] = "add_note";
 static const char __pyx_k_getstate[] = "__getstate__";
-static const char __pyx_k_int_grid[] = "int_grid";
 static const char __pyx_k_itemsize[] = "itemsize";
+static const char __pyx_k_palavras[] = " palavras).";
 static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_register[] = "register";
@@ -3410,9 +3410,9 @@ static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_enumerate[] = "enumerate";
 static const char __pyx_k_isenabled[] = "isenabled";
-static const char __pyx_k_maze_text[] = "maze_text";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_wall_bits[] = "wall_bits";
 static const char __pyx_k_IndexError[] = "IndexError";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_end_coords[] = "end_coords";
@@ -3433,7 +3433,6 @@ static const char __pyx_k_View_MemoryView[] = "View.MemoryView";
 static const char __pyx_k_allocate_buffer[] = "allocate_buffer";
 static const char __pyx_k_collections_abc[] = "collections.abc";
 static const char __pyx_k_dtype_is_object[] = "dtype_is_object";
-static const char __pyx_k_parse_maze_text[] = "parse_maze_text";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_pyx_unpickle_Enum[] = "__pyx_unpickle_Enum";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
@@ -3445,14 +3444,16 @@ static const char __pyx_k_Invalid_shape_in_axis[] = "Invalid shape in axis ";
 static const char __pyx_k_contiguous_and_direct[] = "<contiguous and direct>";
 static const char __pyx_k_Cannot_index_with_type[] = "Cannot index with type '";
 static const char __pyx_k_contiguous_and_indirect[] = "<contiguous and indirect>";
+static const char __pyx_k_find_shortest_path_astar[] = "find_shortest_path_astar";
 static const char __pyx_k_Dimension_d_is_not_direct[] = "Dimension %d is not direct";
 static const char __pyx_k_Index_out_of_bounds_axis_d[] = "Index out of bounds (axis %d)";
 static const char __pyx_k_Step_may_not_be_zero_axis_d[] = "Step may not be zero (axis %d)";
 static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cython.array";
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
-static const char __pyx_k_HF_1_HF_1_AQ_AQ_j_j_Cxs_s_Bc_E[] = "\200\001\360\026\000\005\025\220H\230F\240!\2401\330\004\024\220H\230F\240!\2401\340\004 \240\014\250A\250Q\330\004 \240\014\250A\250Q\330\004\036\230j\250\001\250\021\330\004\036\230j\250\001\250\021\360\006\000\005\t\210\010\220\002\220\"\220C\220x\230s\240%\240s\250(\260\"\260B\260c\270\030\300\023\300E\310\021\330\010\016\210b\220\002\220#\220V\2303\230e\2403\240f\250B\250b\260\003\2606\270\023\270A\330\010\017\210q\340\004\007\200x\210q\220\t\230\031\240#\240Z\250s\260(\270!\2707\300'\310\023\310A\330\010\017\210q\360\006\000\005\010\200x\210s\220&\230\004\230H\240C\240q\330\010\017\210r\220\031\230!\360\006\000\005)\250\005\250R\250q\340\004\016\210a\210q\220\007\220q\360\006\000\005\030\220r\230\026\230r\240\026\240w\250f\260B\260a\330\004/\250q\340\004\020\220\002\220%\220r\230\026\230x\240s\250&\260\002\260!\330\004\020\220\002\220%\220r\230\026\230x\240s\250&\260\002\260!\330\004'\240q\330\004'\240q\360\006\000\005\014\2101\210A\210W\220I\230Q\330\004\013\2101\210I\220[\240\001\360\006\000\005\034\2301\360\006\000\n\013\330\010\016\210d\220.\240\001\240\021\240!\330\014\023\2201\220A\220W\230A\230S\240\001\240\021\360\006\000\r\020\210r\220\023\220F\230$\230b\240\003\2401\330\020\035\230Q\330\020\021\360\010\000\r\022\220\022\2202\220Q\330\014\021\220\022\2202\220Q\330\014\020\220\003\2203\220b\230\004\230C\230r\240\025\240d\250#\250S\260\002\260$\260c\270\022\2705\300\001\330\020\030\230\001\230\024\230T\240\023\240J\250d\260$\260g\270Q\270d\300!\330\020\027\220q\230\004\230F\240!\330\020\026\220a\220t\2306\240\021\330\020\026\220a\220t\2306\240\021\330\020\027\220q\230\001\230\027\240\004\240A\360\006\000\r\022\220\022\2202\220Q\330\014\021\220\022\2202\220Q\330\014\020\220\003\2203\220b\230\004\230C\230r\240\025\240d\250#\250S\260\002\260$\260c\270\022\2705\300\001\330\020\030\230\001\230\024\230T\240\023\240J\250d\260$\260g\270Q\270d\300!\330\020\027\220q\230\004\230F\240!\330\020\026\220a\220t\2306\240\021\330\020\026\220a\220t\2306\240\021\330\020""\027\220q\230\001\230\027\240\004\240A\360\006\000\r\022\220\022\2202\220Q\330\014\021\220\022\2202\220Q\330\014\020\220\003\2203\220b\230\004\230C\230r\240\025\240d\250#\250S\260\002\260$\260c\270\022\2705\300\001\330\020\030\230\001\230\024\230T\240\023\240J\250d\260$\260g\270Q\270d\300!\330\020\027\220q\230\004\230F\240!\330\020\026\220a\220t\2306\240\021\330\020\026\220a\220t\2306\240\021\330\020\027\220q\230\001\230\027\240\004\240A\360\006\000\r\022\220\022\2202\220Q\330\014\021\220\022\2202\220Q\330\014\020\220\003\2203\220b\230\004\230C\230r\240\025\240d\250#\250S\260\002\260$\260c\270\022\2705\300\001\330\020\030\230\001\230\024\230T\240\023\240J\250d\260$\260g\270Q\270d\300!\330\020\027\220q\230\004\230F\240!\330\020\026\220a\220t\2306\240\021\330\020\026\220a\220t\2306\240\021\330\020\027\220q\230\001\230\027\240\004\240A\360\006\000\005\017\210a\210q\220\001\340\004\007\200t\2101\330\010\017\210q\360\006\000\005\026\220Q\330\004\037\230q\330\004\037\230q\360\010\000\005\006\330\010\014\210G\2202\220X\230Q\340\010\013\2107\220#\220X\230T\240\027\250\003\2501\330\014\r\340\010\021\220\026\220q\230\010\240\001\330\010\021\220\026\220q\230\010\240\001\340\010\013\2107\220$\220b\230\004\230G\2404\240q\330\014\023\2201\340\010\021\220\021\330\010\021\220\021\360\006\000\005\t\210\010\220\001\330\004\013\2101";
-static const char __pyx_k_IV2V1A_t1_q_3aq_3auAWKq_3avS_1[] = "\200\001\360\024\000\005\r\210I\220V\2302\230V\2401\240A\330\004\007\200t\2101\330\010\017\210q\340\004\013\2103\210a\210q\330\004\013\2103\210a\210u\220A\220W\230K\240q\360\006\000\005\t\210\010\220\001\330\010\013\2103\210a\210v\220S\230\001\330\014\023\2201\360\006\000\005\020\210r\220\026\220r\230\026\230w\240f\250B\250a\330\004\023\2201\330\004\021\220\021\340\004\010\210\005\210U\220!\2201\330\010\014\210E\220\025\220a\220q\330\014\023\2205\230\001\230\022\2301\230A\330\014\017\210u\220C\220q\330\020\030\230\001\230\023\230E\240\021\330\021\026\220c\230\024\230S\240\005\240S\250\001\330\020\030\230\001\230\023\230E\240\021\330\021\026\220c\230\021\330\020\030\230\001\230\023\230E\240\021\330\020 \240\003\2401\330\021\026\220c\230\021\330\020\030\230\001\230\023\230E\240\021\330\020\036\230c\240\021\340\020\030\230\001\230\023\230E\240\021\340\004\007\200}\220C\220u\230C\230{\250#\250Q\330\010\017\210q\340\004\013\210:\220^\2401";
 static const char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
+static const char __pyx_k_8_uBb_5_E_U_F_D_2RyPVVWWX_j_0_g[] = "\200\001\3608\000\005\010\200u\210B\210b\220\003\2205\230\002\230\"\230E\240\034\250U\260\"\260F\270\"\270D\300\003\3002\300R\300y\320PV\320VW\320WX\330\010\016\210j\230\001\230\022\230>\250\027\3200^\320^g\320gm\320mn\320no\340\004 \240\014\250A\250Q\330\004 \240\014\250A\250Q\330\004\036\230j\250\001\250\021\330\004\036\230j\250\001\250\021\340\004\010\210\010\220\002\220\"\220C\220x\230s\240%\240s\250(\260\"\260B\260c\270\030\300\023\300E\310\021\330\010\016\210b\220\002\220#\220V\2303\230e\2403\240f\250B\250b\260\003\2606\270\023\270A\330\010\017\210q\340\004'\240x\250r\260\025\260b\270\001\330\004%\240V\2502\250U\260\"\260A\340\004\007\200w\210a\210{\230+\240S\250\007\250q\260\013\2701\330\010\017\210q\360\006\000\005\026\220R\220v\230Q\230e\2402\240V\2506\260\022\2601\330\004\024\220B\220f\230A\230U\240\"\240F\250&\260\002\260!\330\004*\250!\330\004'\240q\360\010\000\005\017\210a\210q\220\t\230\025\230b\240\001\330\004\016\210a\210q\220\007\220u\230B\230a\340\004%\240Y\250a\250y\270\t\300\027\310\001\360\006\000\005\034\2301\340\004\010\210\001\210\035\220a\330\004\t\210\021\210-\220q\330\004\013\2101\210A\210Y\220a\340\t\n\330\010\t\330\014\017\210~\230Q\230a\230q\330\020\023\220>\240\021\240!\2401\330\024\025\330\020\027\220q\330\020\032\230!\330\020\030\230\001\330\020\025\220X\230Q\330\020\025\220X\230Q\330\020\033\2301\340\014\022\220(\230!\2301\230A\330\014\017\210u\220A\220U\230\"\230A\330\020\021\330\014\021\220\021\220(\230!\330\014\017\210t\2203\220a\330\020\035\230Q\330\020\021\360\n\000\r\021\220\004\220C\220q\330\014\020\220\004\220B\220b\230\002\230!\330\014\027\220t\2301\230E\240\022\2401\360\006\000\r\020\210r\220\022\2202\220T\230\024\230W\240A\240[\260\004\260B\260a\330\020\033\2301\230A\230U\240!\2404\240q\250\004\250A\250T\260\021\260)\2701\270G\3004\300r\310\026\310q\330\034%\240R\240y\260\001\260\022\2602\260S\270\003\2707\300(\310)\320ST\340\014\017\210r\220\022\2205\230\002\230\"\230D\240\004\240G\2501\250K\260t\2702\270Q\330\020\033""\2301\230A\230U\240!\2404\240q\250\004\250A\250T\260\021\260)\2701\270G\3004\300r\310\026\310q\330\034%\240R\240y\260\001\260\022\2602\260S\270\003\2707\300(\310)\320ST\340\014\017\210r\220\022\2202\220T\230\024\230W\240A\240[\260\004\260B\260a\330\020\033\2301\230A\230U\240!\2404\240q\250\004\250A\250T\260\021\260)\2701\270G\3004\300r\310\023\310A\330\034%\240R\240y\260\001\260\023\260B\260b\270\003\2707\300(\310)\320ST\340\014\017\210r\220\022\2205\230\002\230\"\230D\240\004\240G\2501\250K\260t\2702\270Q\330\020\033\2301\230A\230U\240!\2404\240q\250\004\250A\250T\260\021\260)\2701\270G\3004\300r\310\023\310A\330\034%\240R\240y\260\001\260\023\260B\260b\270\003\2707\300(\310)\320ST\340\004\016\210a\210q\220\001\330\004\016\210a\210q\220\001\340\004\007\200t\2101\330\010\017\210q\360\006\000\005\017\210b\220\006\220b\230\004\230A\230Y\240b\250\003\2504\250v\260R\260q\330\004%\240Q\330\004\030\230\004\230A\230Q\330\004\"\240!\330\004\005\330\010\014\210A\210S\220\005\220U\230#\230Q\330\010\014\210A\210S\220\005\220U\230\"\230A\340\010\013\2102\210S\220\001\330\014\r\340\010\017\210y\230\001\230\026\230u\240A\240V\2502\250V\2601\330\010\r\210Q\340\004\013\2101";
+static const char __pyx_k_incompatveis_com_o_bitmap_de_pa[] = " incompat\303\255veis com o bitmap de paredes (";
+static const char __pyx_k_uBb_5_E_U_F_D_2RyPVVWWX_j_0_ggm[] = "\200\001\360@\001\000\005\010\200u\210B\210b\220\003\2205\230\002\230\"\230E\240\034\250U\260\"\260F\270\"\270D\300\003\3002\300R\300y\320PV\320VW\320WX\330\010\016\210j\230\001\230\022\230>\250\027\3200^\320^g\320gm\320mn\320no\340\004 \240\014\250A\250Q\330\004 \240\014\250A\250Q\330\004\036\230j\250\001\250\021\330\004\036\230j\250\001\250\021\360\006\000\005\t\210\010\220\002\220\"\220C\220x\230s\240%\240s\250(\260\"\260B\260c\270\030\300\023\300E\310\021\330\010\016\210b\220\002\220#\220V\2303\230e\2403\240f\250B\250b\260\003\2606\270\023\270A\330\010\017\210q\340\004'\240x\250r\260\025\260b\270\001\330\004%\240V\2502\250U\260\"\260A\340\004\007\200w\210a\210{\230+\240S\250\007\250q\260\013\2701\330\010\017\210q\360\006\000\005\010\200x\210s\220&\230\004\230H\240C\240q\330\010\017\210r\220\026\220q\230\001\230\021\230)\240;\250f\260B\260a\360\006\000\005)\250\005\250R\250q\340\004\r\210Q\210a\210y\230\017\240q\330\004\r\210Q\210a\210z\320\031)\250\021\360\010\000\005\026\220R\220v\230Q\230e\2402\240V\2506\260\022\2601\330\004*\250!\360\006\000\005\014\2101\210A\210W\220H\230A\330\004\t\210\021\320\n#\2401\330\004\013\2101\210A\210X\220X\230Q\330\004\t\210\021\320\n!\240\021\360\014\000\005\034\2301\330\004\034\230A\360\006\000\n\013\330\010\016\210d\220.\240\001\240\021\240'\250\030\260\024\260T\270\036\300q\310\001\310\030\320QR\330\014\017\210w\220f\230F\240\"\240G\2506\260\026\260s\270(\300&\310\006\310b\320PX\320X^\320^_\330\020\023\220<\230q\240\001\240\031\250!\2505\260\001\260\024\260[\300\006\300f\310A\330\024!\240\021\330\024\"\240!\330\024\025\330\021\035\230Q\230a\230z\250\021\250%\250q\260\004\260K\270v\300V\3101\330\020\035\230Q\330\020\021\360\006\000\005\017\210a\210q\220\007\220q\330\004\016\210a\210q\220\010\230\001\340\004\007\200t\2101\330\010\017\210q\360\010\000\005*\250\024\250Q\250f\3204E\300T\310\021\310!\330\004*\250$\250a\250v\3205F\300d\310!\3101\340\004\"\240!\330\004#\2401\360\006\000\005\014\2101\330\004\n\210%\210s\220!\330\010""\017\210y\230\001\230\026\230u\240A\240V\2502\250V\2601\330\010\027\220q\330\004\013\2101\330\004\n\210%\210s\220!\330\010\017\210y\230\001\230\026\230u\240A\240V\2503\320.>\270a\330\010\030\230\001\360\006\000\005\017\210b\220\006\220b\230\014\240B\240n\260D\270\006\270b\300\001\330\004%\240Q\330\004\030\230\014\240B\240a\330\004\013\2101\330\004\005\330\010\014\210A\210S\220\005\220U\230#\230Q\330\010\014\210A\210S\220\005\220U\230\"\230A\340\010\013\2102\210S\220\001\330\014\r\340\010\017\210y\230\001\230\026\230u\240A\240V\2502\250V\2601\330\010\r\210Q\340\004\010\210\001\330\004\013\2101\330\004\005\330\010\014\210A\210S\220\005\220U\230#\230Q\330\010\014\210A\210S\220\005\220U\230\"\230A\340\010\013\2105\220\003\2201\330\014\r\340\010\017\210y\230\001\230\026\230u\240A\240V\2503\320.>\270a\330\010\r\210Q\340\004\013\2101";
 static const char __pyx_k_All_dimensions_preceding_dimensi[] = "All dimensions preceding dimension %d must be indexed and not sliced";
 static const char __pyx_k_Buffer_view_does_not_expose_stri[] = "Buffer view does not expose strides";
 static const char __pyx_k_Can_only_create_a_buffer_that_is[] = "Can only create a buffer that is contiguous in memory.";
@@ -3514,8 +3515,8 @@ static void __pyx_memoryviewslice___pyx_pf_15View_dot_MemoryView_16_memoryviewsl
 static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_15View_dot_MemoryView___pyx_unpickle_Enum(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_14maze_solver_cy_find_shortest_path_cython_optimized(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_int_grid, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords); /* proto */
-static PyObject *__pyx_pf_14maze_solver_cy_2parse_maze_text(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_maze_text); /* proto */
+static PyObject *__pyx_pf_14maze_solver_cy_find_shortest_path_cython_optimized(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords); /* proto */
+static PyObject *__pyx_pf_14maze_solver_cy_2find_shortest_path_astar(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords); /* proto */
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -3586,9 +3587,10 @@ typedef struct {
   PyObject *__pyx_slice[1];
   PyObject *__pyx_tuple[2];
   PyObject *__pyx_codeobj_tab[2];
-  PyObject *__pyx_string_tab[150];
+  PyObject *__pyx_string_tab[141];
   PyObject *__pyx_int_0;
   PyObject *__pyx_int_1;
+  PyObject *__pyx_int_2;
   PyObject *__pyx_int_112105877;
   PyObject *__pyx_int_136983863;
   PyObject *__pyx_int_184977713;
@@ -3637,8 +3639,8 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u_Cannot_create_writable_memory_vi __pyx_string_tab[7]
 #define __pyx_kp_u_Cannot_index_with_type __pyx_string_tab[8]
 #define __pyx_kp_u_Cannot_transpose_memoryview_with __pyx_string_tab[9]
-#define __pyx_kp_u_Dimension_d_is_not_direct __pyx_string_tab[10]
-#define __pyx_n_u_E __pyx_string_tab[11]
+#define __pyx_kp_u_Dimenses __pyx_string_tab[10]
+#define __pyx_kp_u_Dimension_d_is_not_direct __pyx_string_tab[11]
 #define __pyx_n_u_Ellipsis __pyx_string_tab[12]
 #define __pyx_kp_u_Empty_shape_tuple_for_cython_arr __pyx_string_tab[13]
 #define __pyx_n_u_ImportError __pyx_string_tab[14]
@@ -3654,129 +3656,120 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_b_O __pyx_string_tab[24]
 #define __pyx_kp_u_Out_of_bounds_on_buffer_access_a __pyx_string_tab[25]
 #define __pyx_n_u_PickleError __pyx_string_tab[26]
-#define __pyx_n_u_S __pyx_string_tab[27]
-#define __pyx_n_u_Sequence __pyx_string_tab[28]
-#define __pyx_kp_u_Step_may_not_be_zero_axis_d __pyx_string_tab[29]
-#define __pyx_n_u_TypeError __pyx_string_tab[30]
-#define __pyx_kp_u_Unable_to_convert_item_to_object __pyx_string_tab[31]
-#define __pyx_n_u_ValueError __pyx_string_tab[32]
-#define __pyx_n_u_View_MemoryView __pyx_string_tab[33]
-#define __pyx_kp_u__10 __pyx_string_tab[34]
-#define __pyx_kp_u__2 __pyx_string_tab[35]
-#define __pyx_kp_u__3 __pyx_string_tab[36]
-#define __pyx_kp_u__4 __pyx_string_tab[37]
-#define __pyx_kp_u__5 __pyx_string_tab[38]
-#define __pyx_kp_u__6 __pyx_string_tab[39]
-#define __pyx_kp_u__7 __pyx_string_tab[40]
-#define __pyx_kp_u__8 __pyx_string_tab[41]
-#define __pyx_kp_u__9 __pyx_string_tab[42]
-#define __pyx_n_u_abc __pyx_string_tab[43]
-#define __pyx_kp_u_add_note __pyx_string_tab[44]
-#define __pyx_n_u_allocate_buffer __pyx_string_tab[45]
-#define __pyx_kp_u_and __pyx_string_tab[46]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[47]
-#define __pyx_kp_u_at_0x __pyx_string_tab[48]
-#define __pyx_n_u_base __pyx_string_tab[49]
-#define __pyx_n_u_c __pyx_string_tab[50]
-#define __pyx_n_u_char __pyx_string_tab[51]
-#define __pyx_n_u_class __pyx_string_tab[52]
-#define __pyx_n_u_class_getitem __pyx_string_tab[53]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[54]
-#define __pyx_kp_u_collections_abc __pyx_string_tab[55]
-#define __pyx_n_u_cols __pyx_string_tab[56]
-#define __pyx_kp_u_contiguous_and_direct __pyx_string_tab[57]
-#define __pyx_kp_u_contiguous_and_indirect __pyx_string_tab[58]
-#define __pyx_n_u_count __pyx_string_tab[59]
-#define __pyx_n_u_dict __pyx_string_tab[60]
-#define __pyx_kp_u_disable __pyx_string_tab[61]
-#define __pyx_n_u_dtype __pyx_string_tab[62]
-#define __pyx_n_u_dtype_is_object __pyx_string_tab[63]
-#define __pyx_kp_u_enable __pyx_string_tab[64]
-#define __pyx_n_u_encode __pyx_string_tab[65]
-#define __pyx_n_u_end_coords __pyx_string_tab[66]
-#define __pyx_n_u_enumerate __pyx_string_tab[67]
-#define __pyx_n_u_error __pyx_string_tab[68]
-#define __pyx_n_u_find_shortest_path_cython_optimi __pyx_string_tab[69]
-#define __pyx_n_u_flags __pyx_string_tab[70]
-#define __pyx_n_u_format __pyx_string_tab[71]
-#define __pyx_n_u_fortran __pyx_string_tab[72]
-#define __pyx_n_u_full __pyx_string_tab[73]
-#define __pyx_n_u_func __pyx_string_tab[74]
-#define __pyx_kp_u_gc __pyx_string_tab[75]
-#define __pyx_n_u_getstate __pyx_string_tab[76]
-#define __pyx_kp_u_got __pyx_string_tab[77]
-#define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_string_tab[78]
-#define __pyx_n_u_id __pyx_string_tab[79]
-#define __pyx_n_u_import __pyx_string_tab[80]
-#define __pyx_n_u_index __pyx_string_tab[81]
-#define __pyx_n_u_initializing __pyx_string_tab[82]
-#define __pyx_n_u_int32 __pyx_string_tab[83]
-#define __pyx_n_u_int_grid __pyx_string_tab[84]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[85]
-#define __pyx_kp_u_isenabled __pyx_string_tab[86]
-#define __pyx_n_u_itemsize __pyx_string_tab[87]
-#define __pyx_kp_u_itemsize_0_for_cython_array __pyx_string_tab[88]
-#define __pyx_n_u_line __pyx_string_tab[89]
-#define __pyx_n_u_lines __pyx_string_tab[90]
-#define __pyx_n_u_main __pyx_string_tab[91]
-#define __pyx_n_u_maze_solver_cy __pyx_string_tab[92]
-#define __pyx_kp_u_maze_solver_cy_pyx __pyx_string_tab[93]
-#define __pyx_n_u_maze_text __pyx_string_tab[94]
-#define __pyx_n_u_memview __pyx_string_tab[95]
-#define __pyx_n_u_mode __pyx_string_tab[96]
-#define __pyx_n_u_module __pyx_string_tab[97]
-#define __pyx_n_u_name __pyx_string_tab[98]
-#define __pyx_n_u_name_2 __pyx_string_tab[99]
-#define __pyx_n_u_ndim __pyx_string_tab[100]
-#define __pyx_n_u_new __pyx_string_tab[101]
-#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[102]
-#define __pyx_n_u_np __pyx_string_tab[103]
-#define __pyx_n_u_numpy __pyx_string_tab[104]
-#define __pyx_kp_u_numpy__core_multiarray_failed_to __pyx_string_tab[105]
-#define __pyx_kp_u_numpy__core_umath_failed_to_impo __pyx_string_tab[106]
-#define __pyx_n_u_obj __pyx_string_tab[107]
-#define __pyx_kp_u_object __pyx_string_tab[108]
-#define __pyx_n_u_pack __pyx_string_tab[109]
-#define __pyx_n_u_parse_maze_text __pyx_string_tab[110]
-#define __pyx_n_u_pickle __pyx_string_tab[111]
-#define __pyx_n_u_pop __pyx_string_tab[112]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[113]
-#define __pyx_n_u_pyx_state __pyx_string_tab[114]
-#define __pyx_n_u_pyx_type __pyx_string_tab[115]
-#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[116]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[117]
-#define __pyx_n_u_qualname __pyx_string_tab[118]
-#define __pyx_n_u_r __pyx_string_tab[119]
-#define __pyx_n_u_range __pyx_string_tab[120]
-#define __pyx_n_u_reduce __pyx_string_tab[121]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[122]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[123]
-#define __pyx_n_u_register __pyx_string_tab[124]
-#define __pyx_n_u_rows __pyx_string_tab[125]
-#define __pyx_n_u_set_name __pyx_string_tab[126]
-#define __pyx_n_u_setstate __pyx_string_tab[127]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[128]
-#define __pyx_n_u_shape __pyx_string_tab[129]
-#define __pyx_n_u_size __pyx_string_tab[130]
-#define __pyx_n_u_spec __pyx_string_tab[131]
-#define __pyx_n_u_split __pyx_string_tab[132]
-#define __pyx_n_u_start __pyx_string_tab[133]
-#define __pyx_n_u_start_coords __pyx_string_tab[134]
-#define __pyx_n_u_step __pyx_string_tab[135]
-#define __pyx_n_u_stop __pyx_string_tab[136]
-#define __pyx_kp_u_strided_and_direct __pyx_string_tab[137]
-#define __pyx_kp_u_strided_and_direct_or_indirect __pyx_string_tab[138]
-#define __pyx_kp_u_strided_and_indirect __pyx_string_tab[139]
-#define __pyx_n_u_strip __pyx_string_tab[140]
-#define __pyx_n_u_struct __pyx_string_tab[141]
-#define __pyx_n_u_test __pyx_string_tab[142]
-#define __pyx_n_u_uint8 __pyx_string_tab[143]
-#define __pyx_kp_u_unable_to_allocate_array_data __pyx_string_tab[144]
-#define __pyx_kp_u_unable_to_allocate_shape_and_str __pyx_string_tab[145]
-#define __pyx_n_u_unpack __pyx_string_tab[146]
-#define __pyx_n_u_update __pyx_string_tab[147]
-#define __pyx_n_u_x __pyx_string_tab[148]
-#define __pyx_n_u_zeros __pyx_string_tab[149]
+#define __pyx_n_u_Sequence __pyx_string_tab[27]
+#define __pyx_kp_u_Step_may_not_be_zero_axis_d __pyx_string_tab[28]
+#define __pyx_n_u_TypeError __pyx_string_tab[29]
+#define __pyx_kp_u_Unable_to_convert_item_to_object __pyx_string_tab[30]
+#define __pyx_n_u_ValueError __pyx_string_tab[31]
+#define __pyx_n_u_View_MemoryView __pyx_string_tab[32]
+#define __pyx_kp_u__2 __pyx_string_tab[33]
+#define __pyx_kp_u__3 __pyx_string_tab[34]
+#define __pyx_kp_u__4 __pyx_string_tab[35]
+#define __pyx_kp_u__5 __pyx_string_tab[36]
+#define __pyx_kp_u__6 __pyx_string_tab[37]
+#define __pyx_n_u_abc __pyx_string_tab[38]
+#define __pyx_kp_u_add_note __pyx_string_tab[39]
+#define __pyx_n_u_allocate_buffer __pyx_string_tab[40]
+#define __pyx_kp_u_and __pyx_string_tab[41]
+#define __pyx_n_u_array __pyx_string_tab[42]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[43]
+#define __pyx_kp_u_at_0x __pyx_string_tab[44]
+#define __pyx_n_u_base __pyx_string_tab[45]
+#define __pyx_n_u_c __pyx_string_tab[46]
+#define __pyx_n_u_class __pyx_string_tab[47]
+#define __pyx_n_u_class_getitem __pyx_string_tab[48]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[49]
+#define __pyx_kp_u_collections_abc __pyx_string_tab[50]
+#define __pyx_n_u_cols __pyx_string_tab[51]
+#define __pyx_kp_u_contiguous_and_direct __pyx_string_tab[52]
+#define __pyx_kp_u_contiguous_and_indirect __pyx_string_tab[53]
+#define __pyx_n_u_count __pyx_string_tab[54]
+#define __pyx_n_u_dict __pyx_string_tab[55]
+#define __pyx_kp_u_disable __pyx_string_tab[56]
+#define __pyx_n_u_dtype __pyx_string_tab[57]
+#define __pyx_n_u_dtype_is_object __pyx_string_tab[58]
+#define __pyx_n_u_empty __pyx_string_tab[59]
+#define __pyx_kp_u_enable __pyx_string_tab[60]
+#define __pyx_n_u_encode __pyx_string_tab[61]
+#define __pyx_n_u_end_coords __pyx_string_tab[62]
+#define __pyx_n_u_enumerate __pyx_string_tab[63]
+#define __pyx_n_u_error __pyx_string_tab[64]
+#define __pyx_n_u_find_shortest_path_astar __pyx_string_tab[65]
+#define __pyx_n_u_find_shortest_path_cython_optimi __pyx_string_tab[66]
+#define __pyx_n_u_flags __pyx_string_tab[67]
+#define __pyx_n_u_format __pyx_string_tab[68]
+#define __pyx_n_u_fortran __pyx_string_tab[69]
+#define __pyx_n_u_func __pyx_string_tab[70]
+#define __pyx_kp_u_gc __pyx_string_tab[71]
+#define __pyx_n_u_getstate __pyx_string_tab[72]
+#define __pyx_kp_u_got __pyx_string_tab[73]
+#define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_string_tab[74]
+#define __pyx_n_u_id __pyx_string_tab[75]
+#define __pyx_n_u_import __pyx_string_tab[76]
+#define __pyx_kp_u_incompatveis_com_o_bitmap_de_pa __pyx_string_tab[77]
+#define __pyx_n_u_index __pyx_string_tab[78]
+#define __pyx_n_u_initializing __pyx_string_tab[79]
+#define __pyx_n_u_int32 __pyx_string_tab[80]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[81]
+#define __pyx_kp_u_isenabled __pyx_string_tab[82]
+#define __pyx_n_u_itemsize __pyx_string_tab[83]
+#define __pyx_kp_u_itemsize_0_for_cython_array __pyx_string_tab[84]
+#define __pyx_n_u_main __pyx_string_tab[85]
+#define __pyx_n_u_maze_solver_cy __pyx_string_tab[86]
+#define __pyx_kp_u_maze_solver_cy_pyx __pyx_string_tab[87]
+#define __pyx_n_u_memview __pyx_string_tab[88]
+#define __pyx_n_u_mode __pyx_string_tab[89]
+#define __pyx_n_u_module __pyx_string_tab[90]
+#define __pyx_n_u_name __pyx_string_tab[91]
+#define __pyx_n_u_name_2 __pyx_string_tab[92]
+#define __pyx_n_u_ndim __pyx_string_tab[93]
+#define __pyx_n_u_new __pyx_string_tab[94]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[95]
+#define __pyx_n_u_np __pyx_string_tab[96]
+#define __pyx_n_u_numpy __pyx_string_tab[97]
+#define __pyx_kp_u_numpy__core_multiarray_failed_to __pyx_string_tab[98]
+#define __pyx_kp_u_numpy__core_umath_failed_to_impo __pyx_string_tab[99]
+#define __pyx_n_u_obj __pyx_string_tab[100]
+#define __pyx_kp_u_object __pyx_string_tab[101]
+#define __pyx_n_u_pack __pyx_string_tab[102]
+#define __pyx_kp_u_palavras __pyx_string_tab[103]
+#define __pyx_n_u_pickle __pyx_string_tab[104]
+#define __pyx_n_u_pop __pyx_string_tab[105]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[106]
+#define __pyx_n_u_pyx_state __pyx_string_tab[107]
+#define __pyx_n_u_pyx_type __pyx_string_tab[108]
+#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[109]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[110]
+#define __pyx_n_u_qualname __pyx_string_tab[111]
+#define __pyx_n_u_range __pyx_string_tab[112]
+#define __pyx_n_u_reduce __pyx_string_tab[113]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[114]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[115]
+#define __pyx_n_u_register __pyx_string_tab[116]
+#define __pyx_n_u_rows __pyx_string_tab[117]
+#define __pyx_n_u_set_name __pyx_string_tab[118]
+#define __pyx_n_u_setstate __pyx_string_tab[119]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[120]
+#define __pyx_n_u_shape __pyx_string_tab[121]
+#define __pyx_n_u_size __pyx_string_tab[122]
+#define __pyx_n_u_spec __pyx_string_tab[123]
+#define __pyx_n_u_start __pyx_string_tab[124]
+#define __pyx_n_u_start_coords __pyx_string_tab[125]
+#define __pyx_n_u_step __pyx_string_tab[126]
+#define __pyx_n_u_stop __pyx_string_tab[127]
+#define __pyx_kp_u_strided_and_direct __pyx_string_tab[128]
+#define __pyx_kp_u_strided_and_direct_or_indirect __pyx_string_tab[129]
+#define __pyx_kp_u_strided_and_indirect __pyx_string_tab[130]
+#define __pyx_n_u_struct __pyx_string_tab[131]
+#define __pyx_n_u_test __pyx_string_tab[132]
+#define __pyx_n_u_uint8 __pyx_string_tab[133]
+#define __pyx_kp_u_unable_to_allocate_array_data __pyx_string_tab[134]
+#define __pyx_kp_u_unable_to_allocate_shape_and_str __pyx_string_tab[135]
+#define __pyx_n_u_unpack __pyx_string_tab[136]
+#define __pyx_n_u_update __pyx_string_tab[137]
+#define __pyx_n_u_wall_bits __pyx_string_tab[138]
+#define __pyx_n_u_x __pyx_string_tab[139]
+#define __pyx_n_u_zeros __pyx_string_tab[140]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -3824,9 +3817,10 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_slice[i]); }
   for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
   for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<150; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<141; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   Py_CLEAR(clear_module_state->__pyx_int_0);
   Py_CLEAR(clear_module_state->__pyx_int_1);
+  Py_CLEAR(clear_module_state->__pyx_int_2);
   Py_CLEAR(clear_module_state->__pyx_int_112105877);
   Py_CLEAR(clear_module_state->__pyx_int_136983863);
   Py_CLEAR(clear_module_state->__pyx_int_184977713);
@@ -3878,9 +3872,10 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_slice[i]); }
   for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
   for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<150; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<141; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_0);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_1);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_2);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_112105877);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_136983863);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_184977713);
@@ -17252,7 +17247,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":285
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":285
  *         cdef int type_num
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17263,7 +17258,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":287
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":287
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:
  *             return PyDataType_ELSIZE(self)             # <<<<<<<<<<<<<<
@@ -17273,7 +17268,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   __pyx_r = PyDataType_ELSIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":285
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":285
  *         cdef int type_num
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17286,7 +17281,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":289
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":289
  *             return PyDataType_ELSIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17297,7 +17292,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":291
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":291
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:
  *             return PyDataType_ALIGNMENT(self)             # <<<<<<<<<<<<<<
@@ -17307,7 +17302,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   __pyx_r = PyDataType_ALIGNMENT(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":289
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":289
  *             return PyDataType_ELSIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17320,7 +17315,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":295
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":295
  *         # Use fields/names with care as they may be NULL.  You must check
  *         # for this using PyDataType_HASFIELDS.
  *         @property             # <<<<<<<<<<<<<<
@@ -17334,7 +17329,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("fields", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":297
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":297
  *         @property
  *         cdef inline object fields(self):
  *             return <object>PyDataType_FIELDS(self)             # <<<<<<<<<<<<<<
@@ -17347,7 +17342,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   __pyx_r = ((PyObject *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":295
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":295
  *         # Use fields/names with care as they may be NULL.  You must check
  *         # for this using PyDataType_HASFIELDS.
  *         @property             # <<<<<<<<<<<<<<
@@ -17362,7 +17357,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":299
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":299
  *             return <object>PyDataType_FIELDS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17376,7 +17371,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("names", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":301
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":301
  *         @property
  *         cdef inline tuple names(self):
  *             return <tuple>PyDataType_NAMES(self)             # <<<<<<<<<<<<<<
@@ -17389,7 +17384,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   __pyx_r = ((PyObject*)__pyx_t_1);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":299
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":299
  *             return <object>PyDataType_FIELDS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17404,7 +17399,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":306
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":306
  *         # valid (the pointer can be NULL). Most users should access
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property             # <<<<<<<<<<<<<<
@@ -17415,7 +17410,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
 static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarray(PyArray_Descr *__pyx_v_self) {
   PyArray_ArrayDescr *__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":308
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":308
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:
  *             return PyDataType_SUBARRAY(self)             # <<<<<<<<<<<<<<
@@ -17425,7 +17420,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   __pyx_r = PyDataType_SUBARRAY(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":306
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":306
  *         # valid (the pointer can be NULL). Most users should access
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property             # <<<<<<<<<<<<<<
@@ -17438,7 +17433,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":310
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":310
  *             return PyDataType_SUBARRAY(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17449,7 +17444,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
 static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr *__pyx_v_self) {
   npy_uint64 __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":313
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":313
  *         cdef inline npy_uint64 flags(self) noexcept nogil:
  *             """The data types flags."""
  *             return PyDataType_FLAGS(self)             # <<<<<<<<<<<<<<
@@ -17459,7 +17454,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   __pyx_r = PyDataType_FLAGS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":310
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":310
  *             return PyDataType_SUBARRAY(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17472,7 +17467,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":322
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":322
  *     ctypedef class numpy.broadcast [object PyArrayMultiIterObject, check_size ignore]:
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17483,7 +17478,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":325
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":325
  *         cdef inline int numiter(self) noexcept nogil:
  *             """The number of arrays that need to be broadcast to the same shape."""
  *             return PyArray_MultiIter_NUMITER(self)             # <<<<<<<<<<<<<<
@@ -17493,7 +17488,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   __pyx_r = PyArray_MultiIter_NUMITER(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":322
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":322
  *     ctypedef class numpy.broadcast [object PyArrayMultiIterObject, check_size ignore]:
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17506,7 +17501,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":327
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":327
  *             return PyArray_MultiIter_NUMITER(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17517,7 +17512,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":330
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":330
  *         cdef inline npy_intp size(self) noexcept nogil:
  *             """The total broadcasted size."""
  *             return PyArray_MultiIter_SIZE(self)             # <<<<<<<<<<<<<<
@@ -17527,7 +17522,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":327
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":327
  *             return PyArray_MultiIter_NUMITER(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17540,7 +17535,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":332
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":332
  *             return PyArray_MultiIter_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17551,7 +17546,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":335
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":335
  *         cdef inline npy_intp index(self) noexcept nogil:
  *             """The current (1-d) index into the broadcasted result."""
  *             return PyArray_MultiIter_INDEX(self)             # <<<<<<<<<<<<<<
@@ -17561,7 +17556,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   __pyx_r = PyArray_MultiIter_INDEX(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":332
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":332
  *             return PyArray_MultiIter_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17574,7 +17569,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":337
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":337
  *             return PyArray_MultiIter_INDEX(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17585,7 +17580,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":340
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":340
  *         cdef inline int nd(self) noexcept nogil:
  *             """The number of dimensions in the broadcasted result."""
  *             return PyArray_MultiIter_NDIM(self)             # <<<<<<<<<<<<<<
@@ -17595,7 +17590,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   __pyx_r = PyArray_MultiIter_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":337
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":337
  *             return PyArray_MultiIter_INDEX(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17608,7 +17603,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":342
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":342
  *             return PyArray_MultiIter_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17619,7 +17614,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":345
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":345
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:
  *             """The shape of the broadcasted result."""
  *             return PyArray_MultiIter_DIMS(self)             # <<<<<<<<<<<<<<
@@ -17629,7 +17624,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   __pyx_r = PyArray_MultiIter_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":342
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":342
  *             return PyArray_MultiIter_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17642,7 +17637,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":347
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":347
  *             return PyArray_MultiIter_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17653,7 +17648,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
 static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiIterObject *__pyx_v_self) {
   void **__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":351
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":351
  *             """An array of iterator objects that holds the iterators for the arrays to be broadcast together.
  *             On return, the iterators are adjusted for broadcasting."""
  *             return PyArray_MultiIter_ITERS(self)             # <<<<<<<<<<<<<<
@@ -17663,7 +17658,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_ITERS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":347
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":347
  *             return PyArray_MultiIter_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17676,7 +17671,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":365
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":365
  *         # Instead, we use properties that map to the corresponding C-API functions.
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17687,7 +17682,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
 static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject *__pyx_v_self) {
   PyObject *__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":369
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":369
  *             """Returns a borrowed reference to the object owning the data/memory.
  *             """
  *             return PyArray_BASE(self)             # <<<<<<<<<<<<<<
@@ -17697,7 +17692,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   __pyx_r = PyArray_BASE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":365
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":365
  *         # Instead, we use properties that map to the corresponding C-API functions.
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17710,7 +17705,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":371
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":371
  *             return PyArray_BASE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17724,7 +17719,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   PyArray_Descr *__pyx_t_1;
   __Pyx_RefNannySetupContext("descr", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":375
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":375
  *             """Returns an owned reference to the dtype of the array.
  *             """
  *             return <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
@@ -17737,7 +17732,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   __pyx_r = ((PyArray_Descr *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":371
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":371
  *             return PyArray_BASE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17752,7 +17747,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":377
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":377
  *             return <dtype>PyArray_DESCR(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17763,7 +17758,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
 static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":381
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":381
  *             """Returns the number of dimensions in the array.
  *             """
  *             return PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -17773,7 +17768,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   __pyx_r = PyArray_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":377
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":377
  *             return <dtype>PyArray_DESCR(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17786,7 +17781,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":383
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":383
  *             return PyArray_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17797,7 +17792,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":389
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":389
  *             Can return NULL for 0-dimensional arrays.
  *             """
  *             return PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -17807,7 +17802,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   __pyx_r = PyArray_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":383
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":383
  *             return PyArray_NDIM(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17820,7 +17815,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":391
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":391
  *             return PyArray_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17831,7 +17826,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":396
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":396
  *             The number of elements matches the number of dimensions of the array (ndim).
  *             """
  *             return PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -17841,7 +17836,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   __pyx_r = PyArray_STRIDES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":391
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":391
  *             return PyArray_DIMS(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17854,7 +17849,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":398
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":398
  *             return PyArray_STRIDES(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17865,7 +17860,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":402
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":402
  *             """Returns the total size (in number of elements) of the array.
  *             """
  *             return PyArray_SIZE(self)             # <<<<<<<<<<<<<<
@@ -17875,7 +17870,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   __pyx_r = PyArray_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":398
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":398
  *             return PyArray_STRIDES(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17888,7 +17883,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":404
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":404
  *             return PyArray_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17899,7 +17894,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
 static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__pyx_v_self) {
   char *__pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":411
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":411
  *             of `PyArray_DATA()` instead, which returns a 'void*'.
  *             """
  *             return PyArray_BYTES(self)             # <<<<<<<<<<<<<<
@@ -17909,7 +17904,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   __pyx_r = PyArray_BYTES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":404
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":404
  *             return PyArray_SIZE(self)
  * 
  *         @property             # <<<<<<<<<<<<<<
@@ -17922,7 +17917,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":807
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":807
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -17939,7 +17934,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":808
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":808
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -17953,7 +17948,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":807
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":807
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -17972,7 +17967,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":810
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":810
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -17989,7 +17984,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":811
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":811
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -18003,7 +17998,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":810
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":810
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -18022,7 +18017,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":813
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":813
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -18039,7 +18034,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":814
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":814
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -18053,7 +18048,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":813
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":813
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -18072,7 +18067,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":816
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":816
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -18089,7 +18084,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":817
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":817
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -18103,7 +18098,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":816
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":816
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -18122,7 +18117,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":819
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":819
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -18139,7 +18134,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":820
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":820
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -18153,7 +18148,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":819
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":819
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -18172,7 +18167,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":822
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":822
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -18187,7 +18182,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   PyObject *__pyx_t_2;
   __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":823
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":823
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -18197,7 +18192,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   __pyx_t_1 = PyDataType_HASSUBARRAY(__pyx_v_d);
   if (__pyx_t_1) {
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":824
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":824
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):
  *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
@@ -18210,7 +18205,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     __pyx_r = ((PyObject*)__pyx_t_2);
     goto __pyx_L0;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":823
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":823
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -18219,7 +18214,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
 */
   }
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":826
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":826
  *         return <tuple>d.subarray.shape
  *     else:
  *         return ()             # <<<<<<<<<<<<<<
@@ -18233,7 +18228,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     goto __pyx_L0;
   }
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":822
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":822
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -18248,7 +18243,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1010
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1010
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -18262,7 +18257,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1011
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1011
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
@@ -18271,7 +18266,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
 */
   Py_INCREF(__pyx_v_base);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1012
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1012
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!
  *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
@@ -18280,7 +18275,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
 */
   __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 1012, __pyx_L1_error)
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1010
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1010
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -18295,7 +18290,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_L0:;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1014
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -18310,7 +18305,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1015
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1015
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
@@ -18319,7 +18314,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 */
   __pyx_v_base = PyArray_BASE(__pyx_v_arr);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1016
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1016
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -18329,7 +18324,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_base == NULL);
   if (__pyx_t_1) {
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1017
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1017
  *     base = PyArray_BASE(arr)
  *     if base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -18340,7 +18335,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1016
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1016
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -18349,7 +18344,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 */
   }
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1018
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1018
  *     if base is NULL:
  *         return None
  *     return <object>base             # <<<<<<<<<<<<<<
@@ -18361,7 +18356,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_r = ((PyObject *)__pyx_v_base);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1014
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -18376,7 +18371,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1022
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1022
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -18403,7 +18398,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_array", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1023
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1023
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18419,7 +18414,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1024
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1024
  * cdef inline int import_array() except -1:
  *     try:
  *         __pyx_import_array()             # <<<<<<<<<<<<<<
@@ -18428,7 +18423,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
 */
       __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1024, __pyx_L3_error)
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1023
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1023
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18442,7 +18437,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1025
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1025
  *     try:
  *         __pyx_import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -18457,7 +18452,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1026
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  *         __pyx_import_array()
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")             # <<<<<<<<<<<<<<
@@ -18482,7 +18477,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     }
     goto __pyx_L5_except_error;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1023
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1023
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18498,7 +18493,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L8_try_end:;
   }
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1022
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1022
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -18523,7 +18518,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1028
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1028
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -18550,7 +18545,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_umath", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1029
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1029
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18566,7 +18561,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1030
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1030
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
@@ -18575,7 +18570,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
 */
       __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1030, __pyx_L3_error)
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1029
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1029
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18589,7 +18584,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1031
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1031
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -18604,7 +18599,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1032
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1032
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -18629,7 +18624,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     }
     goto __pyx_L5_except_error;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1029
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1029
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18645,7 +18640,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L8_try_end:;
   }
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1028
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1028
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -18670,7 +18665,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1034
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1034
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -18697,7 +18692,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_ufunc", 0);
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1035
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1035
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18713,7 +18708,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1036
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1036
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
@@ -18722,7 +18717,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
 */
       __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1036, __pyx_L3_error)
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1035
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1035
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18736,7 +18731,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1037
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1037
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -18751,7 +18746,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1038
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1038
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
@@ -18776,7 +18771,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     }
     goto __pyx_L5_except_error;
 
-    /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1035
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1035
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -18792,7 +18787,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L8_try_end:;
   }
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1034
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1034
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -18817,7 +18812,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1041
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18828,7 +18823,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
 static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1053
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1053
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
@@ -18838,7 +18833,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1041
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18851,7 +18846,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1056
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18862,7 +18857,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
 static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1068
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1068
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
@@ -18872,7 +18867,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1056
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -18885,7 +18880,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1071
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1071
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18896,7 +18891,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
 static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
   npy_datetime __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1078
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1078
  *     also needed.  That can be found using `get_datetime64_unit`.
  *     """
  *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -18906,7 +18901,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1071
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1071
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18919,7 +18914,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1081
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1081
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18930,7 +18925,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
 static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
   npy_timedelta __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1085
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1085
  *     returns the int64 value underlying scalar numpy timedelta64 object
  *     """
  *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -18940,7 +18935,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1081
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1081
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18953,7 +18948,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   return __pyx_r;
 }
 
-/* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1088
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1088
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18964,7 +18959,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
 static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
   NPY_DATETIMEUNIT __pyx_r;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1092
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1092
  *     returns the unit part of the dtype for a numpy datetime64 object.
  *     """
  *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
@@ -18974,7 +18969,7 @@ static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObjec
   __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
   goto __pyx_L0;
 
-  /* ".venv/lib/python3.9/site-packages/numpy/__init__.cython-30.pxd":1088
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1088
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18987,186 +18982,131 @@ static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObjec
   return __pyx_r;
 }
 
-/* "maze_solver_cy.pyx":33
- *     queue_index_t capacity
+/* "maze_solver_cy.pyx":28
+ *     queue_index_t tail
  * 
- * cdef inline void init_queue(CircularQueue* q, queue_index_t capacity) nogil:             # <<<<<<<<<<<<<<
- *     """Inicializa a queue circular com capacidade especificada"""
- *     q.data_r = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
+ * cdef inline void init_queue(CellQueue* q, queue_index_t capacity) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Inicializa a queue com capacidade especificada"""
+ *     q.data = <cell_index_type_t*>malloc(capacity * sizeof(cell_index_type_t))
 */
 
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_init_queue(struct __pyx_t_14maze_solver_cy_CircularQueue *__pyx_v_q, __pyx_t_14maze_solver_cy_queue_index_t __pyx_v_capacity) {
-
-  /* "maze_solver_cy.pyx":35
- * cdef inline void init_queue(CircularQueue* q, queue_index_t capacity) nogil:
- *     """Inicializa a queue circular com capacidade especificada"""
- *     q.data_r = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))             # <<<<<<<<<<<<<<
- *     q.data_c = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
- *     q.head = 0
-*/
-  __pyx_v_q->data_r = ((__pyx_t_14maze_solver_cy_coord_type_t *)malloc((__pyx_v_capacity * (sizeof(__pyx_t_14maze_solver_cy_coord_type_t)))));
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_init_queue(struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_q, __pyx_t_14maze_solver_cy_queue_index_t __pyx_v_capacity) {
 
-  /* "maze_solver_cy.pyx":36
- *     """Inicializa a queue circular com capacidade especificada"""
- *     q.data_r = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
- *     q.data_c = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":30
+ * cdef inline void init_queue(CellQueue* q, queue_index_t capacity) noexcept nogil:
+ *     """Inicializa a queue com capacidade especificada"""
+ *     q.data = <cell_index_type_t*>malloc(capacity * sizeof(cell_index_type_t))             # <<<<<<<<<<<<<<
  *     q.head = 0
  *     q.tail = 0
 */
-  __pyx_v_q->data_c = ((__pyx_t_14maze_solver_cy_coord_type_t *)malloc((__pyx_v_capacity * (sizeof(__pyx_t_14maze_solver_cy_coord_type_t)))));
+  __pyx_v_q->data = ((__pyx_t_14maze_solver_cy_cell_index_type_t *)malloc((__pyx_v_capacity * (sizeof(__pyx_t_14maze_solver_cy_cell_index_type_t)))));
 
-  /* "maze_solver_cy.pyx":37
- *     q.data_r = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
- *     q.data_c = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
+  /* "maze_solver_cy.pyx":31
+ *     """Inicializa a queue com capacidade especificada"""
+ *     q.data = <cell_index_type_t*>malloc(capacity * sizeof(cell_index_type_t))
  *     q.head = 0             # <<<<<<<<<<<<<<
  *     q.tail = 0
- *     q.size = 0
+ * 
 */
   __pyx_v_q->head = 0;
 
-  /* "maze_solver_cy.pyx":38
- *     q.data_c = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
+  /* "maze_solver_cy.pyx":32
+ *     q.data = <cell_index_type_t*>malloc(capacity * sizeof(cell_index_type_t))
  *     q.head = 0
  *     q.tail = 0             # <<<<<<<<<<<<<<
- *     q.size = 0
- *     q.capacity = capacity
-*/
-  __pyx_v_q->tail = 0;
-
-  /* "maze_solver_cy.pyx":39
- *     q.head = 0
- *     q.tail = 0
- *     q.size = 0             # <<<<<<<<<<<<<<
- *     q.capacity = capacity
- * 
-*/
-  __pyx_v_q->size = 0;
-
-  /* "maze_solver_cy.pyx":40
- *     q.tail = 0
- *     q.size = 0
- *     q.capacity = capacity             # <<<<<<<<<<<<<<
  * 
- * cdef inline void free_queue(CircularQueue* q) nogil:
+ * cdef inline void free_queue(CellQueue* q) noexcept nogil:
 */
-  __pyx_v_q->capacity = __pyx_v_capacity;
+  __pyx_v_q->tail = 0;
 
-  /* "maze_solver_cy.pyx":33
- *     queue_index_t capacity
+  /* "maze_solver_cy.pyx":28
+ *     queue_index_t tail
  * 
- * cdef inline void init_queue(CircularQueue* q, queue_index_t capacity) nogil:             # <<<<<<<<<<<<<<
- *     """Inicializa a queue circular com capacidade especificada"""
- *     q.data_r = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
+ * cdef inline void init_queue(CellQueue* q, queue_index_t capacity) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Inicializa a queue com capacidade especificada"""
+ *     q.data = <cell_index_type_t*>malloc(capacity * sizeof(cell_index_type_t))
 */
 
   /* function exit code */
 }
 
-/* "maze_solver_cy.pyx":42
- *     q.capacity = capacity
+/* "maze_solver_cy.pyx":34
+ *     q.tail = 0
  * 
- * cdef inline void free_queue(CircularQueue* q) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void free_queue(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Libera a memria da queue"""
- *     if q.data_r != NULL:
+ *     if q.data != NULL:
 */
 
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_free_queue(struct __pyx_t_14maze_solver_cy_CircularQueue *__pyx_v_q) {
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_free_queue(struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_q) {
   int __pyx_t_1;
 
-  /* "maze_solver_cy.pyx":44
- * cdef inline void free_queue(CircularQueue* q) nogil:
- *     """Libera a memria da queue"""
- *     if q.data_r != NULL:             # <<<<<<<<<<<<<<
- *         free(q.data_r)
- *     if q.data_c != NULL:
-*/
-  __pyx_t_1 = (__pyx_v_q->data_r != NULL);
-  if (__pyx_t_1) {
-
-    /* "maze_solver_cy.pyx":45
- *     """Libera a memria da queue"""
- *     if q.data_r != NULL:
- *         free(q.data_r)             # <<<<<<<<<<<<<<
- *     if q.data_c != NULL:
- *         free(q.data_c)
-*/
-    free(__pyx_v_q->data_r);
-
-    /* "maze_solver_cy.pyx":44
- * cdef inline void free_queue(CircularQueue* q) nogil:
+  /* "maze_solver_cy.pyx":36
+ * cdef inline void free_queue(CellQueue* q) noexcept nogil:
  *     """Libera a memria da queue"""
- *     if q.data_r != NULL:             # <<<<<<<<<<<<<<
- *         free(q.data_r)
- *     if q.data_c != NULL:
-*/
-  }
-
-  /* "maze_solver_cy.pyx":46
- *     if q.data_r != NULL:
- *         free(q.data_r)
- *     if q.data_c != NULL:             # <<<<<<<<<<<<<<
- *         free(q.data_c)
+ *     if q.data != NULL:             # <<<<<<<<<<<<<<
+ *         free(q.data)
  * 
 */
-  __pyx_t_1 = (__pyx_v_q->data_c != NULL);
+  __pyx_t_1 = (__pyx_v_q->data != NULL);
   if (__pyx_t_1) {
 
-    /* "maze_solver_cy.pyx":47
- *         free(q.data_r)
- *     if q.data_c != NULL:
- *         free(q.data_c)             # <<<<<<<<<<<<<<
+    /* "maze_solver_cy.pyx":37
+ *     """Libera a memria da queue"""
+ *     if q.data != NULL:
+ *         free(q.data)             # <<<<<<<<<<<<<<
  * 
- * cdef inline bint is_queue_empty(CircularQueue* q) nogil:
+ * cdef inline bint is_queue_empty(CellQueue* q) noexcept nogil:
 */
-    free(__pyx_v_q->data_c);
+    free(__pyx_v_q->data);
 
-    /* "maze_solver_cy.pyx":46
- *     if q.data_r != NULL:
- *         free(q.data_r)
- *     if q.data_c != NULL:             # <<<<<<<<<<<<<<
- *         free(q.data_c)
+    /* "maze_solver_cy.pyx":36
+ * cdef inline void free_queue(CellQueue* q) noexcept nogil:
+ *     """Libera a memria da queue"""
+ *     if q.data != NULL:             # <<<<<<<<<<<<<<
+ *         free(q.data)
  * 
 */
   }
 
-  /* "maze_solver_cy.pyx":42
- *     q.capacity = capacity
+  /* "maze_solver_cy.pyx":34
+ *     q.tail = 0
  * 
- * cdef inline void free_queue(CircularQueue* q) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void free_queue(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Libera a memria da queue"""
- *     if q.data_r != NULL:
+ *     if q.data != NULL:
 */
 
   /* function exit code */
 }
 
-/* "maze_solver_cy.pyx":49
- *         free(q.data_c)
+/* "maze_solver_cy.pyx":39
+ *         free(q.data)
  * 
- * cdef inline bint is_queue_empty(CircularQueue* q) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline bint is_queue_empty(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Verifica se a queue est vazia"""
- *     return q.size == 0
+ *     return q.head == q.tail
 */
 
-static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_queue_empty(struct __pyx_t_14maze_solver_cy_CircularQueue *__pyx_v_q) {
+static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_queue_empty(struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_q) {
   int __pyx_r;
 
-  /* "maze_solver_cy.pyx":51
- * cdef inline bint is_queue_empty(CircularQueue* q) nogil:
+  /* "maze_solver_cy.pyx":41
+ * cdef inline bint is_queue_empty(CellQueue* q) noexcept nogil:
  *     """Verifica se a queue est vazia"""
- *     return q.size == 0             # <<<<<<<<<<<<<<
+ *     return q.head == q.tail             # <<<<<<<<<<<<<<
  * 
- * cdef inline void enqueue(CircularQueue* q, coord_type_t r, coord_type_t c) nogil:
+ * cdef inline void enqueue(CellQueue* q, cell_index_type_t idx) noexcept nogil:
 */
-  __pyx_r = (__pyx_v_q->size == 0);
+  __pyx_r = (__pyx_v_q->head == __pyx_v_q->tail);
   goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":49
- *         free(q.data_c)
+  /* "maze_solver_cy.pyx":39
+ *         free(q.data)
  * 
- * cdef inline bint is_queue_empty(CircularQueue* q) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline bint is_queue_empty(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Verifica se a queue est vazia"""
- *     return q.size == 0
+ *     return q.head == q.tail
 */
 
   /* function exit code */
@@ -19174,2513 +19114,3765 @@ static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_queue_empty(struct __pyx_t_
   return __pyx_r;
 }
 
-/* "maze_solver_cy.pyx":53
- *     return q.size == 0
+/* "maze_solver_cy.pyx":43
+ *     return q.head == q.tail
  * 
- * cdef inline void enqueue(CircularQueue* q, coord_type_t r, coord_type_t c) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void enqueue(CellQueue* q, cell_index_type_t idx) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Adiciona elemento na queue (assume que h espao)"""
- *     q.data_r[q.tail] = r
+ *     q.data[q.tail] = idx
 */
 
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_enqueue(struct __pyx_t_14maze_solver_cy_CircularQueue *__pyx_v_q, __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_r, __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_c) {
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_enqueue(struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_q, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx) {
 
-  /* "maze_solver_cy.pyx":55
- * cdef inline void enqueue(CircularQueue* q, coord_type_t r, coord_type_t c) nogil:
- *     """Adiciona elemento na queue (assume que h espao)"""
- *     q.data_r[q.tail] = r             # <<<<<<<<<<<<<<
- *     q.data_c[q.tail] = c
- *     q.tail = (q.tail + 1) % q.capacity
-*/
-  (__pyx_v_q->data_r[__pyx_v_q->tail]) = __pyx_v_r;
-
-  /* "maze_solver_cy.pyx":56
+  /* "maze_solver_cy.pyx":45
+ * cdef inline void enqueue(CellQueue* q, cell_index_type_t idx) noexcept nogil:
  *     """Adiciona elemento na queue (assume que h espao)"""
- *     q.data_r[q.tail] = r
- *     q.data_c[q.tail] = c             # <<<<<<<<<<<<<<
- *     q.tail = (q.tail + 1) % q.capacity
- *     q.size += 1
-*/
-  (__pyx_v_q->data_c[__pyx_v_q->tail]) = __pyx_v_c;
-
-  /* "maze_solver_cy.pyx":57
- *     q.data_r[q.tail] = r
- *     q.data_c[q.tail] = c
- *     q.tail = (q.tail + 1) % q.capacity             # <<<<<<<<<<<<<<
- *     q.size += 1
+ *     q.data[q.tail] = idx             # <<<<<<<<<<<<<<
+ *     q.tail += 1
  * 
 */
-  __pyx_v_q->tail = ((__pyx_v_q->tail + 1) % __pyx_v_q->capacity);
+  (__pyx_v_q->data[__pyx_v_q->tail]) = __pyx_v_idx;
 
-  /* "maze_solver_cy.pyx":58
- *     q.data_c[q.tail] = c
- *     q.tail = (q.tail + 1) % q.capacity
- *     q.size += 1             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":46
+ *     """Adiciona elemento na queue (assume que h espao)"""
+ *     q.data[q.tail] = idx
+ *     q.tail += 1             # <<<<<<<<<<<<<<
  * 
- * cdef inline void dequeue(CircularQueue* q, coord_type_t* r, coord_type_t* c) nogil:
+ * cdef inline cell_index_type_t dequeue(CellQueue* q) noexcept nogil:
 */
-  __pyx_v_q->size = (__pyx_v_q->size + 1);
+  __pyx_v_q->tail = (__pyx_v_q->tail + 1);
 
-  /* "maze_solver_cy.pyx":53
- *     return q.size == 0
+  /* "maze_solver_cy.pyx":43
+ *     return q.head == q.tail
  * 
- * cdef inline void enqueue(CircularQueue* q, coord_type_t r, coord_type_t c) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline void enqueue(CellQueue* q, cell_index_type_t idx) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Adiciona elemento na queue (assume que h espao)"""
- *     q.data_r[q.tail] = r
+ *     q.data[q.tail] = idx
 */
 
   /* function exit code */
 }
 
-/* "maze_solver_cy.pyx":60
- *     q.size += 1
+/* "maze_solver_cy.pyx":48
+ *     q.tail += 1
  * 
- * cdef inline void dequeue(CircularQueue* q, coord_type_t* r, coord_type_t* c) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline cell_index_type_t dequeue(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Remove elemento da queue (assume que no est vazia)"""
- *     r[0] = q.data_r[q.head]
+ *     cdef cell_index_type_t idx = q.data[q.head]
 */
 
-static CYTHON_INLINE void __pyx_f_14maze_solver_cy_dequeue(struct __pyx_t_14maze_solver_cy_CircularQueue *__pyx_v_q, __pyx_t_14maze_solver_cy_coord_type_t *__pyx_v_r, __pyx_t_14maze_solver_cy_coord_type_t *__pyx_v_c) {
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_dequeue(struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_q) {
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_r;
 
-  /* "maze_solver_cy.pyx":62
- * cdef inline void dequeue(CircularQueue* q, coord_type_t* r, coord_type_t* c) nogil:
+  /* "maze_solver_cy.pyx":50
+ * cdef inline cell_index_type_t dequeue(CellQueue* q) noexcept nogil:
  *     """Remove elemento da queue (assume que no est vazia)"""
- *     r[0] = q.data_r[q.head]             # <<<<<<<<<<<<<<
- *     c[0] = q.data_c[q.head]
- *     q.head = (q.head + 1) % q.capacity
+ *     cdef cell_index_type_t idx = q.data[q.head]             # <<<<<<<<<<<<<<
+ *     q.head += 1
+ *     return idx
 */
-  (__pyx_v_r[0]) = (__pyx_v_q->data_r[__pyx_v_q->head]);
+  __pyx_v_idx = (__pyx_v_q->data[__pyx_v_q->head]);
 
-  /* "maze_solver_cy.pyx":63
+  /* "maze_solver_cy.pyx":51
  *     """Remove elemento da queue (assume que no est vazia)"""
- *     r[0] = q.data_r[q.head]
- *     c[0] = q.data_c[q.head]             # <<<<<<<<<<<<<<
- *     q.head = (q.head + 1) % q.capacity
- *     q.size -= 1
-*/
-  (__pyx_v_c[0]) = (__pyx_v_q->data_c[__pyx_v_q->head]);
-
-  /* "maze_solver_cy.pyx":64
- *     r[0] = q.data_r[q.head]
- *     c[0] = q.data_c[q.head]
- *     q.head = (q.head + 1) % q.capacity             # <<<<<<<<<<<<<<
- *     q.size -= 1
+ *     cdef cell_index_type_t idx = q.data[q.head]
+ *     q.head += 1             # <<<<<<<<<<<<<<
+ *     return idx
  * 
 */
-  __pyx_v_q->head = ((__pyx_v_q->head + 1) % __pyx_v_q->capacity);
+  __pyx_v_q->head = (__pyx_v_q->head + 1);
 
-  /* "maze_solver_cy.pyx":65
- *     c[0] = q.data_c[q.head]
- *     q.head = (q.head + 1) % q.capacity
- *     q.size -= 1             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":52
+ *     cdef cell_index_type_t idx = q.data[q.head]
+ *     q.head += 1
+ *     return idx             # <<<<<<<<<<<<<<
  * 
- * # Direes pr-compiladas como constantes
+ * cdef inline cell_index_type_t pop_last(CellQueue* q) noexcept nogil:
 */
-  __pyx_v_q->size = (__pyx_v_q->size - 1);
+  __pyx_r = __pyx_v_idx;
+  goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":60
- *     q.size += 1
+  /* "maze_solver_cy.pyx":48
+ *     q.tail += 1
  * 
- * cdef inline void dequeue(CircularQueue* q, coord_type_t* r, coord_type_t* c) nogil:             # <<<<<<<<<<<<<<
+ * cdef inline cell_index_type_t dequeue(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
  *     """Remove elemento da queue (assume que no est vazia)"""
- *     r[0] = q.data_r[q.head]
+ *     cdef cell_index_type_t idx = q.data[q.head]
 */
 
   /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
 }
 
-/* "maze_solver_cy.pyx":77
- * DEF DC_RIGHT = 1
+/* "maze_solver_cy.pyx":54
+ *     return idx
  * 
- * cpdef list find_shortest_path_cython_optimized(cnp.int32_t[:, ::1] int_grid, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
- *     """
- *     Verso otimizada do BFS para encontrar o caminho mais curto no labirinto.
+ * cdef inline cell_index_type_t pop_last(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Remove o ltimo elemento inserido, usando a queue como pilha (assume que no est vazia)"""
+ *     q.tail -= 1
 */
 
-static PyObject *__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-static PyObject *__pyx_f_14maze_solver_cy_find_shortest_path_cython_optimized(__Pyx_memviewslice __pyx_v_int_grid, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  int __pyx_v_rows;
-  int __pyx_v_cols;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_start_r;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_start_c;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_r;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_c;
-  __pyx_t_14maze_solver_cy_queue_index_t __pyx_v_max_queue_size;
-  struct __pyx_t_14maze_solver_cy_CircularQueue __pyx_v_queue;
-  PyObject *__pyx_v_visited_np_array = NULL;
-  __Pyx_memviewslice __pyx_v_visited = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_pred_r_np = NULL;
-  PyObject *__pyx_v_pred_c_np = NULL;
-  __Pyx_memviewslice __pyx_v_pred_r = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_pred_c = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_r;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_c;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_nr;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_nc;
-  int __pyx_v_path_found;
-  PyObject *__pyx_v_path = 0;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_curr_r;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_curr_c;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_prev_r;
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_prev_c;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __pyx_t_14maze_solver_cy_coord_type_t __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
-  Py_ssize_t __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  size_t __pyx_t_12;
-  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_t_15;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("find_shortest_path_cython_optimized", 0);
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_pop_last(struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_q) {
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_r;
 
-  /* "maze_solver_cy.pyx":88
- *     - Eliminao de checagens redundantes
- *     """
- *     cdef int rows = int_grid.shape[0]             # <<<<<<<<<<<<<<
- *     cdef int cols = int_grid.shape[1]
+  /* "maze_solver_cy.pyx":56
+ * cdef inline cell_index_type_t pop_last(CellQueue* q) noexcept nogil:
+ *     """Remove o ltimo elemento inserido, usando a queue como pilha (assume que no est vazia)"""
+ *     q.tail -= 1             # <<<<<<<<<<<<<<
+ *     return q.data[q.tail]
  * 
 */
-  __pyx_v_rows = (__pyx_v_int_grid.shape[0]);
+  __pyx_v_q->tail = (__pyx_v_q->tail - 1);
 
-  /* "maze_solver_cy.pyx":89
- *     """
- *     cdef int rows = int_grid.shape[0]
- *     cdef int cols = int_grid.shape[1]             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":57
+ *     """Remove o ltimo elemento inserido, usando a queue como pilha (assume que no est vazia)"""
+ *     q.tail -= 1
+ *     return q.data[q.tail]             # <<<<<<<<<<<<<<
  * 
- *     cdef coord_type_t start_r = start_coords[0]
+ * cdef inline bint is_wall(const wall_word_type_t[::1] wall_bits, cell_index_type_t idx) noexcept nogil:
 */
-  __pyx_v_cols = (__pyx_v_int_grid.shape[1]);
+  __pyx_r = (__pyx_v_q->data[__pyx_v_q->tail]);
+  goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":91
- *     cdef int cols = int_grid.shape[1]
+  /* "maze_solver_cy.pyx":54
+ *     return idx
  * 
- *     cdef coord_type_t start_r = start_coords[0]             # <<<<<<<<<<<<<<
- *     cdef coord_type_t start_c = start_coords[1]
- *     cdef coord_type_t end_r = end_coords[0]
+ * cdef inline cell_index_type_t pop_last(CellQueue* q) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Remove o ltimo elemento inserido, usando a queue como pilha (assume que no est vazia)"""
+ *     q.tail -= 1
 */
-  if (unlikely(__pyx_v_start_coords == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 91, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_start_coords, 0)); if (unlikely((__pyx_t_1 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L1_error)
-  __pyx_v_start_r = __pyx_t_1;
 
-  /* "maze_solver_cy.pyx":92
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "maze_solver_cy.pyx":59
+ *     return q.data[q.tail]
  * 
- *     cdef coord_type_t start_r = start_coords[0]
- *     cdef coord_type_t start_c = start_coords[1]             # <<<<<<<<<<<<<<
- *     cdef coord_type_t end_r = end_coords[0]
- *     cdef coord_type_t end_c = end_coords[1]
+ * cdef inline bint is_wall(const wall_word_type_t[::1] wall_bits, cell_index_type_t idx) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """L o bit da clula no bitmap plano (64 clulas por palavra, bit idx & 63, 1 = parede)"""
+ *     return (wall_bits[idx >> 6] >> (idx & 63)) & 1
 */
-  if (unlikely(__pyx_v_start_coords == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 92, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_start_coords, 1)); if (unlikely((__pyx_t_1 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_v_start_c = __pyx_t_1;
 
-  /* "maze_solver_cy.pyx":93
- *     cdef coord_type_t start_r = start_coords[0]
- *     cdef coord_type_t start_c = start_coords[1]
- *     cdef coord_type_t end_r = end_coords[0]             # <<<<<<<<<<<<<<
- *     cdef coord_type_t end_c = end_coords[1]
+static CYTHON_INLINE int __pyx_f_14maze_solver_cy_is_wall(__Pyx_memviewslice __pyx_v_wall_bits, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx) {
+  int __pyx_r;
+  Py_ssize_t __pyx_t_1;
+
+  /* "maze_solver_cy.pyx":61
+ * cdef inline bint is_wall(const wall_word_type_t[::1] wall_bits, cell_index_type_t idx) noexcept nogil:
+ *     """L o bit da clula no bitmap plano (64 clulas por palavra, bit idx & 63, 1 = parede)"""
+ *     return (wall_bits[idx >> 6] >> (idx & 63)) & 1             # <<<<<<<<<<<<<<
  * 
+ * # Cdigos de direo do predecessor no estado da clula. No BFS bidirecional, um nibble
 */
-  if (unlikely(__pyx_v_end_coords == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 93, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_end_coords, 0)); if (unlikely((__pyx_t_1 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 93, __pyx_L1_error)
-  __pyx_v_end_r = __pyx_t_1;
+  __pyx_t_1 = (__pyx_v_idx >> 6);
+  __pyx_r = (((*((__pyx_t_14maze_solver_cy_wall_word_type_t const  *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_wall_word_type_t const  *) __pyx_v_wall_bits.data) + __pyx_t_1)) ))) >> (__pyx_v_idx & 63)) & 1);
+  goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":94
- *     cdef coord_type_t start_c = start_coords[1]
- *     cdef coord_type_t end_r = end_coords[0]
- *     cdef coord_type_t end_c = end_coords[1]             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":59
+ *     return q.data[q.tail]
  * 
- *     # Validao rpida das coordenadas
+ * cdef inline bint is_wall(const wall_word_type_t[::1] wall_bits, cell_index_type_t idx) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """L o bit da clula no bitmap plano (64 clulas por palavra, bit idx & 63, 1 = parede)"""
+ *     return (wall_bits[idx >> 6] >> (idx & 63)) & 1
 */
-  if (unlikely(__pyx_v_end_coords == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 94, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_end_coords, 1)); if (unlikely((__pyx_t_1 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 94, __pyx_L1_error)
-  __pyx_v_end_c = __pyx_t_1;
 
-  /* "maze_solver_cy.pyx":97
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "maze_solver_cy.pyx":81
+ *     visited_cell_type_t other_mask
  * 
- *     # Validao rpida das coordenadas
- *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
- *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
- *         return None
+ * cdef inline void init_side(SearchSide* side, int shift, queue_index_t capacity) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Inicializa a queue e as mscaras de nibble de um lado da busca"""
+ *     init_queue(&side.queue, capacity)
 */
-  __pyx_t_3 = (__pyx_v_start_r < 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_start_r >= __pyx_v_rows);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_start_c < 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_start_c >= __pyx_v_cols);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
 
-  /* "maze_solver_cy.pyx":98
- *     # Validao rpida das coordenadas
- *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
- *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):             # <<<<<<<<<<<<<<
- *         return None
- * 
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_init_side(struct __pyx_t_14maze_solver_cy_SearchSide *__pyx_v_side, int __pyx_v_shift, __pyx_t_14maze_solver_cy_queue_index_t __pyx_v_capacity) {
+
+  /* "maze_solver_cy.pyx":83
+ * cdef inline void init_side(SearchSide* side, int shift, queue_index_t capacity) noexcept nogil:
+ *     """Inicializa a queue e as mscaras de nibble de um lado da busca"""
+ *     init_queue(&side.queue, capacity)             # <<<<<<<<<<<<<<
+ *     side.shift = shift
+ *     side.own_mask = 0x0F << shift
 */
-  __pyx_t_3 = (__pyx_v_end_r < 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_end_r >= __pyx_v_rows);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_end_c < 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_end_c >= __pyx_v_cols);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L4_bool_binop_done:;
+  __pyx_f_14maze_solver_cy_init_queue((&__pyx_v_side->queue), __pyx_v_capacity);
 
-  /* "maze_solver_cy.pyx":97
- * 
- *     # Validao rpida das coordenadas
- *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
- *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
- *         return None
+  /* "maze_solver_cy.pyx":84
+ *     """Inicializa a queue e as mscaras de nibble de um lado da busca"""
+ *     init_queue(&side.queue, capacity)
+ *     side.shift = shift             # <<<<<<<<<<<<<<
+ *     side.own_mask = 0x0F << shift
+ *     side.other_mask = 0xF0 >> shift
 */
-  if (__pyx_t_2) {
+  __pyx_v_side->shift = __pyx_v_shift;
 
-    /* "maze_solver_cy.pyx":99
- *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
- *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
- *         return None             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":85
+ *     init_queue(&side.queue, capacity)
+ *     side.shift = shift
+ *     side.own_mask = 0x0F << shift             # <<<<<<<<<<<<<<
+ *     side.other_mask = 0xF0 >> shift
  * 
- *     if int_grid[start_r, start_c] == WALL_CELL or int_grid[end_r, end_c] == WALL_CELL:
 */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+  __pyx_v_side->own_mask = (0x0F << __pyx_v_shift);
 
-    /* "maze_solver_cy.pyx":97
+  /* "maze_solver_cy.pyx":86
+ *     side.shift = shift
+ *     side.own_mask = 0x0F << shift
+ *     side.other_mask = 0xF0 >> shift             # <<<<<<<<<<<<<<
  * 
- *     # Validao rpida das coordenadas
- *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
- *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
- *         return None
+ * cdef inline bint visit(SearchSide* side, visited_cell_type_t* state, cell_index_type_t idx,
 */
-  }
+  __pyx_v_side->other_mask = (0xF0 >> __pyx_v_shift);
 
-  /* "maze_solver_cy.pyx":101
- *         return None
- * 
- *     if int_grid[start_r, start_c] == WALL_CELL or int_grid[end_r, end_c] == WALL_CELL:             # <<<<<<<<<<<<<<
- *         return None
+  /* "maze_solver_cy.pyx":81
+ *     visited_cell_type_t other_mask
  * 
+ * cdef inline void init_side(SearchSide* side, int shift, queue_index_t capacity) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Inicializa a queue e as mscaras de nibble de um lado da busca"""
+ *     init_queue(&side.queue, capacity)
 */
-  __pyx_t_4 = __pyx_v_start_r;
-  __pyx_t_5 = __pyx_v_start_c;
-  __pyx_t_3 = ((*((__pyx_t_5numpy_int32_t *) ( /* dim=1 */ ((char *) (((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_int_grid.data + __pyx_t_4 * __pyx_v_int_grid.strides[0]) )) + __pyx_t_5)) ))) == 1);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L13_bool_binop_done;
-  }
-  __pyx_t_5 = __pyx_v_end_r;
-  __pyx_t_4 = __pyx_v_end_c;
-  __pyx_t_3 = ((*((__pyx_t_5numpy_int32_t *) ( /* dim=1 */ ((char *) (((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_int_grid.data + __pyx_t_5 * __pyx_v_int_grid.strides[0]) )) + __pyx_t_4)) ))) == 1);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L13_bool_binop_done:;
-  if (__pyx_t_2) {
 
-    /* "maze_solver_cy.pyx":102
- * 
- *     if int_grid[start_r, start_c] == WALL_CELL or int_grid[end_r, end_c] == WALL_CELL:
- *         return None             # <<<<<<<<<<<<<<
+  /* function exit code */
+}
+
+/* "maze_solver_cy.pyx":88
+ *     side.other_mask = 0xF0 >> shift
  * 
- *     # Caso especial: incio igual ao fim
+ * cdef inline bint visit(SearchSide* side, visited_cell_type_t* state, cell_index_type_t idx,             # <<<<<<<<<<<<<<
+ *                        cell_index_type_t nidx, visited_cell_type_t parent_code,
+ *                        cell_index_type_t* meet) noexcept nogil:
 */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
 
-    /* "maze_solver_cy.pyx":101
- *         return None
- * 
- *     if int_grid[start_r, start_c] == WALL_CELL or int_grid[end_r, end_c] == WALL_CELL:             # <<<<<<<<<<<<<<
- *         return None
- * 
-*/
-  }
+static CYTHON_INLINE int __pyx_f_14maze_solver_cy_visit(struct __pyx_t_14maze_solver_cy_SearchSide *__pyx_v_side, __pyx_t_14maze_solver_cy_visited_cell_type_t *__pyx_v_state, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_nidx, __pyx_t_14maze_solver_cy_visited_cell_type_t __pyx_v_parent_code, __pyx_t_14maze_solver_cy_cell_index_type_t *__pyx_v_meet) {
+  int __pyx_r;
+  int __pyx_t_1;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_t_2;
 
-  /* "maze_solver_cy.pyx":105
- * 
- *     # Caso especial: incio igual ao fim
- *     if start_r == end_r and start_c == end_c:             # <<<<<<<<<<<<<<
- *         return [(start_r, start_c)]
- * 
+  /* "maze_solver_cy.pyx":92
+ *                        cell_index_type_t* meet) noexcept nogil:
+ *     """Visita nidx a partir de idx; devolve True se nidx j foi alcanado pela outra busca"""
+ *     if state[nidx] & side.own_mask:             # <<<<<<<<<<<<<<
+ *         return False
+ *     if state[nidx] & side.other_mask:
 */
-  __pyx_t_3 = (__pyx_v_start_r == __pyx_v_end_r);
-  if (__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L16_bool_binop_done;
-  }
-  __pyx_t_3 = (__pyx_v_start_c == __pyx_v_end_c);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L16_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_1 = (((__pyx_v_state[__pyx_v_nidx]) & __pyx_v_side->own_mask) != 0);
+  if (__pyx_t_1) {
 
-    /* "maze_solver_cy.pyx":106
- *     # Caso especial: incio igual ao fim
- *     if start_r == end_r and start_c == end_c:
- *         return [(start_r, start_c)]             # <<<<<<<<<<<<<<
- * 
- *     # Inicializar estruturas de dados
+    /* "maze_solver_cy.pyx":93
+ *     """Visita nidx a partir de idx; devolve True se nidx j foi alcanado pela outra busca"""
+ *     if state[nidx] & side.own_mask:
+ *         return False             # <<<<<<<<<<<<<<
+ *     if state[nidx] & side.other_mask:
+ *         meet[0] = idx
 */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_6 = __Pyx_PyLong_From_npy_int32(__pyx_v_start_r); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 106, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = __Pyx_PyLong_From_npy_int32(__pyx_v_start_c); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_GIVEREF(__pyx_t_6);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6) != (0)) __PYX_ERR(0, 106, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_7);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7) != (0)) __PYX_ERR(0, 106, __pyx_L1_error);
-    __pyx_t_6 = 0;
-    __pyx_t_7 = 0;
-    __pyx_t_7 = PyList_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_GIVEREF(__pyx_t_8);
-    if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 0, __pyx_t_8) != (0)) __PYX_ERR(0, 106, __pyx_L1_error);
-    __pyx_t_8 = 0;
-    __pyx_r = ((PyObject*)__pyx_t_7);
-    __pyx_t_7 = 0;
+    __pyx_r = 0;
     goto __pyx_L0;
 
-    /* "maze_solver_cy.pyx":105
- * 
- *     # Caso especial: incio igual ao fim
- *     if start_r == end_r and start_c == end_c:             # <<<<<<<<<<<<<<
- *         return [(start_r, start_c)]
- * 
+    /* "maze_solver_cy.pyx":92
+ *                        cell_index_type_t* meet) noexcept nogil:
+ *     """Visita nidx a partir de idx; devolve True se nidx j foi alcanado pela outra busca"""
+ *     if state[nidx] & side.own_mask:             # <<<<<<<<<<<<<<
+ *         return False
+ *     if state[nidx] & side.other_mask:
 */
   }
 
-  /* "maze_solver_cy.pyx":109
- * 
- *     # Inicializar estruturas de dados
- *     cdef queue_index_t max_queue_size = rows * cols             # <<<<<<<<<<<<<<
- *     cdef CircularQueue queue
- *     init_queue(&queue, max_queue_size)
+  /* "maze_solver_cy.pyx":94
+ *     if state[nidx] & side.own_mask:
+ *         return False
+ *     if state[nidx] & side.other_mask:             # <<<<<<<<<<<<<<
+ *         meet[0] = idx
+ *         meet[1] = nidx
 */
-  __pyx_v_max_queue_size = (__pyx_v_rows * __pyx_v_cols);
+  __pyx_t_1 = (((__pyx_v_state[__pyx_v_nidx]) & __pyx_v_side->other_mask) != 0);
+  if (__pyx_t_1) {
 
-  /* "maze_solver_cy.pyx":111
- *     cdef queue_index_t max_queue_size = rows * cols
- *     cdef CircularQueue queue
- *     init_queue(&queue, max_queue_size)             # <<<<<<<<<<<<<<
- * 
- *     # Arrays visitados e predecessores
+    /* "maze_solver_cy.pyx":95
+ *         return False
+ *     if state[nidx] & side.other_mask:
+ *         meet[0] = idx             # <<<<<<<<<<<<<<
+ *         meet[1] = nidx
+ *         return True
 */
-  __pyx_f_14maze_solver_cy_init_queue((&__pyx_v_queue), __pyx_v_max_queue_size); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L1_error)
+    (__pyx_v_meet[0]) = __pyx_v_idx;
 
-  /* "maze_solver_cy.pyx":114
- * 
- *     # Arrays visitados e predecessores
- *     visited_np_array = np.zeros((rows, cols), dtype=np.uint8)             # <<<<<<<<<<<<<<
- *     cdef visited_cell_type_t[:, ::1] visited = visited_np_array
- * 
+    /* "maze_solver_cy.pyx":96
+ *     if state[nidx] & side.other_mask:
+ *         meet[0] = idx
+ *         meet[1] = nidx             # <<<<<<<<<<<<<<
+ *         return True
+ *     state[nidx] |= parent_code << side.shift
 */
-  __pyx_t_8 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_rows); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_10 = __Pyx_PyLong_From_int(__pyx_v_cols); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_GIVEREF(__pyx_t_6);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_6) != (0)) __PYX_ERR(0, 114, __pyx_L1_error);
-  __Pyx_GIVEREF(__pyx_t_10);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_10) != (0)) __PYX_ERR(0, 114, __pyx_L1_error);
-  __pyx_t_6 = 0;
-  __pyx_t_10 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __pyx_t_12 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_9))) {
-    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
-    assert(__pyx_t_8);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_9);
-    __Pyx_INCREF(__pyx_t_8);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_9, __pyx__function);
-    __pyx_t_12 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_8, __pyx_t_11};
-    __pyx_t_10 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_10);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_10, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 114, __pyx_L1_error)
-    __pyx_t_7 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_9, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_10);
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-  }
-  __pyx_v_visited_np_array = __pyx_t_7;
-  __pyx_t_7 = 0;
+    (__pyx_v_meet[1]) = __pyx_v_nidx;
 
-  /* "maze_solver_cy.pyx":115
- *     # Arrays visitados e predecessores
- *     visited_np_array = np.zeros((rows, cols), dtype=np.uint8)
- *     cdef visited_cell_type_t[:, ::1] visited = visited_np_array             # <<<<<<<<<<<<<<
- * 
- *     pred_r_np = np.full((rows, cols), -1, dtype=np.int32)
+    /* "maze_solver_cy.pyx":97
+ *         meet[0] = idx
+ *         meet[1] = nidx
+ *         return True             # <<<<<<<<<<<<<<
+ *     state[nidx] |= parent_code << side.shift
+ *     enqueue(&side.queue, nidx)
 */
-  __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(__pyx_v_visited_np_array, PyBUF_WRITABLE); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 115, __pyx_L1_error)
-  __pyx_v_visited = __pyx_t_13;
-  __pyx_t_13.memview = NULL;
-  __pyx_t_13.data = NULL;
+    __pyx_r = 1;
+    goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":117
- *     cdef visited_cell_type_t[:, ::1] visited = visited_np_array
- * 
- *     pred_r_np = np.full((rows, cols), -1, dtype=np.int32)             # <<<<<<<<<<<<<<
- *     pred_c_np = np.full((rows, cols), -1, dtype=np.int32)
- *     cdef coord_type_t[:, ::1] pred_r = pred_r_np
+    /* "maze_solver_cy.pyx":94
+ *     if state[nidx] & side.own_mask:
+ *         return False
+ *     if state[nidx] & side.other_mask:             # <<<<<<<<<<<<<<
+ *         meet[0] = idx
+ *         meet[1] = nidx
 */
-  __pyx_t_9 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_full); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __pyx_t_10 = __Pyx_PyLong_From_int(__pyx_v_rows); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __pyx_t_11 = __Pyx_PyLong_From_int(__pyx_v_cols); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_GIVEREF(__pyx_t_10);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_10) != (0)) __PYX_ERR(0, 117, __pyx_L1_error);
-  __Pyx_GIVEREF(__pyx_t_11);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_11) != (0)) __PYX_ERR(0, 117, __pyx_L1_error);
-  __pyx_t_10 = 0;
-  __pyx_t_11 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  __pyx_t_12 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_6))) {
-    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
-    assert(__pyx_t_9);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
-    __Pyx_INCREF(__pyx_t_9);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
-    __pyx_t_12 = 0;
   }
-  #endif
-  {
-    PyObject *__pyx_callargs[3 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_9, __pyx_t_8, __pyx_mstate_global->__pyx_int_neg_1};
-    __pyx_t_11 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 117, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_10, __pyx_t_11, __pyx_callargs+3, 0) < 0) __PYX_ERR(0, 117, __pyx_L1_error)
-    __pyx_t_7 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_6, __pyx_callargs+__pyx_t_12, (3-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_11);
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 117, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-  }
-  __pyx_v_pred_r_np = __pyx_t_7;
-  __pyx_t_7 = 0;
 
-  /* "maze_solver_cy.pyx":118
- * 
- *     pred_r_np = np.full((rows, cols), -1, dtype=np.int32)
- *     pred_c_np = np.full((rows, cols), -1, dtype=np.int32)             # <<<<<<<<<<<<<<
- *     cdef coord_type_t[:, ::1] pred_r = pred_r_np
- *     cdef coord_type_t[:, ::1] pred_c = pred_c_np
+  /* "maze_solver_cy.pyx":98
+ *         meet[1] = nidx
+ *         return True
+ *     state[nidx] |= parent_code << side.shift             # <<<<<<<<<<<<<<
+ *     enqueue(&side.queue, nidx)
+ *     return False
 */
-  __pyx_t_6 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_full); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  __pyx_t_11 = __Pyx_PyLong_From_int(__pyx_v_rows); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_8 = __Pyx_PyLong_From_int(__pyx_v_cols); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_GIVEREF(__pyx_t_11);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_11) != (0)) __PYX_ERR(0, 118, __pyx_L1_error);
-  __Pyx_GIVEREF(__pyx_t_8);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_8) != (0)) __PYX_ERR(0, 118, __pyx_L1_error);
-  __pyx_t_11 = 0;
-  __pyx_t_8 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 118, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_12 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_10))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_10);
-    assert(__pyx_t_6);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_10);
-    __Pyx_INCREF(__pyx_t_6);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_10, __pyx__function);
-    __pyx_t_12 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[3 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_6, __pyx_t_9, __pyx_mstate_global->__pyx_int_neg_1};
-    __pyx_t_8 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 118, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_11, __pyx_t_8, __pyx_callargs+3, 0) < 0) __PYX_ERR(0, 118, __pyx_L1_error)
-    __pyx_t_7 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_10, __pyx_callargs+__pyx_t_12, (3-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_8);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 118, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-  }
-  __pyx_v_pred_c_np = __pyx_t_7;
-  __pyx_t_7 = 0;
+  __pyx_t_2 = __pyx_v_nidx;
+  (__pyx_v_state[__pyx_t_2]) = ((__pyx_v_state[__pyx_t_2]) | (__pyx_v_parent_code << __pyx_v_side->shift));
 
-  /* "maze_solver_cy.pyx":119
- *     pred_r_np = np.full((rows, cols), -1, dtype=np.int32)
- *     pred_c_np = np.full((rows, cols), -1, dtype=np.int32)
- *     cdef coord_type_t[:, ::1] pred_r = pred_r_np             # <<<<<<<<<<<<<<
- *     cdef coord_type_t[:, ::1] pred_c = pred_c_np
+  /* "maze_solver_cy.pyx":99
+ *         return True
+ *     state[nidx] |= parent_code << side.shift
+ *     enqueue(&side.queue, nidx)             # <<<<<<<<<<<<<<
+ *     return False
  * 
 */
-  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(__pyx_v_pred_r_np, PyBUF_WRITABLE); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 119, __pyx_L1_error)
-  __pyx_v_pred_r = __pyx_t_14;
-  __pyx_t_14.memview = NULL;
-  __pyx_t_14.data = NULL;
+  __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_side->queue), __pyx_v_nidx);
 
-  /* "maze_solver_cy.pyx":120
- *     pred_c_np = np.full((rows, cols), -1, dtype=np.int32)
- *     cdef coord_type_t[:, ::1] pred_r = pred_r_np
- *     cdef coord_type_t[:, ::1] pred_c = pred_c_np             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":100
+ *     state[nidx] |= parent_code << side.shift
+ *     enqueue(&side.queue, nidx)
+ *     return False             # <<<<<<<<<<<<<<
  * 
- *     # Inicializar BFS
+ * cdef inline cell_index_type_t parent_of(cell_index_type_t idx, visited_cell_type_t code, int cols) noexcept nogil:
 */
-  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(__pyx_v_pred_c_np, PyBUF_WRITABLE); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 120, __pyx_L1_error)
-  __pyx_v_pred_c = __pyx_t_14;
-  __pyx_t_14.memview = NULL;
-  __pyx_t_14.data = NULL;
+  __pyx_r = 0;
+  goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":123
- * 
- *     # Inicializar BFS
- *     enqueue(&queue, start_r, start_c)             # <<<<<<<<<<<<<<
- *     visited[start_r, start_c] = 1
+  /* "maze_solver_cy.pyx":88
+ *     side.other_mask = 0xF0 >> shift
  * 
+ * cdef inline bint visit(SearchSide* side, visited_cell_type_t* state, cell_index_type_t idx,             # <<<<<<<<<<<<<<
+ *                        cell_index_type_t nidx, visited_cell_type_t parent_code,
+ *                        cell_index_type_t* meet) noexcept nogil:
 */
-  __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_queue), __pyx_v_start_r, __pyx_v_start_c); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 123, __pyx_L1_error)
 
-  /* "maze_solver_cy.pyx":124
- *     # Inicializar BFS
- *     enqueue(&queue, start_r, start_c)
- *     visited[start_r, start_c] = 1             # <<<<<<<<<<<<<<
- * 
- *     cdef coord_type_t r, c, nr, nc
-*/
-  __pyx_t_4 = __pyx_v_start_r;
-  __pyx_t_5 = __pyx_v_start_c;
-  *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_4 * __pyx_v_visited.strides[0]) )) + __pyx_t_5)) )) = 1;
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-  /* "maze_solver_cy.pyx":127
- * 
- *     cdef coord_type_t r, c, nr, nc
- *     cdef bint path_found = False             # <<<<<<<<<<<<<<
+/* "maze_solver_cy.pyx":102
+ *     return False
  * 
- *     # BFS principal com nogil para mxima performance
+ * cdef inline cell_index_type_t parent_of(cell_index_type_t idx, visited_cell_type_t code, int cols) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Segue um cdigo de direo at o predecessor"""
+ *     if code == PARENT_UP:
 */
-  __pyx_v_path_found = 0;
 
-  /* "maze_solver_cy.pyx":130
- * 
- *     # BFS principal com nogil para mxima performance
- *     with nogil:             # <<<<<<<<<<<<<<
- *         while not is_queue_empty(&queue):
- *             dequeue(&queue, &r, &c)
-*/
-  {
-      PyThreadState *_save;
-      _save = NULL;
-      Py_UNBLOCK_THREADS
-      __Pyx_FastGIL_Remember();
-      /*try:*/ {
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_parent_of(__pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx, __pyx_t_14maze_solver_cy_visited_cell_type_t __pyx_v_code, int __pyx_v_cols) {
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_r;
+  int __pyx_t_1;
 
-        /* "maze_solver_cy.pyx":131
- *     # BFS principal com nogil para mxima performance
- *     with nogil:
- *         while not is_queue_empty(&queue):             # <<<<<<<<<<<<<<
- *             dequeue(&queue, &r, &c)
- * 
+  /* "maze_solver_cy.pyx":104
+ * cdef inline cell_index_type_t parent_of(cell_index_type_t idx, visited_cell_type_t code, int cols) noexcept nogil:
+ *     """Segue um cdigo de direo at o predecessor"""
+ *     if code == PARENT_UP:             # <<<<<<<<<<<<<<
+ *         return idx - cols
+ *     if code == PARENT_DOWN:
 */
-        while (1) {
-          __pyx_t_2 = __pyx_f_14maze_solver_cy_is_queue_empty((&__pyx_v_queue)); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 131, __pyx_L19_error)
-          __pyx_t_3 = (!__pyx_t_2);
-          if (!__pyx_t_3) break;
+  __pyx_t_1 = (__pyx_v_code == 1);
+  if (__pyx_t_1) {
 
-          /* "maze_solver_cy.pyx":132
- *     with nogil:
- *         while not is_queue_empty(&queue):
- *             dequeue(&queue, &r, &c)             # <<<<<<<<<<<<<<
- * 
- *             # Verificar se chegamos ao destino
+    /* "maze_solver_cy.pyx":105
+ *     """Segue um cdigo de direo at o predecessor"""
+ *     if code == PARENT_UP:
+ *         return idx - cols             # <<<<<<<<<<<<<<
+ *     if code == PARENT_DOWN:
+ *         return idx + cols
 */
-          __pyx_f_14maze_solver_cy_dequeue((&__pyx_v_queue), (&__pyx_v_r), (&__pyx_v_c)); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 132, __pyx_L19_error)
+    __pyx_r = (__pyx_v_idx - __pyx_v_cols);
+    goto __pyx_L0;
 
-          /* "maze_solver_cy.pyx":135
- * 
- *             # Verificar se chegamos ao destino
- *             if r == end_r and c == end_c:             # <<<<<<<<<<<<<<
- *                 path_found = True
- *                 break
-*/
-          __pyx_t_2 = (__pyx_v_r == __pyx_v_end_r);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L24_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_c == __pyx_v_end_c);
-          __pyx_t_3 = __pyx_t_2;
-          __pyx_L24_bool_binop_done:;
-          if (__pyx_t_3) {
-
-            /* "maze_solver_cy.pyx":136
- *             # Verificar se chegamos ao destino
- *             if r == end_r and c == end_c:
- *                 path_found = True             # <<<<<<<<<<<<<<
- *                 break
- * 
+    /* "maze_solver_cy.pyx":104
+ * cdef inline cell_index_type_t parent_of(cell_index_type_t idx, visited_cell_type_t code, int cols) noexcept nogil:
+ *     """Segue um cdigo de direo at o predecessor"""
+ *     if code == PARENT_UP:             # <<<<<<<<<<<<<<
+ *         return idx - cols
+ *     if code == PARENT_DOWN:
 */
-            __pyx_v_path_found = 1;
+  }
 
-            /* "maze_solver_cy.pyx":137
- *             if r == end_r and c == end_c:
- *                 path_found = True
- *                 break             # <<<<<<<<<<<<<<
- * 
- *             # Explorar direes (desenrolado para performance)
+  /* "maze_solver_cy.pyx":106
+ *     if code == PARENT_UP:
+ *         return idx - cols
+ *     if code == PARENT_DOWN:             # <<<<<<<<<<<<<<
+ *         return idx + cols
+ *     if code == PARENT_LEFT:
 */
-            goto __pyx_L22_break;
+  __pyx_t_1 = (__pyx_v_code == 2);
+  if (__pyx_t_1) {
 
-            /* "maze_solver_cy.pyx":135
- * 
- *             # Verificar se chegamos ao destino
- *             if r == end_r and c == end_c:             # <<<<<<<<<<<<<<
- *                 path_found = True
- *                 break
+    /* "maze_solver_cy.pyx":107
+ *         return idx - cols
+ *     if code == PARENT_DOWN:
+ *         return idx + cols             # <<<<<<<<<<<<<<
+ *     if code == PARENT_LEFT:
+ *         return idx - 1
 */
-          }
+    __pyx_r = (__pyx_v_idx + __pyx_v_cols);
+    goto __pyx_L0;
 
-          /* "maze_solver_cy.pyx":141
- *             # Explorar direes (desenrolado para performance)
- *             # Direo UP
- *             nr = r + DR_UP             # <<<<<<<<<<<<<<
- *             nc = c + DC_UP
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
+    /* "maze_solver_cy.pyx":106
+ *     if code == PARENT_UP:
+ *         return idx - cols
+ *     if code == PARENT_DOWN:             # <<<<<<<<<<<<<<
+ *         return idx + cols
+ *     if code == PARENT_LEFT:
 */
-          __pyx_v_nr = (__pyx_v_r + -1L);
+  }
 
-          /* "maze_solver_cy.pyx":142
- *             # Direo UP
- *             nr = r + DR_UP
- *             nc = c + DC_UP             # <<<<<<<<<<<<<<
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
+  /* "maze_solver_cy.pyx":108
+ *     if code == PARENT_DOWN:
+ *         return idx + cols
+ *     if code == PARENT_LEFT:             # <<<<<<<<<<<<<<
+ *         return idx - 1
+ *     return idx + 1
 */
-          __pyx_v_nc = (__pyx_v_c + 0);
+  __pyx_t_1 = (__pyx_v_code == 3);
+  if (__pyx_t_1) {
 
-          /* "maze_solver_cy.pyx":143
- *             nr = r + DR_UP
- *             nc = c + DC_UP
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+    /* "maze_solver_cy.pyx":109
+ *         return idx + cols
+ *     if code == PARENT_LEFT:
+ *         return idx - 1             # <<<<<<<<<<<<<<
+ *     return idx + 1
+ * 
 */
-          __pyx_t_2 = (__pyx_v_nr >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L27_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nr < __pyx_v_rows);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L27_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L27_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc < __pyx_v_cols);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L27_bool_binop_done;
-          }
+    __pyx_r = (__pyx_v_idx - 1);
+    goto __pyx_L0;
 
-          /* "maze_solver_cy.pyx":144
- *             nc = c + DC_UP
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):             # <<<<<<<<<<<<<<
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
+    /* "maze_solver_cy.pyx":108
+ *     if code == PARENT_DOWN:
+ *         return idx + cols
+ *     if code == PARENT_LEFT:             # <<<<<<<<<<<<<<
+ *         return idx - 1
+ *     return idx + 1
 */
-          __pyx_t_5 = __pyx_v_nr;
-          __pyx_t_4 = __pyx_v_nc;
-          __pyx_t_2 = ((*((__pyx_t_5numpy_int32_t *) ( /* dim=1 */ ((char *) (((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_int_grid.data + __pyx_t_5 * __pyx_v_int_grid.strides[0]) )) + __pyx_t_4)) ))) != 1);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L27_bool_binop_done;
-          }
-          __pyx_t_4 = __pyx_v_nr;
-          __pyx_t_5 = __pyx_v_nc;
-          __pyx_t_2 = (!((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_4 * __pyx_v_visited.strides[0]) )) + __pyx_t_5)) ))) != 0));
-          __pyx_t_3 = __pyx_t_2;
-          __pyx_L27_bool_binop_done:;
+  }
 
-          /* "maze_solver_cy.pyx":143
- *             nr = r + DR_UP
- *             nc = c + DC_UP
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
-*/
-          if (__pyx_t_3) {
-
-            /* "maze_solver_cy.pyx":145
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1             # <<<<<<<<<<<<<<
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
-*/
-            __pyx_t_5 = __pyx_v_nr;
-            __pyx_t_4 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_5 * __pyx_v_visited.strides[0]) )) + __pyx_t_4)) )) = 1;
-
-            /* "maze_solver_cy.pyx":146
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r             # <<<<<<<<<<<<<<
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)
-*/
-            __pyx_t_4 = __pyx_v_nr;
-            __pyx_t_5 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_r.data + __pyx_t_4 * __pyx_v_pred_r.strides[0]) )) + __pyx_t_5)) )) = __pyx_v_r;
-
-            /* "maze_solver_cy.pyx":147
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c             # <<<<<<<<<<<<<<
- *                 enqueue(&queue, nr, nc)
- * 
-*/
-            __pyx_t_5 = __pyx_v_nr;
-            __pyx_t_4 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_c.data + __pyx_t_5 * __pyx_v_pred_c.strides[0]) )) + __pyx_t_4)) )) = __pyx_v_c;
-
-            /* "maze_solver_cy.pyx":148
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":110
+ *     if code == PARENT_LEFT:
+ *         return idx - 1
+ *     return idx + 1             # <<<<<<<<<<<<<<
  * 
- *             # Direo DOWN
+ * cdef bint expand_level(SearchSide* side, visited_cell_type_t* state,
 */
-            __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_queue), __pyx_v_nr, __pyx_v_nc); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 148, __pyx_L19_error)
+  __pyx_r = (__pyx_v_idx + 1);
+  goto __pyx_L0;
 
-            /* "maze_solver_cy.pyx":143
- *             nr = r + DR_UP
- *             nc = c + DC_UP
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+  /* "maze_solver_cy.pyx":102
+ *     return False
+ * 
+ * cdef inline cell_index_type_t parent_of(cell_index_type_t idx, visited_cell_type_t code, int cols) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Segue um cdigo de direo at o predecessor"""
+ *     if code == PARENT_UP:
 */
-          }
 
-          /* "maze_solver_cy.pyx":151
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "maze_solver_cy.pyx":112
+ *     return idx + 1
  * 
- *             # Direo DOWN
- *             nr = r + DR_DOWN             # <<<<<<<<<<<<<<
- *             nc = c + DC_DOWN
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
+ * cdef bint expand_level(SearchSide* side, visited_cell_type_t* state,             # <<<<<<<<<<<<<<
+ *                        const wall_word_type_t[::1] wall_bits, int rows, int cols,
+ *                        cell_index_type_t* meet) noexcept nogil:
 */
-          __pyx_v_nr = (__pyx_v_r + 1);
 
-          /* "maze_solver_cy.pyx":152
- *             # Direo DOWN
- *             nr = r + DR_DOWN
- *             nc = c + DC_DOWN             # <<<<<<<<<<<<<<
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
-*/
-          __pyx_v_nc = (__pyx_v_c + 0);
+static int __pyx_f_14maze_solver_cy_expand_level(struct __pyx_t_14maze_solver_cy_SearchSide *__pyx_v_side, __pyx_t_14maze_solver_cy_visited_cell_type_t *__pyx_v_state, __Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, __pyx_t_14maze_solver_cy_cell_index_type_t *__pyx_v_meet) {
+  __pyx_t_14maze_solver_cy_queue_index_t __pyx_v_level_end;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_r;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_c;
+  int __pyx_r;
+  __pyx_t_14maze_solver_cy_queue_index_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
 
-          /* "maze_solver_cy.pyx":153
- *             nr = r + DR_DOWN
- *             nc = c + DC_DOWN
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+  /* "maze_solver_cy.pyx":116
+ *                        cell_index_type_t* meet) noexcept nogil:
+ *     """Expande um nvel inteiro de uma das buscas; devolve True no encontro com a outra"""
+ *     cdef queue_index_t level_end = side.queue.tail             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t idx
+ *     cdef coord_type_t r, c
 */
-          __pyx_t_2 = (__pyx_v_nr >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L34_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nr < __pyx_v_rows);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L34_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L34_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc < __pyx_v_cols);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L34_bool_binop_done;
-          }
+  __pyx_t_1 = __pyx_v_side->queue.tail;
+  __pyx_v_level_end = __pyx_t_1;
 
-          /* "maze_solver_cy.pyx":154
- *             nc = c + DC_DOWN
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):             # <<<<<<<<<<<<<<
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
-*/
-          __pyx_t_4 = __pyx_v_nr;
-          __pyx_t_5 = __pyx_v_nc;
-          __pyx_t_2 = ((*((__pyx_t_5numpy_int32_t *) ( /* dim=1 */ ((char *) (((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_int_grid.data + __pyx_t_4 * __pyx_v_int_grid.strides[0]) )) + __pyx_t_5)) ))) != 1);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L34_bool_binop_done;
-          }
-          __pyx_t_5 = __pyx_v_nr;
-          __pyx_t_4 = __pyx_v_nc;
-          __pyx_t_2 = (!((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_5 * __pyx_v_visited.strides[0]) )) + __pyx_t_4)) ))) != 0));
-          __pyx_t_3 = __pyx_t_2;
-          __pyx_L34_bool_binop_done:;
-
-          /* "maze_solver_cy.pyx":153
- *             nr = r + DR_DOWN
- *             nc = c + DC_DOWN
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
-*/
-          if (__pyx_t_3) {
-
-            /* "maze_solver_cy.pyx":155
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1             # <<<<<<<<<<<<<<
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
-*/
-            __pyx_t_4 = __pyx_v_nr;
-            __pyx_t_5 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_4 * __pyx_v_visited.strides[0]) )) + __pyx_t_5)) )) = 1;
-
-            /* "maze_solver_cy.pyx":156
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r             # <<<<<<<<<<<<<<
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)
-*/
-            __pyx_t_5 = __pyx_v_nr;
-            __pyx_t_4 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_r.data + __pyx_t_5 * __pyx_v_pred_r.strides[0]) )) + __pyx_t_4)) )) = __pyx_v_r;
-
-            /* "maze_solver_cy.pyx":157
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c             # <<<<<<<<<<<<<<
- *                 enqueue(&queue, nr, nc)
- * 
-*/
-            __pyx_t_4 = __pyx_v_nr;
-            __pyx_t_5 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_c.data + __pyx_t_4 * __pyx_v_pred_c.strides[0]) )) + __pyx_t_5)) )) = __pyx_v_c;
-
-            /* "maze_solver_cy.pyx":158
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":120
+ *     cdef coord_type_t r, c
+ * 
+ *     while side.queue.head < level_end:             # <<<<<<<<<<<<<<
+ *         idx = dequeue(&side.queue)
  * 
- *             # Direo LEFT
 */
-            __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_queue), __pyx_v_nr, __pyx_v_nc); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 158, __pyx_L19_error)
+  while (1) {
+    __pyx_t_2 = (__pyx_v_side->queue.head < __pyx_v_level_end);
+    if (!__pyx_t_2) break;
 
-            /* "maze_solver_cy.pyx":153
- *             nr = r + DR_DOWN
- *             nc = c + DC_DOWN
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+    /* "maze_solver_cy.pyx":121
+ * 
+ *     while side.queue.head < level_end:
+ *         idx = dequeue(&side.queue)             # <<<<<<<<<<<<<<
+ * 
+ *         # Uma diviso por clula s para as bordas; vizinhos e bits de parede saem do ndice plano.
 */
-          }
+    __pyx_v_idx = __pyx_f_14maze_solver_cy_dequeue((&__pyx_v_side->queue));
 
-          /* "maze_solver_cy.pyx":161
+    /* "maze_solver_cy.pyx":126
+ *         # Arredondar a largura para potncia de dois (r = idx >> shift) foi medido e no compensa:
+ *         # o BFS  limitado por memria, e as linhas mais espaadas pioram o cache (~10% em 600x600)
+ *         r = idx // cols             # <<<<<<<<<<<<<<
+ *         c = idx - r * cols
  * 
- *             # Direo LEFT
- *             nr = r + DR_LEFT             # <<<<<<<<<<<<<<
- *             nc = c + DC_LEFT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
 */
-          __pyx_v_nr = (__pyx_v_r + 0);
+    __pyx_v_r = (__pyx_v_idx / __pyx_v_cols);
 
-          /* "maze_solver_cy.pyx":162
- *             # Direo LEFT
- *             nr = r + DR_LEFT
- *             nc = c + DC_LEFT             # <<<<<<<<<<<<<<
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
+    /* "maze_solver_cy.pyx":127
+ *         # o BFS  limitado por memria, e as linhas mais espaadas pioram o cache (~10% em 600x600)
+ *         r = idx // cols
+ *         c = idx - r * cols             # <<<<<<<<<<<<<<
+ * 
+ *         # Explorar direes (desenrolado para performance); o vizinho guarda de onde veio
 */
-          __pyx_v_nc = (__pyx_v_c + -1L);
+    __pyx_v_c = (__pyx_v_idx - (__pyx_v_r * __pyx_v_cols));
 
-          /* "maze_solver_cy.pyx":163
- *             nr = r + DR_LEFT
- *             nc = c + DC_LEFT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+    /* "maze_solver_cy.pyx":131
+ *         # Explorar direes (desenrolado para performance); o vizinho guarda de onde veio
+ *         # Direo UP
+ *         if r > 0 and not is_wall(wall_bits, idx - cols) and visit(side, state, idx, idx - cols, PARENT_DOWN, meet):             # <<<<<<<<<<<<<<
+ *             return True
+ *         # Direo DOWN
 */
-          __pyx_t_2 = (__pyx_v_nr >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L41_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nr < __pyx_v_rows);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L41_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L41_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc < __pyx_v_cols);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L41_bool_binop_done;
-          }
+    __pyx_t_3 = (__pyx_v_r > 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_3 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx - __pyx_v_cols)));
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_f_14maze_solver_cy_visit(__pyx_v_side, __pyx_v_state, __pyx_v_idx, (__pyx_v_idx - __pyx_v_cols), 2, __pyx_v_meet);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_2) {
 
-          /* "maze_solver_cy.pyx":164
- *             nc = c + DC_LEFT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):             # <<<<<<<<<<<<<<
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
-*/
-          __pyx_t_5 = __pyx_v_nr;
-          __pyx_t_4 = __pyx_v_nc;
-          __pyx_t_2 = ((*((__pyx_t_5numpy_int32_t *) ( /* dim=1 */ ((char *) (((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_int_grid.data + __pyx_t_5 * __pyx_v_int_grid.strides[0]) )) + __pyx_t_4)) ))) != 1);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L41_bool_binop_done;
-          }
-          __pyx_t_4 = __pyx_v_nr;
-          __pyx_t_5 = __pyx_v_nc;
-          __pyx_t_2 = (!((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_4 * __pyx_v_visited.strides[0]) )) + __pyx_t_5)) ))) != 0));
-          __pyx_t_3 = __pyx_t_2;
-          __pyx_L41_bool_binop_done:;
-
-          /* "maze_solver_cy.pyx":163
- *             nr = r + DR_LEFT
- *             nc = c + DC_LEFT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
-*/
-          if (__pyx_t_3) {
-
-            /* "maze_solver_cy.pyx":165
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1             # <<<<<<<<<<<<<<
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
-*/
-            __pyx_t_5 = __pyx_v_nr;
-            __pyx_t_4 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_5 * __pyx_v_visited.strides[0]) )) + __pyx_t_4)) )) = 1;
-
-            /* "maze_solver_cy.pyx":166
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r             # <<<<<<<<<<<<<<
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)
-*/
-            __pyx_t_4 = __pyx_v_nr;
-            __pyx_t_5 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_r.data + __pyx_t_4 * __pyx_v_pred_r.strides[0]) )) + __pyx_t_5)) )) = __pyx_v_r;
-
-            /* "maze_solver_cy.pyx":167
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c             # <<<<<<<<<<<<<<
- *                 enqueue(&queue, nr, nc)
- * 
-*/
-            __pyx_t_5 = __pyx_v_nr;
-            __pyx_t_4 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_c.data + __pyx_t_5 * __pyx_v_pred_c.strides[0]) )) + __pyx_t_4)) )) = __pyx_v_c;
-
-            /* "maze_solver_cy.pyx":168
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)             # <<<<<<<<<<<<<<
- * 
- *             # Direo RIGHT
+      /* "maze_solver_cy.pyx":132
+ *         # Direo UP
+ *         if r > 0 and not is_wall(wall_bits, idx - cols) and visit(side, state, idx, idx - cols, PARENT_DOWN, meet):
+ *             return True             # <<<<<<<<<<<<<<
+ *         # Direo DOWN
+ *         if r < rows - 1 and not is_wall(wall_bits, idx + cols) and visit(side, state, idx, idx + cols, PARENT_UP, meet):
 */
-            __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_queue), __pyx_v_nr, __pyx_v_nc); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 168, __pyx_L19_error)
+      __pyx_r = 1;
+      goto __pyx_L0;
 
-            /* "maze_solver_cy.pyx":163
- *             nr = r + DR_LEFT
- *             nc = c + DC_LEFT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+      /* "maze_solver_cy.pyx":131
+ *         # Explorar direes (desenrolado para performance); o vizinho guarda de onde veio
+ *         # Direo UP
+ *         if r > 0 and not is_wall(wall_bits, idx - cols) and visit(side, state, idx, idx - cols, PARENT_DOWN, meet):             # <<<<<<<<<<<<<<
+ *             return True
+ *         # Direo DOWN
 */
-          }
+    }
 
-          /* "maze_solver_cy.pyx":171
- * 
- *             # Direo RIGHT
- *             nr = r + DR_RIGHT             # <<<<<<<<<<<<<<
- *             nc = c + DC_RIGHT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
+    /* "maze_solver_cy.pyx":134
+ *             return True
+ *         # Direo DOWN
+ *         if r < rows - 1 and not is_wall(wall_bits, idx + cols) and visit(side, state, idx, idx + cols, PARENT_UP, meet):             # <<<<<<<<<<<<<<
+ *             return True
+ *         # Direo LEFT
 */
-          __pyx_v_nr = (__pyx_v_r + 0);
+    __pyx_t_3 = (__pyx_v_r < (__pyx_v_rows - 1));
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_3 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx + __pyx_v_cols)));
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_f_14maze_solver_cy_visit(__pyx_v_side, __pyx_v_state, __pyx_v_idx, (__pyx_v_idx + __pyx_v_cols), 1, __pyx_v_meet);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L10_bool_binop_done:;
+    if (__pyx_t_2) {
 
-          /* "maze_solver_cy.pyx":172
- *             # Direo RIGHT
- *             nr = r + DR_RIGHT
- *             nc = c + DC_RIGHT             # <<<<<<<<<<<<<<
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
+      /* "maze_solver_cy.pyx":135
+ *         # Direo DOWN
+ *         if r < rows - 1 and not is_wall(wall_bits, idx + cols) and visit(side, state, idx, idx + cols, PARENT_UP, meet):
+ *             return True             # <<<<<<<<<<<<<<
+ *         # Direo LEFT
+ *         if c > 0 and not is_wall(wall_bits, idx - 1) and visit(side, state, idx, idx - 1, PARENT_RIGHT, meet):
 */
-          __pyx_v_nc = (__pyx_v_c + 1);
+      __pyx_r = 1;
+      goto __pyx_L0;
 
-          /* "maze_solver_cy.pyx":173
- *             nr = r + DR_RIGHT
- *             nc = c + DC_RIGHT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+      /* "maze_solver_cy.pyx":134
+ *             return True
+ *         # Direo DOWN
+ *         if r < rows - 1 and not is_wall(wall_bits, idx + cols) and visit(side, state, idx, idx + cols, PARENT_UP, meet):             # <<<<<<<<<<<<<<
+ *             return True
+ *         # Direo LEFT
 */
-          __pyx_t_2 = (__pyx_v_nr >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L48_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nr < __pyx_v_rows);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L48_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc >= 0);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L48_bool_binop_done;
-          }
-          __pyx_t_2 = (__pyx_v_nc < __pyx_v_cols);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L48_bool_binop_done;
-          }
+    }
 
-          /* "maze_solver_cy.pyx":174
- *             nc = c + DC_RIGHT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):             # <<<<<<<<<<<<<<
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
+    /* "maze_solver_cy.pyx":137
+ *             return True
+ *         # Direo LEFT
+ *         if c > 0 and not is_wall(wall_bits, idx - 1) and visit(side, state, idx, idx - 1, PARENT_RIGHT, meet):             # <<<<<<<<<<<<<<
+ *             return True
+ *         # Direo RIGHT
 */
-          __pyx_t_4 = __pyx_v_nr;
-          __pyx_t_5 = __pyx_v_nc;
-          __pyx_t_2 = ((*((__pyx_t_5numpy_int32_t *) ( /* dim=1 */ ((char *) (((__pyx_t_5numpy_int32_t *) ( /* dim=0 */ (__pyx_v_int_grid.data + __pyx_t_4 * __pyx_v_int_grid.strides[0]) )) + __pyx_t_5)) ))) != 1);
-          if (__pyx_t_2) {
-          } else {
-            __pyx_t_3 = __pyx_t_2;
-            goto __pyx_L48_bool_binop_done;
-          }
-          __pyx_t_5 = __pyx_v_nr;
-          __pyx_t_4 = __pyx_v_nc;
-          __pyx_t_2 = (!((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_5 * __pyx_v_visited.strides[0]) )) + __pyx_t_4)) ))) != 0));
-          __pyx_t_3 = __pyx_t_2;
-          __pyx_L48_bool_binop_done:;
-
-          /* "maze_solver_cy.pyx":173
- *             nr = r + DR_RIGHT
- *             nc = c + DC_RIGHT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
-*/
-          if (__pyx_t_3) {
-
-            /* "maze_solver_cy.pyx":175
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1             # <<<<<<<<<<<<<<
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
-*/
-            __pyx_t_4 = __pyx_v_nr;
-            __pyx_t_5 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ (__pyx_v_visited.data + __pyx_t_4 * __pyx_v_visited.strides[0]) )) + __pyx_t_5)) )) = 1;
-
-            /* "maze_solver_cy.pyx":176
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r             # <<<<<<<<<<<<<<
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)
-*/
-            __pyx_t_5 = __pyx_v_nr;
-            __pyx_t_4 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_r.data + __pyx_t_5 * __pyx_v_pred_r.strides[0]) )) + __pyx_t_4)) )) = __pyx_v_r;
-
-            /* "maze_solver_cy.pyx":177
- *                 visited[nr, nc] = 1
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c             # <<<<<<<<<<<<<<
- *                 enqueue(&queue, nr, nc)
- * 
-*/
-            __pyx_t_4 = __pyx_v_nr;
-            __pyx_t_5 = __pyx_v_nc;
-            *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_c.data + __pyx_t_4 * __pyx_v_pred_c.strides[0]) )) + __pyx_t_5)) )) = __pyx_v_c;
-
-            /* "maze_solver_cy.pyx":178
- *                 pred_r[nr, nc] = r
- *                 pred_c[nr, nc] = c
- *                 enqueue(&queue, nr, nc)             # <<<<<<<<<<<<<<
- * 
- *     # Liberar memria da queue
-*/
-            __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_queue), __pyx_v_nr, __pyx_v_nc); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 178, __pyx_L19_error)
-
-            /* "maze_solver_cy.pyx":173
- *             nr = r + DR_RIGHT
- *             nc = c + DC_RIGHT
- *             if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and             # <<<<<<<<<<<<<<
- *                 int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
- *                 visited[nr, nc] = 1
+    __pyx_t_3 = (__pyx_v_c > 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_t_3 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx - 1)));
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_f_14maze_solver_cy_visit(__pyx_v_side, __pyx_v_state, __pyx_v_idx, (__pyx_v_idx - 1), 4, __pyx_v_meet);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L14_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "maze_solver_cy.pyx":138
+ *         # Direo LEFT
+ *         if c > 0 and not is_wall(wall_bits, idx - 1) and visit(side, state, idx, idx - 1, PARENT_RIGHT, meet):
+ *             return True             # <<<<<<<<<<<<<<
+ *         # Direo RIGHT
+ *         if c < cols - 1 and not is_wall(wall_bits, idx + 1) and visit(side, state, idx, idx + 1, PARENT_LEFT, meet):
 */
-          }
-        }
-        __pyx_L22_break:;
-      }
+      __pyx_r = 1;
+      goto __pyx_L0;
 
-      /* "maze_solver_cy.pyx":130
- * 
- *     # BFS principal com nogil para mxima performance
- *     with nogil:             # <<<<<<<<<<<<<<
- *         while not is_queue_empty(&queue):
- *             dequeue(&queue, &r, &c)
+      /* "maze_solver_cy.pyx":137
+ *             return True
+ *         # Direo LEFT
+ *         if c > 0 and not is_wall(wall_bits, idx - 1) and visit(side, state, idx, idx - 1, PARENT_RIGHT, meet):             # <<<<<<<<<<<<<<
+ *             return True
+ *         # Direo RIGHT
 */
-      /*finally:*/ {
-        /*normal exit:*/{
-          __Pyx_FastGIL_Forget();
-          Py_BLOCK_THREADS
-          goto __pyx_L20;
-        }
-        __pyx_L19_error: {
-          __Pyx_FastGIL_Forget();
-          Py_BLOCK_THREADS
-          goto __pyx_L1_error;
-        }
-        __pyx_L20:;
-      }
-  }
+    }
 
-  /* "maze_solver_cy.pyx":181
+    /* "maze_solver_cy.pyx":140
+ *             return True
+ *         # Direo RIGHT
+ *         if c < cols - 1 and not is_wall(wall_bits, idx + 1) and visit(side, state, idx, idx + 1, PARENT_LEFT, meet):             # <<<<<<<<<<<<<<
+ *             return True
  * 
- *     # Liberar memria da queue
- *     free_queue(&queue)             # <<<<<<<<<<<<<<
- * 
- *     if not path_found:
 */
-  __pyx_f_14maze_solver_cy_free_queue((&__pyx_v_queue)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_3 = (__pyx_v_c < (__pyx_v_cols - 1));
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L18_bool_binop_done;
+    }
+    __pyx_t_3 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx + 1)));
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L18_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_f_14maze_solver_cy_visit(__pyx_v_side, __pyx_v_state, __pyx_v_idx, (__pyx_v_idx + 1), 3, __pyx_v_meet);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L18_bool_binop_done:;
+    if (__pyx_t_2) {
 
-  /* "maze_solver_cy.pyx":183
- *     free_queue(&queue)
- * 
- *     if not path_found:             # <<<<<<<<<<<<<<
- *         return None
+      /* "maze_solver_cy.pyx":141
+ *         # Direo RIGHT
+ *         if c < cols - 1 and not is_wall(wall_bits, idx + 1) and visit(side, state, idx, idx + 1, PARENT_LEFT, meet):
+ *             return True             # <<<<<<<<<<<<<<
  * 
+ *     return False
 */
-  __pyx_t_3 = (!__pyx_v_path_found);
-  if (__pyx_t_3) {
+      __pyx_r = 1;
+      goto __pyx_L0;
 
-    /* "maze_solver_cy.pyx":184
- * 
- *     if not path_found:
- *         return None             # <<<<<<<<<<<<<<
+      /* "maze_solver_cy.pyx":140
+ *             return True
+ *         # Direo RIGHT
+ *         if c < cols - 1 and not is_wall(wall_bits, idx + 1) and visit(side, state, idx, idx + 1, PARENT_LEFT, meet):             # <<<<<<<<<<<<<<
+ *             return True
  * 
- *     # Reconstruir caminho otimizado
 */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+    }
+  }
 
-    /* "maze_solver_cy.pyx":183
- *     free_queue(&queue)
+  /* "maze_solver_cy.pyx":143
+ *             return True
  * 
- *     if not path_found:             # <<<<<<<<<<<<<<
- *         return None
+ *     return False             # <<<<<<<<<<<<<<
  * 
+ * cpdef object find_shortest_path_cython_optimized(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):
 */
-  }
+  __pyx_r = 0;
+  goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":187
+  /* "maze_solver_cy.pyx":112
+ *     return idx + 1
  * 
- *     # Reconstruir caminho otimizado
- *     cdef list path = []             # <<<<<<<<<<<<<<
- *     cdef coord_type_t curr_r = end_r
- *     cdef coord_type_t curr_c = end_c
+ * cdef bint expand_level(SearchSide* side, visited_cell_type_t* state,             # <<<<<<<<<<<<<<
+ *                        const wall_word_type_t[::1] wall_bits, int rows, int cols,
+ *                        cell_index_type_t* meet) noexcept nogil:
 */
-  __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 187, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_v_path = ((PyObject*)__pyx_t_7);
-  __pyx_t_7 = 0;
 
-  /* "maze_solver_cy.pyx":188
- *     # Reconstruir caminho otimizado
- *     cdef list path = []
- *     cdef coord_type_t curr_r = end_r             # <<<<<<<<<<<<<<
- *     cdef coord_type_t curr_c = end_c
- *     cdef coord_type_t prev_r, prev_c
-*/
-  __pyx_v_curr_r = __pyx_v_end_r;
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-  /* "maze_solver_cy.pyx":189
- *     cdef list path = []
- *     cdef coord_type_t curr_r = end_r
- *     cdef coord_type_t curr_c = end_c             # <<<<<<<<<<<<<<
- *     cdef coord_type_t prev_r, prev_c
+/* "maze_solver_cy.pyx":145
+ *     return False
  * 
+ * cpdef object find_shortest_path_cython_optimized(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
+ *     """
+ *     Verso otimizada do BFS para encontrar o caminho mais curto no labirinto.
 */
-  __pyx_v_curr_c = __pyx_v_end_c;
 
-  /* "maze_solver_cy.pyx":193
- * 
- *     # Construir caminho de trs para frente
- *     while True:             # <<<<<<<<<<<<<<
- *         path.append((curr_r, curr_c))
+static PyObject *__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_14maze_solver_cy_find_shortest_path_cython_optimized(__Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_start_r;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_start_c;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_r;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_c;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_start_idx;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_end_idx;
+  __pyx_t_14maze_solver_cy_queue_index_t __pyx_v_max_queue_size;
+  struct __pyx_t_14maze_solver_cy_SearchSide __pyx_v_forward;
+  struct __pyx_t_14maze_solver_cy_SearchSide __pyx_v_backward;
+  PyObject *__pyx_v_state_np_array = NULL;
+  __Pyx_memviewslice __pyx_v_state = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_meet[2];
+  int __pyx_v_path_found;
+  int __pyx_v_met_forward;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_forward_end;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_backward_end;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_curr;
+  Py_ssize_t __pyx_v_forward_len;
+  Py_ssize_t __pyx_v_backward_len;
+  PyObject *__pyx_v_path_np = NULL;
+  __Pyx_memviewslice __pyx_v_path = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9[7];
+  PyObject *__pyx_t_10 = NULL;
+  size_t __pyx_t_11;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_t_12;
+  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_14;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_t_15;
+  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_17;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_shortest_path_cython_optimized", 0);
+
+  /* "maze_solver_cy.pyx":177
+ *     coordenadas (linha, coluna) do incio ao fim, ou None se no houver caminho.
+ *     """
+ *     if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:             # <<<<<<<<<<<<<<
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
  * 
 */
-  while (1) {
+  __pyx_t_2 = (__pyx_v_rows < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_cols < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((((((Py_ssize_t)__pyx_v_rows) * __pyx_v_cols) + 63) >> 6) > (__pyx_v_wall_bits.shape[0]));
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
 
-    /* "maze_solver_cy.pyx":194
- *     # Construir caminho de trs para frente
- *     while True:
- *         path.append((curr_r, curr_c))             # <<<<<<<<<<<<<<
+    /* "maze_solver_cy.pyx":178
+ *     """
+ *     if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")             # <<<<<<<<<<<<<<
  * 
- *         if curr_r == start_r and curr_c == start_c:
+ *     cdef coord_type_t start_r = start_coords[0]
 */
-    __pyx_t_7 = __Pyx_PyLong_From_npy_int32(__pyx_v_curr_r); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 194, __pyx_L1_error)
+    __pyx_t_4 = NULL;
+    __Pyx_INCREF(__pyx_builtin_ValueError);
+    __pyx_t_5 = __pyx_builtin_ValueError; 
+    __pyx_t_6 = __Pyx_PyUnicode_From_int(__pyx_v_rows, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyUnicode_From_int(__pyx_v_cols, 0, ' ', 'd'); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 178, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_10 = __Pyx_PyLong_From_npy_int32(__pyx_v_curr_c); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 194, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_10);
-    __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 194, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyUnicode_From_Py_ssize_t((__pyx_v_wall_bits.shape[0]), 0, ' ', 'd'); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 178, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_GIVEREF(__pyx_t_7);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7) != (0)) __PYX_ERR(0, 194, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_10);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_10) != (0)) __PYX_ERR(0, 194, __pyx_L1_error);
-    __pyx_t_7 = 0;
-    __pyx_t_10 = 0;
-    __pyx_t_15 = __Pyx_PyList_Append(__pyx_v_path, __pyx_t_8); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 194, __pyx_L1_error)
+    __pyx_t_9[0] = __pyx_mstate_global->__pyx_kp_u_Dimenses;
+    __pyx_t_9[1] = __pyx_t_6;
+    __pyx_t_9[2] = __pyx_mstate_global->__pyx_n_u_x;
+    __pyx_t_9[3] = __pyx_t_7;
+    __pyx_t_9[4] = __pyx_mstate_global->__pyx_kp_u_incompatveis_com_o_bitmap_de_pa;
+    __pyx_t_9[5] = __pyx_t_8;
+    __pyx_t_9[6] = __pyx_mstate_global->__pyx_kp_u_palavras;
+    __pyx_t_10 = __Pyx_PyUnicode_Join(__pyx_t_9, 7, 10 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6) + 1 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_7) + 40 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_8) + 11, 255);
+    if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-
-    /* "maze_solver_cy.pyx":196
- *         path.append((curr_r, curr_c))
- * 
- *         if curr_r == start_r and curr_c == start_c:             # <<<<<<<<<<<<<<
- *             break
- * 
-*/
-    __pyx_t_2 = (__pyx_v_curr_r == __pyx_v_start_r);
-    if (__pyx_t_2) {
-    } else {
-      __pyx_t_3 = __pyx_t_2;
-      goto __pyx_L58_bool_binop_done;
+    __pyx_t_11 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_10};
+      __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
     }
-    __pyx_t_2 = (__pyx_v_curr_c == __pyx_v_start_c);
-    __pyx_t_3 = __pyx_t_2;
-    __pyx_L58_bool_binop_done:;
-    if (__pyx_t_3) {
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 178, __pyx_L1_error)
 
-      /* "maze_solver_cy.pyx":197
- * 
- *         if curr_r == start_r and curr_c == start_c:
- *             break             # <<<<<<<<<<<<<<
+    /* "maze_solver_cy.pyx":177
+ *     coordenadas (linha, coluna) do incio ao fim, ou None se no houver caminho.
+ *     """
+ *     if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:             # <<<<<<<<<<<<<<
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
  * 
- *         prev_r = pred_r[curr_r, curr_c]
 */
-      goto __pyx_L56_break;
+  }
 
-      /* "maze_solver_cy.pyx":196
- *         path.append((curr_r, curr_c))
- * 
- *         if curr_r == start_r and curr_c == start_c:             # <<<<<<<<<<<<<<
- *             break
+  /* "maze_solver_cy.pyx":180
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
  * 
+ *     cdef coord_type_t start_r = start_coords[0]             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t start_c = start_coords[1]
+ *     cdef coord_type_t end_r = end_coords[0]
 */
-    }
+  if (unlikely(__pyx_v_start_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 180, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_start_coords, 0)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 180, __pyx_L1_error)
+  __pyx_v_start_r = __pyx_t_12;
 
-    /* "maze_solver_cy.pyx":199
- *             break
- * 
- *         prev_r = pred_r[curr_r, curr_c]             # <<<<<<<<<<<<<<
- *         prev_c = pred_c[curr_r, curr_c]
+  /* "maze_solver_cy.pyx":181
  * 
+ *     cdef coord_type_t start_r = start_coords[0]
+ *     cdef coord_type_t start_c = start_coords[1]             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t end_r = end_coords[0]
+ *     cdef coord_type_t end_c = end_coords[1]
 */
-    __pyx_t_5 = __pyx_v_curr_r;
-    __pyx_t_4 = __pyx_v_curr_c;
-    __pyx_v_prev_r = (*((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_r.data + __pyx_t_5 * __pyx_v_pred_r.strides[0]) )) + __pyx_t_4)) )));
+  if (unlikely(__pyx_v_start_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 181, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_start_coords, 1)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 181, __pyx_L1_error)
+  __pyx_v_start_c = __pyx_t_12;
 
-    /* "maze_solver_cy.pyx":200
- * 
- *         prev_r = pred_r[curr_r, curr_c]
- *         prev_c = pred_c[curr_r, curr_c]             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":182
+ *     cdef coord_type_t start_r = start_coords[0]
+ *     cdef coord_type_t start_c = start_coords[1]
+ *     cdef coord_type_t end_r = end_coords[0]             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t end_c = end_coords[1]
  * 
- *         if prev_r == -1 and prev_c == -1:
 */
-    __pyx_t_4 = __pyx_v_curr_r;
-    __pyx_t_5 = __pyx_v_curr_c;
-    __pyx_v_prev_c = (*((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_pred_c.data + __pyx_t_4 * __pyx_v_pred_c.strides[0]) )) + __pyx_t_5)) )));
+  if (unlikely(__pyx_v_end_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 182, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_end_coords, 0)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 182, __pyx_L1_error)
+  __pyx_v_end_r = __pyx_t_12;
 
-    /* "maze_solver_cy.pyx":202
- *         prev_c = pred_c[curr_r, curr_c]
- * 
- *         if prev_r == -1 and prev_c == -1:             # <<<<<<<<<<<<<<
- *             return None  # Erro na reconstruo
+  /* "maze_solver_cy.pyx":183
+ *     cdef coord_type_t start_c = start_coords[1]
+ *     cdef coord_type_t end_r = end_coords[0]
+ *     cdef coord_type_t end_c = end_coords[1]             # <<<<<<<<<<<<<<
  * 
+ *     # Validao rpida das coordenadas
 */
-    __pyx_t_2 = (__pyx_v_prev_r == -1L);
-    if (__pyx_t_2) {
-    } else {
-      __pyx_t_3 = __pyx_t_2;
-      goto __pyx_L61_bool_binop_done;
-    }
-    __pyx_t_2 = (__pyx_v_prev_c == -1L);
-    __pyx_t_3 = __pyx_t_2;
-    __pyx_L61_bool_binop_done:;
-    if (__pyx_t_3) {
+  if (unlikely(__pyx_v_end_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 183, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_end_coords, 1)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_v_end_c = __pyx_t_12;
 
-      /* "maze_solver_cy.pyx":203
+  /* "maze_solver_cy.pyx":186
  * 
- *         if prev_r == -1 and prev_c == -1:
- *             return None  # Erro na reconstruo             # <<<<<<<<<<<<<<
- * 
- *         curr_r = prev_r
-*/
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_r = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
-      goto __pyx_L0;
+ *     # Validao rpida das coordenadas
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None
+*/
+  __pyx_t_2 = (__pyx_v_start_r < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_r >= __pyx_v_rows);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_c < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_c >= __pyx_v_cols);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
 
-      /* "maze_solver_cy.pyx":202
- *         prev_c = pred_c[curr_r, curr_c]
- * 
- *         if prev_r == -1 and prev_c == -1:             # <<<<<<<<<<<<<<
- *             return None  # Erro na reconstruo
+  /* "maze_solver_cy.pyx":187
+ *     # Validao rpida das coordenadas
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):             # <<<<<<<<<<<<<<
+ *         return None
  * 
 */
-    }
+  __pyx_t_2 = (__pyx_v_end_r < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_end_r >= __pyx_v_rows);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_end_c < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_end_c >= __pyx_v_cols);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
 
-    /* "maze_solver_cy.pyx":205
- *             return None  # Erro na reconstruo
- * 
- *         curr_r = prev_r             # <<<<<<<<<<<<<<
- *         curr_c = prev_c
+  /* "maze_solver_cy.pyx":186
  * 
+ *     # Validao rpida das coordenadas
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None
 */
-    __pyx_v_curr_r = __pyx_v_prev_r;
+  if (__pyx_t_1) {
 
-    /* "maze_solver_cy.pyx":206
+    /* "maze_solver_cy.pyx":188
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None             # <<<<<<<<<<<<<<
  * 
- *         curr_r = prev_r
- *         curr_c = prev_c             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t start_idx = start_r * cols + start_c
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":186
  * 
- *     # Reverter o caminho para ordem correta
+ *     # Validao rpida das coordenadas
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None
 */
-    __pyx_v_curr_c = __pyx_v_prev_c;
   }
-  __pyx_L56_break:;
 
-  /* "maze_solver_cy.pyx":209
+  /* "maze_solver_cy.pyx":190
+ *         return None
  * 
- *     # Reverter o caminho para ordem correta
- *     path.reverse()             # <<<<<<<<<<<<<<
- *     return path
+ *     cdef cell_index_type_t start_idx = start_r * cols + start_c             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c
  * 
 */
-  __pyx_t_15 = PyList_Reverse(__pyx_v_path); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_v_start_idx = ((__pyx_v_start_r * __pyx_v_cols) + __pyx_v_start_c);
 
-  /* "maze_solver_cy.pyx":210
- *     # Reverter o caminho para ordem correta
- *     path.reverse()
- *     return path             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":191
  * 
+ *     cdef cell_index_type_t start_idx = start_r * cols + start_c
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c             # <<<<<<<<<<<<<<
  * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):
 */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_path);
-  __pyx_r = __pyx_v_path;
-  goto __pyx_L0;
+  __pyx_v_end_idx = ((__pyx_v_end_r * __pyx_v_cols) + __pyx_v_end_c);
 
-  /* "maze_solver_cy.pyx":77
- * DEF DC_RIGHT = 1
+  /* "maze_solver_cy.pyx":193
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):             # <<<<<<<<<<<<<<
+ *         return None
  * 
- * cpdef list find_shortest_path_cython_optimized(cnp.int32_t[:, ::1] int_grid, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
- *     """
- *     Verso otimizada do BFS para encontrar o caminho mais curto no labirinto.
 */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_14, 1);
-  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_cython_optimized", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_visited_np_array);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_visited, 1);
-  __Pyx_XDECREF(__pyx_v_pred_r_np);
-  __Pyx_XDECREF(__pyx_v_pred_c_np);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_pred_r, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_pred_c, 1);
-  __Pyx_XDECREF(__pyx_v_path);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14maze_solver_cy_find_shortest_path_cython_optimized, "\n    Vers\303\243o otimizada do BFS para encontrar o caminho mais curto no labirinto.\n    \n    Otimiza\303\247\303\265es implementadas:\n    - Queue circular customizada em C para eliminar overhead do Python\n    - Elimina\303\247\303\243o de aloca\303\247\303\265es desnecess\303\241rias\n    - Uso de nogil para paralelismo potencial\n    - Estruturas de dados mais eficientes\n    - Elimina\303\247\303\243o de checagens redundantes\n    ");
-static PyMethodDef __pyx_mdef_14maze_solver_cy_1find_shortest_path_cython_optimized = {"find_shortest_path_cython_optimized", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14maze_solver_cy_find_shortest_path_cython_optimized};
-static PyObject *__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  __Pyx_memviewslice __pyx_v_int_grid = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_start_coords = 0;
-  PyObject *__pyx_v_end_coords = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("find_shortest_path_cython_optimized (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_int_grid,&__pyx_mstate_global->__pyx_n_u_start_coords,&__pyx_mstate_global->__pyx_n_u_end_coords,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 77, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 77, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 77, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 77, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "find_shortest_path_cython_optimized", 0) < 0) __PYX_ERR(0, 77, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("find_shortest_path_cython_optimized", 1, 3, 3, i); __PYX_ERR(0, 77, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 77, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 77, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 77, __pyx_L3_error)
-    }
-    __pyx_v_int_grid = __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_5numpy_int32_t(values[0], PyBUF_WRITABLE); if (unlikely(!__pyx_v_int_grid.memview)) __PYX_ERR(0, 77, __pyx_L3_error)
-    __pyx_v_start_coords = ((PyObject*)values[1]);
-    __pyx_v_end_coords = ((PyObject*)values[2]);
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("find_shortest_path_cython_optimized", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 77, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_int_grid, 1);
-  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_cython_optimized", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_start_coords), (&PyTuple_Type), 1, "start_coords", 1))) __PYX_ERR(0, 77, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_end_coords), (&PyTuple_Type), 1, "end_coords", 1))) __PYX_ERR(0, 77, __pyx_L1_error)
-  __pyx_r = __pyx_pf_14maze_solver_cy_find_shortest_path_cython_optimized(__pyx_self, __pyx_v_int_grid, __pyx_v_start_coords, __pyx_v_end_coords);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
+  __pyx_t_2 = __pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, __pyx_v_start_idx);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L17_bool_binop_done;
   }
-  __pyx_L7_cleaned_up:;
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_int_grid, 1);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  __pyx_t_2 = __pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, __pyx_v_end_idx);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L17_bool_binop_done:;
+  if (__pyx_t_1) {
 
-static PyObject *__pyx_pf_14maze_solver_cy_find_shortest_path_cython_optimized(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_int_grid, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("find_shortest_path_cython_optimized", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_14maze_solver_cy_find_shortest_path_cython_optimized(__pyx_v_int_grid, __pyx_v_start_coords, __pyx_v_end_coords, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+    /* "maze_solver_cy.pyx":194
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     # Caso especial: incio igual ao fim
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_cython_optimized", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+    /* "maze_solver_cy.pyx":193
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
+  }
 
-/* "maze_solver_cy.pyx":213
+  /* "maze_solver_cy.pyx":197
  * 
+ *     # Caso especial: incio igual ao fim
+ *     if start_r == end_r and start_c == end_c:             # <<<<<<<<<<<<<<
+ *         return np.array([[start_r, start_c]], dtype=np.int32)
  * 
- * def parse_maze_text(maze_text):             # <<<<<<<<<<<<<<
- *     """
- *     Converte texto do labirinto para formato de grid inteiro.
 */
+  __pyx_t_2 = (__pyx_v_start_r == __pyx_v_end_r);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_c == __pyx_v_end_c);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L20_bool_binop_done:;
+  if (__pyx_t_1) {
 
-/* Python wrapper */
-static PyObject *__pyx_pw_14maze_solver_cy_3parse_maze_text(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14maze_solver_cy_2parse_maze_text, "\n    Converte texto do labirinto para formato de grid inteiro.\n    \n    Args:\n        maze_text: string com o labirinto, linhas separadas por \n\n        \n    Returns:\n        tuple: (int_grid, start_coords, end_coords) ou None se inv\303\241lido\n    ");
-static PyMethodDef __pyx_mdef_14maze_solver_cy_3parse_maze_text = {"parse_maze_text", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14maze_solver_cy_3parse_maze_text, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14maze_solver_cy_2parse_maze_text};
-static PyObject *__pyx_pw_14maze_solver_cy_3parse_maze_text(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_maze_text = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("parse_maze_text (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
+    /* "maze_solver_cy.pyx":198
+ *     # Caso especial: incio igual ao fim
+ *     if start_r == end_r and start_c == end_c:
+ *         return np.array([[start_r, start_c]], dtype=np.int32)             # <<<<<<<<<<<<<<
+ * 
+ *     # Inicializar estruturas de dados
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_5 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = __Pyx_PyLong_From_npy_int32(__pyx_v_start_r); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_8 = __Pyx_PyLong_From_npy_int32(__pyx_v_start_c); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_7 = PyList_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_10);
+    if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 0, __pyx_t_10) != (0)) __PYX_ERR(0, 198, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_8);
+    if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 1, __pyx_t_8) != (0)) __PYX_ERR(0, 198, __pyx_L1_error);
+    __pyx_t_10 = 0;
+    __pyx_t_8 = 0;
+    __pyx_t_8 = PyList_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_7);
+    if (__Pyx_PyList_SET_ITEM(__pyx_t_8, 0, __pyx_t_7) != (0)) __PYX_ERR(0, 198, __pyx_L1_error);
+    __pyx_t_7 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_11 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      assert(__pyx_t_5);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+      __pyx_t_11 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_8};
+      __pyx_t_7 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 198, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_10, __pyx_t_7, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_4, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":197
+ * 
+ *     # Caso especial: incio igual ao fim
+ *     if start_r == end_r and start_c == end_c:             # <<<<<<<<<<<<<<
+ *         return np.array([[start_r, start_c]], dtype=np.int32)
+ * 
+*/
+  }
+
+  /* "maze_solver_cy.pyx":201
+ * 
+ *     # Inicializar estruturas de dados
+ *     cdef queue_index_t max_queue_size = rows * cols             # <<<<<<<<<<<<<<
+ *     cdef SearchSide forward, backward
+ *     init_side(&forward, FORWARD_SHIFT, max_queue_size)
+*/
+  __pyx_v_max_queue_size = (__pyx_v_rows * __pyx_v_cols);
+
+  /* "maze_solver_cy.pyx":203
+ *     cdef queue_index_t max_queue_size = rows * cols
+ *     cdef SearchSide forward, backward
+ *     init_side(&forward, FORWARD_SHIFT, max_queue_size)             # <<<<<<<<<<<<<<
+ *     init_side(&backward, BACKWARD_SHIFT, max_queue_size)
+ * 
+*/
+  __pyx_f_14maze_solver_cy_init_side((&__pyx_v_forward), 0, __pyx_v_max_queue_size);
+
+  /* "maze_solver_cy.pyx":204
+ *     cdef SearchSide forward, backward
+ *     init_side(&forward, FORWARD_SHIFT, max_queue_size)
+ *     init_side(&backward, BACKWARD_SHIFT, max_queue_size)             # <<<<<<<<<<<<<<
+ * 
+ *     # Estado das clulas, indexado por r * cols + c: nibble baixo = direo do predecessor
+*/
+  __pyx_f_14maze_solver_cy_init_side((&__pyx_v_backward), 4, __pyx_v_max_queue_size);
+
+  /* "maze_solver_cy.pyx":208
+ *     # Estado das clulas, indexado por r * cols + c: nibble baixo = direo do predecessor
+ *     # na busca a partir do incio, nibble alto = na busca a partir do fim (0 = no visitada)
+ *     state_np_array = np.zeros(rows * cols, dtype=np.uint8)             # <<<<<<<<<<<<<<
+ *     cdef visited_cell_type_t[::1] state = state_np_array
+ * 
+*/
+  __pyx_t_4 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyLong_From_int((__pyx_v_rows * __pyx_v_cols)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_11 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_10))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_10);
+    assert(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_10);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_10, __pyx__function);
+    __pyx_t_11 = 0;
+  }
   #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_maze_text,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 213, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 213, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_t_7};
+    __pyx_t_8 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 208, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_8, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 208, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_10, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 208, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_v_state_np_array = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "maze_solver_cy.pyx":209
+ *     # na busca a partir do incio, nibble alto = na busca a partir do fim (0 = no visitada)
+ *     state_np_array = np.zeros(rows * cols, dtype=np.uint8)
+ *     cdef visited_cell_type_t[::1] state = state_np_array             # <<<<<<<<<<<<<<
+ * 
+ *     # Inicializar BFS
+*/
+  __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(__pyx_v_state_np_array, PyBUF_WRITABLE); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_v_state = __pyx_t_13;
+  __pyx_t_13.memview = NULL;
+  __pyx_t_13.data = NULL;
+
+  /* "maze_solver_cy.pyx":212
+ * 
+ *     # Inicializar BFS
+ *     enqueue(&forward.queue, start_idx)             # <<<<<<<<<<<<<<
+ *     state[start_idx] = PARENT_ROOT << FORWARD_SHIFT
+ *     enqueue(&backward.queue, end_idx)
+*/
+  __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_forward.queue), __pyx_v_start_idx);
+
+  /* "maze_solver_cy.pyx":213
+ *     # Inicializar BFS
+ *     enqueue(&forward.queue, start_idx)
+ *     state[start_idx] = PARENT_ROOT << FORWARD_SHIFT             # <<<<<<<<<<<<<<
+ *     enqueue(&backward.queue, end_idx)
+ *     state[end_idx] = PARENT_ROOT << BACKWARD_SHIFT
+*/
+  __pyx_t_14 = __pyx_v_start_idx;
+  *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) )) = 0x5;
+
+  /* "maze_solver_cy.pyx":214
+ *     enqueue(&forward.queue, start_idx)
+ *     state[start_idx] = PARENT_ROOT << FORWARD_SHIFT
+ *     enqueue(&backward.queue, end_idx)             # <<<<<<<<<<<<<<
+ *     state[end_idx] = PARENT_ROOT << BACKWARD_SHIFT
+ * 
+*/
+  __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_backward.queue), __pyx_v_end_idx);
+
+  /* "maze_solver_cy.pyx":215
+ *     state[start_idx] = PARENT_ROOT << FORWARD_SHIFT
+ *     enqueue(&backward.queue, end_idx)
+ *     state[end_idx] = PARENT_ROOT << BACKWARD_SHIFT             # <<<<<<<<<<<<<<
+ * 
+ *     # meet[0]  a clula expandida e meet[1] a vizinha j alcanada pela outra busca.
+*/
+  __pyx_t_14 = __pyx_v_end_idx;
+  *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) )) = 0x50;
+
+  /* "maze_solver_cy.pyx":221
+ *     # o primeiro encontro j d um caminho mnimo
+ *     cdef cell_index_type_t meet[2]
+ *     cdef bint path_found = False             # <<<<<<<<<<<<<<
+ *     cdef bint met_forward = False
+ * 
+*/
+  __pyx_v_path_found = 0;
+
+  /* "maze_solver_cy.pyx":222
+ *     cdef cell_index_type_t meet[2]
+ *     cdef bint path_found = False
+ *     cdef bint met_forward = False             # <<<<<<<<<<<<<<
+ * 
+ *     # BFS principal com nogil para mxima performance
+*/
+  __pyx_v_met_forward = 0;
+
+  /* "maze_solver_cy.pyx":225
+ * 
+ *     # BFS principal com nogil para mxima performance
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+*/
+  {
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      /*try:*/ {
+
+        /* "maze_solver_cy.pyx":226
+ *     # BFS principal com nogil para mxima performance
+ *     with nogil:
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):             # <<<<<<<<<<<<<<
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):
+*/
+        while (1) {
+          __pyx_t_2 = (!__pyx_f_14maze_solver_cy_is_queue_empty((&__pyx_v_forward.queue)));
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_1 = __pyx_t_2;
+            goto __pyx_L27_bool_binop_done;
+          }
+          __pyx_t_2 = (!__pyx_f_14maze_solver_cy_is_queue_empty((&__pyx_v_backward.queue)));
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_L27_bool_binop_done:;
+          if (!__pyx_t_1) break;
+
+          /* "maze_solver_cy.pyx":227
+ *     with nogil:
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:             # <<<<<<<<<<<<<<
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):
+ *                     path_found = True
+*/
+          __pyx_t_1 = ((__pyx_v_forward.queue.tail - __pyx_v_forward.queue.head) <= (__pyx_v_backward.queue.tail - __pyx_v_backward.queue.head));
+          if (__pyx_t_1) {
+
+            /* "maze_solver_cy.pyx":228
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):             # <<<<<<<<<<<<<<
+ *                     path_found = True
+ *                     met_forward = True
+*/
+            __pyx_t_14 = 0;
+            __pyx_t_1 = __pyx_f_14maze_solver_cy_expand_level((&__pyx_v_forward), (&(*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) )))), __pyx_v_wall_bits, __pyx_v_rows, __pyx_v_cols, __pyx_v_meet);
+            if (__pyx_t_1) {
+
+              /* "maze_solver_cy.pyx":229
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):
+ *                     path_found = True             # <<<<<<<<<<<<<<
+ *                     met_forward = True
+ *                     break
+*/
+              __pyx_v_path_found = 1;
+
+              /* "maze_solver_cy.pyx":230
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):
+ *                     path_found = True
+ *                     met_forward = True             # <<<<<<<<<<<<<<
+ *                     break
+ *             elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):
+*/
+              __pyx_v_met_forward = 1;
+
+              /* "maze_solver_cy.pyx":231
+ *                     path_found = True
+ *                     met_forward = True
+ *                     break             # <<<<<<<<<<<<<<
+ *             elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):
+ *                 path_found = True
+*/
+              goto __pyx_L26_break;
+
+              /* "maze_solver_cy.pyx":228
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):             # <<<<<<<<<<<<<<
+ *                     path_found = True
+ *                     met_forward = True
+*/
+            }
+
+            /* "maze_solver_cy.pyx":227
+ *     with nogil:
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:             # <<<<<<<<<<<<<<
+ *                 if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):
+ *                     path_found = True
+*/
+            goto __pyx_L29;
+          }
+
+          /* "maze_solver_cy.pyx":232
+ *                     met_forward = True
+ *                     break
+ *             elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):             # <<<<<<<<<<<<<<
+ *                 path_found = True
+ *                 break
+*/
+          __pyx_t_14 = 0;
+          __pyx_t_1 = __pyx_f_14maze_solver_cy_expand_level((&__pyx_v_backward), (&(*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) )))), __pyx_v_wall_bits, __pyx_v_rows, __pyx_v_cols, __pyx_v_meet);
+          if (__pyx_t_1) {
+
+            /* "maze_solver_cy.pyx":233
+ *                     break
+ *             elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):
+ *                 path_found = True             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+*/
+            __pyx_v_path_found = 1;
+
+            /* "maze_solver_cy.pyx":234
+ *             elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):
+ *                 path_found = True
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *     # Liberar memria das queues
+*/
+            goto __pyx_L26_break;
+
+            /* "maze_solver_cy.pyx":232
+ *                     met_forward = True
+ *                     break
+ *             elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):             # <<<<<<<<<<<<<<
+ *                 path_found = True
+ *                 break
+*/
+          }
+          __pyx_L29:;
+        }
+        __pyx_L26_break:;
       }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "parse_maze_text", 0) < 0) __PYX_ERR(0, 213, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("parse_maze_text", 1, 1, 1, i); __PYX_ERR(0, 213, __pyx_L3_error) }
+
+      /* "maze_solver_cy.pyx":225
+ * 
+ *     # BFS principal com nogil para mxima performance
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+ *             if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+*/
+      /*finally:*/ {
+        /*normal exit:*/{
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          goto __pyx_L24;
+        }
+        __pyx_L24:;
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 213, __pyx_L3_error)
-    }
-    __pyx_v_maze_text = values[0];
   }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("parse_maze_text", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 213, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
+
+  /* "maze_solver_cy.pyx":237
+ * 
+ *     # Liberar memria das queues
+ *     free_queue(&forward.queue)             # <<<<<<<<<<<<<<
+ *     free_queue(&backward.queue)
+ * 
+*/
+  __pyx_f_14maze_solver_cy_free_queue((&__pyx_v_forward.queue));
+
+  /* "maze_solver_cy.pyx":238
+ *     # Liberar memria das queues
+ *     free_queue(&forward.queue)
+ *     free_queue(&backward.queue)             # <<<<<<<<<<<<<<
+ * 
+ *     if not path_found:
+*/
+  __pyx_f_14maze_solver_cy_free_queue((&__pyx_v_backward.queue));
+
+  /* "maze_solver_cy.pyx":240
+ *     free_queue(&backward.queue)
+ * 
+ *     if not path_found:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
+  __pyx_t_1 = (!__pyx_v_path_found);
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":241
+ * 
+ *     if not path_found:
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     # Reconstruir caminho otimizado, direto em um array (N, 2) sem tuplas Python:
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":240
+ *     free_queue(&backward.queue)
+ * 
+ *     if not path_found:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
   }
-  __Pyx_AddTraceback("maze_solver_cy.parse_maze_text", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_14maze_solver_cy_2parse_maze_text(__pyx_self, __pyx_v_maze_text);
 
-  /* function exit code */
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
+  /* "maze_solver_cy.pyx":245
+ *     # Reconstruir caminho otimizado, direto em um array (N, 2) sem tuplas Python:
+ *     # [incio .. forward_end] pela busca direta + [backward_end .. fim] pela reversa
+ *     cdef cell_index_type_t forward_end = meet[0] if met_forward else meet[1]             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t backward_end = meet[1] if met_forward else meet[0]
+ *     cdef cell_index_type_t curr
+*/
+  if (__pyx_v_met_forward) {
+    __pyx_t_15 = (__pyx_v_meet[0]);
+  } else {
+    __pyx_t_15 = (__pyx_v_meet[1]);
   }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  __pyx_v_forward_end = __pyx_t_15;
 
-static PyObject *__pyx_pf_14maze_solver_cy_2parse_maze_text(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_maze_text) {
-  PyObject *__pyx_v_lines = NULL;
-  Py_ssize_t __pyx_v_rows;
-  Py_ssize_t __pyx_v_cols;
-  PyObject *__pyx_v_line = NULL;
-  PyObject *__pyx_v_int_grid = NULL;
-  PyObject *__pyx_v_start_coords = NULL;
-  PyObject *__pyx_v_end_coords = NULL;
-  Py_ssize_t __pyx_v_r;
-  Py_ssize_t __pyx_v_c;
-  PyObject *__pyx_v_char = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  /* "maze_solver_cy.pyx":246
+ *     # [incio .. forward_end] pela busca direta + [backward_end .. fim] pela reversa
+ *     cdef cell_index_type_t forward_end = meet[0] if met_forward else meet[1]
+ *     cdef cell_index_type_t backward_end = meet[1] if met_forward else meet[0]             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t curr
+ *     cdef Py_ssize_t forward_len = 1
+*/
+  if (__pyx_v_met_forward) {
+    __pyx_t_15 = (__pyx_v_meet[1]);
+  } else {
+    __pyx_t_15 = (__pyx_v_meet[0]);
+  }
+  __pyx_v_backward_end = __pyx_t_15;
+
+  /* "maze_solver_cy.pyx":248
+ *     cdef cell_index_type_t backward_end = meet[1] if met_forward else meet[0]
+ *     cdef cell_index_type_t curr
+ *     cdef Py_ssize_t forward_len = 1             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t backward_len = 1
+ * 
+*/
+  __pyx_v_forward_len = 1;
+
+  /* "maze_solver_cy.pyx":249
+ *     cdef cell_index_type_t curr
+ *     cdef Py_ssize_t forward_len = 1
+ *     cdef Py_ssize_t backward_len = 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Primeira passada: mede as duas metades seguindo os cdigos de direo
+*/
+  __pyx_v_backward_len = 1;
+
+  /* "maze_solver_cy.pyx":252
+ * 
+ *     # Primeira passada: mede as duas metades seguindo os cdigos de direo
+ *     curr = forward_end             # <<<<<<<<<<<<<<
+ *     while curr != start_idx:
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+*/
+  __pyx_v_curr = __pyx_v_forward_end;
+
+  /* "maze_solver_cy.pyx":253
+ *     # Primeira passada: mede as duas metades seguindo os cdigos de direo
+ *     curr = forward_end
+ *     while curr != start_idx:             # <<<<<<<<<<<<<<
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+ *         forward_len += 1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_curr != __pyx_v_start_idx);
+    if (!__pyx_t_1) break;
+
+    /* "maze_solver_cy.pyx":254
+ *     curr = forward_end
+ *     while curr != start_idx:
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)             # <<<<<<<<<<<<<<
+ *         forward_len += 1
+ *     curr = backward_end
+*/
+    __pyx_t_14 = __pyx_v_curr;
+    __pyx_v_curr = __pyx_f_14maze_solver_cy_parent_of(__pyx_v_curr, ((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) ))) & 0x0F), __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":255
+ *     while curr != start_idx:
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+ *         forward_len += 1             # <<<<<<<<<<<<<<
+ *     curr = backward_end
+ *     while curr != end_idx:
+*/
+    __pyx_v_forward_len = (__pyx_v_forward_len + 1);
+  }
+
+  /* "maze_solver_cy.pyx":256
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+ *         forward_len += 1
+ *     curr = backward_end             # <<<<<<<<<<<<<<
+ *     while curr != end_idx:
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+*/
+  __pyx_v_curr = __pyx_v_backward_end;
+
+  /* "maze_solver_cy.pyx":257
+ *         forward_len += 1
+ *     curr = backward_end
+ *     while curr != end_idx:             # <<<<<<<<<<<<<<
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+ *         backward_len += 1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_curr != __pyx_v_end_idx);
+    if (!__pyx_t_1) break;
+
+    /* "maze_solver_cy.pyx":258
+ *     curr = backward_end
+ *     while curr != end_idx:
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)             # <<<<<<<<<<<<<<
+ *         backward_len += 1
+ * 
+*/
+    __pyx_t_14 = __pyx_v_curr;
+    __pyx_v_curr = __pyx_f_14maze_solver_cy_parent_of(__pyx_v_curr, ((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) ))) >> 4), __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":259
+ *     while curr != end_idx:
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+ *         backward_len += 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Segunda passada: preenche a metade direta de trs para frente e a reversa em ordem
+*/
+    __pyx_v_backward_len = (__pyx_v_backward_len + 1);
+  }
+
+  /* "maze_solver_cy.pyx":262
+ * 
+ *     # Segunda passada: preenche a metade direta de trs para frente e a reversa em ordem
+ *     path_np = np.empty((forward_len + backward_len, 2), dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t[:, ::1] path = path_np
+ *     cdef Py_ssize_t i = forward_len - 1
+*/
+  __pyx_t_10 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = PyLong_FromSsize_t((__pyx_v_forward_len + __pyx_v_backward_len)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_8) != (0)) __PYX_ERR(0, 262, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_mstate_global->__pyx_int_2);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_int_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_mstate_global->__pyx_int_2) != (0)) __PYX_ERR(0, 262, __pyx_L1_error);
+  __pyx_t_8 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_11 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_10);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
+    __pyx_t_11 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_10, __pyx_t_7};
+    __pyx_t_8 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 262, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_8, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 262, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_5, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 262, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_v_path_np = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "maze_solver_cy.pyx":263
+ *     # Segunda passada: preenche a metade direta de trs para frente e a reversa em ordem
+ *     path_np = np.empty((forward_len + backward_len, 2), dtype=np.int32)
+ *     cdef coord_type_t[:, ::1] path = path_np             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = forward_len - 1
+ *     curr = forward_end
+*/
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(__pyx_v_path_np, PyBUF_WRITABLE); if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __pyx_v_path = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "maze_solver_cy.pyx":264
+ *     path_np = np.empty((forward_len + backward_len, 2), dtype=np.int32)
+ *     cdef coord_type_t[:, ::1] path = path_np
+ *     cdef Py_ssize_t i = forward_len - 1             # <<<<<<<<<<<<<<
+ *     curr = forward_end
+ *     while True:
+*/
+  __pyx_v_i = (__pyx_v_forward_len - 1);
+
+  /* "maze_solver_cy.pyx":265
+ *     cdef coord_type_t[:, ::1] path = path_np
+ *     cdef Py_ssize_t i = forward_len - 1
+ *     curr = forward_end             # <<<<<<<<<<<<<<
+ *     while True:
+ *         path[i, 0] = curr // cols
+*/
+  __pyx_v_curr = __pyx_v_forward_end;
+
+  /* "maze_solver_cy.pyx":266
+ *     cdef Py_ssize_t i = forward_len - 1
+ *     curr = forward_end
+ *     while True:             # <<<<<<<<<<<<<<
+ *         path[i, 0] = curr // cols
+ *         path[i, 1] = curr % cols
+*/
+  while (1) {
+
+    /* "maze_solver_cy.pyx":267
+ *     curr = forward_end
+ *     while True:
+ *         path[i, 0] = curr // cols             # <<<<<<<<<<<<<<
+ *         path[i, 1] = curr % cols
+ * 
+*/
+    __pyx_t_14 = __pyx_v_i;
+    __pyx_t_17 = 0;
+    *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_path.data + __pyx_t_14 * __pyx_v_path.strides[0]) )) + __pyx_t_17)) )) = (__pyx_v_curr / __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":268
+ *     while True:
+ *         path[i, 0] = curr // cols
+ *         path[i, 1] = curr % cols             # <<<<<<<<<<<<<<
+ * 
+ *         if i == 0:
+*/
+    __pyx_t_17 = __pyx_v_i;
+    __pyx_t_14 = 1;
+    *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_path.data + __pyx_t_17 * __pyx_v_path.strides[0]) )) + __pyx_t_14)) )) = (__pyx_v_curr % __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":270
+ *         path[i, 1] = curr % cols
+ * 
+ *         if i == 0:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+*/
+    __pyx_t_1 = (__pyx_v_i == 0);
+    if (__pyx_t_1) {
+
+      /* "maze_solver_cy.pyx":271
+ * 
+ *         if i == 0:
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+*/
+      goto __pyx_L37_break;
+
+      /* "maze_solver_cy.pyx":270
+ *         path[i, 1] = curr % cols
+ * 
+ *         if i == 0:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+*/
+    }
+
+    /* "maze_solver_cy.pyx":273
+ *             break
+ * 
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)             # <<<<<<<<<<<<<<
+ *         i -= 1
+ * 
+*/
+    __pyx_t_14 = __pyx_v_curr;
+    __pyx_v_curr = __pyx_f_14maze_solver_cy_parent_of(__pyx_v_curr, ((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) ))) & 0x0F), __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":274
+ * 
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+ *         i -= 1             # <<<<<<<<<<<<<<
+ * 
+ *     i = forward_len
+*/
+    __pyx_v_i = (__pyx_v_i - 1);
+  }
+  __pyx_L37_break:;
+
+  /* "maze_solver_cy.pyx":276
+ *         i -= 1
+ * 
+ *     i = forward_len             # <<<<<<<<<<<<<<
+ *     curr = backward_end
+ *     while True:
+*/
+  __pyx_v_i = __pyx_v_forward_len;
+
+  /* "maze_solver_cy.pyx":277
+ * 
+ *     i = forward_len
+ *     curr = backward_end             # <<<<<<<<<<<<<<
+ *     while True:
+ *         path[i, 0] = curr // cols
+*/
+  __pyx_v_curr = __pyx_v_backward_end;
+
+  /* "maze_solver_cy.pyx":278
+ *     i = forward_len
+ *     curr = backward_end
+ *     while True:             # <<<<<<<<<<<<<<
+ *         path[i, 0] = curr // cols
+ *         path[i, 1] = curr % cols
+*/
+  while (1) {
+
+    /* "maze_solver_cy.pyx":279
+ *     curr = backward_end
+ *     while True:
+ *         path[i, 0] = curr // cols             # <<<<<<<<<<<<<<
+ *         path[i, 1] = curr % cols
+ * 
+*/
+    __pyx_t_14 = __pyx_v_i;
+    __pyx_t_17 = 0;
+    *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_path.data + __pyx_t_14 * __pyx_v_path.strides[0]) )) + __pyx_t_17)) )) = (__pyx_v_curr / __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":280
+ *     while True:
+ *         path[i, 0] = curr // cols
+ *         path[i, 1] = curr % cols             # <<<<<<<<<<<<<<
+ * 
+ *         if curr == end_idx:
+*/
+    __pyx_t_17 = __pyx_v_i;
+    __pyx_t_14 = 1;
+    *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_path.data + __pyx_t_17 * __pyx_v_path.strides[0]) )) + __pyx_t_14)) )) = (__pyx_v_curr % __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":282
+ *         path[i, 1] = curr % cols
+ * 
+ *         if curr == end_idx:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+*/
+    __pyx_t_1 = (__pyx_v_curr == __pyx_v_end_idx);
+    if (__pyx_t_1) {
+
+      /* "maze_solver_cy.pyx":283
+ * 
+ *         if curr == end_idx:
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+*/
+      goto __pyx_L40_break;
+
+      /* "maze_solver_cy.pyx":282
+ *         path[i, 1] = curr % cols
+ * 
+ *         if curr == end_idx:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+*/
+    }
+
+    /* "maze_solver_cy.pyx":285
+ *             break
+ * 
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)             # <<<<<<<<<<<<<<
+ *         i += 1
+ * 
+*/
+    __pyx_t_14 = __pyx_v_curr;
+    __pyx_v_curr = __pyx_f_14maze_solver_cy_parent_of(__pyx_v_curr, ((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_14)) ))) >> 4), __pyx_v_cols);
+
+    /* "maze_solver_cy.pyx":286
+ * 
+ *         curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+ *         i += 1             # <<<<<<<<<<<<<<
+ * 
+ *     return path_np
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+  __pyx_L40_break:;
+
+  /* "maze_solver_cy.pyx":288
+ *         i += 1
+ * 
+ *     return path_np             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_path_np);
+  __pyx_r = __pyx_v_path_np;
+  goto __pyx_L0;
+
+  /* "maze_solver_cy.pyx":145
+ *     return False
+ * 
+ * cpdef object find_shortest_path_cython_optimized(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
+ *     """
+ *     Verso otimizada do BFS para encontrar o caminho mais curto no labirinto.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_16, 1);
+  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_cython_optimized", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state_np_array);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_state, 1);
+  __Pyx_XDECREF(__pyx_v_path_np);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_path, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14maze_solver_cy_find_shortest_path_cython_optimized, "\n    Vers\303\243o otimizada do BFS para encontrar o caminho mais curto no labirinto.\n\n    A busca \303\251 bidirecional: uma BFS parte do in\303\255cio e outra do fim, expandindo\n    um n\303\255vel por vez do lado com a fronteira menor, at\303\251 as duas se encontrarem.\n    Com caminho, find_shortest_path_astar \303\251 bem mais r\303\241pido; este BFS continua\n    como refer\303\252ncia e ganha quando n\303\243o h\303\241 caminho e um dos extremos est\303\241\n    isolado numa regi\303\243o pequena (para assim que essa regi\303\243o se esgota).\n    \n    Otimiza\303\247\303\265es implementadas:\n    - Queue customizada em C (array pr\303\251-alocado, sem m\303\263dulo) para eliminar overhead do Python\n    - Elimina\303\247\303\243o de aloca\303\247\303\265es desnecess\303\241rias\n    - La\303\247o do BFS inteiro sem o GIL: labirintos independentes podem ser\n      resolvidos em paralelo, um por thread\n    - Estruturas de dados mais eficientes\n    - Elimina\303\247\303\243o de checagens redundantes\n    - Grid empacotado em bits (1 bit por c\303\251lula): 32x menos banda de mem\303\263ria que int32;\n      o teste de parede \303\251 um shift e um and sobre o \303\255ndice plano\n    - C\303\251lulas por \303\255ndice plano (r * cols + c): vizinhos s\303\243o idx -+ 1 e idx -+ cols,\n      e queues/estado das c\303\251lulas s\303\243o arrays 1D\n    - Visitados e predecessores num \303\272nico byte por c\303\251lula: o c\303\263digo de dire\303\247\303\243o\n      do predecessor (um nibble por busca), em vez de um int32 por busca\n    - BFS bidirecional: cada lado s\303\263 cobre cerca de metade da dist\303\242ncia\n\n    `wall_bits` \303\251 o bitmap plano das paredes: a c\303\251lula (r, c) \303\251 o bit\n    idx & 63 da palavra idx >> 6, com idx = r * cols + c (ao menos\n    ceil(rows * cols / 64) palavras uint64).\n\n    Retorna o caminho como np.ndarray int32 de forma (N, 2), com as\n    coordenadas (linha, coluna) do in\303\255cio ao fim, ou None"" se n\303\243o houver caminho.\n    ");
+static PyMethodDef __pyx_mdef_14maze_solver_cy_1find_shortest_path_cython_optimized = {"find_shortest_path_cython_optimized", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14maze_solver_cy_find_shortest_path_cython_optimized};
+static PyObject *__pyx_pw_14maze_solver_cy_1find_shortest_path_cython_optimized(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  __Pyx_memviewslice __pyx_v_wall_bits = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_rows;
+  int __pyx_v_cols;
+  PyObject *__pyx_v_start_coords = 0;
+  PyObject *__pyx_v_end_coords = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[5] = {0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_shortest_path_cython_optimized (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_wall_bits,&__pyx_mstate_global->__pyx_n_u_rows,&__pyx_mstate_global->__pyx_n_u_cols,&__pyx_mstate_global->__pyx_n_u_start_coords,&__pyx_mstate_global->__pyx_n_u_end_coords,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 145, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 145, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 145, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 145, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 145, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 145, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "find_shortest_path_cython_optimized", 0) < 0) __PYX_ERR(0, 145, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("find_shortest_path_cython_optimized", 1, 5, 5, i); __PYX_ERR(0, 145, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 5)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 145, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 145, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 145, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 145, __pyx_L3_error)
+      values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 145, __pyx_L3_error)
+    }
+    __pyx_v_wall_bits = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_wall_word_type_t__const__(values[0], 0); if (unlikely(!__pyx_v_wall_bits.memview)) __PYX_ERR(0, 145, __pyx_L3_error)
+    __pyx_v_rows = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_rows == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L3_error)
+    __pyx_v_cols = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_cols == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L3_error)
+    __pyx_v_start_coords = ((PyObject*)values[3]);
+    __pyx_v_end_coords = ((PyObject*)values[4]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_shortest_path_cython_optimized", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 145, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_wall_bits, 1);
+  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_cython_optimized", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_start_coords), (&PyTuple_Type), 1, "start_coords", 1))) __PYX_ERR(0, 145, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_end_coords), (&PyTuple_Type), 1, "end_coords", 1))) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14maze_solver_cy_find_shortest_path_cython_optimized(__pyx_self, __pyx_v_wall_bits, __pyx_v_rows, __pyx_v_cols, __pyx_v_start_coords, __pyx_v_end_coords);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_wall_bits, 1);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_14maze_solver_cy_find_shortest_path_cython_optimized(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_shortest_path_cython_optimized", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_14maze_solver_cy_find_shortest_path_cython_optimized(__pyx_v_wall_bits, __pyx_v_rows, __pyx_v_cols, __pyx_v_start_coords, __pyx_v_end_coords, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_cython_optimized", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "maze_solver_cy.pyx":293
+ * DEF CLOSED_FLAG = 0x10 # No estado da clula (A*): j expandida com o menor custo
+ * 
+ * cdef inline cell_index_type_t manhattan(coord_type_t r, coord_type_t c, coord_type_t end_r, coord_type_t end_c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Distncia de Manhattan at o fim: heurstica admissvel e consistente com custo 1 por passo"""
+ *     cdef cell_index_type_t dr = r - end_r
+*/
+
+static CYTHON_INLINE __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_f_14maze_solver_cy_manhattan(__pyx_t_14maze_solver_cy_coord_type_t __pyx_v_r, __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_c, __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_r, __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_c) {
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_dr;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_dc;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_r;
+  int __pyx_t_1;
+
+  /* "maze_solver_cy.pyx":295
+ * cdef inline cell_index_type_t manhattan(coord_type_t r, coord_type_t c, coord_type_t end_r, coord_type_t end_c) noexcept nogil:
+ *     """Distncia de Manhattan at o fim: heurstica admissvel e consistente com custo 1 por passo"""
+ *     cdef cell_index_type_t dr = r - end_r             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t dc = c - end_c
+ *     if dr < 0:
+*/
+  __pyx_v_dr = (__pyx_v_r - __pyx_v_end_r);
+
+  /* "maze_solver_cy.pyx":296
+ *     """Distncia de Manhattan at o fim: heurstica admissvel e consistente com custo 1 por passo"""
+ *     cdef cell_index_type_t dr = r - end_r
+ *     cdef cell_index_type_t dc = c - end_c             # <<<<<<<<<<<<<<
+ *     if dr < 0:
+ *         dr = -dr
+*/
+  __pyx_v_dc = (__pyx_v_c - __pyx_v_end_c);
+
+  /* "maze_solver_cy.pyx":297
+ *     cdef cell_index_type_t dr = r - end_r
+ *     cdef cell_index_type_t dc = c - end_c
+ *     if dr < 0:             # <<<<<<<<<<<<<<
+ *         dr = -dr
+ *     if dc < 0:
+*/
+  __pyx_t_1 = (__pyx_v_dr < 0);
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":298
+ *     cdef cell_index_type_t dc = c - end_c
+ *     if dr < 0:
+ *         dr = -dr             # <<<<<<<<<<<<<<
+ *     if dc < 0:
+ *         dc = -dc
+*/
+    __pyx_v_dr = (-__pyx_v_dr);
+
+    /* "maze_solver_cy.pyx":297
+ *     cdef cell_index_type_t dr = r - end_r
+ *     cdef cell_index_type_t dc = c - end_c
+ *     if dr < 0:             # <<<<<<<<<<<<<<
+ *         dr = -dr
+ *     if dc < 0:
+*/
+  }
+
+  /* "maze_solver_cy.pyx":299
+ *     if dr < 0:
+ *         dr = -dr
+ *     if dc < 0:             # <<<<<<<<<<<<<<
+ *         dc = -dc
+ *     return dr + dc
+*/
+  __pyx_t_1 = (__pyx_v_dc < 0);
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":300
+ *         dr = -dr
+ *     if dc < 0:
+ *         dc = -dc             # <<<<<<<<<<<<<<
+ *     return dr + dc
+ * 
+*/
+    __pyx_v_dc = (-__pyx_v_dc);
+
+    /* "maze_solver_cy.pyx":299
+ *     if dr < 0:
+ *         dr = -dr
+ *     if dc < 0:             # <<<<<<<<<<<<<<
+ *         dc = -dc
+ *     return dr + dc
+*/
+  }
+
+  /* "maze_solver_cy.pyx":301
+ *     if dc < 0:
+ *         dc = -dc
+ *     return dr + dc             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void astar_visit(visited_cell_type_t* state, cell_index_type_t* cost, CellQueue* current, CellQueue* upper,
+*/
+  __pyx_r = (__pyx_v_dr + __pyx_v_dc);
+  goto __pyx_L0;
+
+  /* "maze_solver_cy.pyx":293
+ * DEF CLOSED_FLAG = 0x10 # No estado da clula (A*): j expandida com o menor custo
+ * 
+ * cdef inline cell_index_type_t manhattan(coord_type_t r, coord_type_t c, coord_type_t end_r, coord_type_t end_c) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Distncia de Manhattan at o fim: heurstica admissvel e consistente com custo 1 por passo"""
+ *     cdef cell_index_type_t dr = r - end_r
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "maze_solver_cy.pyx":303
+ *     return dr + dc
+ * 
+ * cdef inline void astar_visit(visited_cell_type_t* state, cell_index_type_t* cost, CellQueue* current, CellQueue* upper,             # <<<<<<<<<<<<<<
+ *                              cell_index_type_t nidx, cell_index_type_t new_cost, cell_index_type_t f,
+ *                              cell_index_type_t f_bound, visited_cell_type_t parent_code) noexcept nogil:
+*/
+
+static CYTHON_INLINE void __pyx_f_14maze_solver_cy_astar_visit(__pyx_t_14maze_solver_cy_visited_cell_type_t *__pyx_v_state, __pyx_t_14maze_solver_cy_cell_index_type_t *__pyx_v_cost, struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_current, struct __pyx_t_14maze_solver_cy_CellQueue *__pyx_v_upper, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_nidx, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_new_cost, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_f, __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_f_bound, __pyx_t_14maze_solver_cy_visited_cell_type_t __pyx_v_parent_code) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "maze_solver_cy.pyx":307
+ *                              cell_index_type_t f_bound, visited_cell_type_t parent_code) noexcept nogil:
+ *     """Registra nidx com custo new_cost se for melhor que o atual, no balde de f (f_bound ou f_bound + 2)"""
+ *     if state[nidx] & CLOSED_FLAG:             # <<<<<<<<<<<<<<
+ *         return
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:
+*/
+  __pyx_t_1 = (((__pyx_v_state[__pyx_v_nidx]) & 16) != 0);
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":308
+ *     """Registra nidx com custo new_cost se for melhor que o atual, no balde de f (f_bound ou f_bound + 2)"""
+ *     if state[nidx] & CLOSED_FLAG:
+ *         return             # <<<<<<<<<<<<<<
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:
+ *         return
+*/
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":307
+ *                              cell_index_type_t f_bound, visited_cell_type_t parent_code) noexcept nogil:
+ *     """Registra nidx com custo new_cost se for melhor que o atual, no balde de f (f_bound ou f_bound + 2)"""
+ *     if state[nidx] & CLOSED_FLAG:             # <<<<<<<<<<<<<<
+ *         return
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:
+*/
+  }
+
+  /* "maze_solver_cy.pyx":309
+ *     if state[nidx] & CLOSED_FLAG:
+ *         return
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:             # <<<<<<<<<<<<<<
+ *         return
+ *     cost[nidx] = new_cost
+*/
+  __pyx_t_2 = ((__pyx_v_state[__pyx_v_nidx]) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_cost[__pyx_v_nidx]) <= __pyx_v_new_cost);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":310
+ *         return
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:
+ *         return             # <<<<<<<<<<<<<<
+ *     cost[nidx] = new_cost
+ *     state[nidx] = parent_code
+*/
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":309
+ *     if state[nidx] & CLOSED_FLAG:
+ *         return
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:             # <<<<<<<<<<<<<<
+ *         return
+ *     cost[nidx] = new_cost
+*/
+  }
+
+  /* "maze_solver_cy.pyx":311
+ *     if state[nidx] != 0 and cost[nidx] <= new_cost:
+ *         return
+ *     cost[nidx] = new_cost             # <<<<<<<<<<<<<<
+ *     state[nidx] = parent_code
+ *     if f == f_bound:
+*/
+  (__pyx_v_cost[__pyx_v_nidx]) = __pyx_v_new_cost;
+
+  /* "maze_solver_cy.pyx":312
+ *         return
+ *     cost[nidx] = new_cost
+ *     state[nidx] = parent_code             # <<<<<<<<<<<<<<
+ *     if f == f_bound:
+ *         enqueue(current, nidx)
+*/
+  (__pyx_v_state[__pyx_v_nidx]) = __pyx_v_parent_code;
+
+  /* "maze_solver_cy.pyx":313
+ *     cost[nidx] = new_cost
+ *     state[nidx] = parent_code
+ *     if f == f_bound:             # <<<<<<<<<<<<<<
+ *         enqueue(current, nidx)
+ *     else:
+*/
+  __pyx_t_1 = (__pyx_v_f == __pyx_v_f_bound);
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":314
+ *     state[nidx] = parent_code
+ *     if f == f_bound:
+ *         enqueue(current, nidx)             # <<<<<<<<<<<<<<
+ *     else:
+ *         enqueue(upper, nidx)
+*/
+    __pyx_f_14maze_solver_cy_enqueue(__pyx_v_current, __pyx_v_nidx);
+
+    /* "maze_solver_cy.pyx":313
+ *     cost[nidx] = new_cost
+ *     state[nidx] = parent_code
+ *     if f == f_bound:             # <<<<<<<<<<<<<<
+ *         enqueue(current, nidx)
+ *     else:
+*/
+    goto __pyx_L7;
+  }
+
+  /* "maze_solver_cy.pyx":316
+ *         enqueue(current, nidx)
+ *     else:
+ *         enqueue(upper, nidx)             # <<<<<<<<<<<<<<
+ * 
+ * cpdef object find_shortest_path_astar(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):
+*/
+  /*else*/ {
+    __pyx_f_14maze_solver_cy_enqueue(__pyx_v_upper, __pyx_v_nidx);
+  }
+  __pyx_L7:;
+
+  /* "maze_solver_cy.pyx":303
+ *     return dr + dc
+ * 
+ * cdef inline void astar_visit(visited_cell_type_t* state, cell_index_type_t* cost, CellQueue* current, CellQueue* upper,             # <<<<<<<<<<<<<<
+ *                              cell_index_type_t nidx, cell_index_type_t new_cost, cell_index_type_t f,
+ *                              cell_index_type_t f_bound, visited_cell_type_t parent_code) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+}
+
+/* "maze_solver_cy.pyx":318
+ *         enqueue(upper, nidx)
+ * 
+ * cpdef object find_shortest_path_astar(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
+ *     """
+ *     A* com heurstica de Manhattan para encontrar o caminho mais curto no labirinto.
+*/
+
+static PyObject *__pyx_pw_14maze_solver_cy_3find_shortest_path_astar(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_14maze_solver_cy_find_shortest_path_astar(__Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_start_r;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_start_c;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_r;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_end_c;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_start_idx;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_end_idx;
+  PyObject *__pyx_v_state_np_array = NULL;
+  PyObject *__pyx_v_cost_np_array = NULL;
+  __Pyx_memviewslice __pyx_v_state = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_cost = { 0, 0, { 0 }, { 0 }, { 0 } };
+  struct __pyx_t_14maze_solver_cy_CellQueue __pyx_v_current;
+  struct __pyx_t_14maze_solver_cy_CellQueue __pyx_v_upper;
+  struct __pyx_t_14maze_solver_cy_CellQueue __pyx_v_swap;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_f_bound;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_idx;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_new_cost;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_r;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_v_c;
+  int __pyx_v_path_found;
+  PyObject *__pyx_v_path_np = NULL;
+  __Pyx_memviewslice __pyx_v_path = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_v_i;
+  __pyx_t_14maze_solver_cy_cell_index_type_t __pyx_v_curr;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  PyObject *(*__pyx_t_10)(PyObject *);
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  Py_ssize_t __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9[7];
+  PyObject *__pyx_t_10 = NULL;
+  size_t __pyx_t_11;
+  __pyx_t_14maze_solver_cy_coord_type_t __pyx_t_12;
+  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
   Py_ssize_t __pyx_t_15;
   Py_ssize_t __pyx_t_16;
+  __Pyx_memviewslice __pyx_t_17 = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("parse_maze_text", 0);
+  __Pyx_RefNannySetupContext("find_shortest_path_astar", 0);
+
+  /* "maze_solver_cy.pyx":346
+ *     coordenadas (linha, coluna) do incio ao fim, ou None se no houver caminho.
+ *     """
+ *     if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:             # <<<<<<<<<<<<<<
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
+ * 
+*/
+  __pyx_t_2 = (__pyx_v_rows < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_cols < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((((((Py_ssize_t)__pyx_v_rows) * __pyx_v_cols) + 63) >> 6) > (__pyx_v_wall_bits.shape[0]));
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "maze_solver_cy.pyx":347
+ *     """
+ *     if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef coord_type_t start_r = start_coords[0]
+*/
+    __pyx_t_4 = NULL;
+    __Pyx_INCREF(__pyx_builtin_ValueError);
+    __pyx_t_5 = __pyx_builtin_ValueError; 
+    __pyx_t_6 = __Pyx_PyUnicode_From_int(__pyx_v_rows, 0, ' ', 'd'); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyUnicode_From_int(__pyx_v_cols, 0, ' ', 'd'); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyUnicode_From_Py_ssize_t((__pyx_v_wall_bits.shape[0]), 0, ' ', 'd'); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9[0] = __pyx_mstate_global->__pyx_kp_u_Dimenses;
+    __pyx_t_9[1] = __pyx_t_6;
+    __pyx_t_9[2] = __pyx_mstate_global->__pyx_n_u_x;
+    __pyx_t_9[3] = __pyx_t_7;
+    __pyx_t_9[4] = __pyx_mstate_global->__pyx_kp_u_incompatveis_com_o_bitmap_de_pa;
+    __pyx_t_9[5] = __pyx_t_8;
+    __pyx_t_9[6] = __pyx_mstate_global->__pyx_kp_u_palavras;
+    __pyx_t_10 = __Pyx_PyUnicode_Join(__pyx_t_9, 7, 10 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6) + 1 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_7) + 40 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_8) + 11, 255);
+    if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_11 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_10};
+      __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 347, __pyx_L1_error)
+
+    /* "maze_solver_cy.pyx":346
+ *     coordenadas (linha, coluna) do incio ao fim, ou None se no houver caminho.
+ *     """
+ *     if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:             # <<<<<<<<<<<<<<
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
+ * 
+*/
+  }
+
+  /* "maze_solver_cy.pyx":349
+ *         raise ValueError(f"Dimenses {rows}x{cols} incompatveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
+ * 
+ *     cdef coord_type_t start_r = start_coords[0]             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t start_c = start_coords[1]
+ *     cdef coord_type_t end_r = end_coords[0]
+*/
+  if (unlikely(__pyx_v_start_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 349, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_start_coords, 0)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 349, __pyx_L1_error)
+  __pyx_v_start_r = __pyx_t_12;
+
+  /* "maze_solver_cy.pyx":350
+ * 
+ *     cdef coord_type_t start_r = start_coords[0]
+ *     cdef coord_type_t start_c = start_coords[1]             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t end_r = end_coords[0]
+ *     cdef coord_type_t end_c = end_coords[1]
+*/
+  if (unlikely(__pyx_v_start_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 350, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_start_coords, 1)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 350, __pyx_L1_error)
+  __pyx_v_start_c = __pyx_t_12;
+
+  /* "maze_solver_cy.pyx":351
+ *     cdef coord_type_t start_r = start_coords[0]
+ *     cdef coord_type_t start_c = start_coords[1]
+ *     cdef coord_type_t end_r = end_coords[0]             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t end_c = end_coords[1]
+ * 
+*/
+  if (unlikely(__pyx_v_end_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 351, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_end_coords, 0)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 351, __pyx_L1_error)
+  __pyx_v_end_r = __pyx_t_12;
+
+  /* "maze_solver_cy.pyx":352
+ *     cdef coord_type_t start_c = start_coords[1]
+ *     cdef coord_type_t end_r = end_coords[0]
+ *     cdef coord_type_t end_c = end_coords[1]             # <<<<<<<<<<<<<<
+ * 
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
+*/
+  if (unlikely(__pyx_v_end_coords == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 352, __pyx_L1_error)
+  }
+  __pyx_t_12 = __Pyx_PyLong_As_npy_int32(__Pyx_PyTuple_GET_ITEM(__pyx_v_end_coords, 1)); if (unlikely((__pyx_t_12 == ((npy_int32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 352, __pyx_L1_error)
+  __pyx_v_end_c = __pyx_t_12;
+
+  /* "maze_solver_cy.pyx":354
+ *     cdef coord_type_t end_c = end_coords[1]
+ * 
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None
+*/
+  __pyx_t_2 = (__pyx_v_start_r < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_r >= __pyx_v_rows);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_c < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_start_c >= __pyx_v_cols);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+
+  /* "maze_solver_cy.pyx":355
+ * 
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
+  __pyx_t_2 = (__pyx_v_end_r < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_end_r >= __pyx_v_rows);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_end_c < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_end_c >= __pyx_v_cols);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
+
+  /* "maze_solver_cy.pyx":354
+ *     cdef coord_type_t end_c = end_coords[1]
+ * 
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None
+*/
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":356
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     cdef cell_index_type_t start_idx = start_r * cols + start_c
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":354
+ *     cdef coord_type_t end_c = end_coords[1]
+ * 
+ *     if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or             # <<<<<<<<<<<<<<
+ *         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
+ *         return None
+*/
+  }
+
+  /* "maze_solver_cy.pyx":358
+ *         return None
+ * 
+ *     cdef cell_index_type_t start_idx = start_r * cols + start_c             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c
+ * 
+*/
+  __pyx_v_start_idx = ((__pyx_v_start_r * __pyx_v_cols) + __pyx_v_start_c);
+
+  /* "maze_solver_cy.pyx":359
+ * 
+ *     cdef cell_index_type_t start_idx = start_r * cols + start_c
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c             # <<<<<<<<<<<<<<
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):
+*/
+  __pyx_v_end_idx = ((__pyx_v_end_r * __pyx_v_cols) + __pyx_v_end_c);
+
+  /* "maze_solver_cy.pyx":361
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
+  __pyx_t_2 = __pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, __pyx_v_start_idx);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L17_bool_binop_done;
+  }
+  __pyx_t_2 = __pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, __pyx_v_end_idx);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L17_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "maze_solver_cy.pyx":362
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     # Estado: cdigo de direo do predecessor + CLOSED_FLAG; custo s  lido em clulas com estado != 0
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "maze_solver_cy.pyx":361
+ *     cdef cell_index_type_t end_idx = end_r * cols + end_c
+ * 
+ *     if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
+  }
+
+  /* "maze_solver_cy.pyx":365
+ * 
+ *     # Estado: cdigo de direo do predecessor + CLOSED_FLAG; custo s  lido em clulas com estado != 0
+ *     state_np_array = np.zeros(rows * cols, dtype=np.uint8)             # <<<<<<<<<<<<<<
+ *     cost_np_array = np.empty(rows * cols, dtype=np.int32)
+ *     cdef visited_cell_type_t[::1] state = state_np_array
+*/
+  __pyx_t_5 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_10 = __Pyx_PyLong_From_int((__pyx_v_rows * __pyx_v_cols)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_11 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_5);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_11 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_10};
+    __pyx_t_8 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 365, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_7, __pyx_t_8, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_4, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 365, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_v_state_np_array = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "maze_solver_cy.pyx":366
+ *     # Estado: cdigo de direo do predecessor + CLOSED_FLAG; custo s  lido em clulas com estado != 0
+ *     state_np_array = np.zeros(rows * cols, dtype=np.uint8)
+ *     cost_np_array = np.empty(rows * cols, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef visited_cell_type_t[::1] state = state_np_array
+ *     cdef cell_index_type_t[::1] cost = cost_np_array
+*/
+  __pyx_t_4 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = __Pyx_PyLong_From_int((__pyx_v_rows * __pyx_v_cols)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_11 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_11 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_t_8};
+    __pyx_t_10 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_10, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 366, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_7, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_10);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_v_cost_np_array = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "maze_solver_cy.pyx":367
+ *     state_np_array = np.zeros(rows * cols, dtype=np.uint8)
+ *     cost_np_array = np.empty(rows * cols, dtype=np.int32)
+ *     cdef visited_cell_type_t[::1] state = state_np_array             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t[::1] cost = cost_np_array
+ * 
+*/
+  __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(__pyx_v_state_np_array, PyBUF_WRITABLE); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __pyx_v_state = __pyx_t_13;
+  __pyx_t_13.memview = NULL;
+  __pyx_t_13.data = NULL;
+
+  /* "maze_solver_cy.pyx":368
+ *     cost_np_array = np.empty(rows * cols, dtype=np.int32)
+ *     cdef visited_cell_type_t[::1] state = state_np_array
+ *     cdef cell_index_type_t[::1] cost = cost_np_array             # <<<<<<<<<<<<<<
+ * 
+ *     # Cada clula entra no mximo uma vez por balde, ento rows * cols basta para cada pilha
+*/
+  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_cell_index_type_t(__pyx_v_cost_np_array, PyBUF_WRITABLE); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __pyx_v_cost = __pyx_t_14;
+  __pyx_t_14.memview = NULL;
+  __pyx_t_14.data = NULL;
+
+  /* "maze_solver_cy.pyx":372
+ *     # Cada clula entra no mximo uma vez por balde, ento rows * cols basta para cada pilha
+ *     cdef CellQueue current, upper, swap
+ *     init_queue(&current, rows * cols)             # <<<<<<<<<<<<<<
+ *     init_queue(&upper, rows * cols)
+ * 
+*/
+  __pyx_f_14maze_solver_cy_init_queue((&__pyx_v_current), (__pyx_v_rows * __pyx_v_cols));
+
+  /* "maze_solver_cy.pyx":373
+ *     cdef CellQueue current, upper, swap
+ *     init_queue(&current, rows * cols)
+ *     init_queue(&upper, rows * cols)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef cell_index_type_t f_bound = manhattan(start_r, start_c, end_r, end_c)
+*/
+  __pyx_f_14maze_solver_cy_init_queue((&__pyx_v_upper), (__pyx_v_rows * __pyx_v_cols));
+
+  /* "maze_solver_cy.pyx":375
+ *     init_queue(&upper, rows * cols)
+ * 
+ *     cdef cell_index_type_t f_bound = manhattan(start_r, start_c, end_r, end_c)             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t idx, new_cost
+ *     cdef coord_type_t r, c
+*/
+  __pyx_v_f_bound = __pyx_f_14maze_solver_cy_manhattan(__pyx_v_start_r, __pyx_v_start_c, __pyx_v_end_r, __pyx_v_end_c);
 
-  /* "maze_solver_cy.pyx":223
- *         tuple: (int_grid, start_coords, end_coords) ou None se invlido
- *     """
- *     lines = maze_text.strip().split('\n')             # <<<<<<<<<<<<<<
- *     if not lines:
- *         return None
+  /* "maze_solver_cy.pyx":378
+ *     cdef cell_index_type_t idx, new_cost
+ *     cdef coord_type_t r, c
+ *     cdef bint path_found = False             # <<<<<<<<<<<<<<
+ * 
+ *     cost[start_idx] = 0
 */
-  __pyx_t_4 = __pyx_v_maze_text;
-  __Pyx_INCREF(__pyx_t_4);
-  __pyx_t_5 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-    __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_strip, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __pyx_t_2 = __pyx_t_3;
-  __Pyx_INCREF(__pyx_t_2);
-  __pyx_t_5 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_mstate_global->__pyx_kp_u__6};
-    __pyx_t_1 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_split, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 223, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  __pyx_v_lines = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_v_path_found = 0;
 
-  /* "maze_solver_cy.pyx":224
- *     """
- *     lines = maze_text.strip().split('\n')
- *     if not lines:             # <<<<<<<<<<<<<<
- *         return None
+  /* "maze_solver_cy.pyx":380
+ *     cdef bint path_found = False
  * 
+ *     cost[start_idx] = 0             # <<<<<<<<<<<<<<
+ *     state[start_idx] = PARENT_ROOT
+ *     enqueue(&current, start_idx)
 */
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_lines); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 224, __pyx_L1_error)
-  __pyx_t_7 = (!__pyx_t_6);
-  if (__pyx_t_7) {
+  __pyx_t_15 = __pyx_v_start_idx;
+  *((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_15)) )) = 0;
 
-    /* "maze_solver_cy.pyx":225
- *     lines = maze_text.strip().split('\n')
- *     if not lines:
- *         return None             # <<<<<<<<<<<<<<
+  /* "maze_solver_cy.pyx":381
+ * 
+ *     cost[start_idx] = 0
+ *     state[start_idx] = PARENT_ROOT             # <<<<<<<<<<<<<<
+ *     enqueue(&current, start_idx)
  * 
- *     rows = len(lines)
 */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+  __pyx_t_15 = __pyx_v_start_idx;
+  *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_15)) )) = 5;
 
-    /* "maze_solver_cy.pyx":224
- *     """
- *     lines = maze_text.strip().split('\n')
- *     if not lines:             # <<<<<<<<<<<<<<
- *         return None
+  /* "maze_solver_cy.pyx":382
+ *     cost[start_idx] = 0
+ *     state[start_idx] = PARENT_ROOT
+ *     enqueue(&current, start_idx)             # <<<<<<<<<<<<<<
  * 
+ *     with nogil:
 */
-  }
+  __pyx_f_14maze_solver_cy_enqueue((&__pyx_v_current), __pyx_v_start_idx);
 
-  /* "maze_solver_cy.pyx":227
- *         return None
+  /* "maze_solver_cy.pyx":384
+ *     enqueue(&current, start_idx)
  * 
- *     rows = len(lines)             # <<<<<<<<<<<<<<
- *     cols = len(lines[0]) if lines else 0
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         while True:
+ *             if is_queue_empty(&current):
+*/
+  {
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      /*try:*/ {
+
+        /* "maze_solver_cy.pyx":385
  * 
+ *     with nogil:
+ *         while True:             # <<<<<<<<<<<<<<
+ *             if is_queue_empty(&current):
+ *                 if is_queue_empty(&upper):
+*/
+        while (1) {
+
+          /* "maze_solver_cy.pyx":386
+ *     with nogil:
+ *         while True:
+ *             if is_queue_empty(&current):             # <<<<<<<<<<<<<<
+ *                 if is_queue_empty(&upper):
+ *                     break
+*/
+          __pyx_t_1 = __pyx_f_14maze_solver_cy_is_queue_empty((&__pyx_v_current));
+          if (__pyx_t_1) {
+
+            /* "maze_solver_cy.pyx":387
+ *         while True:
+ *             if is_queue_empty(&current):
+ *                 if is_queue_empty(&upper):             # <<<<<<<<<<<<<<
+ *                     break
+ *                 swap = current
+*/
+            __pyx_t_1 = __pyx_f_14maze_solver_cy_is_queue_empty((&__pyx_v_upper));
+            if (__pyx_t_1) {
+
+              /* "maze_solver_cy.pyx":388
+ *             if is_queue_empty(&current):
+ *                 if is_queue_empty(&upper):
+ *                     break             # <<<<<<<<<<<<<<
+ *                 swap = current
+ *                 current = upper
+*/
+              goto __pyx_L23_break;
+
+              /* "maze_solver_cy.pyx":387
+ *         while True:
+ *             if is_queue_empty(&current):
+ *                 if is_queue_empty(&upper):             # <<<<<<<<<<<<<<
+ *                     break
+ *                 swap = current
+*/
+            }
+
+            /* "maze_solver_cy.pyx":389
+ *                 if is_queue_empty(&upper):
+ *                     break
+ *                 swap = current             # <<<<<<<<<<<<<<
+ *                 current = upper
+ *                 upper = swap
+*/
+            __pyx_v_swap = __pyx_v_current;
+
+            /* "maze_solver_cy.pyx":390
+ *                     break
+ *                 swap = current
+ *                 current = upper             # <<<<<<<<<<<<<<
+ *                 upper = swap
+ *                 upper.head = 0
+*/
+            __pyx_v_current = __pyx_v_upper;
+
+            /* "maze_solver_cy.pyx":391
+ *                 swap = current
+ *                 current = upper
+ *                 upper = swap             # <<<<<<<<<<<<<<
+ *                 upper.head = 0
+ *                 upper.tail = 0
+*/
+            __pyx_v_upper = __pyx_v_swap;
+
+            /* "maze_solver_cy.pyx":392
+ *                 current = upper
+ *                 upper = swap
+ *                 upper.head = 0             # <<<<<<<<<<<<<<
+ *                 upper.tail = 0
+ *                 f_bound += 2
 */
-  __pyx_t_8 = PyObject_Length(__pyx_v_lines); if (unlikely(__pyx_t_8 == ((Py_ssize_t)-1))) __PYX_ERR(0, 227, __pyx_L1_error)
-  __pyx_v_rows = __pyx_t_8;
+            __pyx_v_upper.head = 0;
 
-  /* "maze_solver_cy.pyx":228
+            /* "maze_solver_cy.pyx":393
+ *                 upper = swap
+ *                 upper.head = 0
+ *                 upper.tail = 0             # <<<<<<<<<<<<<<
+ *                 f_bound += 2
  * 
- *     rows = len(lines)
- *     cols = len(lines[0]) if lines else 0             # <<<<<<<<<<<<<<
+*/
+            __pyx_v_upper.tail = 0;
+
+            /* "maze_solver_cy.pyx":394
+ *                 upper.head = 0
+ *                 upper.tail = 0
+ *                 f_bound += 2             # <<<<<<<<<<<<<<
  * 
- *     # Verificar se todas as linhas tm o mesmo tamanho
+ *             idx = pop_last(&current)
 */
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_v_lines); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 228, __pyx_L1_error)
-  if (__pyx_t_7) {
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_lines, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 228, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_8 = __pyx_t_9;
-  } else {
-    __pyx_t_8 = 0;
-  }
-  __pyx_v_cols = __pyx_t_8;
+            __pyx_v_f_bound = (__pyx_v_f_bound + 2);
+
+            /* "maze_solver_cy.pyx":386
+ *     with nogil:
+ *         while True:
+ *             if is_queue_empty(&current):             # <<<<<<<<<<<<<<
+ *                 if is_queue_empty(&upper):
+ *                     break
+*/
+          }
 
-  /* "maze_solver_cy.pyx":231
+          /* "maze_solver_cy.pyx":396
+ *                 f_bound += 2
  * 
- *     # Verificar se todas as linhas tm o mesmo tamanho
- *     for line in lines:             # <<<<<<<<<<<<<<
- *         if len(line) != cols:
- *             return None
+ *             idx = pop_last(&current)             # <<<<<<<<<<<<<<
+ *             if state[idx] & CLOSED_FLAG:
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor
 */
-  if (likely(PyList_CheckExact(__pyx_v_lines)) || PyTuple_CheckExact(__pyx_v_lines)) {
-    __pyx_t_1 = __pyx_v_lines; __Pyx_INCREF(__pyx_t_1);
-    __pyx_t_8 = 0;
-    __pyx_t_10 = NULL;
-  } else {
-    __pyx_t_8 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_lines); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_10 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 231, __pyx_L1_error)
-  }
-  for (;;) {
-    if (likely(!__pyx_t_10)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 231, __pyx_L1_error)
-          #endif
-          if (__pyx_t_8 >= __pyx_temp) break;
-        }
-        __pyx_t_3 = __Pyx_PyList_GetItemRef(__pyx_t_1, __pyx_t_8);
-        ++__pyx_t_8;
-      } else {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 231, __pyx_L1_error)
-          #endif
-          if (__pyx_t_8 >= __pyx_temp) break;
-        }
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_3 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_8));
-        #else
-        __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_8);
-        #endif
-        ++__pyx_t_8;
-      }
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
-    } else {
-      __pyx_t_3 = __pyx_t_10(__pyx_t_1);
-      if (unlikely(!__pyx_t_3)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 231, __pyx_L1_error)
-          PyErr_Clear();
-        }
-        break;
-      }
-    }
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_3);
-    __pyx_t_3 = 0;
+          __pyx_v_idx = __pyx_f_14maze_solver_cy_pop_last((&__pyx_v_current));
 
-    /* "maze_solver_cy.pyx":232
- *     # Verificar se todas as linhas tm o mesmo tamanho
- *     for line in lines:
- *         if len(line) != cols:             # <<<<<<<<<<<<<<
- *             return None
+          /* "maze_solver_cy.pyx":397
  * 
+ *             idx = pop_last(&current)
+ *             if state[idx] & CLOSED_FLAG:             # <<<<<<<<<<<<<<
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor
+ *             state[idx] |= CLOSED_FLAG
 */
-    __pyx_t_9 = PyObject_Length(__pyx_v_line); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 232, __pyx_L1_error)
-    __pyx_t_7 = (__pyx_t_9 != __pyx_v_cols);
-    if (__pyx_t_7) {
+          __pyx_t_15 = __pyx_v_idx;
+          __pyx_t_1 = (((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_15)) ))) & 16) != 0);
+          if (__pyx_t_1) {
 
-      /* "maze_solver_cy.pyx":233
- *     for line in lines:
- *         if len(line) != cols:
- *             return None             # <<<<<<<<<<<<<<
+            /* "maze_solver_cy.pyx":398
+ *             idx = pop_last(&current)
+ *             if state[idx] & CLOSED_FLAG:
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor             # <<<<<<<<<<<<<<
+ *             state[idx] |= CLOSED_FLAG
+ *             if idx == end_idx:
+*/
+            goto __pyx_L22_continue;
+
+            /* "maze_solver_cy.pyx":397
  * 
- *     # Criar grid e encontrar S e E
+ *             idx = pop_last(&current)
+ *             if state[idx] & CLOSED_FLAG:             # <<<<<<<<<<<<<<
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor
+ *             state[idx] |= CLOSED_FLAG
 */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+          }
+
+          /* "maze_solver_cy.pyx":399
+ *             if state[idx] & CLOSED_FLAG:
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor
+ *             state[idx] |= CLOSED_FLAG             # <<<<<<<<<<<<<<
+ *             if idx == end_idx:
+ *                 path_found = True
+*/
+          __pyx_t_15 = __pyx_v_idx;
+          *((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_15)) )) |= 16;
+
+          /* "maze_solver_cy.pyx":400
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor
+ *             state[idx] |= CLOSED_FLAG
+ *             if idx == end_idx:             # <<<<<<<<<<<<<<
+ *                 path_found = True
+ *                 break
+*/
+          __pyx_t_1 = (__pyx_v_idx == __pyx_v_end_idx);
+          if (__pyx_t_1) {
 
-      /* "maze_solver_cy.pyx":232
- *     # Verificar se todas as linhas tm o mesmo tamanho
- *     for line in lines:
- *         if len(line) != cols:             # <<<<<<<<<<<<<<
- *             return None
+            /* "maze_solver_cy.pyx":401
+ *             state[idx] |= CLOSED_FLAG
+ *             if idx == end_idx:
+ *                 path_found = True             # <<<<<<<<<<<<<<
+ *                 break
  * 
 */
-    }
+            __pyx_v_path_found = 1;
 
-    /* "maze_solver_cy.pyx":231
+            /* "maze_solver_cy.pyx":402
+ *             if idx == end_idx:
+ *                 path_found = True
+ *                 break             # <<<<<<<<<<<<<<
  * 
- *     # Verificar se todas as linhas tm o mesmo tamanho
- *     for line in lines:             # <<<<<<<<<<<<<<
- *         if len(line) != cols:
- *             return None
+ *             # Uma diviso por clula s para as bordas; vizinhos e bits de parede saem do ndice plano.
 */
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+            goto __pyx_L23_break;
+
+            /* "maze_solver_cy.pyx":400
+ *                 continue # Entrada antiga, a clula j foi expandida com custo menor
+ *             state[idx] |= CLOSED_FLAG
+ *             if idx == end_idx:             # <<<<<<<<<<<<<<
+ *                 path_found = True
+ *                 break
+*/
+          }
+
+          /* "maze_solver_cy.pyx":407
+ *             # Arredondar a largura para potncia de dois (r = idx >> shift) foi medido e no compensa:
+ *             # a busca  limitada por memria, e as linhas mais espaadas pioram o cache (~10% em 600x600)
+ *             r = idx // cols             # <<<<<<<<<<<<<<
+ *             c = idx - r * cols
+ *             new_cost = cost[idx] + 1
+*/
+          __pyx_v_r = (__pyx_v_idx / __pyx_v_cols);
 
-  /* "maze_solver_cy.pyx":236
+          /* "maze_solver_cy.pyx":408
+ *             # a busca  limitada por memria, e as linhas mais espaadas pioram o cache (~10% em 600x600)
+ *             r = idx // cols
+ *             c = idx - r * cols             # <<<<<<<<<<<<<<
+ *             new_cost = cost[idx] + 1
  * 
- *     # Criar grid e encontrar S e E
- *     int_grid = np.zeros((rows, cols), dtype=np.int32)             # <<<<<<<<<<<<<<
- *     start_coords = None
- *     end_coords = None
 */
-  __pyx_t_3 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyLong_FromSsize_t(__pyx_v_rows); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_11 = PyLong_FromSsize_t(__pyx_v_cols); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_12 = PyTuple_New(2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_2) != (0)) __PYX_ERR(0, 236, __pyx_L1_error);
-  __Pyx_GIVEREF(__pyx_t_11);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_t_11) != (0)) __PYX_ERR(0, 236, __pyx_L1_error);
-  __pyx_t_2 = 0;
-  __pyx_t_11 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  __pyx_t_5 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
-    assert(__pyx_t_3);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
-    __Pyx_INCREF(__pyx_t_3);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_5 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_3, __pyx_t_12};
-    __pyx_t_11 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 236, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_11, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 236, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_11);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  __pyx_v_int_grid = __pyx_t_1;
-  __pyx_t_1 = 0;
+          __pyx_v_c = (__pyx_v_idx - (__pyx_v_r * __pyx_v_cols));
 
-  /* "maze_solver_cy.pyx":237
- *     # Criar grid e encontrar S e E
- *     int_grid = np.zeros((rows, cols), dtype=np.int32)
- *     start_coords = None             # <<<<<<<<<<<<<<
- *     end_coords = None
+          /* "maze_solver_cy.pyx":409
+ *             r = idx // cols
+ *             c = idx - r * cols
+ *             new_cost = cost[idx] + 1             # <<<<<<<<<<<<<<
  * 
+ *             # Direo UP
 */
-  __Pyx_INCREF(Py_None);
-  __pyx_v_start_coords = Py_None;
+          __pyx_t_15 = __pyx_v_idx;
+          __pyx_v_new_cost = ((*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_15)) ))) + 1);
 
-  /* "maze_solver_cy.pyx":238
- *     int_grid = np.zeros((rows, cols), dtype=np.int32)
- *     start_coords = None
- *     end_coords = None             # <<<<<<<<<<<<<<
+          /* "maze_solver_cy.pyx":412
  * 
- *     for r in range(rows):
+ *             # Direo UP
+ *             if r > 0 and not is_wall(wall_bits, idx - cols):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - cols, new_cost,
+ *                             new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)
 */
-  __Pyx_INCREF(Py_None);
-  __pyx_v_end_coords = Py_None;
+          __pyx_t_2 = (__pyx_v_r > 0);
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_1 = __pyx_t_2;
+            goto __pyx_L29_bool_binop_done;
+          }
+          __pyx_t_2 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx - __pyx_v_cols)));
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_L29_bool_binop_done:;
+          if (__pyx_t_1) {
 
-  /* "maze_solver_cy.pyx":240
- *     end_coords = None
+            /* "maze_solver_cy.pyx":413
+ *             # Direo UP
+ *             if r > 0 and not is_wall(wall_bits, idx - cols):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - cols, new_cost,             # <<<<<<<<<<<<<<
+ *                             new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)
+ *             # Direo DOWN
+*/
+            __pyx_t_15 = 0;
+            __pyx_t_16 = 0;
+
+            /* "maze_solver_cy.pyx":414
+ *             if r > 0 and not is_wall(wall_bits, idx - cols):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - cols, new_cost,
+ *                             new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)             # <<<<<<<<<<<<<<
+ *             # Direo DOWN
+ *             if r < rows - 1 and not is_wall(wall_bits, idx + cols):
+*/
+            __pyx_f_14maze_solver_cy_astar_visit((&(*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_15)) )))), (&(*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_16)) )))), (&__pyx_v_current), (&__pyx_v_upper), (__pyx_v_idx - __pyx_v_cols), __pyx_v_new_cost, (__pyx_v_new_cost + __pyx_f_14maze_solver_cy_manhattan((__pyx_v_r - 1), __pyx_v_c, __pyx_v_end_r, __pyx_v_end_c)), __pyx_v_f_bound, 2);
+
+            /* "maze_solver_cy.pyx":412
  * 
- *     for r in range(rows):             # <<<<<<<<<<<<<<
- *         for c in range(cols):
- *             char = lines[r][c]
+ *             # Direo UP
+ *             if r > 0 and not is_wall(wall_bits, idx - cols):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - cols, new_cost,
+ *                             new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)
 */
-  __pyx_t_8 = __pyx_v_rows;
-  __pyx_t_9 = __pyx_t_8;
-  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_9; __pyx_t_13+=1) {
-    __pyx_v_r = __pyx_t_13;
+          }
 
-    /* "maze_solver_cy.pyx":241
+          /* "maze_solver_cy.pyx":416
+ *                             new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)
+ *             # Direo DOWN
+ *             if r < rows - 1 and not is_wall(wall_bits, idx + cols):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + cols, new_cost,
+ *                             new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)
+*/
+          __pyx_t_2 = (__pyx_v_r < (__pyx_v_rows - 1));
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_1 = __pyx_t_2;
+            goto __pyx_L32_bool_binop_done;
+          }
+          __pyx_t_2 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx + __pyx_v_cols)));
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_L32_bool_binop_done:;
+          if (__pyx_t_1) {
+
+            /* "maze_solver_cy.pyx":417
+ *             # Direo DOWN
+ *             if r < rows - 1 and not is_wall(wall_bits, idx + cols):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + cols, new_cost,             # <<<<<<<<<<<<<<
+ *                             new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)
+ *             # Direo LEFT
+*/
+            __pyx_t_16 = 0;
+            __pyx_t_15 = 0;
+
+            /* "maze_solver_cy.pyx":418
+ *             if r < rows - 1 and not is_wall(wall_bits, idx + cols):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + cols, new_cost,
+ *                             new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)             # <<<<<<<<<<<<<<
+ *             # Direo LEFT
+ *             if c > 0 and not is_wall(wall_bits, idx - 1):
+*/
+            __pyx_f_14maze_solver_cy_astar_visit((&(*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_16)) )))), (&(*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_15)) )))), (&__pyx_v_current), (&__pyx_v_upper), (__pyx_v_idx + __pyx_v_cols), __pyx_v_new_cost, (__pyx_v_new_cost + __pyx_f_14maze_solver_cy_manhattan((__pyx_v_r + 1), __pyx_v_c, __pyx_v_end_r, __pyx_v_end_c)), __pyx_v_f_bound, 1);
+
+            /* "maze_solver_cy.pyx":416
+ *                             new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)
+ *             # Direo DOWN
+ *             if r < rows - 1 and not is_wall(wall_bits, idx + cols):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + cols, new_cost,
+ *                             new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)
+*/
+          }
+
+          /* "maze_solver_cy.pyx":420
+ *                             new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)
+ *             # Direo LEFT
+ *             if c > 0 and not is_wall(wall_bits, idx - 1):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - 1, new_cost,
+ *                             new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)
+*/
+          __pyx_t_2 = (__pyx_v_c > 0);
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_1 = __pyx_t_2;
+            goto __pyx_L35_bool_binop_done;
+          }
+          __pyx_t_2 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx - 1)));
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_L35_bool_binop_done:;
+          if (__pyx_t_1) {
+
+            /* "maze_solver_cy.pyx":421
+ *             # Direo LEFT
+ *             if c > 0 and not is_wall(wall_bits, idx - 1):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - 1, new_cost,             # <<<<<<<<<<<<<<
+ *                             new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)
+ *             # Direo RIGHT
+*/
+            __pyx_t_15 = 0;
+            __pyx_t_16 = 0;
+
+            /* "maze_solver_cy.pyx":422
+ *             if c > 0 and not is_wall(wall_bits, idx - 1):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - 1, new_cost,
+ *                             new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)             # <<<<<<<<<<<<<<
+ *             # Direo RIGHT
+ *             if c < cols - 1 and not is_wall(wall_bits, idx + 1):
+*/
+            __pyx_f_14maze_solver_cy_astar_visit((&(*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_15)) )))), (&(*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_16)) )))), (&__pyx_v_current), (&__pyx_v_upper), (__pyx_v_idx - 1), __pyx_v_new_cost, (__pyx_v_new_cost + __pyx_f_14maze_solver_cy_manhattan(__pyx_v_r, (__pyx_v_c - 1), __pyx_v_end_r, __pyx_v_end_c)), __pyx_v_f_bound, 4);
+
+            /* "maze_solver_cy.pyx":420
+ *                             new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)
+ *             # Direo LEFT
+ *             if c > 0 and not is_wall(wall_bits, idx - 1):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx - 1, new_cost,
+ *                             new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)
+*/
+          }
+
+          /* "maze_solver_cy.pyx":424
+ *                             new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)
+ *             # Direo RIGHT
+ *             if c < cols - 1 and not is_wall(wall_bits, idx + 1):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + 1, new_cost,
+ *                             new_cost + manhattan(r, c + 1, end_r, end_c), f_bound, PARENT_LEFT)
+*/
+          __pyx_t_2 = (__pyx_v_c < (__pyx_v_cols - 1));
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_1 = __pyx_t_2;
+            goto __pyx_L38_bool_binop_done;
+          }
+          __pyx_t_2 = (!__pyx_f_14maze_solver_cy_is_wall(__pyx_v_wall_bits, (__pyx_v_idx + 1)));
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_L38_bool_binop_done:;
+          if (__pyx_t_1) {
+
+            /* "maze_solver_cy.pyx":425
+ *             # Direo RIGHT
+ *             if c < cols - 1 and not is_wall(wall_bits, idx + 1):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + 1, new_cost,             # <<<<<<<<<<<<<<
+ *                             new_cost + manhattan(r, c + 1, end_r, end_c), f_bound, PARENT_LEFT)
  * 
- *     for r in range(rows):
- *         for c in range(cols):             # <<<<<<<<<<<<<<
- *             char = lines[r][c]
- *             if char == '#':
 */
-    __pyx_t_14 = __pyx_v_cols;
-    __pyx_t_15 = __pyx_t_14;
-    for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_15; __pyx_t_16+=1) {
-      __pyx_v_c = __pyx_t_16;
+            __pyx_t_16 = 0;
+            __pyx_t_15 = 0;
 
-      /* "maze_solver_cy.pyx":242
- *     for r in range(rows):
- *         for c in range(cols):
- *             char = lines[r][c]             # <<<<<<<<<<<<<<
- *             if char == '#':
- *                 int_grid[r, c] = WALL_CELL
+            /* "maze_solver_cy.pyx":426
+ *             if c < cols - 1 and not is_wall(wall_bits, idx + 1):
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + 1, new_cost,
+ *                             new_cost + manhattan(r, c + 1, end_r, end_c), f_bound, PARENT_LEFT)             # <<<<<<<<<<<<<<
+ * 
+ *     free_queue(&current)
 */
-      __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_lines, __pyx_v_r, Py_ssize_t, 1, PyLong_FromSsize_t, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_c, Py_ssize_t, 1, PyLong_FromSsize_t, 0, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_char, __pyx_t_4);
-      __pyx_t_4 = 0;
+            __pyx_f_14maze_solver_cy_astar_visit((&(*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_16)) )))), (&(*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_15)) )))), (&__pyx_v_current), (&__pyx_v_upper), (__pyx_v_idx + 1), __pyx_v_new_cost, (__pyx_v_new_cost + __pyx_f_14maze_solver_cy_manhattan(__pyx_v_r, (__pyx_v_c + 1), __pyx_v_end_r, __pyx_v_end_c)), __pyx_v_f_bound, 3);
 
-      /* "maze_solver_cy.pyx":243
- *         for c in range(cols):
- *             char = lines[r][c]
- *             if char == '#':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = WALL_CELL
- *             elif char == ' ' or char == '':
+            /* "maze_solver_cy.pyx":424
+ *                             new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)
+ *             # Direo RIGHT
+ *             if c < cols - 1 and not is_wall(wall_bits, idx + 1):             # <<<<<<<<<<<<<<
+ *                 astar_visit(&state[0], &cost[0], &current, &upper, idx + 1, new_cost,
+ *                             new_cost + manhattan(r, c + 1, end_r, end_c), f_bound, PARENT_LEFT)
 */
-      __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_char, __pyx_mstate_global->__pyx_kp_u__7, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 243, __pyx_L1_error)
-      if (__pyx_t_7) {
+          }
+          __pyx_L22_continue:;
+        }
+        __pyx_L23_break:;
+      }
 
-        /* "maze_solver_cy.pyx":244
- *             char = lines[r][c]
- *             if char == '#':
- *                 int_grid[r, c] = WALL_CELL             # <<<<<<<<<<<<<<
- *             elif char == ' ' or char == '':
- *                 int_grid[r, c] = PATH_CELL
+      /* "maze_solver_cy.pyx":384
+ *     enqueue(&current, start_idx)
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         while True:
+ *             if is_queue_empty(&current):
 */
-        __pyx_t_4 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __Pyx_GIVEREF(__pyx_t_4);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_4) != (0)) __PYX_ERR(0, 244, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 244, __pyx_L1_error);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = 0;
-        if (unlikely((PyObject_SetItem(__pyx_v_int_grid, __pyx_t_11, __pyx_mstate_global->__pyx_int_1) < 0))) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      /*finally:*/ {
+        /*normal exit:*/{
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          goto __pyx_L21;
+        }
+        __pyx_L21:;
+      }
+  }
+
+  /* "maze_solver_cy.pyx":428
+ *                             new_cost + manhattan(r, c + 1, end_r, end_c), f_bound, PARENT_LEFT)
+ * 
+ *     free_queue(&current)             # <<<<<<<<<<<<<<
+ *     free_queue(&upper)
+ * 
+*/
+  __pyx_f_14maze_solver_cy_free_queue((&__pyx_v_current));
+
+  /* "maze_solver_cy.pyx":429
+ * 
+ *     free_queue(&current)
+ *     free_queue(&upper)             # <<<<<<<<<<<<<<
+ * 
+ *     if not path_found:
+*/
+  __pyx_f_14maze_solver_cy_free_queue((&__pyx_v_upper));
+
+  /* "maze_solver_cy.pyx":431
+ *     free_queue(&upper)
+ * 
+ *     if not path_found:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
+*/
+  __pyx_t_1 = (!__pyx_v_path_found);
+  if (__pyx_t_1) {
 
-        /* "maze_solver_cy.pyx":243
- *         for c in range(cols):
- *             char = lines[r][c]
- *             if char == '#':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = WALL_CELL
- *             elif char == ' ' or char == '':
+    /* "maze_solver_cy.pyx":432
+ * 
+ *     if not path_found:
+ *         return None             # <<<<<<<<<<<<<<
+ * 
+ *     # Reconstruir do fim para o incio seguindo os cdigos de direo
 */
-        goto __pyx_L12;
-      }
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-      /* "maze_solver_cy.pyx":245
- *             if char == '#':
- *                 int_grid[r, c] = WALL_CELL
- *             elif char == ' ' or char == '':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = PATH_CELL
- *             elif char == 'S':
+    /* "maze_solver_cy.pyx":431
+ *     free_queue(&upper)
+ * 
+ *     if not path_found:             # <<<<<<<<<<<<<<
+ *         return None
+ * 
 */
-      __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_char, __pyx_mstate_global->__pyx_kp_u__8, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 245, __pyx_L1_error)
-      if (!__pyx_t_6) {
-      } else {
-        __pyx_t_7 = __pyx_t_6;
-        goto __pyx_L13_bool_binop_done;
-      }
-      __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_char, __pyx_mstate_global->__pyx_kp_u__9, Py_EQ)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 245, __pyx_L1_error)
-      __pyx_t_7 = __pyx_t_6;
-      __pyx_L13_bool_binop_done:;
-      if (__pyx_t_7) {
-
-        /* "maze_solver_cy.pyx":246
- *                 int_grid[r, c] = WALL_CELL
- *             elif char == ' ' or char == '':
- *                 int_grid[r, c] = PATH_CELL             # <<<<<<<<<<<<<<
- *             elif char == 'S':
- *                 int_grid[r, c] = PATH_CELL
-*/
-        __pyx_t_11 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 246, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 246, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_11);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_11) != (0)) __PYX_ERR(0, 246, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 246, __pyx_L1_error);
-        __pyx_t_11 = 0;
-        __pyx_t_1 = 0;
-        if (unlikely((PyObject_SetItem(__pyx_v_int_grid, __pyx_t_4, __pyx_mstate_global->__pyx_int_0) < 0))) __PYX_ERR(0, 246, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
 
-        /* "maze_solver_cy.pyx":245
- *             if char == '#':
- *                 int_grid[r, c] = WALL_CELL
- *             elif char == ' ' or char == '':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = PATH_CELL
- *             elif char == 'S':
+  /* "maze_solver_cy.pyx":435
+ * 
+ *     # Reconstruir do fim para o incio seguindo os cdigos de direo
+ *     path_np = np.empty((cost[end_idx] + 1, 2), dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef coord_type_t[:, ::1] path = path_np
+ *     cdef Py_ssize_t i = cost[end_idx]
 */
-        goto __pyx_L12;
-      }
+  __pyx_t_7 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_15 = __pyx_v_end_idx;
+  __pyx_t_10 = __Pyx_PyLong_From_long(((*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_15)) ))) + 1)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_10);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_10) != (0)) __PYX_ERR(0, 435, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_mstate_global->__pyx_int_2);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_int_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_mstate_global->__pyx_int_2) != (0)) __PYX_ERR(0, 435, __pyx_L1_error);
+  __pyx_t_10 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_11 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_7);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
+    __pyx_t_11 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_7, __pyx_t_8};
+    __pyx_t_10 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_10, __pyx_callargs+2, 0) < 0) __PYX_ERR(0, 435, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder(__pyx_t_5, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_10);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_v_path_np = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-      /* "maze_solver_cy.pyx":247
- *             elif char == ' ' or char == '':
- *                 int_grid[r, c] = PATH_CELL
- *             elif char == 'S':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = PATH_CELL
- *                 start_coords = (r, c)
+  /* "maze_solver_cy.pyx":436
+ *     # Reconstruir do fim para o incio seguindo os cdigos de direo
+ *     path_np = np.empty((cost[end_idx] + 1, 2), dtype=np.int32)
+ *     cdef coord_type_t[:, ::1] path = path_np             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = cost[end_idx]
+ *     cdef cell_index_type_t curr = end_idx
+*/
+  __pyx_t_17 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(__pyx_v_path_np, PyBUF_WRITABLE); if (unlikely(!__pyx_t_17.memview)) __PYX_ERR(0, 436, __pyx_L1_error)
+  __pyx_v_path = __pyx_t_17;
+  __pyx_t_17.memview = NULL;
+  __pyx_t_17.data = NULL;
+
+  /* "maze_solver_cy.pyx":437
+ *     path_np = np.empty((cost[end_idx] + 1, 2), dtype=np.int32)
+ *     cdef coord_type_t[:, ::1] path = path_np
+ *     cdef Py_ssize_t i = cost[end_idx]             # <<<<<<<<<<<<<<
+ *     cdef cell_index_type_t curr = end_idx
+ *     while True:
 */
-      __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_char, __pyx_mstate_global->__pyx_n_u_S, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 247, __pyx_L1_error)
-      if (__pyx_t_7) {
+  __pyx_t_15 = __pyx_v_end_idx;
+  __pyx_v_i = (*((__pyx_t_14maze_solver_cy_cell_index_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_cell_index_type_t *) __pyx_v_cost.data) + __pyx_t_15)) )));
 
-        /* "maze_solver_cy.pyx":248
- *                 int_grid[r, c] = PATH_CELL
- *             elif char == 'S':
- *                 int_grid[r, c] = PATH_CELL             # <<<<<<<<<<<<<<
- *                 start_coords = (r, c)
- *             elif char == 'E':
+  /* "maze_solver_cy.pyx":438
+ *     cdef coord_type_t[:, ::1] path = path_np
+ *     cdef Py_ssize_t i = cost[end_idx]
+ *     cdef cell_index_type_t curr = end_idx             # <<<<<<<<<<<<<<
+ *     while True:
+ *         path[i, 0] = curr // cols
 */
-        __pyx_t_4 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 248, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 248, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __Pyx_GIVEREF(__pyx_t_4);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_4) != (0)) __PYX_ERR(0, 248, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 248, __pyx_L1_error);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = 0;
-        if (unlikely((PyObject_SetItem(__pyx_v_int_grid, __pyx_t_11, __pyx_mstate_global->__pyx_int_0) < 0))) __PYX_ERR(0, 248, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-
-        /* "maze_solver_cy.pyx":249
- *             elif char == 'S':
- *                 int_grid[r, c] = PATH_CELL
- *                 start_coords = (r, c)             # <<<<<<<<<<<<<<
- *             elif char == 'E':
- *                 int_grid[r, c] = PATH_CELL
-*/
-        __pyx_t_11 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 249, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 249, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 249, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_11);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_11) != (0)) __PYX_ERR(0, 249, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 249, __pyx_L1_error);
-        __pyx_t_11 = 0;
-        __pyx_t_1 = 0;
-        __Pyx_DECREF_SET(__pyx_v_start_coords, __pyx_t_4);
-        __pyx_t_4 = 0;
+  __pyx_v_curr = __pyx_v_end_idx;
 
-        /* "maze_solver_cy.pyx":247
- *             elif char == ' ' or char == '':
- *                 int_grid[r, c] = PATH_CELL
- *             elif char == 'S':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = PATH_CELL
- *                 start_coords = (r, c)
+  /* "maze_solver_cy.pyx":439
+ *     cdef Py_ssize_t i = cost[end_idx]
+ *     cdef cell_index_type_t curr = end_idx
+ *     while True:             # <<<<<<<<<<<<<<
+ *         path[i, 0] = curr // cols
+ *         path[i, 1] = curr % cols
 */
-        goto __pyx_L12;
-      }
+  while (1) {
 
-      /* "maze_solver_cy.pyx":250
- *                 int_grid[r, c] = PATH_CELL
- *                 start_coords = (r, c)
- *             elif char == 'E':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = PATH_CELL
- *                 end_coords = (r, c)
-*/
-      __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_char, __pyx_mstate_global->__pyx_n_u_E, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 250, __pyx_L1_error)
-      if (__pyx_t_7) {
-
-        /* "maze_solver_cy.pyx":251
- *                 start_coords = (r, c)
- *             elif char == 'E':
- *                 int_grid[r, c] = PATH_CELL             # <<<<<<<<<<<<<<
- *                 end_coords = (r, c)
- *             else:
+    /* "maze_solver_cy.pyx":440
+ *     cdef cell_index_type_t curr = end_idx
+ *     while True:
+ *         path[i, 0] = curr // cols             # <<<<<<<<<<<<<<
+ *         path[i, 1] = curr % cols
+ * 
 */
-        __pyx_t_4 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 251, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 251, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __Pyx_GIVEREF(__pyx_t_4);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_4) != (0)) __PYX_ERR(0, 251, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 251, __pyx_L1_error);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = 0;
-        if (unlikely((PyObject_SetItem(__pyx_v_int_grid, __pyx_t_11, __pyx_mstate_global->__pyx_int_0) < 0))) __PYX_ERR(0, 251, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_15 = __pyx_v_i;
+    __pyx_t_16 = 0;
+    *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_path.data + __pyx_t_15 * __pyx_v_path.strides[0]) )) + __pyx_t_16)) )) = (__pyx_v_curr / __pyx_v_cols);
 
-        /* "maze_solver_cy.pyx":252
- *             elif char == 'E':
- *                 int_grid[r, c] = PATH_CELL
- *                 end_coords = (r, c)             # <<<<<<<<<<<<<<
- *             else:
- *                 int_grid[r, c] = PATH_CELL  # Assume qualquer outro char como caminho
+    /* "maze_solver_cy.pyx":441
+ *     while True:
+ *         path[i, 0] = curr // cols
+ *         path[i, 1] = curr % cols             # <<<<<<<<<<<<<<
+ * 
+ *         if i == 0:
 */
-        __pyx_t_11 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 252, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 252, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_11);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_11) != (0)) __PYX_ERR(0, 252, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 252, __pyx_L1_error);
-        __pyx_t_11 = 0;
-        __pyx_t_1 = 0;
-        __Pyx_DECREF_SET(__pyx_v_end_coords, __pyx_t_4);
-        __pyx_t_4 = 0;
+    __pyx_t_16 = __pyx_v_i;
+    __pyx_t_15 = 1;
+    *((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=1 */ ((char *) (((__pyx_t_14maze_solver_cy_coord_type_t *) ( /* dim=0 */ (__pyx_v_path.data + __pyx_t_16 * __pyx_v_path.strides[0]) )) + __pyx_t_15)) )) = (__pyx_v_curr % __pyx_v_cols);
 
-        /* "maze_solver_cy.pyx":250
- *                 int_grid[r, c] = PATH_CELL
- *                 start_coords = (r, c)
- *             elif char == 'E':             # <<<<<<<<<<<<<<
- *                 int_grid[r, c] = PATH_CELL
- *                 end_coords = (r, c)
+    /* "maze_solver_cy.pyx":443
+ *         path[i, 1] = curr % cols
+ * 
+ *         if i == 0:             # <<<<<<<<<<<<<<
+ *             break
+ * 
 */
-        goto __pyx_L12;
-      }
+    __pyx_t_1 = (__pyx_v_i == 0);
+    if (__pyx_t_1) {
 
-      /* "maze_solver_cy.pyx":254
- *                 end_coords = (r, c)
- *             else:
- *                 int_grid[r, c] = PATH_CELL  # Assume qualquer outro char como caminho             # <<<<<<<<<<<<<<
+      /* "maze_solver_cy.pyx":444
+ * 
+ *         if i == 0:
+ *             break             # <<<<<<<<<<<<<<
  * 
- *     if start_coords is None or end_coords is None:
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
 */
-      /*else*/ {
-        __pyx_t_4 = PyLong_FromSsize_t(__pyx_v_r); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_c); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __Pyx_GIVEREF(__pyx_t_4);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_4) != (0)) __PYX_ERR(0, 254, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_1);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 254, __pyx_L1_error);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = 0;
-        if (unlikely((PyObject_SetItem(__pyx_v_int_grid, __pyx_t_11, __pyx_mstate_global->__pyx_int_0) < 0))) __PYX_ERR(0, 254, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-      }
-      __pyx_L12:;
-    }
-  }
+      goto __pyx_L42_break;
 
-  /* "maze_solver_cy.pyx":256
- *                 int_grid[r, c] = PATH_CELL  # Assume qualquer outro char como caminho
+      /* "maze_solver_cy.pyx":443
+ *         path[i, 1] = curr % cols
  * 
- *     if start_coords is None or end_coords is None:             # <<<<<<<<<<<<<<
- *         return None
+ *         if i == 0:             # <<<<<<<<<<<<<<
+ *             break
  * 
 */
-  __pyx_t_6 = (__pyx_v_start_coords == Py_None);
-  if (!__pyx_t_6) {
-  } else {
-    __pyx_t_7 = __pyx_t_6;
-    goto __pyx_L16_bool_binop_done;
-  }
-  __pyx_t_6 = (__pyx_v_end_coords == Py_None);
-  __pyx_t_7 = __pyx_t_6;
-  __pyx_L16_bool_binop_done:;
-  if (__pyx_t_7) {
+    }
 
-    /* "maze_solver_cy.pyx":257
+    /* "maze_solver_cy.pyx":446
+ *             break
  * 
- *     if start_coords is None or end_coords is None:
- *         return None             # <<<<<<<<<<<<<<
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)             # <<<<<<<<<<<<<<
+ *         i -= 1
  * 
- *     return int_grid, start_coords, end_coords
 */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
+    __pyx_t_15 = __pyx_v_curr;
+    __pyx_v_curr = __pyx_f_14maze_solver_cy_parent_of(__pyx_v_curr, ((*((__pyx_t_14maze_solver_cy_visited_cell_type_t *) ( /* dim=0 */ ((char *) (((__pyx_t_14maze_solver_cy_visited_cell_type_t *) __pyx_v_state.data) + __pyx_t_15)) ))) & 0x0F), __pyx_v_cols);
 
-    /* "maze_solver_cy.pyx":256
- *                 int_grid[r, c] = PATH_CELL  # Assume qualquer outro char como caminho
+    /* "maze_solver_cy.pyx":447
  * 
- *     if start_coords is None or end_coords is None:             # <<<<<<<<<<<<<<
- *         return None
+ *         curr = parent_of(curr, state[curr] & 0x0F, cols)
+ *         i -= 1             # <<<<<<<<<<<<<<
  * 
+ *     return path_np
 */
+    __pyx_v_i = (__pyx_v_i - 1);
   }
+  __pyx_L42_break:;
 
-  /* "maze_solver_cy.pyx":259
- *         return None
+  /* "maze_solver_cy.pyx":449
+ *         i -= 1
  * 
- *     return int_grid, start_coords, end_coords             # <<<<<<<<<<<<<<
+ *     return path_np             # <<<<<<<<<<<<<<
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_11 = PyTuple_New(3); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_INCREF(__pyx_v_int_grid);
-  __Pyx_GIVEREF(__pyx_v_int_grid);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_v_int_grid) != (0)) __PYX_ERR(0, 259, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_start_coords);
-  __Pyx_GIVEREF(__pyx_v_start_coords);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_v_start_coords) != (0)) __PYX_ERR(0, 259, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_end_coords);
-  __Pyx_GIVEREF(__pyx_v_end_coords);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_v_end_coords) != (0)) __PYX_ERR(0, 259, __pyx_L1_error);
-  __pyx_r = __pyx_t_11;
-  __pyx_t_11 = 0;
+  __Pyx_INCREF(__pyx_v_path_np);
+  __pyx_r = __pyx_v_path_np;
   goto __pyx_L0;
 
-  /* "maze_solver_cy.pyx":213
+  /* "maze_solver_cy.pyx":318
+ *         enqueue(upper, nidx)
  * 
- * 
- * def parse_maze_text(maze_text):             # <<<<<<<<<<<<<<
+ * cpdef object find_shortest_path_astar(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
  *     """
- *     Converte texto do labirinto para formato de grid inteiro.
+ *     A* com heurstica de Manhattan para encontrar o caminho mais curto no labirinto.
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_AddTraceback("maze_solver_cy.parse_maze_text", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_14, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_17, 1);
+  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_astar", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state_np_array);
+  __Pyx_XDECREF(__pyx_v_cost_np_array);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_state, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cost, 1);
+  __Pyx_XDECREF(__pyx_v_path_np);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_path, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14maze_solver_cy_3find_shortest_path_astar(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14maze_solver_cy_2find_shortest_path_astar, "\n    A* com heur\303\255stica de Manhattan para encontrar o caminho mais curto no labirinto.\n\n    Com custo 1 por passo, f = custo + heur\303\255stica s\303\263 fica igual ou sobe 2 a cada\n    passo, ent\303\243o a fila de prioridade vira dois baldes (f e f + 2) usados como\n    pilhas, sem heap. Dentro do balde, a pilha segue primeiro a c\303\251lula mais\n    recente, indo em dire\303\247\303\243o ao fim. Mesmo contrato de\n    find_shortest_path_cython_optimized; sem caminho, explora toda a regi\303\243o\n    alcan\303\247\303\241vel a partir do in\303\255cio (ver o BFS bidirecional).\n\n    Otimiza\303\247\303\265es implementadas:\n    - Pilhas customizadas em C (arrays pr\303\251-alocados) para eliminar overhead do Python\n    - La\303\247o da busca inteiro sem o GIL: labirintos independentes podem ser\n      resolvidos em paralelo, um por thread\n    - Grid empacotado em bits (1 bit por c\303\251lula): 32x menos banda de mem\303\263ria que int32;\n      o teste de parede \303\251 um shift e um and sobre o \303\255ndice plano\n    - C\303\251lulas por \303\255ndice plano (r * cols + c): vizinhos s\303\243o idx -+ 1 e idx -+ cols\n    - Visitados e predecessores num \303\272nico byte por c\303\251lula (c\303\263digo de dire\303\247\303\243o do\n      predecessor), em vez de um int32 de predecessor\n\n    `wall_bits` \303\251 o bitmap plano das paredes: a c\303\251lula (r, c) \303\251 o bit\n    idx & 63 da palavra idx >> 6, com idx = r * cols + c (ao menos\n    ceil(rows * cols / 64) palavras uint64).\n\n    Retorna o caminho como np.ndarray int32 de forma (N, 2), com as\n    coordenadas (linha, coluna) do in\303\255cio ao fim, ou None se n\303\243o houver caminho.\n    ");
+static PyMethodDef __pyx_mdef_14maze_solver_cy_3find_shortest_path_astar = {"find_shortest_path_astar", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14maze_solver_cy_3find_shortest_path_astar, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14maze_solver_cy_2find_shortest_path_astar};
+static PyObject *__pyx_pw_14maze_solver_cy_3find_shortest_path_astar(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  __Pyx_memviewslice __pyx_v_wall_bits = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_rows;
+  int __pyx_v_cols;
+  PyObject *__pyx_v_start_coords = 0;
+  PyObject *__pyx_v_end_coords = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[5] = {0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_shortest_path_astar (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_wall_bits,&__pyx_mstate_global->__pyx_n_u_rows,&__pyx_mstate_global->__pyx_n_u_cols,&__pyx_mstate_global->__pyx_n_u_start_coords,&__pyx_mstate_global->__pyx_n_u_end_coords,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 318, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 318, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 318, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 318, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 318, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 318, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "find_shortest_path_astar", 0) < 0) __PYX_ERR(0, 318, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("find_shortest_path_astar", 1, 5, 5, i); __PYX_ERR(0, 318, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 5)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 318, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 318, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 318, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 318, __pyx_L3_error)
+      values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 318, __pyx_L3_error)
+    }
+    __pyx_v_wall_bits = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_wall_word_type_t__const__(values[0], 0); if (unlikely(!__pyx_v_wall_bits.memview)) __PYX_ERR(0, 318, __pyx_L3_error)
+    __pyx_v_rows = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_rows == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 318, __pyx_L3_error)
+    __pyx_v_cols = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_cols == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 318, __pyx_L3_error)
+    __pyx_v_start_coords = ((PyObject*)values[3]);
+    __pyx_v_end_coords = ((PyObject*)values[4]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_shortest_path_astar", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 318, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_wall_bits, 1);
+  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_astar", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_start_coords), (&PyTuple_Type), 1, "start_coords", 1))) __PYX_ERR(0, 318, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_end_coords), (&PyTuple_Type), 1, "end_coords", 1))) __PYX_ERR(0, 318, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14maze_solver_cy_2find_shortest_path_astar(__pyx_self, __pyx_v_wall_bits, __pyx_v_rows, __pyx_v_cols, __pyx_v_start_coords, __pyx_v_end_coords);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_wall_bits, 1);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_14maze_solver_cy_2find_shortest_path_astar(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_wall_bits, int __pyx_v_rows, int __pyx_v_cols, PyObject *__pyx_v_start_coords, PyObject *__pyx_v_end_coords) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_shortest_path_astar", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_14maze_solver_cy_find_shortest_path_astar(__pyx_v_wall_bits, __pyx_v_rows, __pyx_v_cols, __pyx_v_start_coords, __pyx_v_end_coords, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("maze_solver_cy.find_shortest_path_astar", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_lines);
-  __Pyx_XDECREF(__pyx_v_line);
-  __Pyx_XDECREF(__pyx_v_int_grid);
-  __Pyx_XDECREF(__pyx_v_start_coords);
-  __Pyx_XDECREF(__pyx_v_end_coords);
-  __Pyx_XDECREF(__pyx_v_char);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -23774,28 +24966,28 @@ __Pyx_RefNannySetupContext("PyInit_maze_solver_cy", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_np, __pyx_t_5) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "maze_solver_cy.pyx":77
- * DEF DC_RIGHT = 1
+  /* "maze_solver_cy.pyx":145
+ *     return False
  * 
- * cpdef list find_shortest_path_cython_optimized(cnp.int32_t[:, ::1] int_grid, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
+ * cpdef object find_shortest_path_cython_optimized(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
  *     """
  *     Verso otimizada do BFS para encontrar o caminho mais curto no labirinto.
 */
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_14maze_solver_cy_1find_shortest_path_cython_optimized, 0, __pyx_mstate_global->__pyx_n_u_find_shortest_path_cython_optimi, NULL, __pyx_mstate_global->__pyx_n_u_maze_solver_cy, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_14maze_solver_cy_1find_shortest_path_cython_optimized, 0, __pyx_mstate_global->__pyx_n_u_find_shortest_path_cython_optimi, NULL, __pyx_mstate_global->__pyx_n_u_maze_solver_cy, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_find_shortest_path_cython_optimi, __pyx_t_5) < 0) __PYX_ERR(0, 77, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_find_shortest_path_cython_optimi, __pyx_t_5) < 0) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "maze_solver_cy.pyx":213
+  /* "maze_solver_cy.pyx":318
+ *         enqueue(upper, nidx)
  * 
- * 
- * def parse_maze_text(maze_text):             # <<<<<<<<<<<<<<
+ * cpdef object find_shortest_path_astar(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):             # <<<<<<<<<<<<<<
  *     """
- *     Converte texto do labirinto para formato de grid inteiro.
+ *     A* com heurstica de Manhattan para encontrar o caminho mais curto no labirinto.
 */
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_14maze_solver_cy_3parse_maze_text, 0, __pyx_mstate_global->__pyx_n_u_parse_maze_text, NULL, __pyx_mstate_global->__pyx_n_u_maze_solver_cy, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_14maze_solver_cy_3find_shortest_path_astar, 0, __pyx_mstate_global->__pyx_n_u_find_shortest_path_astar, NULL, __pyx_mstate_global->__pyx_n_u_maze_solver_cy, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_parse_maze_text, __pyx_t_5) < 0) __PYX_ERR(0, 213, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_find_shortest_path_astar, __pyx_t_5) < 0) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
   /* "maze_solver_cy.pyx":1
@@ -23878,8 +25070,8 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_Cannot_create_writable_memory_vi, sizeof(__pyx_k_Cannot_create_writable_memory_vi), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Cannot_create_writable_memory_vi */
   {__pyx_k_Cannot_index_with_type, sizeof(__pyx_k_Cannot_index_with_type), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Cannot_index_with_type */
   {__pyx_k_Cannot_transpose_memoryview_with, sizeof(__pyx_k_Cannot_transpose_memoryview_with), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Cannot_transpose_memoryview_with */
+  {__pyx_k_Dimenses, sizeof(__pyx_k_Dimenses), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Dimenses */
   {__pyx_k_Dimension_d_is_not_direct, sizeof(__pyx_k_Dimension_d_is_not_direct), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Dimension_d_is_not_direct */
-  {__pyx_k_E, sizeof(__pyx_k_E), 0, 1, 1}, /* PyObject cname: __pyx_n_u_E */
   {__pyx_k_Ellipsis, sizeof(__pyx_k_Ellipsis), 0, 1, 1}, /* PyObject cname: __pyx_n_u_Ellipsis */
   {__pyx_k_Empty_shape_tuple_for_cython_arr, sizeof(__pyx_k_Empty_shape_tuple_for_cython_arr), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Empty_shape_tuple_for_cython_arr */
   {__pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ImportError */
@@ -23895,31 +25087,26 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_O, sizeof(__pyx_k_O), 0, 0, 1}, /* PyObject cname: __pyx_n_b_O */
   {__pyx_k_Out_of_bounds_on_buffer_access_a, sizeof(__pyx_k_Out_of_bounds_on_buffer_access_a), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Out_of_bounds_on_buffer_access_a */
   {__pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_PickleError */
-  {__pyx_k_S, sizeof(__pyx_k_S), 0, 1, 1}, /* PyObject cname: __pyx_n_u_S */
   {__pyx_k_Sequence, sizeof(__pyx_k_Sequence), 0, 1, 1}, /* PyObject cname: __pyx_n_u_Sequence */
   {__pyx_k_Step_may_not_be_zero_axis_d, sizeof(__pyx_k_Step_may_not_be_zero_axis_d), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Step_may_not_be_zero_axis_d */
   {__pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_TypeError */
   {__pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Unable_to_convert_item_to_object */
   {__pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ValueError */
   {__pyx_k_View_MemoryView, sizeof(__pyx_k_View_MemoryView), 0, 1, 1}, /* PyObject cname: __pyx_n_u_View_MemoryView */
-  {__pyx_k__10, sizeof(__pyx_k__10), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__10 */
   {__pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__2 */
   {__pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__3 */
   {__pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__4 */
   {__pyx_k__5, sizeof(__pyx_k__5), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__5 */
   {__pyx_k__6, sizeof(__pyx_k__6), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__6 */
-  {__pyx_k__7, sizeof(__pyx_k__7), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__7 */
-  {__pyx_k__8, sizeof(__pyx_k__8), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__8 */
-  {__pyx_k__9, sizeof(__pyx_k__9), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__9 */
   {__pyx_k_abc, sizeof(__pyx_k_abc), 0, 1, 1}, /* PyObject cname: __pyx_n_u_abc */
   {__pyx_k_add_note, sizeof(__pyx_k_add_note), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_add_note */
   {__pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 1, 1}, /* PyObject cname: __pyx_n_u_allocate_buffer */
   {__pyx_k_and, sizeof(__pyx_k_and), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_and */
+  {__pyx_k_array, sizeof(__pyx_k_array), 0, 1, 1}, /* PyObject cname: __pyx_n_u_array */
   {__pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_asyncio_coroutines */
   {__pyx_k_at_0x, sizeof(__pyx_k_at_0x), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_at_0x */
   {__pyx_k_base, sizeof(__pyx_k_base), 0, 1, 1}, /* PyObject cname: __pyx_n_u_base */
   {__pyx_k_c, sizeof(__pyx_k_c), 0, 1, 1}, /* PyObject cname: __pyx_n_u_c */
-  {__pyx_k_char, sizeof(__pyx_k_char), 0, 1, 1}, /* PyObject cname: __pyx_n_u_char */
   {__pyx_k_class, sizeof(__pyx_k_class), 0, 1, 1}, /* PyObject cname: __pyx_n_u_class */
   {__pyx_k_class_getitem, sizeof(__pyx_k_class_getitem), 0, 1, 1}, /* PyObject cname: __pyx_n_u_class_getitem */
   {__pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 1, 1}, /* PyObject cname: __pyx_n_u_cline_in_traceback */
@@ -23932,16 +25119,17 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_disable */
   {__pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 1, 1}, /* PyObject cname: __pyx_n_u_dtype */
   {__pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 1, 1}, /* PyObject cname: __pyx_n_u_dtype_is_object */
+  {__pyx_k_empty, sizeof(__pyx_k_empty), 0, 1, 1}, /* PyObject cname: __pyx_n_u_empty */
   {__pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_enable */
   {__pyx_k_encode, sizeof(__pyx_k_encode), 0, 1, 1}, /* PyObject cname: __pyx_n_u_encode */
   {__pyx_k_end_coords, sizeof(__pyx_k_end_coords), 0, 1, 1}, /* PyObject cname: __pyx_n_u_end_coords */
   {__pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_enumerate */
   {__pyx_k_error, sizeof(__pyx_k_error), 0, 1, 1}, /* PyObject cname: __pyx_n_u_error */
+  {__pyx_k_find_shortest_path_astar, sizeof(__pyx_k_find_shortest_path_astar), 0, 1, 1}, /* PyObject cname: __pyx_n_u_find_shortest_path_astar */
   {__pyx_k_find_shortest_path_cython_optimi, sizeof(__pyx_k_find_shortest_path_cython_optimi), 0, 1, 1}, /* PyObject cname: __pyx_n_u_find_shortest_path_cython_optimi */
   {__pyx_k_flags, sizeof(__pyx_k_flags), 0, 1, 1}, /* PyObject cname: __pyx_n_u_flags */
   {__pyx_k_format, sizeof(__pyx_k_format), 0, 1, 1}, /* PyObject cname: __pyx_n_u_format */
   {__pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 1}, /* PyObject cname: __pyx_n_u_fortran */
-  {__pyx_k_full, sizeof(__pyx_k_full), 0, 1, 1}, /* PyObject cname: __pyx_n_u_full */
   {__pyx_k_func, sizeof(__pyx_k_func), 0, 1, 1}, /* PyObject cname: __pyx_n_u_func */
   {__pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_gc */
   {__pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_getstate */
@@ -23949,20 +25137,17 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_got_differing_extents_in_dimensi */
   {__pyx_k_id, sizeof(__pyx_k_id), 0, 1, 1}, /* PyObject cname: __pyx_n_u_id */
   {__pyx_k_import, sizeof(__pyx_k_import), 0, 1, 1}, /* PyObject cname: __pyx_n_u_import */
+  {__pyx_k_incompatveis_com_o_bitmap_de_pa, sizeof(__pyx_k_incompatveis_com_o_bitmap_de_pa), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_incompatveis_com_o_bitmap_de_pa */
   {__pyx_k_index, sizeof(__pyx_k_index), 0, 1, 1}, /* PyObject cname: __pyx_n_u_index */
   {__pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 1, 1}, /* PyObject cname: __pyx_n_u_initializing */
   {__pyx_k_int32, sizeof(__pyx_k_int32), 0, 1, 1}, /* PyObject cname: __pyx_n_u_int32 */
-  {__pyx_k_int_grid, sizeof(__pyx_k_int_grid), 0, 1, 1}, /* PyObject cname: __pyx_n_u_int_grid */
   {__pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 1, 1}, /* PyObject cname: __pyx_n_u_is_coroutine */
   {__pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_isenabled */
   {__pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 1, 1}, /* PyObject cname: __pyx_n_u_itemsize */
   {__pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_itemsize_0_for_cython_array */
-  {__pyx_k_line, sizeof(__pyx_k_line), 0, 1, 1}, /* PyObject cname: __pyx_n_u_line */
-  {__pyx_k_lines, sizeof(__pyx_k_lines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_lines */
   {__pyx_k_main, sizeof(__pyx_k_main), 0, 1, 1}, /* PyObject cname: __pyx_n_u_main */
   {__pyx_k_maze_solver_cy, sizeof(__pyx_k_maze_solver_cy), 0, 1, 1}, /* PyObject cname: __pyx_n_u_maze_solver_cy */
   {__pyx_k_maze_solver_cy_pyx, sizeof(__pyx_k_maze_solver_cy_pyx), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_maze_solver_cy_pyx */
-  {__pyx_k_maze_text, sizeof(__pyx_k_maze_text), 0, 1, 1}, /* PyObject cname: __pyx_n_u_maze_text */
   {__pyx_k_memview, sizeof(__pyx_k_memview), 0, 1, 1}, /* PyObject cname: __pyx_n_u_memview */
   {__pyx_k_mode, sizeof(__pyx_k_mode), 0, 1, 1}, /* PyObject cname: __pyx_n_u_mode */
   {__pyx_k_module, sizeof(__pyx_k_module), 0, 1, 1}, /* PyObject cname: __pyx_n_u_module */
@@ -23978,7 +25163,7 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_obj, sizeof(__pyx_k_obj), 0, 1, 1}, /* PyObject cname: __pyx_n_u_obj */
   {__pyx_k_object, sizeof(__pyx_k_object), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_object */
   {__pyx_k_pack, sizeof(__pyx_k_pack), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pack */
-  {__pyx_k_parse_maze_text, sizeof(__pyx_k_parse_maze_text), 0, 1, 1}, /* PyObject cname: __pyx_n_u_parse_maze_text */
+  {__pyx_k_palavras, sizeof(__pyx_k_palavras), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_palavras */
   {__pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pickle */
   {__pyx_k_pop, sizeof(__pyx_k_pop), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pop */
   {__pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pyx_checksum */
@@ -23987,7 +25172,6 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_pyx_unpickle_Enum, sizeof(__pyx_k_pyx_unpickle_Enum), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pyx_unpickle_Enum */
   {__pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pyx_vtable */
   {__pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 1, 1}, /* PyObject cname: __pyx_n_u_qualname */
-  {__pyx_k_r, sizeof(__pyx_k_r), 0, 1, 1}, /* PyObject cname: __pyx_n_u_r */
   {__pyx_k_range, sizeof(__pyx_k_range), 0, 1, 1}, /* PyObject cname: __pyx_n_u_range */
   {__pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 1, 1}, /* PyObject cname: __pyx_n_u_reduce */
   {__pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 1, 1}, /* PyObject cname: __pyx_n_u_reduce_cython */
@@ -24000,7 +25184,6 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_shape, sizeof(__pyx_k_shape), 0, 1, 1}, /* PyObject cname: __pyx_n_u_shape */
   {__pyx_k_size, sizeof(__pyx_k_size), 0, 1, 1}, /* PyObject cname: __pyx_n_u_size */
   {__pyx_k_spec, sizeof(__pyx_k_spec), 0, 1, 1}, /* PyObject cname: __pyx_n_u_spec */
-  {__pyx_k_split, sizeof(__pyx_k_split), 0, 1, 1}, /* PyObject cname: __pyx_n_u_split */
   {__pyx_k_start, sizeof(__pyx_k_start), 0, 1, 1}, /* PyObject cname: __pyx_n_u_start */
   {__pyx_k_start_coords, sizeof(__pyx_k_start_coords), 0, 1, 1}, /* PyObject cname: __pyx_n_u_start_coords */
   {__pyx_k_step, sizeof(__pyx_k_step), 0, 1, 1}, /* PyObject cname: __pyx_n_u_step */
@@ -24008,7 +25191,6 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_strided_and_direct, sizeof(__pyx_k_strided_and_direct), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_strided_and_direct */
   {__pyx_k_strided_and_direct_or_indirect, sizeof(__pyx_k_strided_and_direct_or_indirect), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_strided_and_direct_or_indirect */
   {__pyx_k_strided_and_indirect, sizeof(__pyx_k_strided_and_indirect), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_strided_and_indirect */
-  {__pyx_k_strip, sizeof(__pyx_k_strip), 0, 1, 1}, /* PyObject cname: __pyx_n_u_strip */
   {__pyx_k_struct, sizeof(__pyx_k_struct), 0, 1, 1}, /* PyObject cname: __pyx_n_u_struct */
   {__pyx_k_test, sizeof(__pyx_k_test), 0, 1, 1}, /* PyObject cname: __pyx_n_u_test */
   {__pyx_k_uint8, sizeof(__pyx_k_uint8), 0, 1, 1}, /* PyObject cname: __pyx_n_u_uint8 */
@@ -24016,6 +25198,7 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_unable_to_allocate_shape_and_str, sizeof(__pyx_k_unable_to_allocate_shape_and_str), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_unable_to_allocate_shape_and_str */
   {__pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 1, 1}, /* PyObject cname: __pyx_n_u_unpack */
   {__pyx_k_update, sizeof(__pyx_k_update), 0, 1, 1}, /* PyObject cname: __pyx_n_u_update */
+  {__pyx_k_wall_bits, sizeof(__pyx_k_wall_bits), 0, 1, 1}, /* PyObject cname: __pyx_n_u_wall_bits */
   {__pyx_k_x, sizeof(__pyx_k_x), 0, 1, 1}, /* PyObject cname: __pyx_n_u_x */
   {__pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 1, 1}, /* PyObject cname: __pyx_n_u_zeros */
   {0, 0, 0, 0, 0}
@@ -24027,12 +25210,12 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry const *t, PyObject **target, c
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_range); if (!__pyx_builtin_range) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 178, __pyx_L1_error)
   __pyx_builtin___import__ = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_import); if (!__pyx_builtin___import__) __PYX_ERR(1, 101, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 139, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 154, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 157, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_range); if (!__pyx_builtin_range) __PYX_ERR(1, 259, __pyx_L1_error)
   __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(1, 373, __pyx_L1_error)
   __pyx_builtin_Ellipsis = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_Ellipsis); if (!__pyx_builtin_Ellipsis) __PYX_ERR(1, 408, __pyx_L1_error)
   __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_id); if (!__pyx_builtin_id) __PYX_ERR(1, 618, __pyx_L1_error)
@@ -24099,6 +25282,7 @@ static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   if (__Pyx_InitStrings(__pyx_string_tab, __pyx_mstate->__pyx_string_tab, __pyx_string_tab_encodings) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_mstate->__pyx_int_0 = PyLong_FromLong(0); if (unlikely(!__pyx_mstate->__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_mstate->__pyx_int_1 = PyLong_FromLong(1); if (unlikely(!__pyx_mstate->__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_int_2 = PyLong_FromLong(2); if (unlikely(!__pyx_mstate->__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_mstate->__pyx_int_112105877 = PyLong_FromLong(112105877L); if (unlikely(!__pyx_mstate->__pyx_int_112105877)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_mstate->__pyx_int_136983863 = PyLong_FromLong(136983863L); if (unlikely(!__pyx_mstate->__pyx_int_136983863)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_mstate->__pyx_int_184977713 = PyLong_FromLong(184977713L); if (unlikely(!__pyx_mstate->__pyx_int_184977713)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -24110,12 +25294,12 @@ static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
 /* #### Code section: init_codeobjects ### */
 \
         typedef struct {
-            unsigned int argcount : 2;
+            unsigned int argcount : 3;
             unsigned int num_posonly_args : 1;
             unsigned int num_kwonly_args : 1;
-            unsigned int nlocals : 4;
+            unsigned int nlocals : 3;
             unsigned int flags : 10;
-            unsigned int first_line : 8;
+            unsigned int first_line : 9;
             unsigned int line_table_length : 15;
         } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
@@ -24133,14 +25317,14 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 77, 1040};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_int_grid, __pyx_mstate->__pyx_n_u_start_coords, __pyx_mstate->__pyx_n_u_end_coords};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_maze_solver_cy_pyx, __pyx_mstate->__pyx_n_u_find_shortest_path_cython_optimi, __pyx_k_HF_1_HF_1_AQ_AQ_j_j_Cxs_s_Bc_E, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 145, 923};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_wall_bits, __pyx_mstate->__pyx_n_u_rows, __pyx_mstate->__pyx_n_u_cols, __pyx_mstate->__pyx_n_u_start_coords, __pyx_mstate->__pyx_n_u_end_coords};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_maze_solver_cy_pyx, __pyx_mstate->__pyx_n_u_find_shortest_path_cython_optimi, __pyx_k_uBb_5_E_U_F_D_2RyPVVWWX_j_0_ggm, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 11, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 213, 288};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_maze_text, __pyx_mstate->__pyx_n_u_lines, __pyx_mstate->__pyx_n_u_rows, __pyx_mstate->__pyx_n_u_cols, __pyx_mstate->__pyx_n_u_line, __pyx_mstate->__pyx_n_u_int_grid, __pyx_mstate->__pyx_n_u_start_coords, __pyx_mstate->__pyx_n_u_end_coords, __pyx_mstate->__pyx_n_u_r, __pyx_mstate->__pyx_n_u_c, __pyx_mstate->__pyx_n_u_char};
-    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_maze_solver_cy_pyx, __pyx_mstate->__pyx_n_u_parse_maze_text, __pyx_k_IV2V1A_t1_q_3aq_3auAWKq_3avS_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 318, 1047};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_wall_bits, __pyx_mstate->__pyx_n_u_rows, __pyx_mstate->__pyx_n_u_cols, __pyx_mstate->__pyx_n_u_start_coords, __pyx_mstate->__pyx_n_u_end_coords};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_maze_solver_cy_pyx, __pyx_mstate->__pyx_n_u_find_shortest_path_astar, __pyx_k_8_uBb_5_E_U_F_D_2RyPVVWWX_j_0_g, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -27009,15 +28193,6 @@ CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyO
 }
 #endif
 
-/* ErrOccurredWithGIL */
-static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
-  int err;
-  PyGILState_STATE _save = PyGILState_Ensure();
-  err = !!PyErr_Occurred();
-  PyGILState_Release(_save);
-  return err;
-}
-
 /* CallTypeTraverse */
 #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
 #else
@@ -30135,18 +31310,18 @@ no_fail:
 }
 
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_5numpy_int32_t(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_wall_word_type_t__const__(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
     int retcode;
     if (obj == Py_None) {
         result.memview = (struct __pyx_memoryview_obj *) Py_None;
         return result;
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
-                                                 &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, stack,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_wall_word_type_t__const__, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -30180,7 +31355,30 @@ __pyx_fail:
     }
 
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_visited_cell_type_t(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_visited_cell_type_t, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -30191,7 +31389,7 @@ __pyx_fail:
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
                                                  (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
-                                                 &__Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_visited_cell_type_t, stack,
+                                                 &__Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_coord_type_t, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -30203,18 +31401,18 @@ __pyx_fail:
 }
 
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_nn___pyx_t_14maze_solver_cy_coord_type_t(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_14maze_solver_cy_cell_index_type_t(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
     int retcode;
     if (obj == Py_None) {
         result.memview = (struct __pyx_memoryview_obj *) Py_None;
         return result;
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
-                                                 &__Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_coord_type_t, stack,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_nn___pyx_t_14maze_solver_cy_cell_index_type_t, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -30895,6 +32093,260 @@ static CYTHON_INLINE void __Pyx_XCLEAR_MEMVIEW(__Pyx_memviewslice *memslice,
     }
 }
 
+/* CIntFromPy */
+  static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyLong_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (int) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(int) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(int) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+        }
+    }
+    {
+        int val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (int) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (int) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (int) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (int) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((int) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((int) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (int) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
 /* CIntToPy */
   static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -31362,260 +32814,6 @@ raise_neg_overflow:
     }
 }
 
-/* CIntFromPy */
-  static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (unlikely(!PyLong_Check(x))) {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_Long(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyLong_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-    if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
-            goto raise_neg_overflow;
-        } else if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_DigitCount(x)) {
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-            }
-        }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
-        if (unlikely(Py_SIZE(x) < 0)) {
-            goto raise_neg_overflow;
-        }
-#else
-        {
-            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-            if (unlikely(result < 0))
-                return (int) -1;
-            if (unlikely(result == 1))
-                goto raise_neg_overflow;
-        }
-#endif
-        if ((sizeof(int) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
-        }
-    } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-        if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_SignedDigitCount(x)) {
-                case -2:
-                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-            }
-        }
-#endif
-        if ((sizeof(int) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
-        }
-    }
-    {
-        int val;
-        int ret = -1;
-#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
-        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
-            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
-        if (unlikely(bytes_copied == -1)) {
-        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
-            goto raise_overflow;
-        } else {
-            ret = 0;
-        }
-#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
-        int one = 1; int is_little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        ret = _PyLong_AsByteArray((PyLongObject *)x,
-                                    bytes, sizeof(val),
-                                    is_little, !is_unsigned);
-#else
-        PyObject *v;
-        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
-        int bits, remaining_bits, is_negative = 0;
-        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
-        if (likely(PyLong_CheckExact(x))) {
-            v = __Pyx_NewRef(x);
-        } else {
-            v = PyNumber_Long(x);
-            if (unlikely(!v)) return (int) -1;
-            assert(PyLong_CheckExact(v));
-        }
-        {
-            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
-            if (unlikely(result < 0)) {
-                Py_DECREF(v);
-                return (int) -1;
-            }
-            is_negative = result == 1;
-        }
-        if (is_unsigned && unlikely(is_negative)) {
-            Py_DECREF(v);
-            goto raise_neg_overflow;
-        } else if (is_negative) {
-            stepval = PyNumber_Invert(v);
-            Py_DECREF(v);
-            if (unlikely(!stepval))
-                return (int) -1;
-        } else {
-            stepval = v;
-        }
-        v = NULL;
-        val = (int) 0;
-        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
-        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
-            PyObject *tmp, *digit;
-            long idigit;
-            digit = PyNumber_And(stepval, mask);
-            if (unlikely(!digit)) goto done;
-            idigit = PyLong_AsLong(digit);
-            Py_DECREF(digit);
-            if (unlikely(idigit < 0)) goto done;
-            val |= ((int) idigit) << bits;
-            tmp = PyNumber_Rshift(stepval, shift);
-            if (unlikely(!tmp)) goto done;
-            Py_DECREF(stepval); stepval = tmp;
-        }
-        Py_DECREF(shift); shift = NULL;
-        Py_DECREF(mask); mask = NULL;
-        {
-            long idigit = PyLong_AsLong(stepval);
-            if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
-            if (unlikely(idigit >= (1L << remaining_bits)))
-                goto raise_overflow;
-            val |= ((int) idigit) << bits;
-        }
-        if (!is_unsigned) {
-            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
-                goto raise_overflow;
-            if (is_negative)
-                val = ~val;
-        }
-        ret = 0;
-    done:
-        Py_XDECREF(shift);
-        Py_XDECREF(mask);
-        Py_XDECREF(stepval);
-#endif
-        if (unlikely(ret))
-            return (int) -1;
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
 /* CIntFromPy */
   static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -32157,7 +33355,7 @@ __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
         result = name;
         name = NULL;
     } else {
-        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__10);
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__6);
     }
     goto done;
 }
@@ -11,82 +11,171 @@
 import numpy as np
 cimport numpy as cnp
 from libc.stdlib cimport malloc, free
-from libc.string cimport memset
 
-ctypedef cnp.int32_t grid_cell_type_t
-ctypedef cnp.uint8_t visited_cell_type_t
+ctypedef cnp.uint64_t wall_word_type_t
+ctypedef cnp.uint8_t visited_cell_type_t # Estado da célula: direção do predecessor (0 = não visitada)
 ctypedef cnp.int32_t coord_type_t
 ctypedef cnp.uint32_t queue_index_t
+ctypedef cnp.int32_t cell_index_type_t # Índice plano da célula: r * cols + c
 
-DEF PATH_CELL = 0
-DEF WALL_CELL = 1
-
-# Estrutura para queue circular otimizada
-cdef struct CircularQueue:
-    coord_type_t* data_r
-    coord_type_t* data_c
+# Buffer de índices planos de célula: fila no BFS, pilha nos baldes do A*. Cada célula entra
+# no máximo uma vez (por balde, no A*), então com capacidade rows * cols nunca há volta
+cdef struct CellQueue:
+    cell_index_type_t* data
     queue_index_t head
     queue_index_t tail
-    queue_index_t size
-    queue_index_t capacity
 
-cdef inline void init_queue(CircularQueue* q, queue_index_t capacity) nogil:
-    """Inicializa a queue circular com capacidade especificada"""
-    q.data_r = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
-    q.data_c = <coord_type_t*>malloc(capacity * sizeof(coord_type_t))
+cdef inline void init_queue(CellQueue* q, queue_index_t capacity) noexcept nogil:
+    """Inicializa a queue com capacidade especificada"""
+    q.data = <cell_index_type_t*>malloc(capacity * sizeof(cell_index_type_t))
     q.head = 0
     q.tail = 0
-    q.size = 0
-    q.capacity = capacity
 
-cdef inline void free_queue(CircularQueue* q) nogil:
+cdef inline void free_queue(CellQueue* q) noexcept nogil:
     """Libera a memória da queue"""
-    if q.data_r != NULL:
-        free(q.data_r)
-    if q.data_c != NULL:
-        free(q.data_c)
+    if q.data != NULL:
+        free(q.data)
 
-cdef inline bint is_queue_empty(CircularQueue* q) nogil:
+cdef inline bint is_queue_empty(CellQueue* q) noexcept nogil:
     """Verifica se a queue está vazia"""
-    return q.size == 0
+    return q.head == q.tail
 
-cdef inline void enqueue(CircularQueue* q, coord_type_t r, coord_type_t c) nogil:
+cdef inline void enqueue(CellQueue* q, cell_index_type_t idx) noexcept nogil:
     """Adiciona elemento na queue (assume que há espaço)"""
-    q.data_r[q.tail] = r
-    q.data_c[q.tail] = c
-    q.tail = (q.tail + 1) % q.capacity
-    q.size += 1
+    q.data[q.tail] = idx
+    q.tail += 1
 
-cdef inline void dequeue(CircularQueue* q, coord_type_t* r, coord_type_t* c) nogil:
+cdef inline cell_index_type_t dequeue(CellQueue* q) noexcept nogil:
     """Remove elemento da queue (assume que não está vazia)"""
-    r[0] = q.data_r[q.head]
-    c[0] = q.data_c[q.head]
-    q.head = (q.head + 1) % q.capacity
-    q.size -= 1
-
-# Direções pré-compiladas como constantes
-DEF DR_UP = -1
-DEF DC_UP = 0
-DEF DR_DOWN = 1
-DEF DC_DOWN = 0
-DEF DR_LEFT = 0
-DEF DC_LEFT = -1
-DEF DR_RIGHT = 0
-DEF DC_RIGHT = 1
-
-cpdef list find_shortest_path_cython_optimized(cnp.int32_t[:, ::1] int_grid, tuple start_coords, tuple end_coords):
+    cdef cell_index_type_t idx = q.data[q.head]
+    q.head += 1
+    return idx
+
+cdef inline cell_index_type_t pop_last(CellQueue* q) noexcept nogil:
+    """Remove o último elemento inserido, usando a queue como pilha (assume que não está vazia)"""
+    q.tail -= 1
+    return q.data[q.tail]
+
+cdef inline bint is_wall(const wall_word_type_t[::1] wall_bits, cell_index_type_t idx) noexcept nogil:
+    """Lê o bit da célula no bitmap plano (64 células por palavra, bit idx & 63, 1 = parede)"""
+    return (wall_bits[idx >> 6] >> (idx & 63)) & 1
+
+# Códigos de direção do predecessor no estado da célula. No BFS bidirecional, um nibble
+# por busca (baixo: início, alto: fim); no A*, nibble baixo + CLOSED_FLAG.
+# 0 = não visitada; ROOT marca a origem da busca
+DEF PARENT_UP = 1
+DEF PARENT_DOWN = 2
+DEF PARENT_LEFT = 3
+DEF PARENT_RIGHT = 4
+DEF PARENT_ROOT = 5
+DEF FORWARD_SHIFT = 0
+DEF BACKWARD_SHIFT = 4
+
+# Estado de um dos lados da BFS bidirecional
+cdef struct SearchSide:
+    CellQueue queue
+    int shift # Posição do nibble desta busca no estado da célula
+    visited_cell_type_t own_mask
+    visited_cell_type_t other_mask
+
+cdef inline void init_side(SearchSide* side, int shift, queue_index_t capacity) noexcept nogil:
+    """Inicializa a queue e as máscaras de nibble de um lado da busca"""
+    init_queue(&side.queue, capacity)
+    side.shift = shift
+    side.own_mask = 0x0F << shift
+    side.other_mask = 0xF0 >> shift
+
+cdef inline bint visit(SearchSide* side, visited_cell_type_t* state, cell_index_type_t idx,
+                       cell_index_type_t nidx, visited_cell_type_t parent_code,
+                       cell_index_type_t* meet) noexcept nogil:
+    """Visita nidx a partir de idx; devolve True se nidx já foi alcançado pela outra busca"""
+    if state[nidx] & side.own_mask:
+        return False
+    if state[nidx] & side.other_mask:
+        meet[0] = idx
+        meet[1] = nidx
+        return True
+    state[nidx] |= parent_code << side.shift
+    enqueue(&side.queue, nidx)
+    return False
+
+cdef inline cell_index_type_t parent_of(cell_index_type_t idx, visited_cell_type_t code, int cols) noexcept nogil:
+    """Segue um código de direção até o predecessor"""
+    if code == PARENT_UP:
+        return idx - cols
+    if code == PARENT_DOWN:
+        return idx + cols
+    if code == PARENT_LEFT:
+        return idx - 1
+    return idx + 1
+
+cdef bint expand_level(SearchSide* side, visited_cell_type_t* state,
+                       const wall_word_type_t[::1] wall_bits, int rows, int cols,
+                       cell_index_type_t* meet) noexcept nogil:
+    """Expande um nível inteiro de uma das buscas; devolve True no encontro com a outra"""
+    cdef queue_index_t level_end = side.queue.tail
+    cdef cell_index_type_t idx
+    cdef coord_type_t r, c
+
+    while side.queue.head < level_end:
+        idx = dequeue(&side.queue)
+
+        # Uma divisão por célula só para as bordas; vizinhos e bits de parede saem do índice plano.
+        # Arredondar a largura para potência de dois (r = idx >> shift) foi medido e não compensa:
+        # o BFS é limitado por memória, e as linhas mais espaçadas pioram o cache (~10% em 600x600)
+        r = idx // cols
+        c = idx - r * cols
+
+        # Explorar direções (desenrolado para performance); o vizinho guarda de onde veio
+        # Direção UP
+        if r > 0 and not is_wall(wall_bits, idx - cols) and visit(side, state, idx, idx - cols, PARENT_DOWN, meet):
+            return True
+        # Direção DOWN
+        if r < rows - 1 and not is_wall(wall_bits, idx + cols) and visit(side, state, idx, idx + cols, PARENT_UP, meet):
+            return True
+        # Direção LEFT
+        if c > 0 and not is_wall(wall_bits, idx - 1) and visit(side, state, idx, idx - 1, PARENT_RIGHT, meet):
+            return True
+        # Direção RIGHT
+        if c < cols - 1 and not is_wall(wall_bits, idx + 1) and visit(side, state, idx, idx + 1, PARENT_LEFT, meet):
+            return True
+
+    return False
+
+cpdef object find_shortest_path_cython_optimized(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):
     """
     Versão otimizada do BFS para encontrar o caminho mais curto no labirinto.
+
+    A busca é bidirecional: uma BFS parte do início e outra do fim, expandindo
+    um nível por vez do lado com a fronteira menor, até as duas se encontrarem.
+    Com caminho, find_shortest_path_astar é bem mais rápido; este BFS continua
+    como referência e ganha quando não há caminho e um dos extremos está
+    isolado numa região pequena (para assim que essa região se esgota).
     
     Otimizações implementadas:
-    - Queue circular customizada em C para eliminar overhead do Python
+    - Queue customizada em C (array pré-alocado, sem módulo) para eliminar overhead do Python
     - Eliminação de alocações desnecessárias
-    - Uso de nogil para paralelismo potencial
+    - Laço do BFS inteiro sem o GIL: labirintos independentes podem ser
+      resolvidos em paralelo, um por thread
     - Estruturas de dados mais eficientes
     - Eliminação de checagens redundantes
+    - Grid empacotado em bits (1 bit por célula): 32x menos banda de memória que int32;
+      o teste de parede é um shift e um and sobre o índice plano
+    - Células por índice plano (r * cols + c): vizinhos são idx -+ 1 e idx -+ cols,
+      e queues/estado das células são arrays 1D
+    - Visitados e predecessores num único byte por célula: o código de direção
+      do predecessor (um nibble por busca), em vez de um int32 por busca
+    - BFS bidirecional: cada lado só cobre cerca de metade da distância
+
+    `wall_bits` é o bitmap plano das paredes: a célula (r, c) é o bit
+    idx & 63 da palavra idx >> 6, com idx = r * cols + c (ao menos
+    ceil(rows * cols / 64) palavras uint64).
+
+    Retorna o caminho como np.ndarray int32 de forma (N, 2), com as
+    coordenadas (linha, coluna) do início ao fim, ou None se não houver caminho.
     """
-    cdef int rows = int_grid.shape[0]
-    cdef int cols = int_grid.shape[1]
+    if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:
+        raise ValueError(f"Dimensões {rows}x{cols} incompatíveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
     
     cdef coord_type_t start_r = start_coords[0]
     cdef coord_type_t start_c = start_coords[1]
@@ -98,161 +187,263 @@ cpdef list find_shortest_path_cython_optimized(cnp.int32_t[:, ::1] int_grid, tup
         end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
         return None
 
-    if int_grid[start_r, start_c] == WALL_CELL or int_grid[end_r, end_c] == WALL_CELL:
+    cdef cell_index_type_t start_idx = start_r * cols + start_c
+    cdef cell_index_type_t end_idx = end_r * cols + end_c
+
+    if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):
         return None
 
     # Caso especial: início igual ao fim
     if start_r == end_r and start_c == end_c:
-        return [(start_r, start_c)]
+        return np.array([[start_r, start_c]], dtype=np.int32)
 
     # Inicializar estruturas de dados
     cdef queue_index_t max_queue_size = rows * cols
-    cdef CircularQueue queue
-    init_queue(&queue, max_queue_size)
-
-    # Arrays visitados e predecessores
-    visited_np_array = np.zeros((rows, cols), dtype=np.uint8)
-    cdef visited_cell_type_t[:, ::1] visited = visited_np_array
+    cdef SearchSide forward, backward
+    init_side(&forward, FORWARD_SHIFT, max_queue_size)
+    init_side(&backward, BACKWARD_SHIFT, max_queue_size)
 
-    pred_r_np = np.full((rows, cols), -1, dtype=np.int32)
-    pred_c_np = np.full((rows, cols), -1, dtype=np.int32)
-    cdef coord_type_t[:, ::1] pred_r = pred_r_np
-    cdef coord_type_t[:, ::1] pred_c = pred_c_np
+    # Estado das células, indexado por r * cols + c: nibble baixo = direção do predecessor
+    # na busca a partir do início, nibble alto = na busca a partir do fim (0 = não visitada)
+    state_np_array = np.zeros(rows * cols, dtype=np.uint8)
+    cdef visited_cell_type_t[::1] state = state_np_array
 
     # Inicializar BFS
-    enqueue(&queue, start_r, start_c)
-    visited[start_r, start_c] = 1
-
-    cdef coord_type_t r, c, nr, nc
+    enqueue(&forward.queue, start_idx)
+    state[start_idx] = PARENT_ROOT << FORWARD_SHIFT
+    enqueue(&backward.queue, end_idx)
+    state[end_idx] = PARENT_ROOT << BACKWARD_SHIFT
+
+    # meet[0] é a célula expandida e meet[1] a vizinha já alcançada pela outra busca.
+    # Como o encontro é detectado ao descobrir a célula e os níveis são completos,
+    # o primeiro encontro já dá um caminho mínimo
+    cdef cell_index_type_t meet[2]
     cdef bint path_found = False
+    cdef bint met_forward = False
 
     # BFS principal com nogil para máxima performance
     with nogil:
-        while not is_queue_empty(&queue):
-            dequeue(&queue, &r, &c)
-            
-            # Verificar se chegamos ao destino
-            if r == end_r and c == end_c:
+        while not is_queue_empty(&forward.queue) and not is_queue_empty(&backward.queue):
+            if forward.queue.tail - forward.queue.head <= backward.queue.tail - backward.queue.head:
+                if expand_level(&forward, &state[0], wall_bits, rows, cols, meet):
+                    path_found = True
+                    met_forward = True
+                    break
+            elif expand_level(&backward, &state[0], wall_bits, rows, cols, meet):
                 path_found = True
                 break
 
-            # Explorar direções (desenrolado para performance)
-            # Direção UP
-            nr = r + DR_UP
-            nc = c + DC_UP
-            if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
-                int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
-                visited[nr, nc] = 1
-                pred_r[nr, nc] = r
-                pred_c[nr, nc] = c
-                enqueue(&queue, nr, nc)
-
-            # Direção DOWN
-            nr = r + DR_DOWN
-            nc = c + DC_DOWN
-            if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
-                int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
-                visited[nr, nc] = 1
-                pred_r[nr, nc] = r
-                pred_c[nr, nc] = c
-                enqueue(&queue, nr, nc)
-
-            # Direção LEFT
-            nr = r + DR_LEFT
-            nc = c + DC_LEFT
-            if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
-                int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
-                visited[nr, nc] = 1
-                pred_r[nr, nc] = r
-                pred_c[nr, nc] = c
-                enqueue(&queue, nr, nc)
-
-            # Direção RIGHT
-            nr = r + DR_RIGHT
-            nc = c + DC_RIGHT
-            if (nr >= 0 and nr < rows and nc >= 0 and nc < cols and
-                int_grid[nr, nc] != WALL_CELL and not visited[nr, nc]):
-                visited[nr, nc] = 1
-                pred_r[nr, nc] = r
-                pred_c[nr, nc] = c
-                enqueue(&queue, nr, nc)
-
-    # Liberar memória da queue
-    free_queue(&queue)
+    # Liberar memória das queues
+    free_queue(&forward.queue)
+    free_queue(&backward.queue)
 
     if not path_found:
         return None
 
-    # Reconstruir caminho otimizado
-    cdef list path = []
-    cdef coord_type_t curr_r = end_r
-    cdef coord_type_t curr_c = end_c
-    cdef coord_type_t prev_r, prev_c
-
-    # Construir caminho de trás para frente
+    # Reconstruir caminho otimizado, direto em um array (N, 2) sem tuplas Python:
+    # [início .. forward_end] pela busca direta + [backward_end .. fim] pela reversa
+    cdef cell_index_type_t forward_end = meet[0] if met_forward else meet[1]
+    cdef cell_index_type_t backward_end = meet[1] if met_forward else meet[0]
+    cdef cell_index_type_t curr
+    cdef Py_ssize_t forward_len = 1
+    cdef Py_ssize_t backward_len = 1
+
+    # Primeira passada: mede as duas metades seguindo os códigos de direção
+    curr = forward_end
+    while curr != start_idx:
+        curr = parent_of(curr, state[curr] & 0x0F, cols)
+        forward_len += 1
+    curr = backward_end
+    while curr != end_idx:
+        curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+        backward_len += 1
+
+    # Segunda passada: preenche a metade direta de trás para frente e a reversa em ordem
+    path_np = np.empty((forward_len + backward_len, 2), dtype=np.int32)
+    cdef coord_type_t[:, ::1] path = path_np
+    cdef Py_ssize_t i = forward_len - 1
+    curr = forward_end
     while True:
-        path.append((curr_r, curr_c))
-        
-        if curr_r == start_r and curr_c == start_c:
+        path[i, 0] = curr // cols
+        path[i, 1] = curr % cols
+
+        if i == 0:
             break
 
-        prev_r = pred_r[curr_r, curr_c]
-        prev_c = pred_c[curr_r, curr_c]
+        curr = parent_of(curr, state[curr] & 0x0F, cols)
+        i -= 1
 
-        if prev_r == -1 and prev_c == -1:
-            return None  # Erro na reconstrução
+    i = forward_len
+    curr = backward_end
+    while True:
+        path[i, 0] = curr // cols
+        path[i, 1] = curr % cols
 
-        curr_r = prev_r
-        curr_c = prev_c
+        if curr == end_idx:
+            break
 
-    # Reverter o caminho para ordem correta
-    path.reverse()
-    return path
+        curr = parent_of(curr, state[curr] >> BACKWARD_SHIFT, cols)
+        i += 1
+
+    return path_np
+
+
+DEF CLOSED_FLAG = 0x10 # No estado da célula (A*): já expandida com o menor custo
+
+cdef inline cell_index_type_t manhattan(coord_type_t r, coord_type_t c, coord_type_t end_r, coord_type_t end_c) noexcept nogil:
+    """Distância de Manhattan até o fim: heurística admissível e consistente com custo 1 por passo"""
+    cdef cell_index_type_t dr = r - end_r
+    cdef cell_index_type_t dc = c - end_c
+    if dr < 0:
+        dr = -dr
+    if dc < 0:
+        dc = -dc
+    return dr + dc
+
+cdef inline void astar_visit(visited_cell_type_t* state, cell_index_type_t* cost, CellQueue* current, CellQueue* upper,
+                             cell_index_type_t nidx, cell_index_type_t new_cost, cell_index_type_t f,
+                             cell_index_type_t f_bound, visited_cell_type_t parent_code) noexcept nogil:
+    """Registra nidx com custo new_cost se for melhor que o atual, no balde de f (f_bound ou f_bound + 2)"""
+    if state[nidx] & CLOSED_FLAG:
+        return
+    if state[nidx] != 0 and cost[nidx] <= new_cost:
+        return
+    cost[nidx] = new_cost
+    state[nidx] = parent_code
+    if f == f_bound:
+        enqueue(current, nidx)
+    else:
+        enqueue(upper, nidx)
+
+cpdef object find_shortest_path_astar(const wall_word_type_t[::1] wall_bits, int rows, int cols, tuple start_coords, tuple end_coords):
+    """
+    A* com heurística de Manhattan para encontrar o caminho mais curto no labirinto.
 
+    Com custo 1 por passo, f = custo + heurística só fica igual ou sobe 2 a cada
+    passo, então a fila de prioridade vira dois baldes (f e f + 2) usados como
+    pilhas, sem heap. Dentro do balde, a pilha segue primeiro a célula mais
+    recente, indo em direção ao fim. Mesmo contrato de
+    find_shortest_path_cython_optimized; sem caminho, explora toda a região
+    alcançável a partir do início (ver o BFS bidirecional).
 
-def parse_maze_text(maze_text):
-    """
-    Converte texto do labirinto para formato de grid inteiro.
-    
-    Args:
-        maze_text: string com o labirinto, linhas separadas por \n
-        
-    Returns:
-        tuple: (int_grid, start_coords, end_coords) ou None se inválido
+    Otimizações implementadas:
+    - Pilhas customizadas em C (arrays pré-alocados) para eliminar overhead do Python
+    - Laço da busca inteiro sem o GIL: labirintos independentes podem ser
+      resolvidos em paralelo, um por thread
+    - Grid empacotado em bits (1 bit por célula): 32x menos banda de memória que int32;
+      o teste de parede é um shift e um and sobre o índice plano
+    - Células por índice plano (r * cols + c): vizinhos são idx -+ 1 e idx -+ cols
+    - Visitados e predecessores num único byte por célula (código de direção do
+      predecessor), em vez de um int32 de predecessor
+
+    `wall_bits` é o bitmap plano das paredes: a célula (r, c) é o bit
+    idx & 63 da palavra idx >> 6, com idx = r * cols + c (ao menos
+    ceil(rows * cols / 64) palavras uint64).
+
+    Retorna o caminho como np.ndarray int32 de forma (N, 2), com as
+    coordenadas (linha, coluna) do início ao fim, ou None se não houver caminho.
     """
-    lines = maze_text.strip().split('\n')
-    if not lines:
+    if rows < 0 or cols < 0 or ((<Py_ssize_t>rows * cols) + 63) >> 6 > wall_bits.shape[0]:
+        raise ValueError(f"Dimensões {rows}x{cols} incompatíveis com o bitmap de paredes ({wall_bits.shape[0]} palavras).")
+
+    cdef coord_type_t start_r = start_coords[0]
+    cdef coord_type_t start_c = start_coords[1]
+    cdef coord_type_t end_r = end_coords[0]
+    cdef coord_type_t end_c = end_coords[1]
+
+    if (start_r < 0 or start_r >= rows or start_c < 0 or start_c >= cols or
+        end_r < 0 or end_r >= rows or end_c < 0 or end_c >= cols):
         return None
-    
-    rows = len(lines)
-    cols = len(lines[0]) if lines else 0
-    
-    # Verificar se todas as linhas têm o mesmo tamanho
-    for line in lines:
-        if len(line) != cols:
-            return None
-    
-    # Criar grid e encontrar S e E
-    int_grid = np.zeros((rows, cols), dtype=np.int32)
-    start_coords = None
-    end_coords = None
-    
-    for r in range(rows):
-        for c in range(cols):
-            char = lines[r][c]
-            if char == '#':
-                int_grid[r, c] = WALL_CELL
-            elif char == ' ' or char == '·':
-                int_grid[r, c] = PATH_CELL
-            elif char == 'S':
-                int_grid[r, c] = PATH_CELL
-                start_coords = (r, c)
-            elif char == 'E':
-                int_grid[r, c] = PATH_CELL
-                end_coords = (r, c)
-            else:
-                int_grid[r, c] = PATH_CELL  # Assume qualquer outro char como caminho
-    
-    if start_coords is None or end_coords is None:
+
+    cdef cell_index_type_t start_idx = start_r * cols + start_c
+    cdef cell_index_type_t end_idx = end_r * cols + end_c
+
+    if is_wall(wall_bits, start_idx) or is_wall(wall_bits, end_idx):
+        return None
+
+    # Estado: código de direção do predecessor + CLOSED_FLAG; custo só é lido em células com estado != 0
+    state_np_array = np.zeros(rows * cols, dtype=np.uint8)
+    cost_np_array = np.empty(rows * cols, dtype=np.int32)
+    cdef visited_cell_type_t[::1] state = state_np_array
+    cdef cell_index_type_t[::1] cost = cost_np_array
+
+    # Cada célula entra no máximo uma vez por balde, então rows * cols basta para cada pilha
+    cdef CellQueue current, upper, swap
+    init_queue(&current, rows * cols)
+    init_queue(&upper, rows * cols)
+
+    cdef cell_index_type_t f_bound = manhattan(start_r, start_c, end_r, end_c)
+    cdef cell_index_type_t idx, new_cost
+    cdef coord_type_t r, c
+    cdef bint path_found = False
+
+    cost[start_idx] = 0
+    state[start_idx] = PARENT_ROOT
+    enqueue(&current, start_idx)
+
+    with nogil:
+        while True:
+            if is_queue_empty(&current):
+                if is_queue_empty(&upper):
+                    break
+                swap = current
+                current = upper
+                upper = swap
+                upper.head = 0
+                upper.tail = 0
+                f_bound += 2
+
+            idx = pop_last(&current)
+            if state[idx] & CLOSED_FLAG:
+                continue # Entrada antiga, a célula já foi expandida com custo menor
+            state[idx] |= CLOSED_FLAG
+            if idx == end_idx:
+                path_found = True
+                break
+
+            # Uma divisão por célula só para as bordas; vizinhos e bits de parede saem do índice plano.
+            # Arredondar a largura para potência de dois (r = idx >> shift) foi medido e não compensa:
+            # a busca é limitada por memória, e as linhas mais espaçadas pioram o cache (~10% em 600x600)
+            r = idx // cols
+            c = idx - r * cols
+            new_cost = cost[idx] + 1
+
+            # Direção UP
+            if r > 0 and not is_wall(wall_bits, idx - cols):
+                astar_visit(&state[0], &cost[0], &current, &upper, idx - cols, new_cost,
+                            new_cost + manhattan(r - 1, c, end_r, end_c), f_bound, PARENT_DOWN)
+            # Direção DOWN
+            if r < rows - 1 and not is_wall(wall_bits, idx + cols):
+                astar_visit(&state[0], &cost[0], &current, &upper, idx + cols, new_cost,
+                            new_cost + manhattan(r + 1, c, end_r, end_c), f_bound, PARENT_UP)
+            # Direção LEFT
+            if c > 0 and not is_wall(wall_bits, idx - 1):
+                astar_visit(&state[0], &cost[0], &current, &upper, idx - 1, new_cost,
+                            new_cost + manhattan(r, c - 1, end_r, end_c), f_bound, PARENT_RIGHT)
+            # Direção RIGHT
+            if c < cols - 1 and not is_wall(wall_bits, idx + 1):
+                astar_visit(&state[0], &cost[0], &current, &upper, idx + 1, new_cost,
+                            new_cost + manhattan(r, c + 1, end_r, end_c), f_bound, PARENT_LEFT)
+
+    free_queue(&current)
+    free_queue(&upper)
+
+    if not path_found:
         return None
-     
\ No newline at end of file
+
+    # Reconstruir do fim para o início seguindo os códigos de direção
+    path_np = np.empty((cost[end_idx] + 1, 2), dtype=np.int32)
+    cdef coord_type_t[:, ::1] path = path_np
+    cdef Py_ssize_t i = cost[end_idx]
+    cdef cell_index_type_t curr = end_idx
+    while True:
+        path[i, 0] = curr // cols
+        path[i, 1] = curr % cols
+
+        if i == 0:
+            break
+
+        curr = parent_of(curr, state[curr] & 0x0F, cols)
+        i -= 1
+
+    return path_np
@@ -1,14 +1,23 @@
 from setuptools import Extension, setup
 from Cython.Build import cythonize
+import os
+import sys
 import numpy # Para obter o include_dir do NumPy
 
+# MAZE_NATIVE=1 compila para a CPU local, e o binário pode não rodar em outra máquina.
+# Medido: ~2-4% mais rápido no BFS bidirecional, mas ~10% mais lento no A* (o padrão de
+# solve_maze), então só compensa com MAZE_SOLVER=bfs. Flags no estilo gcc/clang; no
+# Windows (MSVC) ficam as opções padrão
+extra_compile_args = []
+if os.environ.get("MAZE_NATIVE") == "1" and sys.platform != "win32":
+    extra_compile_args = ["-O3", "-march=native", "-funroll-loops"]
+
 extensions = [
     Extension(
         "maze_solver_cy", # Nome do módulo compilado
         ["maze_solver_cy.pyx"],
         include_dirs=[numpy.get_include()], # Necessário para typed memoryviews do NumPy
-        # descomente as linhas abaixo para otimizações extras em alguns compiladores
-        # extra_compile_args=["-O3", "-march=native"], 
+        extra_compile_args=extra_compile_args, # Ver MAZE_NATIVE acima
     )
 ]
 
@@ -1,165 +1,313 @@
-from datetime import datetime
+import functools
+import os
+import sys
+import time
 import numpy as np
-import maze_solver_cy # Importa o módulo Cython compilado
+try:
+    import maze_solver_cy # Importa o módulo Cython compilado (AOT: sem custo de compilação por execução)
+except ImportError: # Ainda não compilado; solve_maze usa find_shortest_path_numpy (mais lento)
+    maze_solver_cy = None
 import traceback # Para imprimir a pilha de erros em exceções inesperadas
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-# Mapeamento de caracteres para inteiros (consistente com .pyx e suas informações salvas)
-CHAR_TO_INT = {
-    ' ': 0,  # Caminho livre
-    '#': 1,  # Parede
-    'S': 2,  # Início (tratado como caminho livre no int_grid para BFS)
-    'E': 3   # Fim (tratado como caminho livre no int_grid para BFS)
-}
-PATH_CELL_INT = CHAR_TO_INT[' ']
-WALL_CELL_INT = CHAR_TO_INT['#']
+WALL_CHAR_BYTE = ord('#') # Byte de parede no texto; pack_walls recebe char_arr == WALL_CHAR_BYTE
+_VALID_BYTES = b' #SE\n' # Bytes aceitos no texto do labirinto ('\n' separa as linhas)
+
+PATH_MARK = '·' # Seu caractere para caminho percorrido
+PATH_MARK_BYTE = ord('.') # '·' ocupa 2 bytes em UTF-8; no grid uint8 usamos '.' e trocamos na saída
+
+# Labirinto grande de exemplo, em arquivo ao lado do módulo (ver load_maze_file)
+MAZE_FILE = str(Path(__file__).with_suffix('.maze'))
+
+OUTPUT_FILENAME = "output_capivaras.txt" # Arquivo de auditoria da interface
+OUTPUT_FILENAME_PATTERN = "output_capivaras_{}.txt" # Um por labirinto em solve_mazes
+
+# MAZE_AUDIT=0 desliga o desenho e a escrita da solução (útil em benchmarks);
+# erros continuam sendo registrados no arquivo
+_AUDIT = os.environ.get("MAZE_AUDIT", "1") != "0"
+
+# MAZE_SOLVER=bfs troca o A* pelo BFS bidirecional do módulo Cython: mais lento quando há
+# caminho, mas termina quase na hora quando o fim está isolado numa região pequena
+_USE_BFS = os.environ.get("MAZE_SOLVER", "astar") == "bfs"
+
+# Um único worker: as escritas no arquivo de auditoria saem do caminho do solve_maze,
+# mas continuam serializadas na ordem das chamadas
+_output_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maze-output")
+
+# Partes fixas das mensagens do arquivo de auditoria, já codificadas em UTF-8
+_MSG_NO_PATH_HEAD = "Nenhum caminho encontrado no labirinto.\n(Tempo de processamento: ".encode("utf-8")
+_MSG_ERR_PARSE_HEAD = "Erro ao processar o labirinto: ".encode("utf-8")
+_MSG_ERR_UNEXPECTED_HEAD = "Um erro inesperado ocorreu: ".encode("utf-8")
+_MSG_ELAPSED_HEAD = "Tempo decorrido até o erro: ".encode("utf-8")
+_MSG_TRACEBACK_HEAD = "Traceback (resumo):\n".encode("utf-8")
+_MSG_MAZE_HEAD = "Labirinto fornecido:\n".encode("utf-8")
 
 # --- Funções Auxiliares ---
 
+# Cache só em memória: para o labirinto2 (~62 KB) o parse leva ~0,1 ms, e um .npy em disco
+# (np.load + hash do texto como chave) custaria o mesmo, sem ganho entre processos
+@functools.lru_cache(maxsize=4)
 def parse_maze_for_cython(maze_str: str):
     """
     Analisa a string do labirinto e retorna:
-    1. char_grid (list de list de str): O labirinto original para desenho.
-    2. int_grid_np (np.ndarray int32): O labirinto como inteiros para Cython.
+    1. char_arr (np.ndarray uint8): Os bytes ASCII do labirinto original, para desenho.
+    2. wall_bits (np.ndarray uint64): O bitmap plano das paredes para Cython (ver pack_walls).
     3. start_coords (tuple): Coordenadas (linha, coluna) de 'S'.
     4. end_coords (tuple): Coordenadas (linha, coluna) de 'E'.
     Levanta ValueError se o labirinto for malformado.
+    O resultado é memoizado para os últimos 4 labirintos: chamadas repetidas com o
+    mesmo texto devolvem os mesmos arrays (somente leitura; copie antes de alterar).
     """
     if not maze_str.strip():
         raise ValueError("O labirinto fornecido (string) está vazio ou contém apenas espaços em branco.")
-    lines = maze_str.strip().split('\n')
-    if not lines:
-        raise ValueError("O labirinto (string) não contém linhas.")
-    rows = len(lines)
-    cols = len(lines[0])
-    char_grid = [['' for _ in range(cols)] for _ in range(rows)]
-    int_grid_np = np.empty((rows, cols), dtype=np.int32)
-    start_coords = None
-    end_coords = None
-    for r, line in enumerate(lines):
-        if len(line) != cols:
-            raise ValueError(f"Linha {r+1} tem comprimento inconsistente. Esperado: {cols}, Obtido: {len(line)}.")
-        for c, char_val in enumerate(line):
-            char_grid[r][c] = char_val
-            if char_val == 'S':
-                start_coords = (r, c)
-                int_grid_np[r, c] = PATH_CELL_INT
-            elif char_val == 'E':
-                end_coords = (r, c)
-                int_grid_np[r, c] = PATH_CELL_INT
-            elif char_val == '#':
-                int_grid_np[r, c] = WALL_CELL_INT
-            elif char_val == ' ':
-                int_grid_np[r, c] = PATH_CELL_INT
-            else:
-                raise ValueError(f"Caractere inválido '{char_val}' no labirinto em ({r},{c}). Use apenas 'S', 'E', '#', ' '.")
-    if start_coords is None:
+    maze_str = maze_str.strip()
+    # Dimensões e retangularidade só com operações de str em C (count, find, fatiamento)
+    rows = maze_str.count('\n') + 1
+    cols = maze_str.find('\n') if rows > 1 else len(maze_str)
+    if len(maze_str) != rows * (cols + 1) - 1 or maze_str[cols::cols + 1] != '\n' * (rows - 1):
+        # Caminho lento apenas no erro, para apontar a linha com comprimento diferente
+        for r, line in enumerate(maze_str.split('\n')):
+            if len(line) != cols:
+                raise ValueError(f"Linha {r+1} tem comprimento inconsistente. Esperado: {cols}, Obtido: {len(line)}.")
+    try:
+        maze_bytes = (maze_str + '\n').encode('ascii')
+    except UnicodeEncodeError as e:
+        r, c = divmod(e.start, cols + 1)
+        raise ValueError(f"Caractere inválido '{maze_str[e.start]}' no labirinto em ({r},{c}). Use apenas 'S', 'E', '#', ' '.")
+    # Teste de pertinência em uma passada: apaga todos os bytes válidos; se sobrar algo, é inválido
+    invalid = maze_bytes.translate(None, _VALID_BYTES)
+    if invalid:
+        r, c = divmod(maze_bytes.index(invalid[:1]), cols + 1)
+        raise ValueError(f"Caractere inválido '{chr(invalid[0])}' no labirinto em ({r},{c}). Use apenas 'S', 'E', '#', ' '.")
+    # Visão (rows, cols) sobre o buffer, descartando a coluna dos '\n' (sem cópia)
+    char_arr = np.frombuffer(maze_bytes, dtype=np.uint8).reshape(rows, cols + 1)[:, :cols]
+    # bytes.find usa memchr (varredura SIMD da libc) e para no primeiro achado,
+    # sem alocar a máscara booleana que uma comparação NumPy + argmax precisaria
+    start_pos = maze_bytes.find(b'S')
+    if start_pos < 0:
         raise ValueError("Ponto de início 'S' não encontrado no labirinto.")
-    if end_coords is None:
+    end_pos = maze_bytes.find(b'E')
+    if end_pos < 0:
         raise ValueError("Ponto de chegada 'E' não encontrado no labirinto.")
-    return char_grid, int_grid_np, start_coords, end_coords
-
-def draw_path_on_char_grid(char_grid: list, path: list) -> list:
-    grid_with_path = [row[:] for row in char_grid]
-    if path:
-        for r, c in path:
-            if grid_with_path[r][c] != 'S' and grid_with_path[r][c] != 'E':
-                grid_with_path[r][c] = '·' # Seu caractere para caminho percorrido
+    start_r, start_c = divmod(start_pos, cols + 1)
+    end_r, end_c = divmod(end_pos, cols + 1)
+    return char_arr, pack_walls(char_arr == WALL_CHAR_BYTE), (start_r, start_c), (end_r, end_c)
+
+def pack_walls(wall_grid: np.ndarray) -> np.ndarray:
+    """
+    Empacota o grid (rows, cols) de paredes (não zero = parede) em um bitmap plano de
+    palavras uint64, 1 bit por célula: com idx = r * cols + c, a célula (r, c) é o bit
+    idx & 63 da palavra idx >> 6, formato lido pelo A* em Cython.
+    """
+    flat_bits = np.packbits(wall_grid.reshape(-1), bitorder='little')
+    packed = np.zeros(((flat_bits.size + 7) >> 3) * 8, dtype=np.uint8)
+    packed[:flat_bits.size] = flat_bits
+    wall_bits = packed.view('<u8')
+    wall_bits.flags.writeable = False # Compartilhado pelo cache do parse
+    return wall_bits
+
+_WORD_ONE = np.uint64(1)
+_WORD_TOP = np.uint64(63)
+
+def _pack_rows(mask: np.ndarray) -> np.ndarray:
+    """Empacota um grid booleano (rows, cols) em palavras uint64 por linha: (r, c) é o bit c & 63 de [r, c >> 6]."""
+    rows, cols = mask.shape
+    packed = np.zeros((rows, ((cols + 63) >> 6) * 8), dtype=np.uint8)
+    packed[:, :(cols + 7) >> 3] = np.packbits(mask, axis=1, bitorder='little')
+    return packed.view('<u8')
+
+def _unpack_rows(words: np.ndarray, cols: int) -> np.ndarray:
+    """Inverso de _pack_rows: volta para um grid booleano (rows, cols)."""
+    return np.unpackbits(words.view(np.uint8), axis=1, count=cols, bitorder='little').view(bool)
+
+def find_shortest_path_numpy(char_arr: np.ndarray, start_coords: tuple, end_coords: tuple):
+    """
+    BFS em ondas com NumPy, usado quando o módulo Cython não está compilado.
+    Fronteira e células livres ficam empacotadas em bits (64 células por palavra
+    uint64); cada nível desloca a fronteira para cima/baixo/esquerda/direita
+    (com o carry entre palavras vizinhas) e filtra pelas células livres ainda
+    não visitadas. Em vez de um grid de distâncias, guarda só o nível mod 3 de
+    cada célula: vizinhos no BFS diferem de no máximo um nível, então isso basta
+    para reconstruir o caminho do fim para o início.
+    Retorna np.ndarray int32 (N, 2) com (linha, coluna) do início ao fim, ou None
+    se não houver caminho (mesmo contrato de maze_solver_cy.find_shortest_path_astar).
+    """
+    rows, cols = char_arr.shape
+    start_r, start_c = start_coords
+    end_r, end_c = end_coords
+    unvisited = _pack_rows(char_arr != WALL_CHAR_BYTE)
+    frontier = np.zeros_like(unvisited)
+    frontier[start_r, start_c >> 6] = _WORD_ONE << np.uint64(start_c & 63)
+    unvisited ^= frontier
+    end_word = (end_r, end_c >> 6)
+    end_bit = _WORD_ONE << np.uint64(end_c & 63)
+    levels = [frontier.copy(), np.zeros_like(frontier), np.zeros_like(frontier)] # Células por nível mod 3
+    step = 0
+    while not frontier[end_word] & end_bit:
+        new = frontier << _WORD_ONE # Direita (c + 1)
+        new[:, 1:] |= frontier[:, :-1] >> _WORD_TOP
+        new |= frontier >> _WORD_ONE # Esquerda (c - 1)
+        new[:, :-1] |= frontier[:, 1:] << _WORD_TOP
+        new[1:] |= frontier[:-1] # Baixo
+        new[:-1] |= frontier[1:] # Cima
+        new &= unvisited
+        if not new.any():
+            return None
+        step += 1
+        unvisited ^= new
+        levels[step % 3] |= new
+        frontier = new
+
+    level_grids = [_unpack_rows(level, cols) for level in levels]
+    path = np.empty((step + 1, 2), dtype=np.int32)
+    r, c = end_r, end_c
+    for d in range(step, 0, -1):
+        path[d] = r, c
+        prev_level = level_grids[(d - 1) % 3]
+        if r > 0 and prev_level[r - 1, c]:
+            r -= 1
+        elif r < rows - 1 and prev_level[r + 1, c]:
+            r += 1
+        elif c > 0 and prev_level[r, c - 1]:
+            c -= 1
+        else:
+            c += 1
+    path[0] = r, c
+    return path
+
+def draw_path_on_char_grid(char_arr: np.ndarray, path: np.ndarray) -> np.ndarray:
+    grid_with_path = char_arr.copy()
+    if path is not None:
+        # O caminho vai de 'S' a 'E': só o miolo é marcado, num único scatter
+        inner = path[1:-1]
+        grid_with_path[inner[:, 0], inner[:, 1]] = PATH_MARK_BYTE
     return grid_with_path
 
-def maze_to_string(grid: list) -> str:
-    return "\n".join("".join(row) for row in grid)
+def maze_to_bytes(grid: np.ndarray) -> bytes:
+    # Acrescenta uma coluna de '\n' e serializa tudo com um único tobytes() (sem laço Python)
+    rows, cols = grid.shape
+    out = np.empty((rows, cols + 1), dtype=np.uint8)
+    out[:, :-1] = grid
+    out[:, -1] = ord('\n')
+    return out.tobytes()[:-1].replace(bytes((PATH_MARK_BYTE,)), PATH_MARK.encode('utf-8'))
+
+def maze_to_string(grid: np.ndarray) -> str:
+    return maze_to_bytes(grid).decode('utf-8')
+
+def _write_output(filename: str, data: bytes) -> None:
+    try:
+        with open(filename, "wb") as f:
+            f.write(data)
+    except Exception as fe:
+        print(f"Erro crítico: Não foi possível escrever em '{filename}': {fe}")
+
+@functools.lru_cache(maxsize=None)
+def load_maze_file(path: str = MAZE_FILE) -> str:
+    """Lê um labirinto de um arquivo texto (ASCII); o conteúdo fica em cache por caminho."""
+    return Path(path).read_text(encoding='ascii').strip()
+
+def flush_output() -> None:
+    """Bloqueia até que todas as escritas pendentes do arquivo de auditoria terminem."""
+    _output_executor.submit(int).result()
 
 # --- Nova Função Principal Conforme Interface Esperada ---
-def solve_maze(labyrinth: str) -> float:
+def solve_maze(labyrinth: str, output_filename: str = OUTPUT_FILENAME) -> float:
     """
     Recebe um labirinto como string (com \n separando as linhas)
     e retorna o tempo total em milissegundos para resolvê-lo.
     Você deve gerar um arquivo chamado output.txt para que ele possa ser
     auditado.
+    A escrita do arquivo é feita em segundo plano; chame flush_output()
+    antes de lê-lo. Com MAZE_AUDIT=0 no ambiente o arquivo só é escrito em
+    caso de erro.
     """
-    output_filename_fixed = "output_capivaras.txt" # Nome fixo conforme a interface
+    output_filename_fixed = output_filename # Por padrão, o nome fixo conforme a interface
     
     # Inicia a contagem de tempo ANTES de qualquer processamento do labirinto
-    overall_start_time = datetime.now()
+    overall_start_time = time.perf_counter_ns()
     execution_time_ms = 0.0 # Valor padrão para tempo em caso de erro muito inicial
 
     try:
-        # 1. Parse o labirinto (pode levantar ValueError)
-        char_grid, int_grid_np, start_coords, end_coords = parse_maze_for_cython(labyrinth)
-        
-        # Garante que o array NumPy é C-contíguo para o Cython
-        if not int_grid_np.flags['C_CONTIGUOUS']:
-            int_grid_np = np.ascontiguousarray(int_grid_np, dtype=np.int32)
+        # 1. Parse o labirinto (pode levantar ValueError; memoizado, então quase grátis em repetições)
+        char_arr, wall_bits, start_coords, end_coords = parse_maze_for_cython(labyrinth)
+        # O bitmap de pack_walls é C-contíguo (com o cache do parse, repetições recebem o mesmo array)
+        assert wall_bits.flags.c_contiguous
 
-        # 2. Resolva usando Cython (esta é a parte principal da "resolução")
-        path = maze_solver_cy.find_shortest_path_cython_optimized(int_grid_np, start_coords, end_coords)
+        # 2. Resolva com o kernel Cython, ou com o fallback NumPy se o módulo não foi compilado
+        #    (esta é a parte principal da "resolução")
+        if maze_solver_cy is None:
+            path = find_shortest_path_numpy(char_arr, start_coords, end_coords)
+        else:
+            rows, cols = char_arr.shape
+            solver = maze_solver_cy.find_shortest_path_cython_optimized if _USE_BFS else maze_solver_cy.find_shortest_path_astar
+            path = solver(wall_bits, rows, cols, start_coords, end_coords)
         
         # Finaliza a contagem de tempo APÓS a parte principal da resolução
-        overall_end_time = datetime.now()
-        execution_time_ms = (overall_end_time - overall_start_time).total_seconds() * 1000
+        overall_end_time = time.perf_counter_ns()
+        execution_time_ms = (overall_end_time - overall_start_time) * 1e-6
 
-        
-        # 3. Prepare a string da solução para o arquivo de auditoria
-        solution_str_for_file = ""
-        if path:
-            grid_with_solution = draw_path_on_char_grid(char_grid, path)
-            solution_str_for_file = maze_to_string(grid_with_solution)
+        if not _AUDIT:
+            return execution_time_ms
+
+        # 3. Prepare os bytes da solução para o arquivo de auditoria
+        solution_bytes_for_file = b""
+        if path is not None:
+            grid_with_solution = draw_path_on_char_grid(char_arr, path)
+            solution_bytes_for_file = maze_to_bytes(grid_with_solution)
             # Adiciona o tempo ao final do arquivo de solução, se desejado (opcional, não na interface)
-            # solution_str_for_file += f"\n\nTempo de resolução: {execution_time_ms:.4f} ms"
+            # solution_bytes_for_file += f"\n\nTempo de resolução: {execution_time_ms:.4f} ms".encode()
         else:
-            solution_str_for_file = "Nenhum caminho encontrado no labirinto (Cython).\n"
-            solution_str_for_file += f"(Tempo de processamento: {execution_time_ms:.4f} ms)\n\n"
-            solution_str_for_file += labyrinth # Inclui o labirinto original no output para auditoria
+            solution_bytes_for_file = b"".join((
+                _MSG_NO_PATH_HEAD, b"%.4f ms)\n\n" % execution_time_ms,
+                labyrinth.encode("utf-8"), # Inclui o labirinto original no output para auditoria
+            ))
 
-        # 4. Escreva no arquivo output.txt
-        with open(output_filename_fixed, "w", encoding="utf-8") as f:
-            f.write(solution_str_for_file)
+        # 4. Escreva no arquivo output.txt em segundo plano (modo binário: sem passar pelo TextIOWrapper)
+        _output_executor.submit(_write_output, output_filename_fixed, solution_bytes_for_file)
             
         return execution_time_ms
 
     except ValueError as e: # Erros de parsing do labirinto
-        overall_end_time = time.perf_counter() # Tempo até o erro
-        execution_time_ms = (overall_end_time - overall_start_time) * 1000
-        error_message = f"Erro ao processar o labirinto: {e}\n"
-        error_message += f"Tempo decorrido até o erro: {execution_time_ms:.4f} ms\n\n"
-        error_message += "Labirinto fornecido:\n" + labyrinth
-        try:
-            with open(output_filename_fixed, "w", encoding="utf-8") as f:
-                f.write(error_message)
-        except Exception as fe:
-            print(f"Erro crítico: Não foi possível escrever a mensagem de erro em '{output_filename_fixed}': {fe}")
+        overall_end_time = time.perf_counter_ns() # Tempo até o erro
+        execution_time_ms = (overall_end_time - overall_start_time) * 1e-6
+        error_message = b"".join((
+            _MSG_ERR_PARSE_HEAD, str(e).encode("utf-8"), b"\n",
+            _MSG_ELAPSED_HEAD, b"%.4f ms\n\n" % execution_time_ms,
+            _MSG_MAZE_HEAD, labyrinth.encode("utf-8"),
+        ))
+        _output_executor.submit(_write_output, output_filename_fixed, error_message)
         return execution_time_ms # Retorna o tempo gasto até o erro
 
-    except ImportError: # Módulo Cython não encontrado
-        overall_end_time = time.perf_counter()
-        execution_time_ms = (overall_end_time - overall_start_time) * 1000
-        error_message = "Erro: O módulo Cython 'maze_solver_cy' não foi encontrado.\n"
-        error_message += "Certifique-se de que compilou o arquivo .pyx (python setup.py build_ext --inplace).\n"
-        error_message += f"Tempo decorrido até o erro: {execution_time_ms:.4f} ms"
-        try:
-            with open(output_filename_fixed, "w", encoding="utf-8") as f:
-                f.write(error_message)
-        except Exception as fe:
-            print(f"Erro crítico: Não foi possível escrever a mensagem de erro em '{output_filename_fixed}': {fe}")
-        return execution_time_ms
-
     except Exception as e: # Outras exceções inesperadas
-        overall_end_time = time.perf_counter()
-        execution_time_ms = (overall_end_time - overall_start_time) * 1000
+        overall_end_time = time.perf_counter_ns()
+        execution_time_ms = (overall_end_time - overall_start_time) * 1e-6
         print("Ocorreu um erro inesperado. Detalhes abaixo e no 'output.txt'.")
-        traceback.print_exc() # Imprime o traceback completo no console para depuração
-        
-        error_message = f"Um erro inesperado ocorreu: {type(e).__name__} - {e}\n"
-        error_message += f"Tempo decorrido até o erro: {execution_time_ms:.4f} ms\n\n"
-        error_message += "Traceback (resumo):\n" + traceback.format_exc(limit=5) + "\n\n"
-        error_message += "Labirinto fornecido:\n" + labyrinth
-        try:
-            with open(output_filename_fixed, "w", encoding="utf-8") as f:
-                f.write(error_message)
-        except Exception as fe:
-            print(f"Erro crítico: Não foi possível escrever a mensagem de erro em '{output_filename_fixed}': {fe}")
+        tb_str = traceback.format_exc(limit=5) # Percorre a pilha uma única vez: console e arquivo
+        print(tb_str, file=sys.stderr)
+
+        error_message = b"".join((
+            _MSG_ERR_UNEXPECTED_HEAD, f"{type(e).__name__} - {e}\n".encode("utf-8"),
+            _MSG_ELAPSED_HEAD, b"%.4f ms\n\n" % execution_time_ms,
+            _MSG_TRACEBACK_HEAD, tb_str.encode("utf-8"), b"\n\n",
+            _MSG_MAZE_HEAD, labyrinth.encode("utf-8"),
+        ))
+        _output_executor.submit(_write_output, output_filename_fixed, error_message)
         return execution_time_ms
 
+def solve_mazes(labyrinths, max_workers=None) -> list:
+    """
+    Resolve vários labirintos independentes em paralelo, um por thread: o solver
+    em Cython roda sem o GIL, então threads bastam (sem o custo de processos e
+    compartilhando o cache do parse). O arquivo de auditoria do i-ésimo labirinto
+    é OUTPUT_FILENAME_PATTERN.format(i), para as threads não sobrescreverem o
+    mesmo arquivo. Retorna os tempos em milissegundos, na ordem de entrada.
+    """
+    labyrinths = list(labyrinths)
+    output_filenames = [OUTPUT_FILENAME_PATTERN.format(i) for i in range(len(labyrinths))]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="maze-solve") as executor:
+        return list(executor.map(solve_maze, labyrinths, output_filenames))
+
 
 # --- Bloco Principal para Execução e Teste ---
 if __name__ == "__main__":
@@ -185,270 +333,21 @@ if __name__ == "__main__":
 ###############
 """.strip()
     
-    labirinto2 = """
-##########################################################################################################################################################################################################################################################
-#      # ###    #       # # ####   ##  ##            #     ##  ##    ###  # # # # ### #        # #    #  ## #   # #  # #            #   # #   #  # ###   ## ##   ## #    #  ##   ##  ## #         ### #         ##   ##    # # # #   ###    #     ###    #
-## ###    #   # # ## #         # #      #   #   # ##  ##   ####    # # #  # ##    #     #     # # ##    #  # #  #  #  # #    #  ##  #  # ###     #   # # # #  #        # ##    #  # #   # # # ###      #    # #    #    #  #  #   ###   #   ####  #   ####
-# ##    #  # ## ### #              # #   ##   ##    #  #      # ###  #  #  # #   ##    #    # #        ##      #   #         ###  # # # # # #  #  # #     # #          # #   ### ##  ##      #  #  #  ##  #  #    #       ## #####  #      #  ###   #  # #
-#          #    ## ##  # ##       ## #  #   # #  #       #   # # # #   #         ##  # #  # #               ###      #   #  #      #      # ##  ## ##       # #  ##  ###  #         #   #          ##   #      #    #     #  # # # #        #    E    #  #
-#    # #  #    ####      #  #  # #     # ##          #  #      # #     ###    #  #   #  # # ###      #####    ###            #   ###  ## #   #  ## #   #  ####   #      ##         #       #  #     #  #  # ##   #  ##           ##  #       ##  # #     #
-#    #      #    #   ##            #  ##  ###    ###          ## # #   ## #   #    #  # #  ####     #                    ## #  #     ###      ##  # ##    # #  #        # ##        ###          #    ###   #       # # #  # ##   ### ##        ##    ## #
-# ###  ##  ##  ####  #  #   # #           # #     #  # #   # #   ## #  ## #  ###  #       #  # ### #      # ## # # # #  ### #  #  ##    ## #     #           #       #             # #    #   #    #  # #  #   # #  #     #      ##  #      #  # ## #    #
-# # ##  #              # ## #   ## # #     ##   ##   #    #     ####      #  #       #                      # # #        #    #    ### # ##    ### ##     ##     # # # #  ##   ###  # #   #  #  ##    #  ## ## ##        # #            #   #  # ##  #  ##
-##   # # #       #        #  # ## #  #  #  #  ##  # #     #                  #    #  #   #     #####   #### ## ##  #    #          #    #   ##  #    #   #    ##  #  # # # #          #    #    # ####   #  # # #    #  #        ##        # #  #   ##   #
-###      # # # # #   # #   # #      # #  #     #        #  #  ## #  ##    ## #   ##       #    #     ##  #####     #    #      # #  ## #   #         #     #   #  # #     # #   #  # #       ##          #   #     # #  #       #   # ##  #   # # ##    ##
-# #         #    #  ## ##    #    #  #   #    #   #  #   #       # ###  # ##   #   # #### # #   #  ####        # #       #   # #   # #    # #     #   ####   #  ###      # ## #     ## #  #     ##      #  #   # ## ## ##   #      ### ## # #    # #     #
-#  #    #       ##   #  ##    #    # #        #     #   #  ##   #  #    ###        #    ##     ##  ### # # #  #                # #  #  ##   ## #   #   # ###    ##  ##  ###      #     # ## ##   # ##     #    #     # #    #  #      ##   #######     # #
-## ##    ###    #   #  #              ## #  ### #    #        ##       ##  #     #  # #     #   #   ##   ##   # #  #    ##       #   ### #     #   #  #   ##   ####          #  #     #   #   # ##       #     #  #   # ## #         ###     ##    ## # ##
-# #  #  ## # #          #       #       # #     ##  #     # ##  #####  # #      #     #    #  # #           #    #     #####   ##    #  ##  #          #  #        #      #    #  # #              #     #   ## #  #     #   #   # ### ##   #      #   # #
-#     #       #  ##     #   ####     ##    #    #   #   ##      ##        ## #    #   ## #  #   ###   ##  ##   #        #   #  # #   #     ###    ##   #     ##   ###    ##  # ##     # #  #       #   ## # # ###        #    ####  ##   ##   ##     #   #
-# ### #  ####       ####      #       ###       ###      ### ##    ## ##   # # #     #      ##      #         ##      #    # #    #   # #  #   #     # ##  ### #   #   #    ##  #   #      ###       #     #  #      ##       # ##     #               # #
-#   ###  ## #     ##    #        #    # #        #    ######     #  # #       #  ##  # #  #  ##            #   #    #                      #  # ##    ###   #  #        ###  ##   # ## ##    #   ##   #   #       #  #            #    # #  ##   ##      #
-#            # ###  #  ####     #    #    #   # # #  #    # #####    #### # #   #  ##       ### #         #  #  #        #    #   ##  ##   ##            #         #  ## #      ###   #  # # # ## #         #  #   #    #   ## #   #          ### # ##   #
-#  #    # ###  ##         # # ##   #  # #    # # #         #     ##  # # #       #   #        ##  # #          #   #   #   #      #     # ###   #     #                # # ###       #  ###   ## # #      #      ## #  # #  ####         ###   #   ##  ###
-# ## # #   #    #    #       ##   #    #    ####     ##   ###  # #   # #                           ##    #   #     #   ###    #        ## ##  ##     #  #       #      # ## #     #              #   # #    ##   #  #  ##   #  #   #  ## ##   # #  #     #
-#      # #             #    #     # ##   # #  #  #  # ###          #   #      #    #       #    ###     ## #  # #    # # # ##      #      #        ###               #   #   # # ##  # #   # ###  ##     #   # #### # #      # # ##  #   #          ##   #
-# # #     #  ##          #    #     ###     #  # # # ##  #     ##     # #       #  #  #   ##            #  ## ###    #       #   #  #    ## #      #     ##  #   #### #  #         ## ## #  ###   # ##         ## # #   #  # #   #     ## #          #   #
-# #  ## #   #  ####  #   #  #  ## #  #     # #         #   #   ## #        #  #  ## ##  #  ###      # ###   #  ##   #  #  #      ###   ## #  ##       #    #       #  #     #    ## #   #       ### #       # # # #   ###         # ##       # #  #     ##
-# ### #   #     ## #             #     ##     #  ##     #          ###  #    #  # #   ##     #   # ##### ## #   # ##  #   #### #  ##       #  ## ###    # #     # ##       #   # #             #    #    #   #  #  ## #       #     # #     ##     #     #
-#  #  #     #  #   #                  #   ##       #  #  ##     ##  #   #       ##  # # #  ##  #       #    ##   #  #   #   #  # #    #      #      #   # ##    # #  ## # #     ## ####  ## ###  # #     #    # #   ##  #            ##    ####   #   ## #
-## #  #       #      #     # # #  ## #     #      # # #   #    #  #  #     #  #     #     # ## #    #  ### #      ##   #   #  # # # #    ##  # ###   # #  ### ### # #  #   # ######        ##### #  #  #  ##  ###       #   #  #    #    # # # #  #    ###
-#  ## #   #     #                # #     #   #    ## ##  ##   #    # # # #    ##    # #   #        # ##    ### ###  # #     #     #          #       ##   #     #       # #   # #    #     ## ## #     ##   #   # # ##           #    #  ## ## #         #
-## # #   ## # ##  ###   #     # #    # # ##   ##  #        #       #   # #  # #    ## ##      #  #       #  # # #  #  # ##   ## #   #    #              ## #  #    ## # #  ##   # ##  #    #  #  #    # ###  # #      #  #  #       #     # #       #    #
-###     # #  #  #  # #    #  #    ##   #   #      # #  #   #  #   # ##  #   #      #    #     #   ##   #  # #    ##   #    # #   #       # #  # #  #    #    #     #     ##    ##    #       #      #     ##     #    ##    #     # ## #      # #        #
-#   ###    #          ###  # #        ### #   #  # #  #  #   ##  #  # ##    ## # #     #      ###   # ###### #    #  #    #      #   #     #  #     ## ####   #  #    #  # ##                 #  #   #   #     ##  ##      ## #  #  ##   ##   ##     ### #
-#  #  # ##  #      #         #   ##       #  ##   ##   # ###   ##        ####   # #                # ##    # ##            #       ###       #         #          #   ##    #    #    # #   #   #  # ## #     #  #             #      # # #  ###        ##
-# #  # ##      ##   #      ### #        #         ##  #  #  #  # #      #   ##       ## #              ##    ##    #### # #  #  #   ##        #  ### # # # # #      #     #     #        #  # ## #           ##   #    ##   #  #    #  #    # #   #   # ##
-#  ##    #  #  # #  # #   #     #    #       #         # ##    #    ##     ###   #  ###     # ##    # #   # # ##   # ## #    ##   #     # ##    #  # ####                  ## #  ###  # ##   ##    #    #  #  ###      #      # # #         #      # #   #
-##       #   #   #      #  # #   #       #     #  ##   #       #      ### #  ##        #          #   #   #  ###    # # #   #   #  #   # #    ## #  ##    #       #  # # #    #    ##  #    #   #      #          #   #   ###     #       ##   ###     # #
-#  # # #  #    # ##   #    #  #   #   ## #   ## ## ##   ##        #    #  #          #### #  ##        ## # # ###    # #    # ##    ##      ###   #   #   # #       # # #   ##    # ## # #   ##     #  #    # #    #  ## # # # #  # ###     ####     # ###
-#  #     #   #   #  #  #     ##         ##  # #    #   ## #          ##   #    #      #    #        ####         #       #       ##   #   ##     ##   # ##      #     # #   #    # #      #  #       # ## #    ##     #      ##   #  #    ###  ## ## # # #
-# # #  ##   #   # #    #  # #   #   #    # # #   ##      #   # #           ## #    ##  # ###    # #    #  # # ##         #      ##      #  #   # #   #### #  ##  # # #        ##     #         #         ####       # ## # #    ##     #  #  #  # ###   ##
-##  #  # #        #   ##   ##          ###  #           ##    #      ## #   # # #  ##    ##  ## #   #   # # #             ###       #    #           ##     ##  #  # #  # #     # #   ##  #####  ##  #       ##   #    #   #       # #     ##   #### ##  #
-#   #    ## #   #   #          #    ##          # ## #####   #  ##     #       ##    ## # #     #  #       #     ##   #    #  # ##    ### #     ####  #  ### #  #    #  # #    # #     #    #    #       ##                     #     #  #   ##          #
-#    # #  #  #  ##    #     ## #####    #         #  # #   # # #  ##  #     #    ##    # #     # ##     # #  # ##  #  ##       #  # #  # #    #                       #### #  #  #  # #### # # #  ###     # #   # #      #   ###   ###  ##  #    ###   ###
-##  #  #     ##  ## #   #    ##   #   #     # # ##   #  ##                        # #  #####      # # ####   #   ## #      #   #    ##         # #       #         #  # #   # ###### ### #       # #  #  #    #  #   #      # ##         #  #        #   #
-#  ## ## ###  # #  ###            # # ###    #  #  ##   ##  #  #     #     ##  #        #    #    #  # #     #### #   #   ## ## #### ### #   ##         # #   #         #         # ##  #    #   #  # #  #   # ###  #     ## ##  #   ## #  # #### #   ## #
-#       #       #         ##  # ##   #   #   ### #       # # ### #    #   #    ##      #  #  # ####### #   #    #     ###  # #    # ##  #  ##   ##  #      #  #   #           # #  ##    #### # #    #    #     #    #     #         ##      #      #  # #
-#  ##        ## ##   #      # ## # ##    ##   #     #      #  # # ##       ##  #   ##          #                #    #  ## ##        # # #  #           #    # #   # #    ##   ##  ###     ##    #   # ###    #   ####    ## # #          # # #     #   ##
-#   #   # #   ##  #      #     # # #     #####        ##       ##     ###     ##             #     #  #  #   ##   #          ### #      ###    ###  #  ##          ##  #              #      ##     ##    ##         #                        #   #      #
-#          # #  #   #          # ##   # ##### #  # # #      #     #  #  #  # # #      # ##    #  ##   #       # #  #   #     #  #  #  #   ## # ##  ### ## #    ####  #     ## ###  #  #    #  ##  ###  #    #   ## #  # ##    #  ##   ###  # #       #   #
-# #  #    #     #          #     #    #     # ##        #  ## #    #  ###         ##   #            #    #    #  ###    #  ## #  ##         ### ##    ##  #  # # # #     # #  # #      #    #  #    # ### # ###    #  #   ##   #       #      # #  # #  ##
-# ##### # ## ### # #   ## #   ####  #   ## #       # #    #    ##    #   # # #    ##      #   # ##  #   ##      #  #   #   ##    ##   # ##  #    #      # # #   ##   #   ##      #  ##  #### #  # # ##     ### # #  #  #       #     ## ## ###  #  ##  # #
-#  ##    ## #  ## ##  #  #   #### #  ##  #    #    ##    ##  # ##    # #   #    #  #   #     #      #       #      #  #           ## #  # #           #     #     ### ## ##    #  # ##   ## # #   # #    # #           ##  #   #        #     ## ##   ## #
-# #  #  # #  ##  #      ###      #   #     #  #   #     #     #       #  #  #           #      #         #      #    #  # # #    #   #  ###  ##      ##   ## #    #    #    #  #  ## #  ##        #  # # #   ##   # #       #   # ##     #  #     #   ## #
-##  #  #  ##           #    #      #   #  #  ##      #          #  # #         #     #          # #    #  #            # ## # #    #    # ##      #     # #   #       #   ##     #  #          ##  # ##  #   #   ## ###   #   ## ## ##   #  # ## #   #####
-#     ##   #    ## #     #      ###   ##   ##          #       #        #  #  #         # ###    # #         # #      ##        #    #         #   # #        #   #               #  # ###   #  #   #     #  #     ## ###  #  #          # #   #####  # ##
-###  #   #  #      # # ###  # # ##     ## ##   #   #  #   # ##     # #    # ## #    #  #    #      #   #   #     #  ##  # ##        #   #  #              #   #    #    #   # #    # #    #           # #     #  #    #  #        # # ##  #   #    # #   #
-##    #    # ##   #       ##  #     ## #   #          #    ##   #   ###    #        # #   #  #    #   ####      ## #  #     #   #  #    #       #  ##         ##   #    ###  ##   ## #    ##     #  #   ##   #      #       ##  # # ##   ###  #     #  # #
-##        #     ##       ## ##    #    #          # #   ##  #     # ### #  # #        # ###    #   ##  ##  # #                  # # #       #          #   #    ### ## #     ###      # ## # ###   #        #  #  #         #### # #               #    ##
-##   #  ## # #     ##         #   # #  ## #    ##  ###     #   # # ##      ##      #  #   ###  #  ##  #     #### #   # # ##  ##       ### #     #            #                # #   # ##               #  # ##    ##  #      #   #   #      ###      #   #
-#   #                 ##          #   #       #   # #     # #  #####   #    #             # #    # #  #   #  # #  # ## ##     # #          #   ## # ##     ## #  #         # # #  #  #          ####              ##     #  #   #        #      #  #    ##
-# # ###      #      # #   # #    # #      # ##  #   #       #     #   #      #  ##     ##   #     ###   #  #   #   #  #      ###     #  ##         #       ##    #   #      ##  #  ##     #  #  # ###                ### #       #   #         # ##      #
-#    # #    #     #     # #     ## #  #     ###    # # # #    #  #      #         ##  #  ###        #  #        #  #       # ##   ##    #  ##    #  ##       #   # # ##    #          #    #   #      # #  ###   #  #         #    ###     ##     #     ##
-#    #  #  # ## #         # #        #    #  #     ###   #     #     #   #  #    ##  #     # ##          #   #   #   ## #    # ##     # #### ###    # # ####           #  # ##  #       #  # # # #   # ## ####     ## ## #          #           #   #    #
-#       ###         #     # #    #      ##    #          ##   # #             #    # #  #  # #   #  ### # ##       #  # ##    # # #  ##  ##    # #  # ## # #           #  #   #     #  ## # #     #   ###        ##  # ## # #  ####     #    #    ##   # #
-# #    ##  #  #              #   # #  #  # ##      #     ##   # #   # ##  #### #     # # #  # #  # #    # #      ##        ##    #   #  #  #      ##     #       ##       ####     ##    #     #       ### #    #  #               #    #       #   # #  #
-#          #                #   ## #   ## #  ##   #  # # ### #     # ###    # #  ##        ##     # # #  #        #      ##   #    #  ####   # ###    ###             #  # ##  #    ##        #            # #  #   ##          #      ##      # #      ##
-#     ##       #    ##   #  #     ##   ## #  # #     ##       #     ###  # # # ##  #   # # #  # # #          ##    #   ##  ## #        ## #  # ##  #     #      #  #       #  #   ##        # # ####   #   ##  ## #     #        ###    ##        #   #  #
-# #   #  ### ##   #  #  ## #  #  #       # #  #             ### #  #   #   #   ####### ### # # # #          # ## #   ####  #   ## # ###  # #             #     # # #      ##   #      #      ##   #       # #               ##    #   #   # #       #    #
-#      #         ### ##  # #   ##       ######       ### #    #        #  #  #    #  # #   #            # # #    #   #  ## #   #   ###   ##    #     #      #  # #       #   # #  # #     #      ##     ## ##       #  # #  #    #  # #### #     #   #   #
-#  #  #         ### # # ##  #   ##  #   ## # ###        ## #     #  #  #     #       #   #   ##     # # # #   #      ##  ##  ## ###  #    #     #            ##       #   ##     #         ##      #          #   ## #   #  ### #            #  #   #  ###
-##    #  ##  #  ##  #  #  ## #  #    #  # #### #  #  ####       #   ###  # #  ##  ####      #   #  #    ##  #       #  ##  ##  #   #  #   ##  #  #      # #    #        ##    # #       #  #  #   # #       # #  #   #  # #   #    #      ##  #  #     # #
-#   #  #####  # #### #  #    # #  #     #     ###  #      #   ##    #       #  #      #  ##   ##  #   ###  # #  # # #    #         ##      #       # # #    ##  #    #  #  # #    #      ## #     # #  #  #  #      #   #    #    # #                # # #
-# #       #       #           #      ##  ##        # # ##   #  ##    ##  #   # #  ## ##     #   # ##         # #  ### # #      #   #       #   ## #     #  #  ###            #  #       #    # # #    #       #     #    ##   #        # #       #   #   #
-#           #    #   #   ####   ##    ###   #  #  #  ## # #   #              # #  #      #    #       #   # ##  #         #  #                     ####  ####  # #              #  #   #  #  # ##     ### #     #  # # #   #   #  #         #  # #   #   #
-#  ##   ### ##   #  #    # #  #    #   ##        #    #   #      ## #       #                 #  # #  #  ##      #   # # # ##      ##  #    #      ###  #   # #       #  ## # ##  #    ## #   ##    ###         #  #   #   # #   #  ##  #  #   #        ##
-#    # #      #  ###   #           # #  #             #    ## #  #      # #     ###  # # #            ##    #      #    ##        # #           # ##    #   ## #      ##  #  #   #             #   #   #    ##       #        #  ## ##  # # #  #        ##
-###  # #  # #    #  #  ##       #                 # ####    #           #   ##    #  # # # #    ##        # #    ##    #  ##  #  #        # # # #    ##    #     #      #    #    # #    #    # #    ####   #    ### ##      ##  #        #  ##   #      #
-# ##  #    ###  ##      #   #    #          ##      #   #      ##      #   #    #       ###  ##  # #  #              #   # #  ###         #  ### ###       # #  #  # # #    #    ##   ##       #  # #  #   ### # #    # #     ###    #  ###   #   #  ##  #
-##    #    ## #   #  ###   ## ##                         ##         #   #  ##   ##  #   #    # ###  ##   ##   #    # #### #    ## ###       # ## ## # ##   ## ##     #      # ##   #    # # ##     #  ## ###          # #      ## ##  #       #  # # #   #
-# ###   ##  # # #     ##  ##  #     ## ##  #   # ##  #        #  #   # # #   # ### #  # #  #  ## #  ##   ##   #               ### # #  #  #  #    #   #  #  # # ##   #   #   ## #    #  # # #       #      #  #        ##        ##  #  #### #  ###     ##
-#     ###                      #            ###  # #       #    # #  #     ##  #    #  #         # #    #   #    #  # # #    #     #       #  #  #   ##          #       #  #    ##### #  # #   # #  ##  # #   #       #   #   #  # #   # #     ##  # #  #
-#  #### #     #    ##  ##   #       ##   ##  # #   ##    ##   #    #  # ## ### #  ####      #     #         #        # #     ##   ###   ## ##                 # # #  #     #        # ##          ## # #          #        ##   # ##  # #  # #     # #   #
-##    # ## ## # #  #  #  #  ##   ##   ##   #   # #  ### ## ####   ##   #      #   #  # #     # #     #       #   #   #     #    #      #    #     # #       # #        ###                #  ##  ## #   #             #   # #  #  #       #   #      #####
-# ### #    #   ### #    #  ##   #  #  # #            # #    ##     # # #     #   #     ### #      ##   # ##     #     ##  #  #  #   #  ## ##   #  ## ##   #        #            #   ##    ##                         #         ## #  #  # # # #  #   #  ##
-#   # #    #  #         # ## #  #    # #   # # # ##         #   ### #     #### #####   ##         #    ##       #     #     #   #     #  #      # ###  # #  #    #     ##          #### #  #  #  #  ## ##    #      ## # #     #       #        #    #   #
-#  ##     ## ####     ##   #     #  # # #    ## # # # ##  ####     ### #     # #     #   # ##     #   #   #  # # #     #    ##  #                #     #  ##   ###         #     #   #      #  #   #   ##      #   #  ##    #     ##### # # #    #  ### ##
-# # ###   ##  ##   # #  ### ###   # ###       #     #  ### #       ###  #  #  #          #   #    ##  #   ##    #    ## #    #       #       #         #   ## #         # #    #     # ##     #  ##             ##   #  # ## #              #         #  #
-##    #    # #  #     #   #        #       #   ##  # ##    #     ##    #   #  #     #    # ##   ## # #     ## #   # # ##  ##  ## #     #       #    #   # #        #  #    #    #        #   # #   ##    ###     #   #  # ##     #   # ##        #  #    #
-# #       # #  ## #          # #  #    ##  #  # #   # #          #     # #  # ##      #     #  # # #   ## #     #   # ####   #     ##  #   #   # ##   ## #       #      ## #  #       # ####   #   # #     #  ### # #### #      #         #    # ### # # #
-# # # # #  ###  #      # #    #        #  #          ###     # #       ## #      # #         ##   #   ##   ###    ##     #         #  #  ## ###      #       #  # #  # # ##     # # #    # ##             ## #  # #          ###        ###  #   #   ### #
-#       #  # #### # #        #    ##         #   ##    # #       #  #     #              # #  ##   ###   #        ##  # #  #            ## # #   #    ##      #    #    #       ###  # ##  #         ###   #   ##  # ##             # ##       # ## # #  #
-#  ##    #  #    #         #  ##  #    ###  #                      #      # # #   #       ##      #     ##  #     #     #   ##   # ##  # #          # #  # ##  #    # ##  #   # # # #    ##     # ###  #      #   ###    #     #        ##        # #    #
-#   #        #  #  # #   #  ###    #  #    #  #             # ### ###  #     # #   #    # #      ####  #  #  #     # #    #     #        #      ###   # #   # ###  # # # # ##   #  # ###      ## ###   #   #   #     # # ## # #      ##        #   # #   #
-#          # #    # #  ##    #  ##     # ##    #####  ###      #   # #  #  #   ## # ## #  # #    ### #     ##       # #  #    ## # ###    ##     #      #             #######   # #  # # #        #    #    ###      ##  #  ## #       #    ###  #  ##   #
-###   ##           #     #    ## #    # #  ##     #       ###  #  ###  # #      #   #   #   # ##    #  ### #        ### ###     ###      #      # ##     #         ## # ##  # ####   ####   #  #  ##  #  #  #     # ##     ##         #  # # ###### #  ###
-## # #      ##    #     #    #   #    ##        # #  #     #     #     #    #    ###       #    #        # #     #   # #  #   ##  #  #   # #    #   #   # #     ##  # ## #     ## # #         ## ##          #    # # #   #  ## ##  #  # #         #    ##
-## #    ## ##     # # #  #  #      ##     ##      # #  ###  # #  # ###  #   ## ####         #   # ##    #   ##     # #   ##  # ##   #     #        #   #  # ##  ## ##    ##      #  #  #     ###      # # #       # #   # #          #     ####  ####  # #
-# #  #   #  # ####     # #  ##  # # # #             ###  # #   #  # # # #   ## #   ##      ##   ##      #        #   #             #  ## ## #  #          ###### #    #   ## #  #   ##   #     #   #### ###    #     #   ## ### ##   ## # #   # #  ##### #
-#     #   ##    # #    #   ##    #     ##  # ### #   #    ### #    ##  #  #   ##  #  #  #     ## ##        #  ### #  ##           ### # #     # #   ##    #       # #  ##    ##  #      ### #        #  #        ## # ##  ##    #  # ##  ## #    # ## ## #
-##        #   #      # # #       ## ##  ##   ####           #         #   # ## ##       #   # #       # ### ###    ##  # #   #         ## #       # ##   #   #   ## #   ### # #  #    # #   #       ##    #         #     # ##         # # #     #       #
-#    # # #       ## # #  # ##  #    ## # # #### ##  #     # #      # #  #     #  #         ## # ###  ##         #    ##  #  #  #  ##  # #  ###  ##      # # ###  ####    #    ## ###   # ##     # #      # #   ##  # #       #     #   ##     #    ## #  #
-#      ## ### #  #   #     #  # #  #   ## #        # #  # ##   # ##   # ## # #  # # # #  #  ## # ##            # # # # ## # # #      # # ##    #           #  #   #   #                         # ##      # #    #     #   # #          ## ## #   #   #  #
-#            ##    ###           #   #      # #####    ### ###   # #   ###   #  ##   # #  #  ## #    #       # #         #  #   # # # # ##  #  #          ##    #      #######  ##    ##  ###  #       ####  # #  ####  ##  #   #   #   ##    #   #  # # #
-##  # ####     #   #         ##       ##     ##           #    ##  # ##  #     # #    ##  #   ##    ##  # #       ##         #  ##  #        ### #      #   #  # #    # ###   #     #     ## # #  #      ####      #   # #    ###  #         #     #   ###
-# ##### #   ## #    # #    ##       #           # ## ##   #         ##    #      # #  #  # ## #         # ### #   #  # # #   ###   #          # #  #   ###   #  ###  #        #   ##    ####   #     ##   # ###          ###    #     ##   #   ###    #  #
-#  ####       #   # #  ##  ###     ##  #         #  ##       #      ## ##    ###   # ##   #     #          ## # #       ## #   # # #  # #    ##  #   #  #    # ## ## ####            #           #  #     ### # #    #  ##  #    # #  #   # # ###   #   ##
-#  ##       ####  ###  #    #          #  ##   ##   ### #       ##   #    # ##   #    # #      #   #    # #          ## #      # #      # ##  #   ##  # #    #   #     ###      #  #   # # ###    ### #  #    ## ## # ### #     # ##     #  #  # # ## #  #
-#      # ##   #  #    # ##      ## #    #  # #   #   #  ##  ##   ## ##  #   #   #  #    #  # # ##  ###         #  ##     # #       # #  ##        #  #  #   # #      ##          # #        # # ##       # ##       ##   ###   #  ## #   # #  ####     ###
-# #  # ###   ##    #   #   # #   # ###     # # ###  #    # #    #  #  #  #        #      #      #      # #   #  #     ## ##    ## #  #  #  ## # #  ##    #        #  # # #   #   ## #    #   #  #     #    ##     #        #   # #### ##   #      ## #   #
-#          #                     ###  ####        ###  #  # #    ## # ###    ##   ## # ##   #        ##  # # ##         #     # #   # # #  #  #      ##       #         ###      ##  #        #    # #    #  ##  ####  ###   ##      #  # # ##  ### #  # #
-#        #     # #     #   ##   #   #  #    ##     ### # #     # #  ## #       ## #   #         #    ##         #      #       #       # #  ###   # ##   ##  ##  #       #    #  #   #  #       ##     ##    #    ## # #     #     # ##     #### # ##   ##
-#     #   ### ### #    ##  ## #         ##   ##  #    ##  ###     #             ### #     # #    # #     #     ###  #    #     # #        # #   #  # ## #   # ##    #           ###  #          # #       ##    #   # ## #  ## # ### ##   #          # # #
-###   #  ##   #    ##   #   #            ## #  # # # #      #   ##   #   ###### # ##### #    # # ##      ##    #  #        ##  ##   #  ##   #    ## ###### ##   # #  ###       ### #  #  ##  #  ## # # #         #    # #   ## #  #   #     # #  #  #    #
-#  # #  #  #   #       #            # ## ##         #     ##       #   ## ##      ##       # #   ## #     ####  # # ####  # ##                 #  ### #   # ##     ####     ##     #   # ##          #  # ##  ###    #     #      #     #  #  # #      # #
-# #  #  # ##  #      # # ##  ## #  #   # ## # # ##            # ## # #  #   #  #     # #  ##    #  #       ####      ###  # #        # #    # #    ## # ##  ## ###    #       #   #   #  #        #      ##      ## #    # ##              # ## ##     # #
-#  # # #   ### #         #          #    #   # ##   #   #       #       #   #  #  #    #      #   #  # #  ##     #             #   # #           #      #    # #   #          #  ###   #  ## ##    ######  ## #     ##### #    # ### ##   #      ## # ## #
-#              #       #    #   #    #      # # ## # ## ##  #  #       ## ##         #    # #   # # #####     # #  ##   #### #  # #    # #  ##   ##   ##    #  #   #   #  #   ###   #      ##    #   ####     #   # #####           ##       #  #    #  ##
-### # #   #  ##   #    ##  #        # # #   #    #  #          #         #  #      ## #      ##  #   #     #           #  #       ##     ### #    #      #  ## ##  #  #   ##     #     #  # #  ## #    # #  ##          #     # #     # # # #   #     #  #
-# # #        ##  #        ##  # ###    ###     # #   #   # ##  #   # ### #  #  #    #          # #     #     ###  #  #      #  #   ##      #### ##        # #    #      ###  # #   #      # #  #         #         #    ## #  ### #    # # #     #  #  # #
-## #    #        #    # # # #    #   # ####   ###       ### ## #  #      #              # #     #       # #   ##### ##       #  #    #     #    ##   # # #    # # #  # #  ## #    #           ### #  #   ##  #   #     #     ##       #  #     #      #  #
-##       #  ## #  ##           #     #  # #      #     #    #          # #   #     ##  #  #    # # #   #   # #       ## #   # # ## # #   ##        #     ##           #  ###  # ###  ##   # # ####  #  #  #   #            ## #     ## #   # ##     # #  #
-###  ## ##  ##  ###  ##### #    ##     #    #                    # #     #  # ## ##   ###   # ### #    #      #   # # ## #    #### # #     ##    ##     #    #   #       # #  # ##  #   #  ### #      #   #     #     # ## #           ####   #  ## ##   #
-####  ## ##  #       #       # #  ##   #   # #    ###  # #  # ##      #    #  ##  ### #       #      #  # #  #  #####    ## # # ###  #         #         #       #  #             #  # #          # ##   #     ##          ###        ###          # # ###
-##    #    ##  #    #      #        # # #        #   # ### #      #  ##    #  # #       ###  #   ##   # # # ##   #  ##   #    ## ## ##### #   #  #  #   #       #  #   # # #   # # #   #  #        #  ### ## #   #  #      # #   #      #  ##   ##  #  # #
-#      ##   #     #     ####     ## #   #  # # ## #### #  ##   #  ##      ### # ##   # ##     ##       #    #  ##    #         ###        #    # ##    ###  ### #   ###      #  #              ##    # #   ##   ###     #  #    # ## #### #       #    # #
-#   #    #   #     ##   ## # ## ##   #  ##  #     # # ##          #   #   ## #  #   #         ## # # # #      #     ##  # #  #  # #  #    #  #   ## ##   ###   #   #### #  #  #  ##  #  #         #      #   ###    #        ##      ##           # # #  #
-#     #  ##  #  ## ###     #      ### #  # #   #   #  ##   #    ##  #  ###       # #       # #####     #  # #  ### ## #   ##     ##   #  # #   #    #        #      #   # #    #  #     #    ##     #    ## # ### #  # ##                #               #
-#           #  #   # #    ## ##   ##  ## ##   # #      # #             ### ####   ##   #  ### # #    ##   #       # #   #    #  #  # ###     ###   ##  #  #   #    ##       ## #    # #    #    #  # #  ## ##     #### ##   #     #   #  #  # #    ## #  #
-###      #   ###    # #        ##     # ## ##   #  #       ## #       #   #     #    #   # #   #    ##          #   #     #    ## #   #     #        ##  # #  # #  ##  #  ##                   #  ####  #          #  ### #  #  #        #       ##  ##  #
-#  ###     #        #  ###   # ##     #          #  #  #      #  #      #### ##        #  # #   #   ##  ##  #  #### #    # #    #  # #### #  #       #    #  #  #    #   #       #####     #    #           # #   ## # #     # #      ##       #  ##    ##
-#      # #    ###  #        #    #    # #  #  #  #   #     # #### # ##   #   #   #   #     #    #     # #  #    #     # #     ##    # #    #  # ##  ##    #    #              ##       #   #  ##         #         #    #       #   #   #  # # #  ###  # #
-##  #  # ##       # ##  #####           #  #       #  # # #      #     #     #   # ###  ##      ##  # # #    ##      #    # ## # ## ##  #     #   #        ###    ##   #      # #    #    ## ## #    # ####    #     #  #  #  #   #    # #     # #       #
-###    #    #  # ##           #    #        # ##   ##   ##    #    #   ##  ## #           #    ## #      ####     ##  #     #  #    # #  #   #   #    #    #    #  ##   #  #  #        ## ### # #   # ### ## # # #  ##   #  ##          #  # # #### #    #
-#      ## #         #        #         ######   # ## # ## #    ##     ##   ####  # #    ###    #####      # ##   ## #      # #  ##  #  #      # #  ##  ###  ##         # #  ##   ##        #  #  ##  ##    # # # #  #   #   #   #  ###   # # # #   # ### #
-### ##     #   #      # #  # ## #  #     #      ##        #   #    ###        #     #    #   ##        #       #    # ## ###   #  #   # ##     ##  # #  ###       ##       #    ##  #      #  ##   #      # #    #    #       # ## ##    # # ## # # #    #
-#     ##   # #    #  #  #  #      #    ##     #        #    #      ##     ##   #        #   # #   ## #  #  #       ##   #  ##  ##     #    ##       #  #  ##  ##   # #      # #  ## #  #  ##  # #  #     # #       # # #### #  #         ##    ##    ##  #
-###   ### # ##    #     # ## ##  #    ###   #   #  # # #   #       #          # # ##   ##          # #    #    ## #  #  #       ##     #    ##      ##   #       #   ##  #        #   #    #        #  #       # ##   # #       #    ##  #  ##  #     #  #
-# #      #                 # #   # #   #  #   #   ##   #  #     #   ## # # # #               ## # ##      #          #   # #      #  #  #   #   # #     # #   # # ##  #  ## #      ###  #  ### # ##  # #   # # #         ##  ## #     #    # # #    #    #
-#  # #  #          ##  # ## # #       # #       # #          ##          # ###    #    # #  #   # #          #                 #  #  ##   #   #  # # #        #  #  #  # ###   #  ###   ## # ##  #  ###### ##    ###        # # #  ##        # ###   # # #
-# # # #   ## ##  ## # #  ##    # #         #  # ###    # ##  # # # # ## # # ## #  #           ####          #                 #  #   ##       ##  ##  #  #   #  #  # #   #            # #     #  ##  #  ###   #   ##  ###      # #     # #    # ##       #
-# # #   # ### #  ## #     ####  #    #####    # ###  #    #  ### #  ## ## ### #  #    ##        ####   # #  #       ### #   #    # ####  #  #   # #  #         # #    ###  #              ##  ## #   #   #   # ### #         # ## ##  # #     # ##      ##
-###   #     #   ##    # # # # #  #            #     # #  # #       # #  ##  ##     ##   # #  #  #   ## ##       #  #               #    #    ## # #   #        #    #     #     ##  ####       # #     #    #  # ## # #     ## #    #    # #     #   ### #
-#  #         ## ##  #  #  #  ## ### # #   #  ##         ##    #    # #         ###  #  ##        ##    #      ##     ##      # #   #   #  #               ##    #   ###    # # # ## ##         #  #  # #    #     ##     #   # #     #    #  # ## ##  # ##
-##  #  #  ## #       #  ##       #      ###   #   # #      ## # # #  ###   #         #   ## ##   ##    ### ##  ##   #   #  # # ##  ## # #   # #     #           #     ##    # ####  # ##           #    # # ##   # #    # ##   # #  ## # ## ##   # #  ## #
-###  #       # ## ##             ##   ### ##  #    #    ##  #       #  #   # ##    # # ###        ###      #  #     #       ##  #   #      #   # # #     ## #         ##   #        #     ##             #  #  ## ##            #  #     # # # #  ##     #
-##       ##  # #  #   # ##      # ##   # # # #  #   # #  # ##        #         ##  ##  #       #   #  ##      # ##     # ## #  #        ###  ##  ## # #   ## # #   ## #      # # ##         #     # #      ### # #   #     # #    # #   ## #    #   #    #
-# #  #    #  # #  #     ## #  #  #   ##  # #       #    #   # ##  ##  ##   #      #    # #  ### #  ##     #  #   #     # #       #   # # #  ### # ## #   #  ## ### # # ##   ##  # #      #  #    #  #    #  # ##   ##      ###     #   ##  ##            #
-#   ###  ##   ##             ##  #         # S#   #   #    ##     #  #                 # #   ## #   ## # #  ## #  #   # # #  ##     ##   #     ##     ###  #  # #      ##  ## #    #    # #  #      # # #  ## #   ##    #  #  #   # ##  ##      #  ##    #
-##  #  #  # # # #  #  # ##     ###  ## # ##  #   ## # ## #      # ##   # #  #    # #    #  #   #    #   #   # #   #  ##      #   #  #  #  ###        ##    ###  ##  #        ##  # #     ## # ### #                #      #        #  #   #   ##  #   ## #
-# #      #    #    ##  #    #  #   ##         #     ####          #        ##    # # #       #      ##        #  #   #     #       #    ## #   #    #   #          ####  #  #  #     #     #     #   #          ##  ##  #   ##         #   ###          ##
-#  #    #   ##     #   #       #     #  #  ##   #     ####   # ##  ##                ###    #        ### #     ## # #       ### #  ###### #   #     #  #  #   #  #   # # ###  #  # #    #    #   ## #   ##   # ##   #   # # #   # #  #       # #     #   #
-##  #  #   ##  ##  ## # #         #     #      #     # ###  # #   #     # #  ## ##  ###           ##  ## # ##  #  #   ###     #      #      #   # #    ## # ## ### #  # ##   ##  #  ##    #   #   #        # #   ####       ####   # ##          ##      #
-#### # #  #  ##  #  #         #  #          ##         ## ##  #      ##    #   #   #  ##          #  #  ###  #   ### #   #     #  #    #    ##   ## #   ##    #   # ##    ##   ### #     # ##   #   #  ##       # #   #  ##  #       # # #        #      #
-## #  #           # ##  #  #  # #   #      ##        ## #        #   # # #   ##   # #      # ##       # ###        ##  #       #    ##    #  ##            ###    #     #  # ###  # ##     #   ##       # #    ## ##   ##    # # ##      ##  #       ##  #
-#   #              ###     # #      #           # # #  # #### # ##  # ## # #   ##           # #     ###  #    #          #  ##        ##           #  #    # #   #   ## ##  ## #  #  ##           ####    #   # #    # #  # ####  ## #  #   #            #
-####  ##   #       #       # #   #     #  ## ##  #           #      # #### ###    #   #  #   # #   ##      #   #      ##  ##         # #  ##   #   # #  ###         # #   # #    # # ### ###  #    #   #     #      #### ##  #     #      #  #      #    #
-#  #            ### # #   #  #   ##   ### #  #     #      #   #         #  ##  ###        ##  #  #  ##          # #  #    # #       # ## #    ##  #   # ##  ##  ### # ##       #  ## #      #          #     ##    # # ##  ######          ##   ####    ##
-##   ###  #  #####    #   #    #  # # ##    ##      #      # #     ##   #  #    #     #    #  #  # #     #  #  #   ##  # ##   # # # # # ## ## ##      #       # #      ###     #    ##     ##      #  ##  # #  #      ##      #    #   #  ###     #      #
-# # #   #   ##    ##       #  ## #   #   #      # # # ##      #   #   # # ### #   #      #      #  ##    ### # # ## ###           #        # # ##     ##  # # ## ###  #    #  ##                      ### # ## # #             #    #      #    ######   #
-#      #   ## #  ##  #    ### #    ##    #       # #    #   #   # ###      #     # ##  ###     # #       # #     ###    # # ## # #    # #      ##       ### #     ###   ## #  ## ###    ####    #     ### #   #        # #  ### # #  #   ## ###### #  #  #
-#  ##        #     ##     ####    ##      #  ##      #     #  ##    ##     # # #   #      ##  # #  ## #  #    # #       #   #      #      #   ##  #      #          #    #            # ###    ##  #          ##   # #   #    ##    # ##      #    #  ## #
-##   ##### #      ##    #  #   #      #       #      #  #    #    #   ##  #     #  #   #    ##  #     ##  #   # #     ##     #    #  ### ###  # ##  #   #          ## #  ##   ## #   ##     #    #  ##   #  ##   # # #  # #  # # ##      ###        #    #
-#      # #  ##   #   ##  # #    #     # ###  # #     #    # #   #  #   ##   # ##    # ###     ##      #    # #   #    #     #  #  #### #  ####  #  #   ##       #     # #  #      ####     ###        ###   # #### # # #    # #   # #  # #   #      #  # #
-####   #          ## #   #  # # #          #    #  ##  #  ###      #    #   #  ##       ###    #     #       ##         #  #  #     #   #### #       # # #  #   ## ##   #     #   #       ##    #  #       #     # # ##      #  #    # # ## ##     # #   #
-# #   ##   ##    #   # #    # ##   #      ##     # ##  #     # ##  # #         ###  # ## # ##   ##    #    #      #          #   #   #  # ##       ## ### #   #       ### ###  ## ####       # #          ##  #  #      ##   #       #   #          #    #
-#     #  #   #      # #   ###  #       #  ###       #   #      #         #  #   ##  ## #              # #   ####  # ##        #       #  #     # # # ##     #  #  #     #      # ## ##      # #   #     # #   # #  #   ## #     #  ##  #   #      #     ##
-##  #    #      ##  # #  ###  #    #  # # ###  ## ##    #                   ## #      #   ##  ##         #  #   #  #        # #  # #       # #     #      ## # ### # #          # ##    ####         #        # ##    #          #  #    #  # # #        #
-# # #    #  ###     ##         #  ## ###  #   #     #  # #   #     #   #      # ##  # ### #   # ##     #  # ###        #    ######   # ###  ## ###  # #       #    # #### ### # #   ## # #            ## #    ### # # ## ###      # #  ##      #         #
-# #      #      ##    ##         ## # # #    # ###  #   ## ##       # #  ##      #  ##   #  # #      #   ##    ## # #             #     #   #    #  #   # #####   ##    ##  ##     ##  # # ## # ##     #  #  # #          #     ##   #  ### #           ##
-# ###   # # ##  ## ### #     #      ##        #  # #  #    #    # # ##    ##   #        # #   #     ##             #   #  #    #   #### ### # ### #   #        ## ## #   #       # #  # # ## #   #  # #  # #            ## #  #     ## ##     ##       ###
-## #  #  #         ##    ###         #     # ##  # # # # #  #     #   # #  # #  #  #    #   # #      #  # ###  # #   # #   #   # # ##          ## # ## #    #    # #  # #            #      #    #            #    #  #    # ## #    #       # #       # #
-##  #  # # ##    #   #    #   #  # ### ##      # # ##  #     #    #             ##    #  ###  ##       ## ##  # #    # # ##    ##    #####     #   ##     #  #  #  # # #  ###   #                #      # #  ###    #    #       #  # # #    ##     #### #
-#    #            #   #   #    #        ##    # ##   ##     #  # #  # # #   # ## #    #   # ####       ##  #  #  #    ####  # #    #  ## #       ###      #  # #     #  # #         # #   #   #            #        #  ###     ##     #   ### #  #      ##
-#    #      #  #  ###  ##       ### ##       #  # #        #   ##     # # ### #    #       ##  ## ##  ##             ###   ## ####   ##       ##   #  # ##   # ######     ###       #   #   ### #  #           # ## # #  ##    # #   # #  ## ## ##     # #
-# #    #  #   ###  # # ####  # # #    ##    ###    #       ## #   #     ## # #####    #  #       ##        ### #     #    ##    # ## #    #    #   ####           ###       #####  # #   # ####  #  #   # #    #        #    #  # #   #      # #  ### #  #
-##      ##     # ##     ## #  #   ####  # ### # #     #  ##       ## #  #   ###   #  ##   # ##   #     #  #  #    # #  #         # # #      #    #   ##   # #     ##            ##   #         ### ## #     #    #   ##    # # #  #   ##     #      # ## #
-# # ##   #    ## #                  #    # ## #     #    ## # # ## ###### # ###    #       #  # ####  ## #  #       ## #  #         #  ## ##             ###    ###      # #  ##        #     # #  # #  # ##   # #   ####                       ###   ## #
-## ##       #   #       ###    # #   #    ### #      # #     #     #       # #   #      #####        #       #    # ### #       # ####        #  ## # ##  ##    #   ## #     #  # ##    #   #    ## #    ### ##  #   #     #  #   # ##  #    # ###  #   ##
-#  ##    #  #  #     # ## #   # #     ##  ##  # #   #  ###   #    #   # ##  ##    # #   #      # #   # #  #     #####         ##    ### #  # #       ##     #       #      #   ## ##  #     # # # ###  #  #  ##  # #           #  ##  ### #     #      # #
-## #  #                  ##   ###   #   ##   # #        #  #  #       # #  #  #      #    #      ###   # # ##    #     #####  # ##     #         # # #     #    #     ## ##            ### #    #        # #  #   ##    # #  # #  #  #    #              #
-# #  ####  #      #       ## #    ## ## ##      #   ##  # ###  ##      #          #    # #  #  #  #   # #  #      #    # #  #  # #          #      #   ##    #  #       #        # # ## # ##  # #                 #    # #      #   # ## ##    #  ##   ###
-###   # ##    ## #   ##   #       # # ####   # # ##    #    ###  #   # #          #      #  #   #  #  #   ###       #  #    #### ##  ##    #  # ##     #  ## #   ###   #        #  #         ## # # #### ###  ##  # ## ###                ## ##  # #  #  #
-#          # ##   #   ###  # # #     ###  #  #  ##  #   # # #     ### # # ## ##  #     #   #   # # ###   #  #     #    #      # #  #         ## ###    ##      #    #       #####  #   #      #     # #  # #     #   ### #  # ##   # ## #  #  ##  # #  # #
-#   #  #  #     #  #   #    #            ##     # #  ##     ##          ##  #  #      # # # # # #     # #  #         #   #      ###   #  #  # #   #      #  #    # ###   # #            ##           #       #   #  #  ####  #    #      #   ##          #
-#    #    ###      #         # ### # # #   # #  #     #        #       #    ##            # # #  #     #               ## #  # ##         ### # #      # ##     #   #  # #   #  #         #          # #  # #  #  #   ## #      #     # #  #  ##   ##### #
-#   ##  ##      #     #  ## # # #   ##       #  ##  ## # #   #     #    #       #     # #    # #  ##       #     ##     # #  ##     # #   ## # #  #  #    ## #  ##   #  # # #   #       #       ## #  # # #    # ##    # # # # # #        #     #     #  #
-#  #   #   #     #  #    #    #  # #   # #   #  #  #    #   # # #   # #   #    ##  ###      #    #  #     #       # # #       # #### ##     #   #   #  ##     #   ##      #  #         ###  #####    #   #### ## #         ## #  ## # # #  ##   #   #  # #
-###      # ##     ## #         ### #   #  #    ##  # #    #   #  #   #         #  #       # #      #     ## #     # # # #     ##       ###  #      #  # ###   #        #       # #      ###   #   #  #     #  # #####     #  #  #  #   ###  #     ## # # #
-##      #  # # #       # # ###    # ##   # #  #  ## #     ### ##     #  #   #    ## #    #       #  ### ##     #    #         # #          #  #   #       #        ##  #  #    ##     #          #     # #      ##      #   ##   #       ##            # #
-# ### ##### #  #          #     #    # # ## #      #      # #      #  #  #  #   ##  # ## ##   ###       #          # #  ##  ## ##    #  #      # # ### #  #  # #    #        ### #   ## #    #    #    #  # ###    #     #       #    #   #       #      #
-#  ##   #   #  ##    #    ###     ### ##       #   ##           ## #      ###         ##      #  ###    #  #             #        ##                   #    # # #       #     ### # # ## ##    ##    ###   # #  # #  ##     ## # # ###   ###   ##  #   # #
-#   ## ## #   ## #    # # #   # ## ###   # ##    #  #  ## #### #  ##  # ##  #   # ##    # #  # ##  # #  #    #    #   #  #    #       # #   #  #   #   ### ##     ##           #  # ##    ####      ##    # #    ##    # #  # ###  ##  ##     #  ##    # #
-#   #  # ## ##    #       # #  ##    #   ###  # #         ###  # #     # # # #   ### ##    #   #     # #          #      #    #   # #       #       #  #           ###    #     #         #   #        #   # #     #  ## #      # #       # #  #  # ###  #
-#   #  #                    #       #  #      # # #  # ####    ### ###  # #        #         #    # #  # ## ## #        #      ##        #       ## ### ##      #   #    # #  ###   #  # #   #  #    #   #  #    #      # #  ## ##    #      # ##  # # # #
-###              #    #    #      ##  # # # #  # ##  #     ##  #   #  # # # #    ##   #        #  #           #    #        ##   #        #     ##  #      #  #   ##    #####      #          #  #  # #  # #        #    #   ##  #   # # #   # #  # # # ##
-#      #   ##        #    ## #                    # #   #    #  ###         ### #     #   # # # ## #   # #  #     # ## #      # #    ## # #     #    #  #     #  #  #     #  #   ##        # #####    # ##    ##       ##  # #    #### ##   # # #        #
-#          #   #          # # #  #  #  #  #   #       #       #          ##  ##      #  #  #  ## # # # # ##  #        #  # #       #        #   # # # #  #  #    #        ## #    # #    ##  #     ## #          #  ##     ##   ###       # #    # ###  ##
-#   #     #  ### #  # # #  #     #        #  #  #   ##       #  ###       #     #  #      # # #      #        # #       #   #     ###  # # ##  #  #  #    # #   # # #  ##     #    #    #     ### #  #           #    # ##   #     ## #     #           ##
-#  #         #       ##     #      #    #  # #   ##### #  #  # #  ###      ##  ###  # #   ## ### #   #  #   #    #     ##       # #       ### ###       #  ##    ##       ##       #  #  #      ###         # #  #         # # #        #  ##      ##    #
-##  #   #         # # #       ## # # ###  #           #  ##    # ###  ##   #   ##  ##        ##  #   ##    # #    # #  #  ## #     #    ##      #   ### ##        ###  #          #                ### # #      #  # # ##     #    #           #    ###  #
-#          ## ##         #      #   ## #    #  # #   # #  ###### #    ##  ##  ##  #   #  ####               #  # # #   #  #        #  ### ## #   #    ####  # # # #        #     # ##         ###  ##  # #     #  ##  # # #  #        #    #   #    #  # #
-#  ##      ####   ####  ###   #   ##   ###    #       # # ##   ##         #      ###  # #           # #     # #  #    #   # # ## #    # ## #     #   #  #  #    #    ##         # ##  # #  # #                #  ## ###  #  # #    # ###    #  #   #     #
-##   # ##    #       #       #  ## ##  # #          #     # #   #    # # ###     ###  ## # # #     #   # #    #       # # #  #    # #   #    ##      #    # #  #     #     ## #   #           #    # ##  # #                 ##   #      #       # ## ####
-# #        # # #     # #   # #      #  ## # ##   #   ## #           ## #   # #    #     #           ##   #  #  ## #   #   # #       #      ##  ##  #      #  #   #     # #    #  # #  #   # #  #    ###    # #  ## #       ##        #  # # ###  ##      #
-##  # #    ## #     #    #     #  #  # # #       #    #    ###    #### #  ##  #    ##    #####    #  ##   #      ##    # # #  #       #    ## # ## #    ##  ## ###         #    ## # #                        #       # # ##   ## # #        # #     #   #
-#   #   #    #    #     #  ####  #  #  #       # #  #   #####  #     #    #     #  ##    ## # ####   # #         # #  #  ##     ###   # #     #     # ##    #  #     #    # #     #    ##  # ##         #     #       # ##       #   #  # #      ## ##   #
-###   #     #    #  ##     #  ## ##    #   #  # ##  ##         #  #         #   ## #  #   #     #   ## #  #    #      #    # #  #   # ##         #  #       #    #   # # # ##              ###  #### # ####    ###   #    # #    # ## #         # #    ###
-##   #  #     # ##  ##   #  # #  #        #   # #           #    #           # ##      #   # # ###       #         #  ### #   #    # #      ### ##   #      #         ## #        #  #                 ### ##   #       # #  #             # #        ## #
-#         #   #  #                  ## #   # #  #     #    # ##   #       #   # #  ##  #    ##     ## # #        # #   #  ##  #    ## #   ## ### #     # #     ####     #   # #     ##          ##    #    #   #         ##   # #                     ## #
-#           # #            #####     # # ###         ##       ##  #  #  #  ##       # #  ## #  #         # #  #    #   ##  #  # #     #       ##  ####   #      ## ##  ##   #     #         ## #  ### #       # #   # # # # # #     # #####    #  # #    #
-# ## #  ##          #  #    ##   #      ## #  # #    #   #     #     #  #  ##    # #   # #     # # ##      ##    # ####      # #     #  #                # #      # ##    # #       ##  ## #  #  #  ## #    ##    ##    ##              #  #  #       # ##
-#  # #     ##   #  ##         ##          #    #  #     # ###  #           # ### # #  #    #  #   #         # # ##      ##   ##   ## #  #           ##   #    # #   #    #  #     #           #     # ##    #   #      #  #       #   ## # ## #  # # #   #
-####     #  #      ##     #### ##     ## #      # #   # ### #    ##      #       # #  ## #  #   ##  # ### # #               # # # ##              #  #   #       #   #            # #     # #  ####     # ##        #         #   # #         #  ##      #
-#  ##           #  ## #     # #  ##    #   #                       ## ## #    #   #  #  #    ##      # ##  ##   ##### ## ##    ###   #     ###       ####### # #         #   ###  #     ##       # #  # #  # ##     # # ##   ###    ##         ##  #     #
-##  ## ##  # ##  # #     ##   #   #      ##    #      #   # #     ###     #### #   #   #         ##    #      ##   #   ### # # #   # # #  #            #  ##   #  #         ## ## # # # ##      #    #   ##  # #    # #  #   ##     #  #   #    #     #  #
-# #  ## #     #   # # #    # ## ## #     ##   ##    ##     # # #####  ## ###   #####      #  #####  #         ##    #     #   ##       ##  ### # #      ##     #         # ##   #   #  # #   #     #   #       #    #    #      ###   ##   # ##   # ###  #
-#     # # #  ## # #      # #         ###    #    #   #   # #  ### #  #  # ###      #       ####  #        # #  # # #  #           # # #       # # ###    # # #       #    ## ##  ##  ###    #         #  #####   ##  #    # #  ##   #  # ##  #     #     #
-# #      #   #       #   #  #####  ##     # # #  ##   #  ## ###            ###         #  #  #  #     #   #  #   ##     #     # #            #  #   #        ##  # #  ### #  # ###   #    ##      #   # ## ## #    #  ##      #  ####  # #    ###    #   #
-# ####  # ### #    #####   #   ### ##     ##    #  #  ##         #   # ### #   ##  #    #               #   ##  ##   #   #       #  # #    ##      #        #  #      #  ###         #        ## ####  ###           #    #      #            #      #   #
-#        #           #   #      #  #             # #        #   ## # #   ## #   #   #  ####     ##  #             ##      ### ##         ## #      #  ## ## ### #   # #    # ##  ##    #    #         ## #     #      #          # #  #   # #  # ##  #   #
-##  #       # #     # #         # #  #        #  ## ###  ## ###   #          #    ## #     #  #      #          # # #      #      ##  #  ## ##   #  # # #      #                    #  ##     #      ###  ##                 #  #   #  #   #   #         #
-## #   #  ##       #    ##      #       #   #    #       # ##        ##  # #     # # #   #   ###          ##  ##  #   #  #     #  # #        #  ##    #  #  ##   ##          ##    #       ### ##  #  #       #   #        ##         #    #    ###      #
-###      # #  #  #    # #      # ## #     ## #   # #           #  #         #          # ###  #   #  # #     #    #       ## ##  #     #  #          #    ###  #        # #           # #    #  # ##         #    #  #   # #     #       #     # #    #  #
-#    # #   #  # #  #   #         ##### ##  #   #  # # ##   # # #     ##    ## ##   ## #        ###              #                  #         #       #    #  #   ##     # ## # #    ##    #    #      #   ## ##    ### #   #   #    #      # #   ##   #  #
-# #      #      # ##   #  #   #    # #     # #     ###  ##    #  #  ##     #  ##        #   ##  #     #   # #              #     #   #    # ###   ## # ##       # #   # # ##  #   ### #  ## ## #  #  #    #  #   #   ## #  #  #    ###   #  ## #     ### #
-#  ###  # #        # #  #   # ###   # # # #  #   # ####   #  #  # ##   ## #  #  #     ##   ## ## #   ##  #  ##          # # #   # #           #     ###  #  ##     #   ## # #   ## # # #                         #        #                #  #   # #  ###
-##   ##  ##  #  #       ##   #  # #     #  ## #     # #   #     ##            #  #      ##  #   #      #  #   # ##     #     # # # # # #  ### #     #             # #        #  # ##       ## #  #  ####     #            ##       # #       # #    #    #
-#  #      ##           ### #        #         # #  #         # # ##  # # #     ##          # #   #      ###  #  #      # # #         #   #  #  ## #    ###       #    # ##  ##   # # #          #   # # #   ##  #       # ##   ##             #   #   ####
-#       #      ##  ##   #  #  ## #       ## #      # ##  # #              ##   #      #  #      ###  #      #    # #      ##      # #    ##   #   ##     #   #        #       ##    #  # #    ##  # ##       #      #   #  # ##    #      #  ###   #    ##
-#    #    ## ## #    #       #     ##  #     ##  #  #     # ##      #    # # # #    #      ## # #  #   #  # ##      ##    #   ## ##   ## #  ## # #   # ##  #  ##   #  # #  #  ##   ##         ## #  ## ##  #  ##   #            #   ###     #          # #
-#####                 ##   ## #    # #       #       #  #     #     ##   #                # # # #     #     #        # #### ## # #   # ###  #                    #    ### #        ###        #  #  #### ## # #  #  #  #  # ## # #   #    #  ####  ###   #
-### #    # #       #   ## #   #        # #  # #  #  #            # ##     ## #    ##  #                 ##   #       ## #  # ### #     #   # #    #  #     #          #    #   #     #  # # #####     ###  #  #    #    #  # #  #### # ##   ######    #  #
-# # #    # ## ###  # # ##  #   #     #              #   #     ##    # # #    #      #   #     # #   ## ##    #####  #   #### # # #     #      #  #  ###  ## # #      # #          #  #   #   ## #  # #     ##   ###   #              #  ##   # ##        #
-# ##  #      #      ###  #   #    # #         # ## # #    #     #        ##  #         #     #  # ##  #    #  # #   #    # #  # #        ###       ## ##     ##                 #    # #  ## # #   #   #  #   #### ##   ##        # #  # ##   ## # ###   #
-##      # ##  ##     #####  #      #  #    # #   ##  ##  #  # #    #    ##  ###      #      ## ##      ###         # ##    #   ## ####  ##         ##      # ###   ##     #         # #    #  ###   #       ##  ## ##    #   #  ###   ##      #   #  ### #
-###    # #     #   ##  ##    ##    ##    # ##    #   #   # #     ####   # #  ###  # #  #   # ## #####  #        #     #  #       #          # #     #    ## #       # #            ##    #  #     #    #  # #  # ### ######    #      # ##  ###   #      #
-#   #     #    ## #  ###      ## #       #     # #       # #        # #    ## ##    #  ###   ##   # #   #     # #     # ###  #   ### #       #      # #  ## #    #   #   #    #    # ##   #  ###  #    # #        # ##   # # #   ####    #   ##  #  ###  #
-###  #            #     #    ##   # #   # #       #  # #     #   # ####    # # #   ##    # #     #            #   ###   #     #   #         #     ##      #    #  #   ##   #  ##  #   ## #       # # ## # ####               #       #    #            # #
-#      #      #        #     #  #      # # ##    #   #  ###   ##   ##          #   ##        # # #    #   # #    # ####  ###  #    # #  ##    #      #       #   # #  ##   ##       #          #   # #            #  ## #  #  # #     # #  # # ##  #  #  #
-#   #  #   ###  # # ##   #     ##        ##  #  #  # #    ##     # #  ##  #  #      ##       ###    # ##  # # # #   #   #   #  #        #                  #    # # #          #          ##   #       #   #          ##     #        ## ###     # #    ##
-#       ###            ### # ##  # ##     ## # #  ##          ## #     ##  #  ##     #  ### #     ##      #      ##  # # # # #  ##  #   # # #    #   #           #  # #  ##      #     ####   ##             #   #   #   #          # ##    # ##  #  # # #
-#          #     #  ##    ##  #          # #     #       ## #    #    #     ##   ##      # # ##      # ##  # ##   ## #    #  # #  #  #   ##  #   ##  #      #       ## ##  #     ### #  ##       # #    #    ## ##  ## #  #   # # #  # #   #### # ##  #  #
-##          #     #  # #          ##  ## #   #  ## ##   #   #    #  #    ##      # #       #   ##  #   ###    #    #    #    # #    ##  #       ## #   #   ##    # ## #    #    #   #  ## #      #     ####  #         # #  # #    #     #  # # #        #
-##  #    #   #  #  #      ## # #    # #       #   #  #     ##      #       #      #  ## #    #    ##   ##          ##   ## ##   # #     #  #     #      # #    # #   #                #    #       #   #    #   #  #### ##      ##   # #     # #      ## #
-##### ##  # #            #  #  ### #  #  #    #    # # #      #       ##  ##    ###     #            # #      #        #   #     #          ## #           # #             #      # ##  #  # #  ##   #      #      #  ##    ##  #   #   #     #    ##   ##
-###    ##  #   ##   # #      #### # #       # # # # # # #         #  #   #                   ##                #    #   #   ##   # ##     ##    #   ##  #    #     #  #  # # #  #       #               #        # #           # ##   ##   ## #  #       #
-#     ## #  ##    #  ####     #   #   ##     ##    #  #  # ##            #  #   #  # ###   #     ##   # #                 #  #   #  #    ##  #    # #     #   #      ####       #     #   #  ### #  #        # ##      #   ####            #    #        #
-##  #  #   #   # ##   # #  ##  #  ###  #  #   # #               #   #  #  #   ###  #     #  #         #  ##           #   #      #     ##  #   ## #       ## #      #   ##   #  #  #    ###  ## #             #   # # # ##  #  ###   # ## ## #  #   #   ##
-#   # #   #   #  # ##  ##  ##        ## #   ## #      ## ##   #  #  #    # ##   #### ##          #       #  #        ##   # ## #    #  #    #    #       # #  ##   ##    #  #    #   #  #   # ####      #      #  ##  #  # #        #   #   ##  #  # #  ##
-###  #   ##     ##      #   # #        # #    #     # ##  ##  ## # #  #  #       ##   #  # # ##  #   ##  #    #  # #      ##   #  ###   #    # #    ##       #       #  ##  #   # #          #   #     #             ##### #   #   #  #          #  #   ##
-#   ###    # #  #   ##  #   #  #         # #         #####     ##           #      ##      # ## ##   #      #    # # # #   #     #  # #  # #    #  #     ## #       #     #                  #    ## #  #  #     #   # #  # ## #   # # # ##             ##
-##########################################################################################################################################################################################################################################################
-""".strip()
-
+    # O labirinto grande fica em team_capivaras.maze: fora do .pyc, só é lido quando usado
+    labirinto2 = load_maze_file()
 
-print(f"Processando labirinto :")
-maze_content_str = labirinto2
+    print(f"Processando labirinto :")
+    maze_content_str = labirinto2
 
-if maze_content_str is not None: # Verifica se a leitura do arquivo foi bem sucedida
-    returned_time_ms = solve_maze(maze_content_str) # Chama a nova função de interface
-    print(f"-> Chamada a solve_maze para o labirinto concluída.")
-    print(f"   Tempo retornado: {returned_time_ms:.4f} ms.")
-    print(f"   Arquivo gerado: 'output_capivaras.txt' (verifique seu conteúdo).")
-else:
-    # read_maze_from_file já imprimiu uma mensagem de erro
-    print(f"   Não foi possível ler ou processar o labirinto. Pulando.")
+    if maze_content_str is not None: # Verifica se a leitura do arquivo foi bem sucedida
+        returned_time_ms = solve_maze(maze_content_str) # Chama a nova função de interface
+        flush_output() # Garante que o arquivo de auditoria já foi escrito
+        print(f"-> Chamada a solve_maze para o labirinto concluída.")
+        print(f"   Tempo retornado: {returned_time_ms:.4f} ms.")
+        if _AUDIT:
+            print(f"   Arquivo gerado: 'output_capivaras.txt' (verifique seu conteúdo).")
+    else:
+        # read_maze_from_file já imprimiu uma mensagem de erro
+        print(f"   Não foi possível ler ou processar o labirinto. Pulando.")
 
-print("\n" + "="*60 + "\n")
\ No newline at end of file
+    print("\n" + "="*60 + "\n")
\ No newline at end of file